@@ -177,6 +177,95 @@ TOOL_CATEGORIES = {
     },
 }
 
+# Argument schemas used by the scope validator to find targets in commands.
+# target_flags: value is a target; port_flags: value is a port spec;
+# value_flags: value is neither (wordlists, output files, tuning).
+ARGUMENT_SCHEMAS = {
+    "nmap": {
+        "port_flags": ["-p", "--top-ports-list"],
+        "value_flags": [
+            "-oX", "-oN", "-oG", "-oA", "-oS", "-iL", "--excludefile",
+            "--script", "--script-args", "--top-ports", "-T", "--min-rate",
+            "--max-rate", "--max-retries", "--host-timeout", "--data-length",
+        ],
+    },
+    "masscan": {
+        "port_flags": ["-p", "--ports"],
+        "value_flags": ["--rate", "-oX", "-oJ", "-oL", "-oG", "-iL", "--excludefile", "-c"],
+    },
+    "sqlmap": {
+        "target_flags": ["-u", "--url"],
+        "value_flags": [
+            "-p", "--data", "--cookie", "--level", "--risk", "--dbms", "--technique",
+            "-D", "-T", "-C", "--threads", "--tamper", "--output-dir", "-r",
+        ],
+    },
+    "nikto": {
+        "target_flags": ["-h", "-host"],
+        "port_flags": ["-p", "-port"],
+        "value_flags": ["-o", "-output", "-Format", "-Tuning", "-Plugins", "-maxtime"],
+    },
+    "gobuster": {
+        "target_flags": ["-u", "--url", "-d", "--domain"],
+        "value_flags": ["-w", "--wordlist", "-o", "--output", "-t", "--threads", "-x", "-s", "-b"],
+    },
+    "ffuf": {
+        "target_flags": ["-u"],
+        "value_flags": ["-w", "-o", "-of", "-mc", "-fc", "-fs", "-fw", "-t", "-H", "-X", "-d"],
+    },
+    "nuclei": {
+        "target_flags": ["-u", "-target"],
+        "value_flags": ["-l", "-t", "-tags", "-severity", "-o", "-rate-limit", "-c"],
+    },
+    "hydra": {
+        "port_flags": ["-s"],
+        "value_flags": ["-l", "-L", "-p", "-P", "-C", "-o", "-t", "-M", "-m"],
+    },
+    "whatweb": {
+        "value_flags": ["-a", "--aggression", "--log-json", "--log-verbose", "-U"],
+    },
+    "wafw00f": {
+        "value_flags": ["-o", "--output", "-i", "--input"],
+    },
+    "dnsrecon": {
+        "target_flags": ["-d", "--domain", "-n", "--name_server", "-r", "--range"],
+        "value_flags": ["-t", "--type", "-D", "--dictionary", "-j", "--json", "-x", "--xml"],
+    },
+    "subfinder": {
+        "target_flags": ["-d", "-domain"],
+        "value_flags": ["-dL", "-o", "-oJ", "-t", "-timeout"],
+    },
+    "ping": {
+        "value_flags": ["-c", "-i", "-W", "-w", "-s", "-t", "-I"],
+    },
+}
+
+# Result cache TTLs in seconds. Only idempotent recon tools opt in: their
+# successful runs are reused for the same engagement, command and scope.
+CACHE_TTLS = {
+    "nmap": 900,
+    "subfinder": 3600,
+    "wafw00f": 1800,
+    "whatweb": 1800,
+    "nuclei": 600,
+}
+
+# Resource profiles used by the execution scheduler for admission.
+# expected_duration: seconds until learned from runs; cpu: cores per run;
+# max_concurrent: cap on simultaneous runs of the tool (0 or absent: none).
+RESOURCE_PROFILES = {
+    "nmap": {"expected_duration": 600, "cpu": 1.0, "max_concurrent": 4},
+    "masscan": {"expected_duration": 120, "cpu": 2.0, "max_concurrent": 2},
+    "subfinder": {"expected_duration": 60, "cpu": 0.5},
+    "whatweb": {"expected_duration": 5, "cpu": 0.25},
+    "ffuf": {"expected_duration": 180, "cpu": 1.0, "max_concurrent": 4},
+    "gobuster": {"expected_duration": 180, "cpu": 1.0, "max_concurrent": 4},
+    "nikto": {"expected_duration": 600, "cpu": 0.5, "max_concurrent": 4},
+    "nuclei": {"expected_duration": 300, "cpu": 1.0, "max_concurrent": 3},
+    "sqlmap": {"expected_duration": 900, "cpu": 1.0, "max_concurrent": 3},
+    "hydra": {"expected_duration": 1200, "cpu": 2.0, "max_concurrent": 2},
+}
+
 def get_category(tool_name: str) -> str:
     """Determine the category for a tool."""
     tool_lower = tool_name.lower()
@@ -246,6 +335,12 @@ def main():
             "common_flags": [],
             "output_format": "stdout"
         }
+        if name in CACHE_TTLS:
+            tool_entry["cache"] = {"ttl": CACHE_TTLS[name]}
+        if name in RESOURCE_PROFILES:
+            tool_entry["resources"] = RESOURCE_PROFILES[name]
+        if name in ARGUMENT_SCHEMAS:
+            tool_entry["arguments"] = ARGUMENT_SCHEMAS[name]
         categories[category]["tools"].append(tool_entry)
         all_tools_flat.append(tool_entry)
 
@@ -0,0 +1,329 @@
+"""Blob Store - Content-addressed, compressed storage for raw tool output.
+
+Raw scan output can run to megabytes. Instead of keeping a decoded copy
+in every result, event and JSON dump, the raw bytes are written once to
+disk and results carry their hash:
+
+- Content-addressed: a blob's name is the SHA-256 of its bytes, so the
+  same output stored twice (the same scan re-run) takes space once.
+- Compressed: blobs are zstd frames (level 3 by default), sharded into
+  <root>/<first two hex digits>/<digest>.zst and written atomically.
+- Lazy: RawOutput decodes only when text() is called; preview() and
+  tail() decode a memoryview slice, so a 4 KB preview of a 50 MB output
+  does not decode (or copy) the rest.
+- Streamed: a BlobWriter (BlobStore.writer()) compresses output chunk by
+  chunk as a tool produces it, so streamed runs are stored in full
+  without ever being held in memory.
+- Bounded: with max_bytes, storing a blob that takes the store over that
+  many (compressed) bytes evicts the least recently stored or reused
+  blobs first. The blob just stored is never evicted.
+
+Usage:
+    from cyberred.core.blob_store import BlobStore
+
+    store = BlobStore("~/.cyber-red/blobs", max_bytes=2 * 1024**3)
+    digest = store.put(stdout_bytes)
+    output = store.open(digest)
+    output.preview(200)  # first 200 bytes, decoded
+    output.text()  # full decoded text
+
+    writer = store.writer()
+    writer.write(chunk)  # for each chunk of a streamed run
+    digest = writer.close()
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+import zstandard
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# SHA-256 hex digest
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+BLOB_SUFFIX = ".zst"
+
+# Largest zstd frame header (holds the uncompressed content size)
+_MAX_FRAME_HEADER = 18
+
+# Bytes decompressed at a time when sizing a streamed blob
+_READ_CHUNK = 1 << 16
+
+
+def _decode(data: BytesLike) -> str:
+    """Decode UTF-8, dropping a multi-byte character cut off at the end."""
+    return codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data)
+
+
+class RawOutput:
+    """Raw tool output, held as bytes and decoded on demand.
+
+    Wraps either bytes in memory or a blob in a BlobStore; stored blobs
+    are read (and decompressed) on each access rather than kept.
+
+    Attributes:
+        digest: Blob digest, if the output is stored.
+    """
+
+    __slots__ = ("_data", "_store", "digest")
+
+    def __init__(
+        self,
+        data: BytesLike = b"",
+        store: Optional[BlobStore] = None,
+        digest: Optional[str] = None,
+    ) -> None:
+        """Wrap in-memory bytes, or a stored blob (store and digest).
+
+        Args:
+            data: Raw output bytes (ignored for stored blobs).
+            store: Blob store holding the output.
+            digest: Digest of the output in store.
+        """
+        if (store is None) != (digest is None):
+            raise ValueError("store and digest must be given together")
+        self._data = None if store is not None else bytes(data)
+        self._store = store
+        self.digest = digest
+
+    @property
+    def data(self) -> bytes:
+        """The raw bytes (read from the store for stored output)."""
+        if self._data is not None:
+            return self._data
+        return self._store.get(self.digest)
+
+    def __len__(self) -> int:
+        """Size in bytes."""
+        if self._data is not None:
+            return len(self._data)
+        return self._store.size(self.digest)
+
+    def text(self) -> str:
+        """The whole output, decoded (invalid UTF-8 is replaced)."""
+        return self.data.decode("utf-8", errors="replace")
+
+    def preview(self, limit: int) -> str:
+        """The first limit bytes, decoded."""
+        return _decode(memoryview(self.data)[:limit])
+
+    def tail(self, limit: int) -> str:
+        """The last limit bytes, decoded."""
+        view = memoryview(self.data)[-limit:] if limit > 0 else memoryview(b"")
+        # Skip continuation bytes of a character cut off at the start
+        start = 0
+        while start < min(3, len(view)) and 0x80 <= view[start] < 0xC0:
+            start += 1
+        return _decode(view[start:])
+
+
+class BlobWriter:
+    """Writes one blob incrementally (see BlobStore.writer()).
+
+    Chunks are hashed and compressed into a temporary file as they are
+    written; close() names the blob by the digest of all of them. The
+    frame does not record its size up front, which BlobStore handles.
+
+    Attributes:
+        size: Bytes written so far.
+    """
+
+    def __init__(self, store: BlobStore) -> None:
+        self._store = store
+        store.root.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=store.root, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._compressor = zstandard.ZstdCompressor(level=store.level).compressobj()
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: BytesLike) -> None:
+        """Append a chunk to the blob."""
+        self._hash.update(data)
+        self.size += len(data)
+        self._file.write(self._compressor.compress(data))
+
+    def close(self) -> str:
+        """Finish the blob (once per distinct content) and return its digest."""
+        try:
+            self._file.write(self._compressor.flush())
+            self._file.close()
+            digest = self._hash.hexdigest()
+            path = self._store.path(digest)
+            if self._store._reuse(path):
+                os.unlink(self._tmp)
+                return digest
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp, path)
+        except BaseException:
+            self.abort()
+            raise
+        self._store._stored(path)
+        return digest
+
+    def abort(self) -> None:
+        """Discard the blob written so far."""
+        self._file.close()
+        try:
+            os.unlink(self._tmp)
+        except FileNotFoundError:
+            pass
+
+
+class BlobStore:
+    """Content-addressed store of zstd-compressed blobs on disk.
+
+    Attributes:
+        root: Directory holding the blobs (created on first put).
+        level: zstd compression level.
+        max_bytes: Compressed bytes kept on disk (0 = unbounded); the
+            least recently stored or reused blobs are evicted beyond it.
+    """
+
+    def __init__(self, root: Union[str, Path], level: int = 3, max_bytes: int = 0) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"Invalid blob store size limit: {max_bytes}")
+        self.root = Path(root).expanduser()
+        self.level = level
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Compressed bytes on disk, counted when first needed
+        self._usage: Optional[int] = None
+
+    def path(self, digest: str) -> Path:
+        """File of a blob.
+
+        Raises:
+            ValueError: If digest is not a SHA-256 hex digest.
+        """
+        if not _DIGEST.fullmatch(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self.root / digest[:2] / f"{digest}{BLOB_SUFFIX}"
+
+    def put(self, data: BytesLike) -> str:
+        """Store bytes (once per distinct content) and return their digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if self._reuse(path):
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zstandard.ZstdCompressor(level=self.level).compress(data)
+        # Write then rename, so readers never see a partial blob
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._stored(path)
+        return digest
+
+    def writer(self) -> BlobWriter:
+        """Start a blob to be written chunk by chunk."""
+        return BlobWriter(self)
+
+    def get(self, digest: str) -> bytes:
+        """Read and decompress a blob.
+
+        Raises:
+            FileNotFoundError: If the blob is not stored.
+        """
+        # decompressobj() also reads streamed frames, which have no size header
+        return zstandard.ZstdDecompressor().decompressobj().decompress(self.path(digest).read_bytes())
+
+    def open(self, digest: str) -> RawOutput:
+        """Lazy handle on a stored blob."""
+        return RawOutput(store=self, digest=digest)
+
+    def size(self, digest: str) -> int:
+        """Uncompressed size of a blob (from its frame header)."""
+        with open(self.path(digest), "rb") as f:
+            size = zstandard.frame_content_size(f.read(_MAX_FRAME_HEADER))
+            if size >= 0:
+                return size
+            # Streamed blob: count the decompressed bytes
+            f.seek(0)
+            reader = zstandard.ZstdDecompressor().stream_reader(f)
+            size = 0
+            while chunk := reader.read(_READ_CHUNK):
+                size += len(chunk)
+            return size
+
+    def __contains__(self, digest: object) -> bool:
+        if not isinstance(digest, str) or not _DIGEST.fullmatch(digest):
+            return False
+        return self.path(digest).exists()
+
+    def delete(self, digest: str) -> bool:
+        """Remove a blob; returns False if it was not stored."""
+        path = self.path(digest)
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return False
+            if self._usage is not None:
+                self._usage -= size
+        return True
+
+    @property
+    def usage(self) -> int:
+        """Compressed bytes of all stored blobs."""
+        with self._lock:
+            if self._usage is None:
+                self._usage = sum(size for _, size, _ in self._blobs())
+            return self._usage
+
+    def _blobs(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every stored blob."""
+        blobs = []
+        for path in self.root.glob(f"??/*{BLOB_SUFFIX}"):
+            stat = path.stat()
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        return blobs
+
+    def _reuse(self, path: Path) -> bool:
+        """Whether a blob is stored; with max_bytes, mark it recently used."""
+        if not self.max_bytes:
+            return path.exists()
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _stored(self, path: Path) -> None:
+        """Count a newly stored blob and evict the oldest ones over max_bytes."""
+        if not self.max_bytes:
+            return
+        with self._lock:
+            if self._usage is None:
+                blobs = self._blobs()
+                self._usage = sum(size for _, size, _ in blobs)
+            else:
+                self._usage += path.stat().st_size
+                if self._usage <= self.max_bytes:
+                    return
+                blobs = self._blobs()
+                # Rescanned: also corrects for blobs removed behind our back
+                self._usage = sum(size for _, size, _ in blobs)
+            if self._usage <= self.max_bytes:
+                return
+            for _, size, old in sorted(blobs):
+                if self._usage <= self.max_bytes:
+                    break
+                if old != path:
+                    old.unlink(missing_ok=True)
+                    self._usage -= size
@@ -22,7 +22,7 @@ import os
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -390,6 +390,7 @@ class _SettingsHolder:
     _last_reload: Optional[float] = None
     _pending_unsafe_changes: list[str] = []
     _system_config_path: Optional[Path] = None
+    _reload_listeners: list[Callable[[Settings, list[str]], None]] = []
     
     @classmethod
     def get(cls, force_reload: bool = False, **kwargs: Any) -> Settings:
@@ -423,6 +424,23 @@ class _SettingsHolder:
             cls._last_reload = None
             cls._pending_unsafe_changes = []
             cls._system_config_path = None
+            cls._reload_listeners = []
+    
+    @classmethod
+    def add_reload_listener(
+        cls, callback: Callable[[Settings, list[str]], None]
+    ) -> None:
+        """Register a callback invoked after each applied hot reload.
+        
+        The callback receives the new settings and the changed config
+        paths. ScopeValidator.handle_settings_reload uses this to follow
+        ``engagement.scope_path``.
+        
+        Args:
+            callback: Function taking (settings, changed_paths).
+        """
+        with cls._lock:
+            cls._reload_listeners = cls._reload_listeners + [callback]
     
     @classmethod
     def start_watching(cls, config_path: Path) -> None:
@@ -502,6 +520,15 @@ class _SettingsHolder:
                     "config_reloaded",
                     changed_paths=list(changes.keys()),
                 )
+                
+                for listener in cls._reload_listeners:
+                    try:
+                        listener(new_settings, list(changes.keys()))
+                    except Exception as e:
+                        log.error(
+                            "config_reload_listener_failed",
+                            error=str(e),
+                        )
             else:
                 # Don't apply, but track the pending unsafe changes
                 cls._pending_unsafe_changes = unsafe_paths
@@ -627,6 +654,8 @@ HOT_RELOAD_SAFE_PATHS: frozenset[str] = frozenset({
     # Engagement-specific
     "engagement.max_agents",
     "engagement.auto_pause_hours",
+    # Scope (republished to validators as a new versioned snapshot)
+    "engagement.scope_path",
 })
 
 
@@ -878,3 +878,45 @@ class LLMResponseError(LLMError):
 class ContainerPoolExhausted(CyberRedError):
     """Raised when container pool is exhausted and timeout reached."""
     pass
+
+
+class ExecChannelError(CyberRedError):
+    """Persistent exec channel to a container failed or closed.
+
+    Raised when the in-container exec agent cannot be started, or when
+    the channel closes while jobs are pending (usually because the
+    container died).
+
+    Attributes:
+        container_id: Container the channel belongs to.
+        reason: Description of the failure.
+    """
+
+    def __init__(
+        self,
+        container_id: str,
+        reason: str,
+        message: str | None = None,
+    ) -> None:
+        """Initialize ExecChannelError.
+
+        Args:
+            container_id: Container the channel belongs to.
+            reason: Description of the failure.
+            message: Optional custom message.
+        """
+        self.container_id = container_id
+        self.reason = reason
+        super().__init__(message or f"Exec channel to {container_id} failed: {reason}")
+
+    @property
+    def context(self) -> dict[str, Any]:
+        """Return context for exec channel error."""
+        return {
+            "container_id": self.container_id,
+            "reason": self.reason,
+        }
+
+    def __repr__(self) -> str:
+        """Return debug representation with attributes."""
+        return f"ExecChannelError(container_id={self.container_id!r}, reason={self.reason!r})"
@@ -0,0 +1,320 @@
+"""Exec Channel - Persistent job channel into a Kali container.
+
+Running a tool used to create a new Docker exec instance per command
+(RealContainer.execute() via exec_run, WorkerPool via ``docker exec``).
+For short tools such as whatweb, wafw00f or dnsrecon the exec setup costs
+more than the tool itself. An ExecChannel starts a small agent inside the
+container once (one long-lived ``docker exec -i ... python3``) and sends it
+jobs over stdin/stdout.
+
+Protocol (newline-delimited JSON, one frame per line):
+- Host -> agent: {"op": "run", "id": 1, "argv": [...], "timeout": 30}
+                 {"op": "cancel", "id": 1}
+- Agent -> host: {"ready": true}                                 (startup)
+                 {"id": 1, "stream": "stdout", "data": "<base64>"}
+                 {"id": 1, "exit": 0, "timed_out": false, "error": null}
+
+The agent runs jobs concurrently (one thread per job), enforces each job's
+timeout, kills the job's process group on timeout or cancel, and streams
+stdout and stderr back as separate frames. Closing stdin kills every job.
+
+Usage:
+    from cyberred.core.exec_channel import ExecChannel
+
+    channel = ExecChannel("red-kali-worker-1")
+    await channel.start()
+    result = await channel.run(["whatweb", "example.com"], timeout=30)
+    result.exit_code, result.stdout
+    await channel.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from cyberred.core.exceptions import ExecChannelError
+
+logger = logging.getLogger(__name__)
+
+DOCKER_BINARY = "/usr/bin/docker"
+
+# Seconds to wait for the agent's ready frame
+STARTUP_TIMEOUT = 10.0
+
+# Output chunk size inside the agent; frames stay well under READ_LIMIT
+CHUNK_SIZE = 32768
+READ_LIMIT = 1 << 20
+
+# Source of the in-container agent (stdlib only, run with python3 -u -c)
+AGENT_SOURCE = f"""
+import base64, json, os, signal, subprocess, sys, threading
+out = sys.stdout.buffer
+lock = threading.Lock()
+procs = {{}}
+
+def send(msg):
+    data = (json.dumps(msg) + "\\n").encode()
+    with lock:
+        out.write(data)
+        out.flush()
+
+def kill(p):
+    try:
+        os.killpg(p.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+def pump(job, name, pipe):
+    for chunk in iter(lambda: pipe.read1({CHUNK_SIZE}), b""):
+        send({{"id": job, "stream": name, "data": base64.b64encode(chunk).decode()}})
+
+def run(job, argv, timeout):
+    try:
+        p = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, start_new_session=True)
+    except OSError as e:
+        send({{"id": job, "exit": 127, "timed_out": False, "error": str(e)}})
+        return
+    procs[job] = p
+    pumps = [threading.Thread(target=pump, args=(job, n, s), daemon=True)
+             for n, s in (("stdout", p.stdout), ("stderr", p.stderr))]
+    for t in pumps:
+        t.start()
+    timed_out = False
+    try:
+        p.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        kill(p)
+        p.wait()
+    for t in pumps:
+        t.join()
+    procs.pop(job, None)
+    send({{"id": job, "exit": p.returncode, "timed_out": timed_out, "error": None}})
+
+send({{"ready": True}})
+for line in sys.stdin.buffer:
+    msg = json.loads(line)
+    if msg["op"] == "run":
+        threading.Thread(target=run, args=(msg["id"], msg["argv"], msg.get("timeout")),
+                         daemon=True).start()
+    elif msg["op"] == "cancel" and msg["id"] in procs:
+        kill(procs[msg["id"]])
+for p in list(procs.values()):
+    kill(p)
+"""
+
+# Called with (stream, data) as output arrives; stream is "stdout" or "stderr"
+OutputCallback = Callable[[str, bytes], None]
+
+
+@dataclass
+class ExecResult:
+    """Outcome of one job run through an ExecChannel.
+
+    Attributes:
+        exit_code: Process exit code (negative signal number if killed).
+        stdout: Captured standard output.
+        stderr: Captured standard error (plus the agent's error, if any).
+        timed_out: True if the agent killed the job at its timeout.
+    """
+
+    exit_code: int
+    stdout: bytes
+    stderr: bytes
+    timed_out: bool = False
+
+
+class _Job:
+    """Host-side state of a running job."""
+
+    __slots__ = ("future", "stdout", "stderr", "on_output", "capture_stdout")
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        on_output: Optional[OutputCallback],
+        capture_stdout: bool = True,
+    ) -> None:
+        self.future = future
+        self.stdout: list[bytes] = []
+        self.stderr: list[bytes] = []
+        self.on_output = on_output
+        self.capture_stdout = capture_stdout
+
+
+class ExecChannel:
+    """Persistent job channel to the exec agent in one container.
+
+    Attributes:
+        container_id: Container the agent runs in.
+    """
+
+    def __init__(
+        self,
+        container_id: str,
+        docker_binary: str = DOCKER_BINARY,
+        max_concurrent: int = 16,
+        exec_prefix: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize the channel (call start() before run()).
+
+        Args:
+            container_id: Container name or ID.
+            docker_binary: Path to the docker CLI.
+            max_concurrent: Jobs allowed to run at once on this channel.
+            exec_prefix: Command that runs a Python interpreter (defaults to
+                ``docker exec -i <container_id> python3``).
+        """
+        self.container_id = container_id
+        self._prefix = list(exec_prefix or [docker_binary, "exec", "-i", container_id, "python3"])
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, _Job] = {}
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def alive(self) -> bool:
+        """True while the agent is running and accepting jobs."""
+        return self._proc is not None and not self._closed
+
+    async def start(self) -> None:
+        """Start the agent and wait until it is ready.
+
+        Raises:
+            ExecChannelError: If the agent cannot be started.
+        """
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                *self._prefix, "-u", "-c", AGENT_SOURCE,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=READ_LIMIT,
+            )
+            line = await asyncio.wait_for(self._proc.stdout.readline(), STARTUP_TIMEOUT)
+            if not json.loads(line or b"{}").get("ready"):
+                raise ValueError("agent did not report ready")
+        except Exception as e:
+            await self._terminate()
+            self._proc = None
+            raise ExecChannelError(self.container_id, f"agent failed to start: {e}") from e
+        self._reader = asyncio.create_task(self._read_loop())
+        logger.debug("exec_channel_started: container=%s", self.container_id)
+
+    async def run(
+        self,
+        argv: Sequence[str],
+        timeout: Optional[float] = None,
+        on_output: Optional[OutputCallback] = None,
+        capture_stdout: bool = True,
+    ) -> ExecResult:
+        """Run one job and wait for it to finish.
+
+        Cancelling the awaiting task cancels the job in the container.
+
+        Args:
+            argv: Command and arguments (no shell).
+            timeout: Seconds after which the agent kills the job.
+            on_output: Called with (stream, data) for each output chunk.
+            capture_stdout: Keep stdout in the result. Streaming callers
+                pass False so large outputs are never held in memory.
+
+        Returns:
+            ExecResult with the demultiplexed output.
+
+        Raises:
+            ExecChannelError: If the channel is closed or closes mid-job.
+        """
+        async with self._slots:
+            if not self.alive:
+                raise ExecChannelError(self.container_id, "channel closed")
+            job_id = next(self._ids)
+            job = _Job(asyncio.get_running_loop().create_future(), on_output, capture_stdout)
+            self._jobs[job_id] = job
+            try:
+                self._send({"op": "run", "id": job_id, "argv": list(argv), "timeout": timeout})
+                return await job.future
+            except asyncio.CancelledError:
+                if self.alive:
+                    self._send({"op": "cancel", "id": job_id})
+                raise
+            finally:
+                self._jobs.pop(job_id, None)
+
+    async def close(self) -> None:
+        """Stop the agent; running jobs are killed and fail."""
+        self._closed = True
+        await self._terminate()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        self._fail_pending("channel closed")
+
+    def _send(self, frame: dict[str, Any]) -> None:
+        self._proc.stdin.write((json.dumps(frame) + "\n").encode())
+
+    async def _terminate(self) -> None:
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            return
+        proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=2.0)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    async def _read_loop(self) -> None:
+        """Dispatch agent frames to jobs until the agent exits."""
+        reason = "agent exited"
+        try:
+            while True:
+                line = await self._proc.stdout.readline()
+                if not line:
+                    break
+                self._dispatch(json.loads(line))
+        except Exception as e:
+            reason = f"protocol error: {e}"
+        self._closed = True
+        self._fail_pending(reason)
+        logger.debug("exec_channel_closed: container=%s reason=%s", self.container_id, reason)
+
+    def _dispatch(self, frame: dict[str, Any]) -> None:
+        job = self._jobs.get(frame.get("id"))
+        if job is None:
+            return  # Cancelled job still winding down
+        if "stream" in frame:
+            data = base64.b64decode(frame["data"])
+            if frame["stream"] != "stdout":
+                job.stderr.append(data)
+            elif job.capture_stdout:
+                job.stdout.append(data)
+            if job.on_output is not None:
+                try:
+                    job.on_output(frame["stream"], data)
+                except Exception as e:
+                    logger.warning("exec_channel_output_callback_failed: error=%s", str(e))
+        elif not job.future.done():
+            stderr = b"".join(job.stderr)
+            if frame.get("error"):
+                stderr += frame["error"].encode()
+            job.future.set_result(ExecResult(
+                exit_code=frame["exit"],
+                stdout=b"".join(job.stdout),
+                stderr=stderr,
+                timed_out=bool(frame.get("timed_out")),
+            ))
+
+    def _fail_pending(self, reason: str) -> None:
+        for job in self._jobs.values():
+            if not job.future.done():
+                job.future.set_exception(ExecChannelError(self.container_id, reason))
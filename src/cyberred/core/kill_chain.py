@@ -11,6 +11,8 @@ import asyncio
 import logging
 from datetime import datetime
 
+from cyberred.core.normalization import FindingCategory, FindingEnricher, normalize
+
 
 class Phase(Enum):
     """Kill Chain phases."""
@@ -55,6 +57,8 @@ class AttackContext:
     vulnerabilities: List[Dict[str, Any]] = field(default_factory=list)
     credentials: List[Dict[str, Any]] = field(default_factory=list)
     shells: List[Dict[str, Any]] = field(default_factory=list)
+    # "product version" -> intelligence results (see FindingEnricher)
+    intelligence: Dict[str, List[Any]] = field(default_factory=dict)
     phase_history: List[PhaseResult] = field(default_factory=list)
     
     def add_port(self, host: str, port: int, service: str = "unknown"):
@@ -87,7 +91,8 @@ class AttackContext:
             "services": dict(self.services),
             "vulnerabilities_count": len(self.vulnerabilities),
             "credentials_count": len(self.credentials),
-            "shells_count": len(self.shells)
+            "shells_count": len(self.shells),
+            "vulnerable_services": [s for s, intel in self.intelligence.items() if intel]
         }
 
 
@@ -118,10 +123,12 @@ class KillChain:
         Phase.POST_EXPLOIT: 1,  # Need elevated access
     }
     
-    def __init__(self, target: str, tool_orchestrator, event_bus=None):
+    def __init__(self, target: str, tool_orchestrator, event_bus=None,
+                 enricher: Optional[FindingEnricher] = None):
         self.target = target
         self.orchestrator = tool_orchestrator
         self.bus = event_bus
+        self.enricher = enricher
         self.current_phase = Phase.RECON
         self.context = AttackContext(target=target)
         self.logger = logging.getLogger("KillChain")
@@ -154,17 +161,21 @@ class KillChain:
             context=self.context.to_dict()
         )
         
-        # Aggregate findings from all tools
+        # Aggregate findings from all tools, normalized to the canonical taxonomy
         all_findings = []
         errors = []
         
         for tool_result in results:
             if tool_result.success:
-                all_findings.extend(tool_result.findings)
-                self._update_context(tool_result)
+                all_findings.extend(normalize(f) for f in tool_result.findings)
             else:
                 errors.extend(tool_result.errors)
         
+        # One intelligence lookup per unique (service, version) in the phase
+        if self.enricher:
+            await self.enricher.enrich(all_findings)
+        self._update_context(all_findings)
+        
         # Determine next phase based on findings
         next_phase = self._determine_next_phase(all_findings)
         recommended = self._recommend_tools(next_phase, all_findings)
@@ -195,34 +206,31 @@ class KillChain:
         
         return result
     
-    def _update_context(self, tool_result):
-        """Update attack context with tool findings."""
-        for finding in tool_result.findings:
-            finding_type = finding.get("type", "")
+    def _update_context(self, findings: List[Dict[str, Any]]):
+        """Update attack context with normalized findings (see normalize())."""
+        for finding in findings:
+            category = finding["category"]
             
-            if finding_type == "port_scan":
-                for port_info in finding.get("ports", []):
-                    host = finding.get("host", self.target)
-                    self.context.add_port(
-                        host, 
-                        int(port_info.get("port", 0)),
-                        port_info.get("service", "unknown")
-                    )
+            if category == FindingCategory.SERVICE:
+                host = finding.get("host") or self.target
+                for port_info in finding["ports"]:
+                    self.context.add_port(host, port_info["port"], port_info["service"])
                     self.context.discovered_hosts.add(host)
+                    if port_info["service_version"] and "intel" in port_info:
+                        self.context.intelligence[" ".join(port_info["service_version"])] = port_info["intel"]
             
-            elif finding_type in ["vulnerability", "sqli", "rce"]:
+            elif category == FindingCategory.VULNERABILITY:
                 self.context.add_vulnerability(finding)
             
-            elif finding_type == "credential":
+            elif category == FindingCategory.CREDENTIAL:
                 self.context.add_credential(finding)
             
-            elif finding_type == "shell":
+            elif category == FindingCategory.ACCESS:
                 self.context.add_shell(finding)
             
-            elif finding_type == "recon":
+            elif category == FindingCategory.RECON:
                 # Add discovered subdomains as potential hosts
-                for subdomain in finding.get("subdomains", []):
-                    self.context.discovered_hosts.add(subdomain)
+                self.context.discovered_hosts.update(finding["hosts"])
     
     def _determine_next_phase(self, findings: List[Dict]) -> Phase:
         """
@@ -256,10 +264,10 @@ class KillChain:
         
         elif current == Phase.EXPLOITATION:
             # Got shell? Move to post-exploit
-            if any(f.get("type") == "shell" for f in findings):
+            if any(f.get("category") == FindingCategory.ACCESS for f in findings):
                 return Phase.POST_EXPLOIT
             # Got credentials? Keep exploiting different services
-            if any(f.get("type") == "credential" for f in findings):
+            if any(f.get("category") == FindingCategory.CREDENTIAL for f in findings):
                 return Phase.EXPLOITATION
             return Phase.EXPLOITATION
         
@@ -36,11 +36,21 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import List, Optional, Union
 
+from cyberred.core.blob_store import BlobStore, RawOutput
 
 # Valid severity levels per architecture specification
 VALID_SEVERITIES = frozenset({"critical", "high", "medium", "low", "info"})
 
 
+def _validate_severity(value: str) -> None:
+    """Validate that the value is one of VALID_SEVERITIES."""
+    if value not in VALID_SEVERITIES:
+        raise ValueError(
+            f"Invalid severity '{value}'. "
+            f"Must be one of: {', '.join(sorted(VALID_SEVERITIES))}"
+        )
+
+
 def _validate_uuid(value: Optional[str], field_name: str) -> None:
     """Validate that the string is a valid UUID."""
     if value is None:
@@ -94,12 +104,13 @@ def _validate_target(value: str, field_name: str) -> None:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Vulnerability finding with 10 required fields.
 
     All stigmergic messages use flat JSON with these fields.
     The signature field (HMAC-SHA256) mitigates Agent-in-the-Middle attacks.
+    Slotted: parsers can emit tens of thousands per scan.
 
     Attributes:
         id: UUID format identifier.
@@ -127,12 +138,7 @@ class Finding:
 
     def __post_init__(self) -> None:
         """Validate fields after initialization."""
-        # Severity Validation
-        if self.severity not in VALID_SEVERITIES:
-            raise ValueError(
-                f"Invalid severity '{self.severity}'. "
-                f"Must be one of: {', '.join(sorted(VALID_SEVERITIES))}"
-            )
+        _validate_severity(self.severity)
         
         # Format Validation
         _validate_uuid(self.id, "id")
@@ -140,9 +146,46 @@ class Finding:
         _validate_timestamp(self.timestamp, "timestamp")
         _validate_target(self.target, "target")
 
+    @classmethod
+    def trusted(
+        cls,
+        id: str,
+        type: str,
+        severity: str,
+        target: str,
+        evidence: str,
+        agent_id: str,
+        timestamp: str,
+        tool: str,
+        topic: str,
+        signature: str,
+    ) -> Finding:
+        """Build a Finding without running __post_init__ validation.
+
+        Only for values the caller has already validated or generated
+        itself (see tools.parsers.common.FindingBatch); everything else
+        goes through the constructor.
+        """
+        finding = cls.__new__(cls)
+        finding.id = id
+        finding.type = type
+        finding.severity = severity
+        finding.target = target
+        finding.evidence = evidence
+        finding.agent_id = agent_id
+        finding.timestamp = timestamp
+        finding.tool = tool
+        finding.topic = topic
+        finding.signature = signature
+        return finding
+
+    def to_dict(self) -> dict:
+        """Serialize to a flat dict of the 10 fields."""
+        return asdict(self)
+
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(asdict(self))
+        return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, data: Union[str, dict]) -> Finding:
@@ -218,6 +261,9 @@ class ToolResult:
             - "CONTAINER_CRASHED": Container became unresponsive
             - "EXECUTION_EXCEPTION": Unexpected exception during execution
             - "POOL_EXHAUSTED": No containers available in pool
+            - "CIRCUIT_OPEN": Tool refused by its circuit breaker
+        output_ref: Digest of the raw stdout bytes in a BlobStore, if the
+            executor stored them (see output()).
     """
 
     success: bool
@@ -226,10 +272,29 @@ class ToolResult:
     exit_code: int
     duration_ms: int
     error_type: Optional[str] = None
+    output_ref: Optional[str] = None
 
     def to_json(self) -> str:
-        """Serialize to JSON string."""
-        return json.dumps(asdict(self))
+        """Serialize to JSON string.
+
+        When the output is stored (output_ref is set) stdout is left out;
+        readers resolve it with output().
+        """
+        data = asdict(self)
+        if self.output_ref is not None:
+            data["stdout"] = ""
+        return json.dumps(data)
+
+    def output(self, store: Optional[BlobStore] = None) -> RawOutput:
+        """Raw stdout: the stored blob if output_ref is set, else stdout.
+
+        Args:
+            store: Blob store holding output_ref (without one, stdout
+                is used).
+        """
+        if self.output_ref is not None and store is not None:
+            return store.open(self.output_ref)
+        return RawOutput(self.stdout.encode("utf-8"))
 
     @classmethod
     def from_json(cls, data: Union[str, dict]) -> ToolResult:
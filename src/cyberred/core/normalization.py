@@ -0,0 +1,302 @@
+"""Finding normalization - canonical types, severities and service intel.
+
+Findings reach the kill chain with free-form ``type`` strings: Tier 1
+parsers emit "open_port" or "nse_script", MCP adapters "port_scan" or
+"web_vulnerability", and Tier 2 types are whatever the LLM chose. This
+post-parse stage maps every finding onto one taxonomy so consumers
+dispatch on a handful of categories instead of string-matching tools.
+
+- Types: a precompiled lookup table (raw type -> FindingCategory), with
+  an ordered keyword table for types it does not know (LLM types such as
+  "SQL Injection" or "exposed-admin-panel"). Resolutions are memoized.
+- Severities: aliases ("moderate", "informational", nuclei's "unknown")
+  map onto the five Finding severities.
+- Services: service findings get a ``ports`` list with a ServiceVersion
+  tuple per port, parsed from Tier 1 evidence when there is no structure.
+- Enrichment: FindingEnricher joins a batch of findings against the
+  intelligence cache, once per unique (service, version) in the batch,
+  and only queries sources for pairs the cache misses.
+
+The finding's own ``type`` is kept; ``category`` is added beside it.
+
+Usage:
+    from cyberred.core.normalization import FindingCategory, FindingEnricher, normalize
+
+    findings = [normalize(f) for f in tool_result.findings]
+    await FindingEnricher(aggregator.cache, aggregator).enrich(findings)
+    services = [f for f in findings if f["category"] == FindingCategory.SERVICE]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from enum import StrEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
+
+import structlog
+
+from cyberred.core.models import Finding
+
+if TYPE_CHECKING:
+    from cyberred.intelligence.aggregator import IntelligenceAggregator
+    from cyberred.intelligence.base import IntelResult
+    from cyberred.intelligence.cache import IntelligenceCache
+
+log = structlog.get_logger()
+
+
+class FindingCategory(StrEnum):
+    """Canonical finding types."""
+
+    SERVICE = "service"              # Open port / listening service
+    HOST = "host"                    # Host liveness, OS, directory objects
+    VULNERABILITY = "vulnerability"  # Exploitable weakness (CVE, SQLi, ...)
+    CREDENTIAL = "credential"        # Passwords, hashes, keys
+    ACCESS = "access"                # Shells, sessions, tunnels
+    PRIVESC = "privesc"              # Privilege escalation vectors
+    RECON = "recon"                  # Subdomains, DNS records, emails
+    CONTENT = "content"              # Directories, files, shares
+    FINGERPRINT = "fingerprint"      # Technologies, WAFs, script output
+    EXPLOIT = "exploit"              # Known exploit references
+    OTHER = "other"
+
+
+# Raw types of the Tier 1 parsers and MCP adapters, per category
+_TAXONOMY: Dict[FindingCategory, tuple[str, ...]] = {
+    FindingCategory.SERVICE: ("open_port", "port", "port_scan", "service", "high_risk_service"),
+    FindingCategory.HOST: ("host", "host_status", "os_detection", "nmap_scan", "ad_object", "domain_controller"),
+    FindingCategory.VULNERABILITY: (
+        "vulnerability", "vuln", "web_vuln", "web_vulnerability", "cve", "exposure",
+        "sqli", "sqli_db", "sqli_table", "sqli_column", "xss", "rce", "lfi", "rfi",
+        "ssrf", "xxe", "misconfiguration",
+    ),
+    FindingCategory.CREDENTIAL: ("credential", "cracked_hash", "hash", "password", "wifi_crack", "wifi_attack"),
+    FindingCategory.ACCESS: ("shell", "shell_access", "session", "tunnel"),
+    FindingCategory.PRIVESC: ("privesc", "privesc_vector"),
+    FindingCategory.RECON: ("recon", "subdomain", "dns_record", "email"),
+    FindingCategory.CONTENT: ("directory", "file", "discovery", "discovery_summary", "share"),
+    FindingCategory.FINGERPRINT: ("technology", "fingerprint", "waf", "waf_detected", "nse_script"),
+    FindingCategory.EXPLOIT: ("exploit", "exploit_ref"),
+}
+
+TYPE_TABLE: Dict[str, FindingCategory] = {
+    raw: category for category, raws in _TAXONOMY.items() for raw in raws
+}
+
+# Fallback for unknown types: first rule with a word starting with a stem
+# (a stem ending in $ must end the type). Stems are specific enough not to
+# catch bare words: "sqli" but not "SQL Server", "access_control" but not
+# "Domain Controller", "key" only as the last word ("ssh_key", not "key
+# exchange"). Weakness names ("broken_access_control", "session_fixation")
+# hit the VULNERABILITY stems first; ACCESS only takes an established shell
+# or foothold, since the kill chain advances to post-exploitation on it.
+_KEYWORD_RULES: tuple[tuple[re.Pattern[str], FindingCategory], ...] = tuple(
+    (re.compile(rf"(?:^|_)(?:{'|'.join(stems)})"), category)
+    for category, stems in [
+        (FindingCategory.PRIVESC, ("privesc", "privilege", "escalat", "suid", "sudo")),
+        (FindingCategory.VULNERABILITY, (
+            "vuln", "cve", "sqli", "sql_inj", "xss", "inject", "rce", "lfi", "rfi", "ssrf", "xxe",
+            "traversal", "overflow", "bypass", "misconfig", "insecure", "exposed", "exposure",
+            "broken_", "access_control", "fixation", "hijack", "shellshock",
+        )),
+        (FindingCategory.CREDENTIAL, (
+            "cred", "passw", "hash", "secret", "token", "api_key", "private_key", "keys?$",
+            "valid_login", "default_login",
+        )),
+        (FindingCategory.ACCESS, ("shell", "webshell", "meterpreter", "foothold")),
+        (FindingCategory.EXPLOIT, ("exploit",)),
+        (FindingCategory.SERVICE, ("port", "service", "listen")),
+        (FindingCategory.RECON, ("subdomain", "dns", "domain", "email", "recon", "whois")),
+        (FindingCategory.CONTENT, ("dir", "file", "path", "url", "endpoint", "share")),
+        (FindingCategory.FINGERPRINT, ("tech", "finger", "banner", "waf", "os", "version")),
+        (FindingCategory.HOST, ("host",)),
+    ]
+)
+
+SEVERITY_TABLE: Dict[str, str] = {
+    **dict.fromkeys(("critical", "crit", "severe", "urgent"), "critical"),
+    **dict.fromkeys(("high", "important"), "high"),
+    **dict.fromkeys(("medium", "med", "moderate", "warning", "warn"), "medium"),
+    **dict.fromkeys(("low", "minor"), "low"),
+    **dict.fromkeys(("info", "informational", "information", "note", "none", "unknown"), "info"),
+}
+
+# Tier 1 RECON types whose target is a discovered host
+_HOST_TYPES = frozenset({"subdomain", "dns_record"})
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Tier 1 open port evidence: nmap "22/tcp open ssh OpenSSH 8.9p1",
+# masscan "Port 22/tcp open on 10.0.0.1"
+_PORT_EVIDENCE = re.compile(
+    r"^(?:Port\s+)?(?P<port>\d+)/(?P<protocol>\w+)\s+open(?:\s+on\s+\S+)?"
+    r"(?:\s+(?P<service>\S+)(?:\s+(?P<rest>.+))?)?$"
+)
+# Product and version: "Apache httpd 2.4.49" -> ("Apache httpd", "2.4.49")
+_PRODUCT_VERSION = re.compile(r"(?P<product>.*?)(?:\s+(?P<version>\d.*))?$")
+
+
+class ServiceVersion(NamedTuple):
+    """Intelligence lookup key of a service (product lowercased)."""
+
+    service: str
+    version: str
+
+
+@lru_cache(maxsize=4096)
+def canonical_type(raw: str) -> FindingCategory:
+    """Map a raw finding type onto the taxonomy (OTHER if unknown)."""
+    key = _NON_WORD.sub("_", raw.lower()).strip("_")
+    category = TYPE_TABLE.get(key)
+    if category is not None:
+        return category
+    for pattern, category in _KEYWORD_RULES:
+        if pattern.search(key):
+            return category
+    return FindingCategory.OTHER
+
+
+def canonical_severity(raw: Optional[str]) -> str:
+    """Map a severity alias onto a Finding severity ("info" if unknown)."""
+    return SEVERITY_TABLE.get((raw or "").strip().lower(), "info")
+
+
+def service_version(port: Mapping[str, Any]) -> Optional[ServiceVersion]:
+    """Lookup key of a port entry, or None without a product and version."""
+    service = port.get("product") or port.get("service")
+    version = port.get("version")
+    if not service or not version or service == "unknown":
+        return None
+    return ServiceVersion(str(service).strip().lower(), str(version).strip())
+
+
+def _port_entry(port: Mapping[str, Any]) -> Dict[str, Any]:
+    entry = {
+        "port": int(port.get("port") or 0),
+        "protocol": port.get("protocol") or port.get("proto") or "tcp",
+        "service": port.get("service") or "unknown",
+        "product": port.get("product") or "",
+        "version": port.get("version") or "",
+    }
+    entry["service_version"] = service_version(entry)
+    return entry
+
+
+def _evidence_ports(evidence: str) -> List[Dict[str, Any]]:
+    match = _PORT_EVIDENCE.match(evidence.strip())
+    if match is None:
+        return []
+    port = match.groupdict()
+    rest = port.pop("rest")
+    if rest:
+        product_version = _PRODUCT_VERSION.match(rest)
+        port["product"] = product_version["product"]
+        port["version"] = product_version["version"]
+    return [_port_entry(port)]
+
+
+def _ports(finding: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if finding.get("ports"):
+        return [_port_entry(port) for port in finding["ports"]]
+    if finding.get("port") is not None:
+        return [_port_entry(finding)]
+    return _evidence_ports(finding.get("evidence") or "")
+
+
+def _hosts(finding: Dict[str, Any]) -> List[str]:
+    if finding.get("subdomains"):
+        return list(finding["subdomains"])
+    if finding.get("subdomain"):
+        return [finding["subdomain"]]
+    # Tier 1 subdomain / DNS findings carry the name as their target
+    if finding.get("type") in _HOST_TYPES and finding.get("target"):
+        return [finding["target"]]
+    return []
+
+
+def normalize(finding: Union[Finding, Mapping[str, Any]]) -> Dict[str, Any]:
+    """Normalized copy of a finding.
+
+    Args:
+        finding: A Finding (Tier 1/2) or an MCP adapter finding dict.
+
+    Returns:
+        Dict with the finding's fields plus:
+        - category: FindingCategory of its type.
+        - severity: Canonical severity.
+        - host: Host it concerns (the adapter's host or the Finding target).
+        - ports: For SERVICE findings, port entries (port, protocol,
+          service, product, version, service_version).
+        - hosts: For RECON findings, discovered host names.
+    """
+    data = finding.to_dict() if isinstance(finding, Finding) else dict(finding)
+    category = canonical_type(data.get("type") or "")
+    data["category"] = category
+    data["severity"] = canonical_severity(data.get("severity"))
+    data["host"] = data.get("host") or data.get("target")
+    if category == FindingCategory.SERVICE:
+        data["ports"] = _ports(data)
+    elif category == FindingCategory.RECON:
+        data["hosts"] = _hosts(data)
+    return data
+
+
+class FindingEnricher:
+    """Joins normalized findings against vulnerability intelligence.
+
+    A batch is looked up with one IntelligenceCache.get_many call; pairs
+    the cache misses are queried once each through the aggregator (whose
+    results are cached for the next batch). Each port entry with a
+    ServiceVersion gets an ``intel`` list.
+    """
+
+    def __init__(
+        self,
+        cache: IntelligenceCache,
+        aggregator: Optional[IntelligenceAggregator] = None,
+    ) -> None:
+        """Initialize the enricher.
+
+        Args:
+            cache: Intelligence cache to join against.
+            aggregator: Queried for cache misses; None for cache-only.
+        """
+        self._cache = cache
+        self._aggregator = aggregator
+
+    async def enrich(self, findings: Iterable[Dict[str, Any]]) -> Dict[ServiceVersion, List[IntelResult]]:
+        """Attach intelligence to the ports of normalized findings.
+
+        Args:
+            findings: Output of normalize().
+
+        Returns:
+            ServiceVersion -> intelligence results, for every pair found.
+        """
+        ports = [port for finding in findings for port in finding.get("ports") or ()]
+        pairs = list(dict.fromkeys(port["service_version"] for port in ports if port["service_version"]))
+        if not pairs:
+            return {}
+
+        found = await self._cache.get_many(pairs)
+        missing = [pair for pair in pairs if found.get(pair) is None]
+        if missing and self._aggregator is not None:
+            queried = await asyncio.gather(
+                *(self._aggregator.query(*pair) for pair in missing), return_exceptions=True
+            )
+            for pair, results in zip(missing, queried):
+                if isinstance(results, BaseException):
+                    log.warning("enrichment_query_failed", service=pair.service,
+                                version=pair.version, error=str(results))
+                else:
+                    found[pair] = results
+
+        for port in ports:
+            if port["service_version"]:
+                port["intel"] = found.get(port["service_version"]) or []
+
+        log.info("findings_enriched", ports=len(ports), pairs=len(pairs),
+                 cache_hits=len(pairs) - len(missing), queried=len(missing) if self._aggregator else 0)
+        return {pair: results for pair, results in found.items() if results is not None}
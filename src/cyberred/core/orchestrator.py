@@ -6,13 +6,33 @@ manages job queues, and coordinates between agents, tools, and the AI council.
 """
 import asyncio
 import logging
+from typing import Optional
 from cyberred.core.event_bus import EventBus
+from cyberred.core.config import _SettingsHolder
 from cyberred.core.council import CouncilOfExperts
 from cyberred.core.worker_pool import WorkerPool
+from cyberred.core.scheduler import ExecutionScheduler
+from cyberred.core.blob_store import BlobStore
+from cyberred.core.retry import RetryPolicy
+from cyberred.core.result_cache import ResultCache
 from cyberred.core.tool_orchestrator import ToolOrchestrator
 from cyberred.agents.ghost_agent import GhostAgent
 from cyberred.core.throttler import SwarmBrain
 from cyberred.core.roe_loader import RoELoader
+from cyberred.tools.command_parser import load_argument_schemas
+from cyberred.tools.manifest import load_cache_ttls, load_tool_profiles
+from cyberred.tools.scope import ScopeValidator
+
+# Tool manifest with per-tool resource profiles, cache TTLs and argument schemas
+TOOL_MANIFEST_PATH = "tools/manifest.yaml"
+
+# Content-addressed store of raw tool output, and the disk space it may
+# take before the least recently used outputs are evicted
+BLOB_STORE_PATH = "~/.cyber-red/blobs"
+BLOB_STORE_MAX_BYTES = 2 * 1024**3
+
+# Wall-clock seconds after which a failing job is not retried again
+JOB_RETRY_BUDGET = 1800.0
 
 
 class Orchestrator:
@@ -26,7 +46,7 @@ class Orchestrator:
     - Coordinate between AI council and tool execution
     """
     
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, scope_path: Optional[str] = None):
         self.bus = event_bus
         self.logger = logging.getLogger("Orchestrator")
         
@@ -35,6 +55,15 @@ class Orchestrator:
         self.roe_loader = RoELoader()
         self.roe = self.roe_loader.load()
         
+        # Hard-gate scope validator (engagement scope file, if given); it
+        # extracts command targets with the manifest's argument schemas
+        self.scope_validator: Optional[ScopeValidator] = (
+            ScopeValidator.from_file(scope_path, argument_schemas=self._load_argument_schemas())
+            if scope_path else None
+        )
+        if self.scope_validator is not None:
+            self._watch_scope(self.scope_validator)
+        
         # Worker pool for Docker container management
         self.pool = WorkerPool(
             event_bus=self.bus, 
@@ -42,10 +71,22 @@ class Orchestrator:
             container_prefix="red-kali-worker"
         )
         
+        # Single scheduler in front of the pool: all tool execution is
+        # admitted, queued fairly, retried and measured in one place
+        self.scheduler = ExecutionScheduler(
+            self.pool,
+            event_bus=self.bus,
+            retry_policy=RetryPolicy(budget=JOB_RETRY_BUDGET)
+        )
+        
         # Tool orchestrator for parallel tool execution
         self.tool_orchestrator = ToolOrchestrator(
-            worker_pool=self.pool,
-            event_bus=self.bus
+            worker_pool=self.scheduler,
+            event_bus=self.bus,
+            tool_profiles=self._load_tool_profiles(),
+            result_cache=ResultCache(self._load_cache_ttls()),
+            scope_version=self._scope_version,
+            blob_store=BlobStore(BLOB_STORE_PATH, max_bytes=BLOB_STORE_MAX_BYTES)
         )
         
         # AI Council for strategic decisions
@@ -64,12 +105,51 @@ class Orchestrator:
         self._jobs_processed = 0
         self._active_jobs = 0
 
+    def _load_tool_profiles(self):
+        """Load per-tool resource profiles; defaults apply if unavailable."""
+        try:
+            return load_tool_profiles(TOOL_MANIFEST_PATH)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Tool profiles not loaded: {e}")
+            return {}
+
+    def _load_cache_ttls(self):
+        """Load per-tool result cache TTLs; nothing is cached if unavailable."""
+        try:
+            return load_cache_ttls(TOOL_MANIFEST_PATH)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Result cache TTLs not loaded: {e}")
+            return {}
+
+    def _watch_scope(self, validator: ScopeValidator) -> None:
+        """Publish a new scope snapshot on every scope change.
+
+        Operator-authorized RoE targets, edits of the scope file and a
+        changed ``engagement.scope_path`` each bump the snapshot version,
+        which also invalidates cached scope decisions and tool results.
+        """
+        self.roe_loader.add_listener(lambda target: validator.add_targets([target]))
+        _SettingsHolder.add_reload_listener(validator.handle_settings_reload)
+        validator.start_watching()
+
+    def _scope_version(self) -> int:
+        """Version of the scope in force; cached results of older scopes miss."""
+        return self.scope_validator.snapshot().version if self.scope_validator else 0
+
+    def _load_argument_schemas(self):
+        """Load per-tool argument schemas; heuristics apply if unavailable."""
+        try:
+            return load_argument_schemas(TOOL_MANIFEST_PATH)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Argument schemas not loaded: {e}")
+            return {}
+
     async def start(self):
         """Start the Orchestrator and initialize all subsystems."""
         self.logger.info("Orchestrator initializing...")
         
-        # Initialize worker pool
-        await self.pool.initialize()
+        # Initialize worker pool (through the scheduler)
+        await self.scheduler.initialize()
         
         # Subscribe to job events
         await self.bus.subscribe("job:new", self.handle_new_job)
@@ -251,6 +331,7 @@ class Orchestrator:
                 "active": sum(1 for a in self.agents.values() if a.is_active)
             },
             "worker_pool": pool_status,
+            "scheduler": self.scheduler.get_metrics(),
             "tools": self.tool_orchestrator.get_available_tools(),
             "stats": {
                 "jobs_processed": self._jobs_processed,
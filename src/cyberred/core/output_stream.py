@@ -0,0 +1,136 @@
+"""Output Stream - Bounded buffers for streamed tool output.
+
+Streamed tool output is consumed line by line as it arrives instead of
+being buffered whole. These helpers keep memory bounded while doing so:
+
+- RingBuffer keeps only the last N characters of a stream (used for
+  raw_truncated and error previews).
+- LineStream incrementally decodes UTF-8 chunks (multi-byte characters
+  may be split across chunks), yields complete lines, and feeds a
+  RingBuffer with the decoded text.
+
+Usage:
+    from cyberred.core.output_stream import LineStream
+
+    lines = LineStream(max_tail=4000)
+    for line in lines.feed(b"80/tcp open\\n443/tcp op"):
+        ...  # "80/tcp open"
+    for line in lines.finish():
+        ...  # "443/tcp op"
+    lines.tail  # last 4000 characters seen
+"""
+
+from __future__ import annotations
+
+import codecs
+from collections import deque
+
+# Lines longer than this are emitted in pieces so a tool that never
+# prints a newline cannot grow the partial line without bound
+MAX_LINE_LENGTH = 1 << 20
+
+
+class RingBuffer:
+    """Keeps the last capacity characters of a text stream.
+
+    Attributes:
+        capacity: Maximum number of characters retained.
+        total: Number of characters appended so far.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.total = 0
+        self._chunks: deque[str] = deque()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def truncated(self) -> bool:
+        """True if older text has been dropped."""
+        return self.total > self._size
+
+    def append(self, text: str) -> None:
+        """Append text, dropping the oldest characters beyond capacity."""
+        if not text:
+            return
+        self.total += len(text)
+        if len(text) >= self.capacity:
+            self._chunks.clear()
+            self._chunks.append(text[len(text) - self.capacity:])
+            self._size = self.capacity
+            return
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.capacity:
+            excess = self._size - self.capacity
+            first = self._chunks[0]
+            if len(first) <= excess:
+                self._chunks.popleft()
+                self._size -= len(first)
+            else:
+                self._chunks[0] = first[excess:]
+                self._size -= excess
+
+    def getvalue(self) -> str:
+        """Return the retained text."""
+        return "".join(self._chunks)
+
+
+class LineStream:
+    """Incremental UTF-8 decoder and line splitter with a bounded tail."""
+
+    def __init__(self, max_tail: int = 4000, max_line: int = MAX_LINE_LENGTH) -> None:
+        """Initialize the stream.
+
+        Args:
+            max_tail: Characters of decoded text kept in the tail buffer.
+            max_line: Partial lines longer than this are emitted as is.
+        """
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+        self._max_line = max_line
+        self._tail = RingBuffer(max_tail)
+
+    @property
+    def tail(self) -> str:
+        """Last max_tail characters of decoded text."""
+        return self._tail.getvalue()
+
+    @property
+    def total_chars(self) -> int:
+        """Characters decoded so far."""
+        return self._tail.total
+
+    def feed(self, data: bytes) -> list[str]:
+        """Decode a chunk and return the lines it completes.
+
+        Args:
+            data: Raw output bytes.
+
+        Returns:
+            Complete lines (without line endings).
+        """
+        return self._split(self._decoder.decode(data))
+
+    def finish(self) -> list[str]:
+        """Flush the decoder and return the final unterminated line, if any."""
+        lines = self._split(self._decoder.decode(b"", final=True))
+        if self._partial:
+            lines.append(self._partial.rstrip("\r"))
+            self._partial = ""
+        return lines
+
+    def _split(self, text: str) -> list[str]:
+        if not text:
+            return []
+        self._tail.append(text)
+        pieces = (self._partial + text).split("\n")
+        self._partial = pieces.pop()
+        lines = [piece.rstrip("\r") for piece in pieces]
+        if len(self._partial) > self._max_line:
+            lines.append(self._partial)
+            self._partial = ""
+        return lines
@@ -0,0 +1,155 @@
+"""Result Cache - Engagement-scoped cache of idempotent tool runs.
+
+Agents re-run the same recon command against the same target within
+minutes (nmap -sV, whatweb, wafw00f, subfinder; GhostAgent falls back to
+nmap/nuclei on every iteration it cannot parse a strategy). For tools
+that opt in, a successful result is kept for a per-tool TTL and returned
+again without taking an execution slot.
+
+- Key: (tool, normalized command, targets, scope version). The command
+  is normalized by shell tokenization, so quoting and whitespace do not
+  matter; a scope change publishes a new version and so never serves a
+  result computed under the old scope.
+- Scope: entries belong to one engagement; clear(engagement_id) drops
+  them when the engagement ends.
+- Opt-in: only tools with a TTL are cached (the ``cache`` block of
+  tools/manifest.yaml, see tools.manifest.load_cache_ttls()).
+- Bounded: least recently used entries are evicted beyond max_entries.
+
+Usage:
+    from cyberred.core.result_cache import ResultCache
+
+    cache = ResultCache({"nmap": 900, "whatweb": 1800})
+    key = cache.key("nmap", "nmap -sV 10.0.0.1", ["10.0.0.1"], scope_version=3)
+    result = cache.get("eng-1", key)
+    if result is None:
+        result = await run(...)
+        cache.put("eng-1", key, result)
+"""
+
+from __future__ import annotations
+
+import shlex
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional
+
+# (tool, normalized command, targets, scope version)
+CacheKey = tuple[str, str, tuple[str, ...], Hashable]
+
+
+def normalize_command(command: str) -> str:
+    """Canonical form of a command (shell words, single spaces, re-quoted)."""
+    try:
+        words = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes: fall back to whitespace normalization
+        words = command.split()
+    return " ".join(shlex.quote(word) for word in words)
+
+
+class ResultCache:
+    """TTL cache of tool results, scoped per engagement.
+
+    Attributes:
+        max_entries: Entries kept across all engagements.
+    """
+
+    COUNTERS = ("hits", "misses", "stores", "expired", "evictions")
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float],
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttls: Tool name -> seconds a result stays valid. Tools not
+                listed (or with a TTL <= 0) are never cached.
+            max_entries: Entries kept across all engagements.
+            clock: Monotonic clock, injectable for tests.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1: {max_entries}")
+        self._ttls = {tool: float(ttl) for tool, ttl in ttls.items() if ttl > 0}
+        self.max_entries = max_entries
+        self._clock = clock
+        # (engagement_id, key) -> (expires_at, value), in LRU order
+        self._entries: OrderedDict[tuple[str, CacheKey], tuple[float, Any]] = OrderedDict()
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def cacheable(self, tool: str) -> bool:
+        """Whether results of a tool are cached."""
+        return tool in self._ttls
+
+    def ttl(self, tool: str) -> float:
+        """Seconds a tool's results stay valid (0.0 if not cached)."""
+        return self._ttls.get(tool, 0.0)
+
+    @staticmethod
+    def key(
+        tool: str, command: str, targets: Iterable[str], scope_version: Hashable = 0
+    ) -> CacheKey:
+        """Build the cache key of a tool run."""
+        return (tool, normalize_command(command), tuple(sorted(set(targets))), scope_version)
+
+    def get(self, engagement_id: str, key: CacheKey) -> Optional[Any]:
+        """Return a live cached value, or None."""
+        if not self.cacheable(key[0]):
+            return None
+        entry = self._entries.get((engagement_id, key))
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[(engagement_id, key)]
+            self._counters["expired"] += 1
+            self._counters["misses"] += 1
+            return None
+        self._entries.move_to_end((engagement_id, key))
+        self._counters["hits"] += 1
+        return value
+
+    def put(self, engagement_id: str, key: CacheKey, value: Any) -> bool:
+        """Store a value if its tool is cacheable.
+
+        Returns:
+            True if the value was stored.
+        """
+        ttl = self._ttls.get(key[0])
+        if ttl is None:
+            return False
+        self._entries[(engagement_id, key)] = (self._clock() + ttl, value)
+        self._entries.move_to_end((engagement_id, key))
+        self._counters["stores"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+        return True
+
+    def clear(self, engagement_id: Optional[str] = None) -> int:
+        """Drop one engagement's entries (all entries if None).
+
+        Returns:
+            Number of entries dropped.
+        """
+        if engagement_id is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+        stale = [entry for entry in self._entries if entry[0] == engagement_id]
+        for entry in stale:
+            del self._entries[entry]
+        return len(stale)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Counters, entry count and hit ratio."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            **self._counters,
+            "entries": len(self._entries),
+            "hit_ratio": self._counters["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,295 @@
+"""Retry Policy - The single retry layer for tool execution.
+
+Retries used to be stacked: BaseToolAdapter retried around
+WorkerPool.execute_task, which retried again, so one failing command
+could hold a worker for up to nine attempts. Retrying now happens in one
+place (ExecutionScheduler.execute_task, or WorkerPool.execute_task when
+used directly) and is governed by:
+
+- Classification: a failed ToolResult is TRANSIENT (crash, timeout,
+  network hiccup: worth another attempt), DETERMINISTIC (permission
+  denied, command not found, usage or parse errors, exit codes with a
+  known meaning: the same attempt fails the same way) or REFUSED
+  (admission control or an open circuit said no). Only transient
+  failures are retried.
+- RetryPolicy: attempts and exponential backoff per job, plus an
+  optional wall-clock budget covering every attempt of the job.
+- CircuitBreaker: per tool, shared by the whole swarm. After
+  failure_threshold consecutive transient failures the tool is refused
+  for cooldown seconds, then one probe job decides whether it closes
+  again. Deterministic failures say nothing about the tool (an
+  unresolvable target or a bad flag fails the same way on any worker),
+  so they do not count.
+
+Usage:
+    from cyberred.core.retry import TRANSIENT, CircuitBreakers, RetryPolicy, classify_result
+
+    policy = RetryPolicy(max_attempts=3, budget=900)
+    breakers = CircuitBreakers()
+    if breakers.allow("nmap"):
+        result = await backend.run(command, timeout)
+        breakers.record("nmap", result)
+        if classify_result(result) == TRANSIENT and policy.should_retry(1, elapsed):
+            await asyncio.sleep(policy.delay(1))
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from cyberred.core.models import ToolResult
+
+logger = logging.getLogger(__name__)
+
+# Failure classes
+TRANSIENT = "transient"
+DETERMINISTIC = "deterministic"
+REFUSED = "refused"
+
+# error_type of results refused by an open circuit breaker
+CIRCUIT_OPEN = "CIRCUIT_OPEN"
+
+# Exit codes with a fixed meaning: usage error, not executable, not found
+DETERMINISTIC_EXIT_CODES = frozenset({2, 126, 127})
+
+# Failure output that will not change on another attempt
+DETERMINISTIC_PATTERN = re.compile(
+    r"permission denied|operation not permitted|command not found|"
+    r"executable file not found|no such file or directory|"
+    r"unrecognized (?:option|argument)|unknown (?:option|flag|argument)|"
+    r"invalid (?:option|argument)|usage:|parse error|syntax error|"
+    r"failed to resolve|could not resolve",
+    re.IGNORECASE,
+)
+
+# Failure output that is likely to go away on its own
+TRANSIENT_PATTERN = re.compile(
+    r"connection (?:reset|refused|timed out)|temporar(?:y|ily)|"
+    r"resource (?:temporarily )?unavailable|too many open files|"
+    r"broken pipe|network is unreachable|try again",
+    re.IGNORECASE,
+)
+
+
+def classify_error(error: str, exit_code: Optional[int] = None) -> str:
+    """Classify failure output (and exit code, if known).
+
+    Transient markers win over deterministic ones: "connection timed out
+    while resolving" is worth another attempt. Failures with no marker
+    are treated as transient.
+
+    Args:
+        error: stderr or an "ERROR: ..." string.
+        exit_code: Process exit code, if the process ran.
+
+    Returns:
+        TRANSIENT or DETERMINISTIC.
+    """
+    if TRANSIENT_PATTERN.search(error):
+        return TRANSIENT
+    if exit_code in DETERMINISTIC_EXIT_CODES or DETERMINISTIC_PATTERN.search(error):
+        return DETERMINISTIC
+    return TRANSIENT
+
+
+def classify_result(result: ToolResult) -> Optional[str]:
+    """Classify a ToolResult (None for a success).
+
+    Returns:
+        None, TRANSIENT, DETERMINISTIC or REFUSED.
+    """
+    if result.success:
+        return None
+    if result.error_type in ("POOL_EXHAUSTED", CIRCUIT_OPEN):
+        return REFUSED
+    if result.error_type in ("TIMEOUT", "CONTAINER_CRASHED"):
+        return TRANSIENT
+    exit_code = result.exit_code if result.error_type == "NON_ZERO_EXIT" else None
+    return classify_error(result.stderr, exit_code)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry settings for one job.
+
+    Attributes:
+        max_attempts: Attempts per job, including the first.
+        base_delay: Seconds before the first retry; doubles per retry.
+        max_delay: Upper bound on the delay between attempts.
+        budget: Wall-clock seconds for all attempts of a job (0 = none).
+            No retry starts once its delay would exhaust the budget.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    budget: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1 or self.base_delay < 0 or self.max_delay < 0 or self.budget < 0:
+            raise ValueError(
+                f"Invalid retry policy: max_attempts={self.max_attempts} "
+                f"base_delay={self.base_delay} max_delay={self.max_delay} budget={self.budget}"
+            )
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the given (1-based) failed attempt."""
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    def should_retry(self, attempt: int, elapsed: float, attempts: Optional[int] = None) -> bool:
+        """Whether another attempt may follow the given failed attempt.
+
+        Args:
+            attempt: 1-based number of the attempt that just failed.
+            elapsed: Seconds the job has taken so far.
+            attempts: Caller's attempt limit, capped by max_attempts.
+        """
+        limit = self.max_attempts if attempts is None else min(max(1, attempts), self.max_attempts)
+        if attempt >= limit:
+            return False
+        return not (self.budget and elapsed + self.delay(attempt) >= self.budget)
+
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one tool.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit.
+        cooldown: Seconds the circuit stays open before a probe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1 or cooldown < 0:
+            raise ValueError(
+                f"Invalid circuit breaker: failure_threshold={failure_threshold} cooldown={cooldown}"
+            )
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = CLOSED
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """CLOSED, OPEN or HALF_OPEN."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Consecutive failures recorded."""
+        return self._failures
+
+    def allow(self) -> bool:
+        """Whether a job may run now (at most one probe while half open)."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._state = CLOSED
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure; open the circuit at the threshold or on a failed probe."""
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = OPEN
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Give back a probe slot whose job never ran (e.g. it was refused)."""
+        self._probing = False
+
+
+class CircuitBreakers:
+    """Per-tool circuit breakers shared across the swarm."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, tool: str) -> CircuitBreaker:
+        """Breaker of a tool (created closed on first use)."""
+        breaker = self._breakers.get(tool)
+        if breaker is None:
+            breaker = CircuitBreaker(self._failure_threshold, self._cooldown, self._clock)
+            self._breakers[tool] = breaker
+        return breaker
+
+    def allow(self, tool: str) -> bool:
+        """Whether a job of the tool may run now."""
+        return self.get(tool).allow()
+
+    def record(self, tool: str, result: ToolResult) -> None:
+        """Update the tool's breaker with a job's result.
+
+        Only transient failures count: deterministic ones are specific
+        to the job (its target or arguments), not to the tool.
+        """
+        breaker = self.get(tool)
+        failure = classify_result(result)
+        if failure is None:
+            breaker.record_success()
+        elif failure in (REFUSED, DETERMINISTIC):
+            breaker.release_probe()
+        else:
+            was_open = breaker.state == OPEN
+            breaker.record_failure()
+            if breaker.state == OPEN and not was_open:
+                logger.warning(
+                    "circuit_opened: tool=%s failures=%s cooldown=%s",
+                    tool, breaker.failures, breaker.cooldown,
+                )
+
+    def refusal(self, tool: str) -> ToolResult:
+        """Result returned for a job refused by an open circuit."""
+        breaker = self.get(tool)
+        return ToolResult(
+            success=False,
+            stdout="",
+            stderr=f"Circuit open for {tool}: {breaker.failures} consecutive failures",
+            exit_code=-1,
+            duration_ms=0,
+            error_type=CIRCUIT_OPEN,
+        )
+
+    def get_metrics(self) -> dict[str, Any]:
+        """State and consecutive failures of every breaker not closed."""
+        return {
+            tool: {"state": breaker.state, "failures": breaker.failures}
+            for tool, breaker in sorted(self._breakers.items())
+            if breaker.state != CLOSED or breaker.failures
+        }
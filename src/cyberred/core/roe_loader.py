@@ -1,6 +1,8 @@
+import copy
 import yaml
 import os
 import logging
+from typing import Callable, List
 
 class RoELoader:
     DEFAULT_ROE = {
@@ -17,13 +19,22 @@ class RoELoader:
         self._roe = None
         self._session_allowed = set()  # Dynamic session-based authorizations
         self._always_allowed = set()   # Permanently authorized (persisted)
+        self._listeners: List[Callable[[str], None]] = []  # Notified on persisted targets
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Register a callback invoked with each newly persisted target.
+
+        Used to publish the target into live scope validators, e.g.
+        ``loader.add_listener(lambda t: validator.add_targets([t]))``.
+        """
+        self._listeners.append(callback)
 
     def load(self) -> dict:
         """Loads RoE from YAML or returns default."""
         if not os.path.exists(self.config_path):
             self.logger.warning(f"RoE file not found at {self.config_path}. Using Defaults.")
             self._create_default()
-            self._roe = self.DEFAULT_ROE.copy()
+            self._roe = copy.deepcopy(self.DEFAULT_ROE)
         else:
             try:
                 with open(self.config_path, 'r') as f:
@@ -32,7 +43,7 @@ class RoELoader:
                     self.logger.info("Rules of Engagement Loaded.")
             except Exception as e:
                 self.logger.error(f"Failed to load RoE: {e}. Aborting to Safe Mode.")
-                self._roe = self.DEFAULT_ROE.copy()
+                self._roe = copy.deepcopy(self.DEFAULT_ROE)
         
         # Pre-populate session allowed from config
         for ip in self._roe.get("allowed_ips", []):
@@ -81,6 +92,12 @@ class RoELoader:
                 
                 with open(self.config_path, 'w') as f:
                     yaml.dump(self._roe, f, default_flow_style=False)
+
+                for listener in self._listeners:
+                    try:
+                        listener(target)
+                    except Exception as e:
+                        self.logger.error(f"RoE listener failed for {target}: {e}")
                     
         except Exception as e:
             self.logger.error(f"Could not persist target to RoE: {e}")
@@ -0,0 +1,687 @@
+"""Execution Scheduler - One queue in front of every execution backend.
+
+WorkerPool (pre-named red-kali-worker-N containers) and ContainerPool
+(testcontainers) used to be picked independently by ToolOrchestrator, the
+MCP adapters and KaliExecutor, so two pools competed for the same host.
+ExecutionScheduler sits in front of a single ExecutionBackendProtocol
+implementation and owns everything about *when* a job runs:
+
+- Admission control: a bounded global queue, plus optional per-engagement
+  running and queued limits. Rejected or expired jobs return a
+  POOL_EXHAUSTED ToolResult (per ERR1) instead of raising.
+- Fair queuing: one FIFO per agent. Agents are served by cost-weighted
+  fair queuing (each dispatched job advances its agent's virtual time by
+  expected duration x CPU), so an agent queueing sqlmap runs cannot
+  starve one queueing a quick whatweb. SchedulerPolicy(admission="sjf")
+  serves the shortest expected job first instead, aged by queue wait.
+- Tool profiles: per-tool expected duration, CPU weight and concurrency
+  cap (the ``resources`` block of tools/manifest.yaml). Durations are
+  re-estimated online from observed duration_ms; an optional CPU budget
+  bounds the summed CPU of running jobs.
+- Retries and circuit breakers (core.retry): execute_task() is the one
+  retry layer; only transient failures are retried, within the job's
+  RetryPolicy budget, and a tool failing across the swarm is refused
+  with CIRCUIT_OPEN until its breaker cools down.
+- Metrics: one set of counters and queue-wait percentiles (overall and
+  per tool) for all tool execution, whatever the backend.
+
+Usage:
+    from cyberred.core.scheduler import ExecutionScheduler, SchedulerPolicy, ToolProfile
+
+    scheduler = ExecutionScheduler(WorkerPool(event_bus=bus), SchedulerPolicy(max_queue_depth=500))
+    scheduler.set_quota("eng-1", max_concurrent=4)
+    scheduler.set_profile("sqlmap", ToolProfile(expected_duration=900, max_concurrent=3))
+    await scheduler.initialize()
+    result = await scheduler.submit(
+        "nmap -sV 10.0.0.1", tool="nmap", engagement_id="eng-1", agent_id="ghost-3"
+    )
+    scheduler.get_metrics()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+from cyberred.core.exec_channel import OutputCallback
+from cyberred.core.models import ToolResult
+from cyberred.core.retry import TRANSIENT, CircuitBreakers, RetryPolicy, classify_result
+from cyberred.protocols.execution import ExecutionBackendProtocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGAGEMENT = "default"
+DEFAULT_AGENT = "default"
+
+# Admission orders
+ADMISSION_FAIR = "fair"
+ADMISSION_SJF = "sjf"
+
+# Results whose duration says something about the tool's cost
+_OBSERVED_ERRORS = (None, "NON_ZERO_EXIT", "TIMEOUT")
+
+
+@dataclass
+class SchedulerPolicy:
+    """Admission settings for an ExecutionScheduler.
+
+    Attributes:
+        max_concurrent: Jobs dispatched at once (0 = backend capacity).
+        max_queue_depth: Queued jobs beyond which new jobs are rejected.
+        queue_timeout: Seconds a job may wait for a slot before failing.
+        engagement_concurrency: Default running limit per engagement (0 = none).
+        engagement_queue_depth: Default queued limit per engagement (0 = none).
+        wait_window: Number of queue-wait samples kept for percentiles.
+        admission: "fair" (cost-weighted fair queuing across agents) or
+            "sjf" (shortest expected job first, aged by queue wait).
+        cpu_budget: Summed CPU of running jobs allowed at once (0 = none).
+        duration_alpha: Weight of a new observation in the duration
+            estimate (exponentially weighted moving average).
+    """
+
+    max_concurrent: int = 0
+    max_queue_depth: int = 1000
+    queue_timeout: float = 600.0
+    engagement_concurrency: int = 0
+    engagement_queue_depth: int = 0
+    wait_window: int = 500
+    admission: str = ADMISSION_FAIR
+    cpu_budget: float = 0.0
+    duration_alpha: float = 0.2
+
+    def __post_init__(self) -> None:
+        if min(self.max_concurrent, self.engagement_concurrency, self.engagement_queue_depth,
+               self.cpu_budget) < 0:
+            raise ValueError("Scheduler limits must be >= 0")
+        if self.max_queue_depth < 1 or self.queue_timeout <= 0 or self.wait_window < 1:
+            raise ValueError(
+                f"Invalid scheduler policy: max_queue_depth={self.max_queue_depth} "
+                f"queue_timeout={self.queue_timeout} wait_window={self.wait_window}"
+            )
+        if self.admission not in (ADMISSION_FAIR, ADMISSION_SJF):
+            raise ValueError(f"Unknown admission order: {self.admission}")
+        if not 0 < self.duration_alpha <= 1:
+            raise ValueError(f"duration_alpha must be in (0, 1]: {self.duration_alpha}")
+
+
+@dataclass(frozen=True)
+class ToolProfile:
+    """Declared resource profile of a tool.
+
+    Loaded from the ``resources`` block of tools/manifest.yaml.
+
+    Attributes:
+        expected_duration: Expected run time in seconds (until observed).
+        cpu: CPU cores the tool keeps busy; weights its cost.
+        max_concurrent: Instances allowed to run at once (0 = unlimited).
+    """
+
+    expected_duration: float = 30.0
+    cpu: float = 1.0
+    max_concurrent: int = 0
+
+    def __post_init__(self) -> None:
+        if self.expected_duration <= 0 or self.cpu <= 0 or self.max_concurrent < 0:
+            raise ValueError(
+                f"Invalid tool profile: expected_duration={self.expected_duration} "
+                f"cpu={self.cpu} max_concurrent={self.max_concurrent}"
+            )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ToolProfile":
+        """Build a profile from a manifest ``resources`` mapping."""
+        defaults = cls()
+        return cls(
+            expected_duration=float(data.get("expected_duration", defaults.expected_duration)),
+            cpu=float(data.get("cpu", defaults.cpu)),
+            max_concurrent=int(data.get("max_concurrent", defaults.max_concurrent)),
+        )
+
+
+@dataclass(frozen=True)
+class EngagementQuota:
+    """Execution limits for one engagement (0 = unlimited).
+
+    Attributes:
+        max_concurrent: Jobs of the engagement running at once.
+        max_queued: Jobs of the engagement waiting for a slot.
+    """
+
+    max_concurrent: int = 0
+    max_queued: int = 0
+
+
+class SchedulerMetrics:
+    """Counters and queue-wait samples for an ExecutionScheduler."""
+
+    COUNTERS = (
+        "submitted",
+        "dispatched",
+        "rejected",
+        "circuit_open",
+        "queue_timeouts",
+        "completed",
+        "failed",
+    )
+
+    def __init__(self, wait_window: int = 500) -> None:
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+        self._wait_window = wait_window
+        self._waits: deque[float] = deque(maxlen=wait_window)
+        self._tool_waits: dict[str, deque[float]] = {}
+        self._by_tool: dict[str, int] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        self._counters[name] += amount
+
+    def record_wait(self, wait_ms: float, tool: Optional[str] = None) -> None:
+        """Record how long a job (of a tool) waited in the queue."""
+        self._waits.append(wait_ms)
+        if tool is not None:
+            if tool not in self._tool_waits:
+                self._tool_waits[tool] = deque(maxlen=self._wait_window)
+            self._tool_waits[tool].append(wait_ms)
+
+    def record_tool(self, tool: str) -> None:
+        """Count a dispatched job for its tool."""
+        self._by_tool[tool] = self._by_tool.get(tool, 0) + 1
+
+    def wait_percentile(self, percentile: float, tool: Optional[str] = None) -> float:
+        """Queue wait (ms) at the given percentile of recent samples."""
+        samples = self._waits if tool is None else self._tool_waits.get(tool, ())
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return counters, per-tool dispatch counts and wait percentiles."""
+        return {
+            **self._counters,
+            "by_tool": dict(self._by_tool),
+            "queue_wait_p50_ms": self.wait_percentile(0.50),
+            "queue_wait_p95_ms": self.wait_percentile(0.95),
+            "queue_wait_p95_ms_by_tool": {
+                tool: self.wait_percentile(0.95, tool) for tool in sorted(self._tool_waits)
+            },
+        }
+
+
+class _Job:
+    """A submitted job waiting for (or holding) an execution slot."""
+
+    __slots__ = ("engagement_id", "agent_id", "tool", "granted", "enqueued_at", "queued", "cpu")
+
+    def __init__(
+        self, engagement_id: str, agent_id: str, tool: str, granted: asyncio.Future, enqueued_at: float
+    ) -> None:
+        self.engagement_id = engagement_id
+        self.agent_id = agent_id
+        self.tool = tool
+        self.granted = granted
+        self.enqueued_at = enqueued_at
+        self.queued = True
+        self.cpu = 0.0
+
+
+def _decrement(counts: dict[str, int], key: str) -> None:
+    """Decrement a per-engagement or per-tool count, dropping it at zero."""
+    counts[key] -= 1
+    if not counts[key]:
+        del counts[key]
+
+
+class ExecutionScheduler:
+    """Admission-controlled, fair job queue in front of one execution backend."""
+
+    def __init__(
+        self,
+        backend: ExecutionBackendProtocol,
+        policy: Optional[SchedulerPolicy] = None,
+        event_bus: Any = None,
+        clock: Callable[[], float] = time.monotonic,
+        profiles: Optional[Mapping[str, ToolProfile]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakers] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            backend: WorkerPool, ContainerPool or another backend.
+            policy: Admission settings (defaults to SchedulerPolicy()).
+            event_bus: Optional legacy EventBus for terminal events.
+            clock: Monotonic clock, injectable for tests.
+            profiles: Tool name -> ToolProfile (see set_profile()).
+            retry_policy: Retry settings of execute_task() jobs.
+            breakers: Per-tool circuit breakers (shared across the swarm).
+        """
+        self._backend = backend
+        self._policy = policy or SchedulerPolicy()
+        self.bus = event_bus
+        self._clock = clock
+        self._metrics = SchedulerMetrics(self._policy.wait_window)
+        self._retry = retry_policy or RetryPolicy()
+        self._breakers = breakers or CircuitBreakers(clock=clock)
+        self._quotas: dict[str, EngagementQuota] = {}
+        # agent_id -> FIFO of queued jobs; dict order breaks priority ties
+        self._queues: dict[str, deque[_Job]] = {}
+        self._queued = 0
+        self._running = 0
+        self._engagement_queued: dict[str, int] = {}
+        self._engagement_running: dict[str, int] = {}
+        self._closed = False
+        self._profiles: dict[str, ToolProfile] = dict(profiles or {})
+        # Learned durations (seconds), tool -> EWMA of observed runs
+        self._estimates: dict[str, float] = {}
+        self._tool_running: dict[str, int] = {}
+        self._cpu_in_use = 0.0
+        # Fair queuing: per-agent virtual time, and the start tag of the
+        # last dispatched job (where newly backlogged agents start)
+        self._vtime: dict[str, float] = {}
+        self._vclock = 0.0
+
+    @property
+    def backend(self) -> ExecutionBackendProtocol:
+        """The backend jobs are dispatched to."""
+        return self._backend
+
+    @property
+    def capacity(self) -> int:
+        """Jobs dispatched at once (backend capacity, capped by policy)."""
+        capacity = self._backend.capacity
+        if self._policy.max_concurrent:
+            capacity = min(capacity, self._policy.max_concurrent)
+        return capacity
+
+    @property
+    def running_count(self) -> int:
+        """Jobs currently running on the backend."""
+        return self._running
+
+    @property
+    def queued_count(self) -> int:
+        """Jobs waiting for a slot."""
+        return self._queued
+
+    @property
+    def metrics(self) -> SchedulerMetrics:
+        """Scheduler counters and queue-wait samples."""
+        return self._metrics
+
+    def set_quota(self, engagement_id: str, max_concurrent: int = 0, max_queued: int = 0) -> None:
+        """Set execution limits for an engagement (0 = unlimited).
+
+        Raises:
+            ValueError: If a limit is negative.
+        """
+        if max_concurrent < 0 or max_queued < 0:
+            raise ValueError("Quota limits must be >= 0")
+        self._quotas[engagement_id] = EngagementQuota(max_concurrent, max_queued)
+        self._dispatch()
+
+    def quota(self, engagement_id: str) -> EngagementQuota:
+        """Limits applying to an engagement (policy defaults if none set)."""
+        return self._quotas.get(engagement_id) or EngagementQuota(
+            self._policy.engagement_concurrency, self._policy.engagement_queue_depth
+        )
+
+    def set_profile(self, tool: str, profile: ToolProfile) -> None:
+        """Set the resource profile of a tool."""
+        self._profiles[tool] = profile
+        self._dispatch()
+
+    def profile(self, tool: str) -> ToolProfile:
+        """Resource profile of a tool (defaults if none declared)."""
+        return self._profiles.get(tool) or ToolProfile()
+
+    def expected_duration(self, tool: str) -> float:
+        """Expected run time of a tool in seconds (learned once observed)."""
+        estimate = self._estimates.get(tool)
+        return estimate if estimate is not None else self.profile(tool).expected_duration
+
+    def observe_duration(self, tool: str, duration_s: float) -> None:
+        """Fold an observed run time into the tool's duration estimate."""
+        previous = self.expected_duration(tool)
+        alpha = self._policy.duration_alpha
+        self._estimates[tool] = alpha * duration_s + (1 - alpha) * previous
+
+    async def initialize(self) -> None:
+        """Initialize the backend."""
+        self._closed = False
+        await self._backend.initialize()
+
+    async def shutdown(self) -> None:
+        """Fail queued jobs, stop accepting new ones and shut the backend down."""
+        self._closed = True
+        for queue in self._queues.values():
+            for job in queue:
+                job.queued = False
+                # A cancelled submitter dequeues nothing once it sees queued=False
+                if not job.granted.done():
+                    job.granted.set_result(False)
+        self._queues.clear()
+        self._queued = 0
+        self._engagement_queued.clear()
+        await self._backend.shutdown()
+
+    async def submit(
+        self,
+        command: str,
+        *,
+        tool: str = "",
+        engagement_id: str = DEFAULT_ENGAGEMENT,
+        agent_id: str = DEFAULT_AGENT,
+        timeout: float = 300.0,
+        on_output: Optional[OutputCallback] = None,
+    ) -> ToolResult:
+        """Queue a command and run it on the backend when admitted.
+
+        Args:
+            command: Command line to run.
+            tool: Tool name (for metrics and logs).
+            engagement_id: Engagement the job counts against.
+            agent_id: Agent submitting the job (fair-queuing key).
+            timeout: Seconds the command may run once dispatched.
+            on_output: Streaming callback passed to the backend.
+
+        Returns:
+            ToolResult from the backend, POOL_EXHAUSTED if the job was
+            rejected or waited longer than queue_timeout, or CIRCUIT_OPEN
+            if the tool's circuit breaker is open.
+        """
+        self._metrics.increment("submitted")
+        if tool and not self._breakers.allow(tool):
+            self._metrics.increment("circuit_open")
+            return self._breakers.refusal(tool)
+        try:
+            result = await self._submit(command, tool, engagement_id, agent_id, timeout, on_output)
+        except asyncio.CancelledError:
+            if tool:
+                self._breakers.get(tool).release_probe()
+            raise
+        if tool:
+            self._breakers.record(tool, result)
+        return result
+
+    async def _submit(
+        self,
+        command: str,
+        tool: str,
+        engagement_id: str,
+        agent_id: str,
+        timeout: float,
+        on_output: Optional[OutputCallback],
+    ) -> ToolResult:
+        """Admit, queue and run one job (see submit())."""
+        start_time = time.perf_counter()
+        reason = self._admission_error(engagement_id)
+        if reason is not None:
+            self._metrics.increment("rejected")
+            logger.warning(
+                "scheduler_rejected: tool=%s engagement=%s reason=%s", tool, engagement_id, reason
+            )
+            return self._unavailable(reason, start_time)
+
+        job = _Job(
+            engagement_id, agent_id, tool, asyncio.get_running_loop().create_future(), self._clock()
+        )
+        if agent_id not in self._queues:
+            # Newly backlogged agents start at the current virtual time
+            self._queues[agent_id] = deque()
+            self._vtime[agent_id] = max(self._vtime.get(agent_id, 0.0), self._vclock)
+        self._queues[agent_id].append(job)
+        self._queued += 1
+        self._engagement_queued[engagement_id] = self._engagement_queued.get(engagement_id, 0) + 1
+        self._dispatch()
+
+        try:
+            granted = await asyncio.wait_for(job.granted, timeout=self._policy.queue_timeout)
+        except asyncio.TimeoutError:
+            # The job may have been granted (or skipped) as the wait expired
+            self._abandon(job)
+            self._metrics.increment("queue_timeouts")
+            logger.warning(
+                "scheduler_queue_timeout: tool=%s engagement=%s agent=%s", tool, engagement_id, agent_id
+            )
+            return self._unavailable(
+                f"no execution slot within {self._policy.queue_timeout}s", start_time
+            )
+        except asyncio.CancelledError:
+            self._abandon(job)
+            raise
+        if not granted:
+            return self._unavailable("scheduler shut down", start_time)
+
+        try:
+            result = await self._backend.run(command, timeout=timeout, on_output=on_output)
+        except Exception as e:
+            # Per ERR1: backend failures come back as ToolResult
+            logger.warning("scheduler_backend_exception: tool=%s error=%s", tool, str(e))
+            result = ToolResult(
+                success=False,
+                stdout="",
+                stderr=str(e),
+                exit_code=-1,
+                duration_ms=int((time.perf_counter() - start_time) * 1000),
+                error_type="EXECUTION_EXCEPTION",
+            )
+        finally:
+            self._release(job)
+        self._metrics.increment("completed" if result.success else "failed")
+        if result.error_type in _OBSERVED_ERRORS:
+            self.observe_duration(tool, result.duration_ms / 1000)
+        return result
+
+    async def execute_task(
+        self,
+        command: str,
+        tool: str,
+        retries: int = 3,
+        timeout: float = 300.0,
+        on_output: Optional[OutputCallback] = None,
+        *,
+        engagement_id: str = DEFAULT_ENGAGEMENT,
+        agent_id: str = DEFAULT_AGENT,
+        on_retry: Optional[Callable[[], None]] = None,
+    ) -> str:
+        """WorkerPool.execute_task()-compatible entry point.
+
+        Lets ToolOrchestrator and the MCP adapters use the scheduler in
+        place of a WorkerPool. Returns stdout, or a string starting with
+        "ERROR:" after the last failed attempt. This is the only retry
+        layer: transient failures are retried up to ``retries`` attempts
+        (capped by the RetryPolicy and its budget); deterministic failures
+        and refused jobs are not.
+
+        Args:
+            on_retry: Called before each retry (e.g. to reset a stream
+                parser fed by on_output).
+        """
+        if self.bus:
+            await self.bus.publish("swarm:terminal", {
+                "source": agent_id,
+                "text": f"⚡ [{tool}] Queued on {self._backend.backend_name}"
+            })
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            result = await self.submit(
+                command, tool=tool, engagement_id=engagement_id, agent_id=agent_id,
+                timeout=timeout, on_output=on_output,
+            )
+            failure = classify_result(result)
+            if failure != TRANSIENT or not self._retry.should_retry(
+                attempt, self._clock() - started, retries
+            ):
+                break
+            logger.info(
+                "scheduler_retry: tool=%s attempt=%s error=%s", tool, attempt, result.error_type
+            )
+            if on_retry is not None:
+                on_retry()
+            await asyncio.sleep(self._retry.delay(attempt))
+        if self.bus:
+            status = f"✓ [{tool}] Complete" if result.success else f"✗ [{tool}] Failed: {result.stderr[:200]}"
+            await self.bus.publish("swarm:terminal", {"source": agent_id, "text": status})
+        if not result.success:
+            return f"ERROR: {result.stderr}"
+        if on_output is None and result.output_ref is not None:
+            return await self._stored_stdout(result)
+        return result.stdout
+
+    async def _stored_stdout(self, result: ToolResult) -> str:
+        """Full stdout of a result whose backend kept only a preview."""
+        store = getattr(self._backend, "blob_store", None)
+        if store is None:
+            return result.stdout
+        return (await asyncio.to_thread(store.get, result.output_ref)).decode("utf-8", errors="replace")
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Return one metrics snapshot for all execution."""
+        engagements = set(self._engagement_running) | set(self._engagement_queued)
+        tools = set(self._profiles) | set(self._estimates) | set(self._tool_running)
+        return {
+            "backend": self._backend.backend_name,
+            "admission": self._policy.admission,
+            "capacity": self.capacity,
+            "running": self._running,
+            "queued": self._queued,
+            "cpu_in_use": self._cpu_in_use,
+            "agents_waiting": len(self._queues),
+            "circuits": self._breakers.get_metrics(),
+            "tools": {
+                tool: {
+                    "running": self._tool_running.get(tool, 0),
+                    "expected_duration_s": round(self.expected_duration(tool), 3),
+                }
+                for tool in sorted(tools)
+            },
+            "engagements": {
+                engagement_id: {
+                    "running": self._engagement_running.get(engagement_id, 0),
+                    "queued": self._engagement_queued.get(engagement_id, 0),
+                }
+                for engagement_id in sorted(engagements)
+            },
+            **self._metrics.get_metrics(),
+        }
+
+    def _admission_error(self, engagement_id: str) -> Optional[str]:
+        """Reason a new job of the engagement cannot be queued, or None."""
+        if self._closed:
+            return "scheduler shut down"
+        if self._queued >= self._policy.max_queue_depth:
+            return f"queue full ({self._queued} jobs)"
+        max_queued = self.quota(engagement_id).max_queued
+        if max_queued and self._engagement_queued.get(engagement_id, 0) >= max_queued:
+            return f"engagement queue quota reached ({max_queued} jobs)"
+        return None
+
+    def _eligible(self, job: _Job) -> bool:
+        """Whether a job may start now (engagement quota, tool cap, CPU budget)."""
+        max_concurrent = self.quota(job.engagement_id).max_concurrent
+        if max_concurrent and self._engagement_running.get(job.engagement_id, 0) >= max_concurrent:
+            return False
+        profile = self.profile(job.tool)
+        if profile.max_concurrent and self._tool_running.get(job.tool, 0) >= profile.max_concurrent:
+            return False
+        budget = self._policy.cpu_budget
+        # A job bigger than the whole budget still runs when nothing else does
+        return not (budget and self._running and self._cpu_in_use + profile.cpu > budget)
+
+    def _priority(self, job: _Job) -> float:
+        """Sort key of an agent's head job (lower runs first)."""
+        if self._policy.admission == ADMISSION_SJF:
+            return self.expected_duration(job.tool) - (self._clock() - job.enqueued_at)
+        return self._vtime[job.agent_id]
+
+    def _next_job(self) -> Optional[_Job]:
+        """Pop the eligible head job with the lowest priority key."""
+        best: Optional[_Job] = None
+        best_key = 0.0
+        for queue in self._queues.values():
+            job = queue[0]
+            if not self._eligible(job):
+                continue
+            key = self._priority(job)
+            if best is None or key < best_key:
+                best, best_key = job, key
+        if best is None:
+            return None
+        queue = self._queues[best.agent_id]
+        queue.popleft()
+        if not queue:
+            del self._queues[best.agent_id]
+        # Charge the agent for the job's expected cost
+        self._vclock = self._vtime[best.agent_id]
+        self._vtime[best.agent_id] += self.expected_duration(best.tool) * self.profile(best.tool).cpu
+        return best
+
+    def _dispatch(self) -> None:
+        """Grant slots to queued jobs while capacity allows."""
+        while self._running < self.capacity:
+            job = self._next_job()
+            if job is None:
+                return
+            job.queued = False
+            self._queued -= 1
+            _decrement(self._engagement_queued, job.engagement_id)
+            if job.granted.done():
+                # Its submitter was cancelled but has not dequeued it yet
+                continue
+            self._running += 1
+            self._engagement_running[job.engagement_id] = (
+                self._engagement_running.get(job.engagement_id, 0) + 1
+            )
+            job.cpu = self.profile(job.tool).cpu
+            self._cpu_in_use += job.cpu
+            self._tool_running[job.tool] = self._tool_running.get(job.tool, 0) + 1
+            self._metrics.increment("dispatched")
+            self._metrics.record_tool(job.tool)
+            self._metrics.record_wait((self._clock() - job.enqueued_at) * 1000, job.tool)
+            job.granted.set_result(True)
+
+    def _dequeue(self, job: _Job) -> None:
+        """Remove a job that gave up waiting."""
+        queue = self._queues[job.agent_id]
+        queue.remove(job)
+        if not queue:
+            del self._queues[job.agent_id]
+        job.queued = False
+        self._queued -= 1
+        _decrement(self._engagement_queued, job.engagement_id)
+
+    def _abandon(self, job: _Job) -> None:
+        """Undo a job whose submitter stopped waiting (timeout or cancel)."""
+        if job.queued:
+            self._dequeue(job)
+        elif job.granted.done() and not job.granted.cancelled() and job.granted.result():
+            self._release(job)
+
+    def _release(self, job: _Job) -> None:
+        """Free a job's slot and dispatch the next ones."""
+        self._running -= 1
+        self._cpu_in_use = max(0.0, self._cpu_in_use - job.cpu)
+        _decrement(self._engagement_running, job.engagement_id)
+        _decrement(self._tool_running, job.tool)
+        # Idle agents at or behind the virtual clock would restart there anyway
+        for agent_id in [a for a, t in self._vtime.items() if t <= self._vclock and a not in self._queues]:
+            del self._vtime[agent_id]
+        self._dispatch()
+
+    @staticmethod
+    def _unavailable(reason: str, start_time: float) -> ToolResult:
+        return ToolResult(
+            success=False,
+            stdout="",
+            stderr=f"Execution unavailable: {reason}",
+            exit_code=-1,
+            duration_ms=int((time.perf_counter() - start_time) * 1000),
+            error_type="POOL_EXHAUSTED",
+        )
@@ -5,11 +5,15 @@ Manages running multiple tools concurrently, aggregating results,
 and providing unified access to all tool adapters.
 """
 import asyncio
+import dataclasses
 import logging
-from typing import Dict, List, Any, Optional, Type
+from typing import Callable, Dict, Hashable, List, Any, Optional, Type, Union
 from dataclasses import dataclass
 
 from cyberred.core.worker_pool import WorkerPool
+from cyberred.core.blob_store import BlobStore
+from cyberred.core.result_cache import ResultCache
+from cyberred.core.scheduler import DEFAULT_ENGAGEMENT, ExecutionScheduler, ToolProfile
 from cyberred.core.kill_chain import Phase
 from cyberred.mcp.base_adapter import BaseToolAdapter, ToolResult
 from cyberred.mcp.nmap_adapter import NmapAdapter
@@ -55,11 +59,34 @@ class ToolOrchestrator:
         "masscan": ToolConfig(MasscanAdapter, 300.0, 2, requires_ip=True),
     }
     
-    def __init__(self, worker_pool: WorkerPool, event_bus=None):
+    def __init__(
+        self,
+        worker_pool: Union[ExecutionScheduler, WorkerPool],
+        event_bus=None,
+        tool_profiles: Optional[Dict[str, ToolProfile]] = None,
+        result_cache: Optional[ResultCache] = None,
+        engagement_id: str = DEFAULT_ENGAGEMENT,
+        scope_version: Callable[[], Hashable] = lambda: 0,
+        blob_store: Optional[BlobStore] = None,
+    ):
         self.worker_pool = worker_pool
         self.bus = event_bus
         self.logger = logging.getLogger("ToolOrchestrator")
         
+        # Repeated runs of idempotent recon tools (e.g. GhostAgent's
+        # nmap/nuclei fallback) are served from the cache with their findings
+        self.result_cache = result_cache
+        self.engagement_id = engagement_id
+        self._scope_version = scope_version
+        
+        # Full raw outputs go to the blob store; results keep a preview
+        self.blob_store = blob_store
+        
+        # Per-tool resource profiles drive the scheduler's admission
+        if isinstance(worker_pool, ExecutionScheduler):
+            for tool_name, profile in (tool_profiles or {}).items():
+                worker_pool.set_profile(tool_name, profile)
+        
         # Initialize adapters
         self.adapters: Dict[str, BaseToolAdapter] = {}
         self._init_adapters()
@@ -75,7 +102,8 @@ class ToolOrchestrator:
                     self.worker_pool,
                     retries=config.default_retries,
                     timeout=config.default_timeout,
-                    event_bus=self.bus
+                    event_bus=self.bus,
+                    blob_store=self.blob_store
                 )
                 self.adapters[tool_name] = adapter
                 self.logger.debug(f"Initialized adapter: {tool_name}")
@@ -111,6 +139,17 @@ class ToolOrchestrator:
                 execution_time=0.0
             )
         
+        cache_key = self._cache_key(adapter, target, options)
+        if cache_key is not None:
+            cached = self.result_cache.get(self.engagement_id, cache_key)
+            # A result whose stored output was evicted is run again
+            if cached is not None and (
+                cached.output_ref is None or self.blob_store is None
+                or cached.output_ref in self.blob_store
+            ):
+                self.logger.info(f"Cached {tool_name} result for {target}")
+                return dataclasses.replace(cached, cached=True)
+        
         self.logger.info(f"Running {tool_name} against {target}")
         
         if self.bus:
@@ -120,6 +159,8 @@ class ToolOrchestrator:
             })
         
         result = await adapter.execute(target, **options)
+        if cache_key is not None and result.success:
+            self.result_cache.put(self.engagement_id, cache_key, result)
         
         if self.bus:
             await self.bus.publish("orchestrator:tool_complete", {
@@ -130,6 +171,17 @@ class ToolOrchestrator:
         
         return result
     
+    def _cache_key(self, adapter: BaseToolAdapter, target: str, options: Dict[str, Any]):
+        """Cache key of a run, or None if the tool is not cached."""
+        if self.result_cache is None or not self.result_cache.cacheable(adapter.tool_name):
+            return None
+        return self.result_cache.key(
+            adapter.tool_name,
+            adapter.build_command(target, **options),
+            [target],
+            self._scope_version()
+        )
+    
     async def run_parallel(self, target: str, tools: List[str], 
                           **shared_options) -> List[ToolResult]:
         """
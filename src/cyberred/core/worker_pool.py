@@ -2,8 +2,13 @@ import asyncio
 import logging
 import shlex
 import os
-from typing import Optional, Dict, Any
+import time
+from typing import Callable, Optional, Dict, Any
 from cyberred.core.event_bus import EventBus
+from cyberred.core.exceptions import ExecChannelError
+from cyberred.core.exec_channel import ExecChannel, OutputCallback
+from cyberred.core.models import ToolResult
+from cyberred.core.retry import TRANSIENT, RetryPolicy, classify_result
 
 
 class WorkerPool:
@@ -12,13 +17,22 @@ class WorkerPool:
     
     This replaces the fake implementation that always used worker-1.
     Now properly distributes work across all available Docker containers.
+    Commands run through one persistent ExecChannel per container, falling
+    back to a `docker exec` per command where the agent cannot start.
+    
+    Implements ExecutionBackendProtocol, so an ExecutionScheduler can
+    dispatch jobs to it through run().
     """
     
+    backend_name = "worker_pool"
+    
     def __init__(self, event_bus: EventBus = None, pool_size: int = 10, 
-                 container_prefix: str = "red-kali-worker"):
+                 container_prefix: str = "red-kali-worker",
+                 retry_policy: Optional[RetryPolicy] = None):
         self.bus = event_bus
         self.pool_size = pool_size
         self.container_prefix = container_prefix
+        self.retry_policy = retry_policy or RetryPolicy()
         self.logger = logging.getLogger("WorkerPool")
         
         # TRUE work-stealing queue - workers are added when free
@@ -31,6 +45,10 @@ class WorkerPool:
         self._initialized = False
         self._init_lock = asyncio.Lock()
         
+        # Persistent exec channels, and containers where the agent failed
+        self._channels: Dict[str, ExecChannel] = {}
+        self._no_channel: set = set()
+        
     async def initialize(self):
         """Initialize the worker pool - must be called before first use."""
         async with self._init_lock:
@@ -66,6 +84,52 @@ class WorkerPool:
                     "message": f"Worker pool ready: {available_count} containers"
                 })
 
+    @property
+    def capacity(self) -> int:
+        """Jobs that can run at once (one per discovered worker)."""
+        if self._initialized:
+            return len(self.worker_states)
+        return self.pool_size
+
+    async def run(self, command: str, timeout: float = 300.0,
+                  on_output: Optional[OutputCallback] = None) -> ToolResult:
+        """
+        Run a command once on a free worker (ExecutionBackendProtocol).
+        
+        Unlike execute_task() there are no retries and no terminal events:
+        failures come back as ToolResult with an error_type.
+        """
+        start_time = time.perf_counter()
+        if not self._initialized:
+            await self.initialize()
+        
+        container_id = await self.acquire_worker(timeout=timeout)
+        if not container_id:
+            return ToolResult(
+                success=False,
+                stdout="",
+                stderr="No workers available (timeout)",
+                exit_code=-1,
+                duration_ms=int((time.perf_counter() - start_time) * 1000),
+                error_type="POOL_EXHAUSTED"
+            )
+        try:
+            return await asyncio.wait_for(
+                self._run_job(container_id, command, on_output),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return ToolResult(
+                success=False,
+                stdout="",
+                stderr=f"Execution timed out after {timeout}s",
+                exit_code=-1,
+                duration_ms=int((time.perf_counter() - start_time) * 1000),
+                error_type="TIMEOUT"
+            )
+        finally:
+            self.release_worker(container_id)
+
     async def _check_docker_access(self) -> bool:
         """Check if we can access Docker."""
         try:
@@ -152,15 +216,23 @@ class WorkerPool:
             })
 
     async def execute_task(self, command: str, tool: str, retries: int = 3, 
-                          timeout: float = 300.0) -> str:
+                          timeout: float = 300.0,
+                          on_output: Optional[OutputCallback] = None,
+                          on_retry: Optional[Callable[[], None]] = None) -> str:
         """
         Execute a command on an available worker.
         
+        Only transient failures are retried (see core.retry); deterministic
+        ones such as permission denied or usage errors fail fast.
+        
         Args:
             command: The CLI command to execute
             tool: Name of the tool (for logging)
-            retries: Number of retry attempts
+            retries: Attempts allowed, capped by the pool's RetryPolicy
             timeout: Command execution timeout
+            on_output: Called with ("stdout" | "stderr", bytes) chunks as
+                they arrive; stdout is then not returned (empty string)
+            on_retry: Called before each retry
             
         Returns:
             Command output or error string
@@ -186,91 +258,157 @@ class WorkerPool:
                 })
 
             
-            # Execute with retries
-            for attempt in range(retries):
+            # Execute with retries (transient failures only)
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                attempt += 1
                 try:
-                    result = await asyncio.wait_for(
-                        self._run_in_docker(container_id, command),
+                    job = await asyncio.wait_for(
+                        self._run_job(container_id, command, on_output),
                         timeout=timeout
                     )
-                    
-                    # strict check for execution error prefix
-                    if not result.startswith("ERROR:"):
-                        # Success - log output summary
-                        source = container_id.split("-")[-1]
-                        if self.bus:
-                            # Log a success indicator
-                            await self.bus.publish("swarm:terminal", {
-                                "source": source,
-                                "text": f"✓ [{tool}] Complete ({len(result)} bytes)"
-                            })
-                            # Log truncated output
-                            if len(result) > 300:
-                                await self.bus.publish("swarm:terminal", {
-                                    "source": source,
-                                    "text": result[:300] + f"... ({len(result)-300} more bytes)"
-                                })
-                            elif result.strip():
-                                await self.bus.publish("swarm:terminal", {
-                                    "source": source,
-                                    "text": result
-                                })
-                        return result
-                    
-                    # Error but not fatal - log and retry
-                    source = container_id.split("-")[-1]
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"Command timeout on attempt {attempt}/{retries}")
                     if self.bus:
                         await self.bus.publish("swarm:terminal", {
-                            "source": source,
-                            "text": f"✗ [{tool}] Attempt {attempt+1} failed: {result[:200]}"
+                            "source": container_id,
+                            "text": f"[TIMEOUT] Attempt {attempt}/{retries}"
                         })
-
-                    
-                    # Fail fast on permission denied
-                    if "permission denied" in result.lower() and "dial unix" in result.lower():
-                        return "ERROR: Docker socket permission denied. Run with sudo."
-                    
-                except asyncio.TimeoutError:
-                    self.logger.warning(f"Command timeout on attempt {attempt + 1}/{retries}")
+                    job = ToolResult(False, "", f"Timeout after {timeout}s", -1,
+                                     int(timeout * 1000), "TIMEOUT")
+                
+                source = container_id.split("-")[-1]
+                if job.success:
+                    result = job.stdout
+                    # Success - log output summary
                     if self.bus:
+                        # Log a success indicator
                         await self.bus.publish("swarm:terminal", {
-                            "source": container_id,
-                            "text": f"[TIMEOUT] Attempt {attempt + 1}/{retries}"
+                            "source": source,
+                            "text": f"✓ [{tool}] Complete ({len(result)} bytes)"
                         })
+                        # Log truncated output
+                        if len(result) > 300:
+                            await self.bus.publish("swarm:terminal", {
+                                "source": source,
+                                "text": result[:300] + f"... ({len(result)-300} more bytes)"
+                            })
+                        elif result.strip():
+                            await self.bus.publish("swarm:terminal", {
+                                "source": source,
+                                "text": result
+                            })
+                    return result
                 
-                except Exception as e:
-                    self.logger.error(f"Execution error: {e}")
+                if self.bus and job.error_type != "TIMEOUT":
+                    await self.bus.publish("swarm:terminal", {
+                        "source": source,
+                        "text": f"✗ [{tool}] Attempt {attempt} failed: {job.stderr[:200]}"
+                    })
                 
-                # Wait before retry
-                if attempt < retries - 1:
-                    await asyncio.sleep(1)
+                # Fail fast on permission denied
+                if "permission denied" in job.stderr.lower() and "dial unix" in job.stderr.lower():
+                    return "ERROR: Docker socket permission denied. Run with sudo."
+                
+                if classify_result(job) != TRANSIENT or not self.retry_policy.should_retry(
+                        attempt, time.monotonic() - started, retries):
+                    break
+                if on_retry is not None:
+                    on_retry()
+                await asyncio.sleep(self.retry_policy.delay(attempt))
             
-            return f"ERROR: Task failed after {retries} retries. Last error: {result if 'result' in locals() else 'Unknown'}"
+            return f"ERROR: Task failed after {attempt} attempt(s). Last error: {job.stderr}"
             
         finally:
             # Always release the worker
             self.release_worker(container_id)
 
-    async def _run_in_docker(self, container_id: str, command: str) -> str:
+    async def _get_channel(self, container_id: str) -> Optional[ExecChannel]:
+        """Get (or start) the exec channel for a container, None if unavailable."""
+        channel = self._channels.get(container_id)
+        if channel is not None and channel.alive:
+            return channel
+        if container_id in self._no_channel:
+            return None
+        channel = ExecChannel(container_id)
+        try:
+            await channel.start()
+        except ExecChannelError as e:
+            self.logger.warning(f"Exec channel unavailable for {container_id}, using docker exec: {e.reason}")
+            self._no_channel.add(container_id)
+            return None
+        self._channels[container_id] = channel
+        return channel
+
+    async def _run_in_docker(self, container_id: str, command: str,
+                             on_output: Optional[OutputCallback] = None) -> str:
         """Execute a command inside a Docker container."""
+        result = await self._run_job(container_id, command, on_output)
+        if not result.success:
+            return f"ERROR: {result.stderr}"
+        return result.stdout
+
+    async def _run_job(self, container_id: str, command: str,
+                       on_output: Optional[OutputCallback] = None) -> ToolResult:
+        """Execute a command inside a Docker container, as a ToolResult."""
+        start_time = time.perf_counter()
+        error_type = "EXECUTION_EXCEPTION"
         try:
-            # Safe execution using list args (no shell injection risks)
-            args = ["/usr/bin/docker", "exec", container_id] + shlex.split(command)
-            
-            proc = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await proc.communicate()
-            
-            if proc.returncode != 0:
-                return f"ERROR: {stderr.decode()}"
-            return stdout.decode()
+            argv = shlex.split(command)
+            channel = await self._get_channel(container_id)
+            if channel is not None:
+                # Cancellation (execute_task timeout) kills the job in the container
+                job = await channel.run(
+                    argv, on_output=on_output, capture_stdout=on_output is None
+                )
+                exit_code, stdout, stderr = job.exit_code, job.stdout, job.stderr
+            else:
+                # Safe execution using list args (no shell injection risks)
+                args = ["/usr/bin/docker", "exec", container_id] + argv
+                
+                proc = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await proc.communicate()
+                exit_code = proc.returncode
+                if on_output is not None and stdout:
+                    # docker exec fallback cannot stream: deliver everything at once
+                    on_output("stdout", stdout)
+                    stdout = b""
         except OSError as e:
-            return f"ERROR: OS Error {e}"
+            stderr_text = f"OS Error {e}"
+        except ExecChannelError as e:
+            error_type = "CONTAINER_CRASHED"
+            stderr_text = f"Exception {e}"
         except Exception as e:
-            return f"ERROR: Exception {e}"
+            stderr_text = f"Exception {e}"
+        else:
+            return ToolResult(
+                success=exit_code == 0,
+                stdout=stdout.decode(errors="replace"),
+                stderr=stderr.decode(errors="replace"),
+                exit_code=exit_code,
+                duration_ms=int((time.perf_counter() - start_time) * 1000),
+                error_type=None if exit_code == 0 else "NON_ZERO_EXIT"
+            )
+        return ToolResult(
+            success=False,
+            stdout="",
+            stderr=stderr_text,
+            exit_code=-1,
+            duration_ms=int((time.perf_counter() - start_time) * 1000),
+            error_type=error_type
+        )
+
+    async def shutdown(self):
+        """Close all exec channels."""
+        channels = list(self._channels.values())
+        self._channels.clear()
+        self._no_channel.clear()
+        await asyncio.gather(*(c.close() for c in channels), return_exceptions=True)
 
     async def execute_parallel(self, commands: list, tool: str = "parallel") -> list:
         """
@@ -1,7 +1,7 @@
 """Redis-backed intelligence cache."""
 
 import structlog
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
 import json
 from dataclasses import asdict
 from datetime import datetime
@@ -119,34 +119,81 @@ class IntelligenceCache:
             
             # Deserialize JSON
             try:
-                cache_entry = json.loads(data)
+                results, cached_at = self._decode(data)
             except json.JSONDecodeError as e:
                 log.warning("cache_corrupt", key=key, error=str(e))
                 await self._delete_key(key)
                 return None, None
             
-            # Handle legacy format (list of results without wrapper)
-            if isinstance(cache_entry, list):
-                results = [IntelResult.from_json(r) for r in cache_entry]
-                if not use_archive:
-                    log.debug("cache_hit_legacy", service=service, version=version, 
-                             result_count=len(results))
-                return results, None
-            
-            # Handle new format (dict with results and cached_at)
-            results_data = cache_entry.get("results", [])
-            results = [IntelResult.from_json(r) for r in results_data]
-            cached_at = cache_entry.get("cached_at")
-            
             if not use_archive:
-                log.debug("cache_hit", service=service, version=version, 
-                         result_count=len(results))
+                # Legacy entries (list of results without wrapper) have no cached_at
+                log.debug("cache_hit" if cached_at else "cache_hit_legacy", service=service,
+                          version=version, result_count=len(results))
             return results, cached_at
             
         except Exception as e:
             log.warning("cache_get_error", key=key, error=str(e))
             return None, None
 
+    async def get_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], Optional[List[IntelResult]]]:
+        """Get cached results for several service/version pairs at once.
+        
+        One MGET round trip for the whole batch instead of a GET per pair.
+        
+        Args:
+            pairs: (service, version) pairs; duplicates are looked up once.
+            
+        Returns:
+            Dict of pair -> results, None for a miss, corrupt entry or error.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+        keys = [self._make_key(service, version) for service, version in pairs]
+        
+        try:
+            values = await self._redis.mget(*keys)
+        except Exception as e:
+            log.warning("cache_get_many_error", count=len(keys), error=str(e))
+            return {pair: None for pair in pairs}
+        
+        found: Dict[Tuple[str, str], Optional[List[IntelResult]]] = {}
+        for pair, key, data in zip(pairs, keys, values):
+            found[pair] = None
+            if data is None:
+                continue
+            try:
+                found[pair], _ = self._decode(data)
+            except json.JSONDecodeError as e:
+                log.warning("cache_corrupt", key=key, error=str(e))
+                await self._delete_key(key)
+            except Exception as e:
+                log.warning("cache_get_error", key=key, error=str(e))
+        
+        log.debug("cache_get_many", count=len(pairs),
+                  hits=sum(results is not None for results in found.values()))
+        return found
+
+    @staticmethod
+    def _decode(data: str) -> Tuple[List[IntelResult], Optional[str]]:
+        """Deserialize a cache entry into (results, cached_at).
+        
+        Raises:
+            json.JSONDecodeError: If the entry is not valid JSON.
+        """
+        cache_entry = json.loads(data)
+        
+        # Handle legacy format (list of results without wrapper)
+        if isinstance(cache_entry, list):
+            return [IntelResult.from_json(r) for r in cache_entry], None
+        
+        # Handle new format (dict with results and cached_at)
+        results_data = cache_entry.get("results", [])
+        return [IntelResult.from_json(r) for r in results_data], cache_entry.get("cached_at")
+
     async def _delete_key(self, key: str) -> int:
         """Delete a specific cache key.
         
@@ -2,18 +2,24 @@
 Base Tool Adapter - Abstract base class for all security tool adapters.
 
 Provides:
-- Common error handling with retries
+- Common error handling (retries live in the worker pool's retry layer)
 - Output parsing interface
+- Streaming, line-by-line parsing for adapters that implement parse_line()
+- Optional blob storage of raw output (results keep a preview and a hash)
 - Standardized result format
 - Logging and event bus integration
 """
 from abc import ABC, abstractmethod
 import asyncio
+import json
 import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 import time
 
+from cyberred.core.blob_store import BlobStore, BlobWriter, RawOutput
+from cyberred.core.output_stream import LineStream
+
 
 @dataclass
 class ToolResult:
@@ -27,6 +33,9 @@ class ToolResult:
     errors: List[str]
     execution_time: float
     command: str = ""
+    cached: bool = False  # Served from the result cache
+    # Blob digest of the full raw output; raw_output is then a preview
+    output_ref: Optional[str] = None
     
     @property
     def has_findings(self) -> bool:
@@ -50,35 +59,158 @@ class ToolResult:
             "success": self.success,
             "command": self.command,
             "execution_time": self.execution_time,
+            "cached": self.cached,
+            "output_ref": self.output_ref,
             "findings_count": len(self.findings),
             "findings": self.findings,
             "errors": self.errors
         }
 
 
+class _LineCollector:
+    """Parses streamed stdout with an adapter's parse_line() as it arrives.
+    
+    With a blob store, the full stdout is also written to a blob as it
+    arrives, since only its tail is kept in memory.
+    
+    Findings published to swarm:finding are remembered across reset(), so
+    a retried attempt that parses them again does not publish them twice.
+    """
+    
+    def __init__(self, adapter: "BaseToolAdapter"):
+        self._adapter = adapter
+        self._pending: set = set()
+        self._published: set = set()
+        self._writer: Optional[BlobWriter] = None
+        self.reset()
+    
+    def reset(self):
+        """Start over (called at the beginning of every attempt).
+        
+        Published findings are kept: they have already left the adapter.
+        """
+        self._lines = LineStream(max_tail=self._adapter.max_raw_output)
+        self.records: List[Dict[str, Any]] = []
+        self.findings: List[Dict[str, Any]] = []
+        self.discard()
+        if self._adapter.blob_store is not None:
+            try:
+                self._writer = self._adapter.blob_store.writer()
+            except OSError as e:
+                self._adapter.logger.warning(f"Raw output not stored: {e}")
+    
+    def discard(self):
+        """Drop the output stored so far (failed or retried attempt)."""
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+    
+    def feed(self, stream: str, data: bytes):
+        """on_output callback for WorkerPool.execute_task()."""
+        if stream != "stdout":
+            return
+        if self._writer is not None:
+            try:
+                self._writer.write(data)
+            except OSError as e:
+                self._adapter.logger.warning(f"Raw output not stored: {e}")
+                self.discard()
+        for line in self._lines.feed(data):
+            self._parse(line)
+    
+    def _parse(self, line: str):
+        adapter = self._adapter
+        try:
+            record = adapter.parse_line(line)
+            if record is None:
+                return
+            findings = adapter.extract_findings({adapter.stream_records_key: [record]})
+        except Exception as e:
+            adapter.logger.warning(f"Stream parse error: {e}")
+            return
+        self.records.append(record)
+        self.findings.extend(findings)
+        if adapter.bus:
+            # Publish each finding as soon as it is parsed, once per run
+            for finding in findings:
+                key = json.dumps(finding, sort_keys=True, default=str)
+                if key in self._published:
+                    continue
+                self._published.add(key)
+                task = asyncio.get_running_loop().create_task(adapter.bus.publish("swarm:finding", {
+                    "tool": adapter.tool_name,
+                    "finding": finding
+                }))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+    
+    async def finish(self):
+        """Flush the last line, wait for pending publishes and store the output.
+        
+        Returns:
+            (raw output tail, parsed_data, findings, output_ref)
+        """
+        for line in self._lines.finish():
+            self._parse(line)
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        parsed = {
+            self._adapter.stream_records_key: self.records,
+            "total_count": len(self.records)
+        }
+        output_ref = None
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            try:
+                output_ref = await asyncio.to_thread(writer.close)
+            except OSError as e:
+                self._adapter.logger.warning(f"Raw output not stored: {e}")
+        return self._lines.tail, parsed, self.findings, output_ref
+
+
 class BaseToolAdapter(ABC):
     """
     Abstract base class for all tool adapters.
     
     Provides common functionality for executing security tools,
     parsing output, handling errors, and standardizing results.
+    
+    Adapters whose output is one record per line can set
+    stream_records_key and implement parse_line(): output is then parsed
+    while the tool runs, findings are published to swarm:finding as soon
+    as they are parsed, and only the last max_raw_output characters are
+    kept as raw_output.
+    
+    With a blob_store, the full raw output of a successful run is written
+    to the store and the result keeps the blob's output_ref plus only the
+    first max_raw_output bytes as raw_output (the last max_raw_output
+    characters for streamed runs, which are stored as they arrive).
     """
     
+    # parsed_data key holding streamed records (None = no streaming)
+    stream_records_key: Optional[str] = None
+    
+    # Characters of raw output kept for streamed runs (bytes of preview
+    # kept when the full output goes to the blob store)
+    max_raw_output: int = 65536
+    
     def __init__(self, worker_pool, retries: int = 3, timeout: float = 300.0,
-                 event_bus=None):
+                 event_bus=None, blob_store: Optional[BlobStore] = None):
         """
         Initialize the adapter.
         
         Args:
-            worker_pool: WorkerPool instance for container execution
+            worker_pool: ExecutionScheduler (or WorkerPool) for container execution
             retries: Number of retry attempts on failure
             timeout: Command execution timeout in seconds
             event_bus: Optional EventBus for publishing status updates
+            blob_store: Optional BlobStore for the full raw output
         """
         self.worker_pool = worker_pool
         self.retries = retries
         self.timeout = timeout
         self.bus = event_bus
+        self.blob_store = blob_store
         self.logger = logging.getLogger(self.__class__.__name__)
     
     @property
@@ -119,6 +251,23 @@ class BaseToolAdapter(ABC):
         """
         pass
     
+    def parse_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse one line of streamed output into a record.
+        
+        Override together with stream_records_key to enable streaming.
+        extract_findings() is called with {stream_records_key: [record]}.
+        
+        Returns:
+            Parsed record, or None to skip the line (the default)
+        """
+        return None
+    
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether output is parsed line by line while the tool runs."""
+        return self.stream_records_key is not None
+    
     def extract_findings(self, parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract security findings from parsed data.
@@ -143,6 +292,29 @@ class BaseToolAdapter(ABC):
         """
         return bool(target and target.strip())
     
+    async def _retain_output(self, output: str, collector: Optional[_LineCollector] = None,
+                             output_ref: Optional[str] = None) -> tuple:
+        """
+        Store the full raw output and return (raw_output, output_ref).
+        
+        Streamed runs (with a collector) were stored while they ran: their
+        output is the tail and is kept as is, with the collector's
+        output_ref (None if it was not stored). Without a blob store (or
+        if storing fails) the output is kept as is.
+        """
+        if collector is not None:
+            collector.discard()
+            return output, output_ref
+        if self.blob_store is None:
+            return output, None
+        raw = RawOutput(output.encode("utf-8"))
+        try:
+            output_ref = await asyncio.to_thread(self.blob_store.put, raw.data)
+        except OSError as e:
+            self.logger.warning(f"Raw output not stored: {e}")
+            return output, None
+        return raw.preview(self.max_raw_output), output_ref
+    
     async def execute(self, target: str, **options) -> ToolResult:
         """
         Execute the tool with full error handling and retry logic.
@@ -185,14 +357,20 @@ class BaseToolAdapter(ABC):
                 "target": target
             })
         
-        result = await self._execute_with_retry(command)
+        collector = _LineCollector(self) if self.supports_streaming else None
+        result = await self._execute_with_retry(command, collector)
         execution_time = time.time() - start_time
         
         # Parse output if successful
         if "ERROR:" not in result:
+            output_ref = None
             try:
-                parsed = self.parse_output(result)
-                findings = self.extract_findings(parsed)
+                if collector is not None:
+                    # Already parsed (and stored) while streaming
+                    result, parsed, findings, output_ref = await collector.finish()
+                else:
+                    parsed = self.parse_output(result)
+                    findings = self.extract_findings(parsed)
                 
                 # Log completion to terminal stream
                 if self.bus:
@@ -213,30 +391,36 @@ class BaseToolAdapter(ABC):
                         "findings_count": len(findings)
                     })
                 
+                raw_output, output_ref = await self._retain_output(result, collector, output_ref)
                 return ToolResult(
                     tool_name=self.tool_name,
                     success=True,
-                    raw_output=result,
+                    raw_output=raw_output,
                     parsed_data=parsed,
                     findings=findings,
                     errors=[],
                     execution_time=execution_time,
-                    command=command
+                    command=command,
+                    output_ref=output_ref
                 )
             except Exception as e:
                 self.logger.error(f"Parse error: {e}")
+                raw_output, output_ref = await self._retain_output(result, collector, output_ref)
                 return ToolResult(
                     tool_name=self.tool_name,
                     success=True,  # Command succeeded, parsing failed
-                    raw_output=result,
+                    raw_output=raw_output,
                     parsed_data={},
                     findings=[],
                     errors=[f"Parse error: {str(e)}"],
                     execution_time=execution_time,
-                    command=command
+                    command=command,
+                    output_ref=output_ref
                 )
         
         # Command failed - log to terminal
+        if collector is not None:
+            collector.discard()
         if self.bus:
             await self.bus.publish("swarm:terminal", {
                 "source": self.tool_name.upper(),
@@ -264,36 +448,26 @@ class BaseToolAdapter(ABC):
         )
 
     
-    async def _execute_with_retry(self, command: str) -> str:
-        """Execute command with retry logic."""
-        last_error = ""
-        
-        for attempt in range(self.retries):
-            try:
-                result = await asyncio.wait_for(
-                    self.worker_pool.execute_task(command, self.tool_name),
-                    timeout=self.timeout
-                )
-                
-                if "ERROR:" not in result:
-                    return result
-                
-                last_error = result
-                self.logger.warning(f"Attempt {attempt + 1}/{self.retries} failed: {result[:100]}")
-                
-            except asyncio.TimeoutError:
-                last_error = f"ERROR: Timeout after {self.timeout}s"
-                self.logger.warning(f"Attempt {attempt + 1}/{self.retries} timed out")
-                
-            except Exception as e:
-                last_error = f"ERROR: {str(e)}"
-                self.logger.error(f"Attempt {attempt + 1}/{self.retries} exception: {e}")
-            
-            # Wait before retry (exponential backoff)
-            if attempt < self.retries - 1:
-                await asyncio.sleep(2 ** attempt)
+    async def _execute_with_retry(self, command: str,
+                                  collector: Optional[_LineCollector] = None) -> str:
+        """Execute command through the worker pool's retry layer.
         
-        return last_error
+        Retrying happens in one place (ExecutionScheduler.execute_task or
+        WorkerPool.execute_task, see core.retry): this adapter only sets
+        the attempt limit. With a collector, stdout is streamed into it
+        and the collector is reset before each retry.
+        """
+        kwargs = {}
+        if collector is not None:
+            collector.reset()
+            kwargs = {"on_output": collector.feed, "on_retry": collector.reset}
+        try:
+            return await self.worker_pool.execute_task(
+                command, self.tool_name, retries=self.retries, timeout=self.timeout, **kwargs
+            )
+        except Exception as e:
+            self.logger.error(f"Execution exception: {e}")
+            return f"ERROR: {str(e)}"
     
     async def quick_scan(self, target: str) -> ToolResult:
         """
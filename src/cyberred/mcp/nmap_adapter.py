@@ -8,6 +8,7 @@ service detection, and OS fingerprinting.
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Any
 from cyberred.mcp.base_adapter import BaseToolAdapter, ToolResult
+from cyberred.tools.parsers.nmap import iter_nmap_elements
 
 
 class NmapAdapter(BaseToolAdapter):
@@ -76,34 +77,34 @@ class NmapAdapter(BaseToolAdapter):
         return cmd
     
     def parse_output(self, raw_output: str) -> Dict[str, Any]:
-        """Parse nmap XML output into structured data."""
+        """
+        Parse nmap XML output into structured data.
+        
+        The XML is parsed host by host (see tools.parsers.nmap), so no tree
+        of the whole scan is built; hosts before a parse error are kept.
+        """
         result = {
             "hosts": [],
             "total_hosts": 0,
             "ports_scanned": 0
         }
         
+        scan_info_seen = False
         try:
-            root = ET.fromstring(raw_output)
-            
-            # Get scan info
-            scan_info = root.find('scaninfo')
-            if scan_info is not None:
-                result["ports_scanned"] = scan_info.get('numservices', '0')
-            
-            # Parse each host
-            for host_elem in root.findall('host'):
-                host_data = self._parse_host(host_elem)
-                if host_data:
-                    result["hosts"].append(host_data)
-            
-            result["total_hosts"] = len(result["hosts"])
-            
+            for elem in iter_nmap_elements(raw_output):
+                if elem.tag == 'scaninfo' and not scan_info_seen:
+                    scan_info_seen = True
+                    result["ports_scanned"] = elem.get('numservices', '0')
+                elif elem.tag == 'host':
+                    host_data = self._parse_host(elem)
+                    if host_data:
+                        result["hosts"].append(host_data)
         except ET.ParseError as e:
             self.logger.error(f"XML Parse Error: {e}")
         except Exception as e:
             self.logger.error(f"Parse Error: {e}")
         
+        result["total_hosts"] = len(result["hosts"])
         return result
     
     def _parse_host(self, host_elem) -> Dict[str, Any]:
@@ -5,7 +5,7 @@ Nuclei is a fast, customizable vulnerability scanner based on
 community-maintained templates for detecting security issues.
 """
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from cyberred.mcp.base_adapter import BaseToolAdapter, ToolResult
 
 
@@ -14,9 +14,12 @@ class NucleiAdapter(BaseToolAdapter):
     Adapter for the Nuclei vulnerability scanner.
     
     Nuclei uses YAML-based templates to detect vulnerabilities,
-    misconfigurations, exposed panels, and more.
+    misconfigurations, exposed panels, and more. JSONL output is
+    parsed line by line while the scan runs.
     """
     
+    stream_records_key = "vulnerabilities"
+    
     @property
     def tool_name(self) -> str:
         return "nuclei"
@@ -62,19 +65,24 @@ class NucleiAdapter(BaseToolAdapter):
         
         return cmd
     
+    def parse_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Parse one JSON line of nuclei output (None for other lines)."""
+        if not line:
+            return None
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            # Skip non-JSON lines (status messages, etc.)
+            return None
+    
     def parse_output(self, raw_output: str) -> Dict[str, Any]:
         """Parse JSON lines output from nuclei."""
         vulnerabilities = []
         
         for line in raw_output.strip().split('\n'):
-            if not line:
-                continue
-            try:
-                vuln = json.loads(line)
+            vuln = self.parse_line(line)
+            if vuln is not None:
                 vulnerabilities.append(vuln)
-            except json.JSONDecodeError:
-                # Skip non-JSON lines (status messages, etc.)
-                continue
         
         return {
             "vulnerabilities": vulnerabilities,
@@ -8,6 +8,7 @@ Protocols:
     AgentProtocol: Interface for all Cyber-Red agents.
     StorageProtocol: Interface for storage backends.
     LLMProviderProtocol: Interface for LLM providers.
+    ExecutionBackendProtocol: Interface for container execution backends.
 
 Usage:
     from cyberred.protocols import AgentProtocol, StorageProtocol, LLMProviderProtocol
@@ -21,9 +22,11 @@ from __future__ import annotations
 from cyberred.protocols.agent import AgentProtocol
 from cyberred.protocols.storage import StorageProtocol
 from cyberred.protocols.provider import LLMProviderProtocol
+from cyberred.protocols.execution import ExecutionBackendProtocol
 
 __all__ = [
     "AgentProtocol",
     "StorageProtocol",
     "LLMProviderProtocol",
+    "ExecutionBackendProtocol",
 ]
@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 from cyberred.core.models import ToolResult
 
 class ContainerProtocol(ABC):
     @abstractmethod
-    async def execute(self, code: str, timeout: int = 30) -> ToolResult:
-        """Execute a command in the container."""
+    async def execute(
+        self,
+        code: str,
+        timeout: int = 30,
+        on_output: Optional[Callable[[str, bytes], None]] = None,
+    ) -> ToolResult:
+        """Execute a command in the container.
+
+        When on_output is given, output chunks are passed to it as
+        ("stdout" | "stderr", data) while the command runs, and stdout is
+        not retained in the returned ToolResult.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,73 @@
+"""Execution backend protocol for Cyber-Red.
+
+This module defines the ExecutionBackendProtocol interface implemented by
+the container backends that ExecutionScheduler dispatches jobs to
+(core.worker_pool.WorkerPool and tools.container_pool.ContainerPool).
+Uses `typing.Protocol` for structural subtyping.
+
+Usage:
+    from cyberred.protocols import ExecutionBackendProtocol
+
+    pool = WorkerPool()
+    assert isinstance(pool, ExecutionBackendProtocol)
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Protocol, runtime_checkable
+
+from cyberred.core.models import ToolResult
+
+
+@runtime_checkable
+class ExecutionBackendProtocol(Protocol):
+    """Protocol for backends that run commands in Kali containers.
+
+    The scheduler decides when a job runs; the backend decides where.
+    A backend must be able to run ``capacity`` jobs at once without
+    blocking for long in run().
+
+    Attributes:
+        backend_name: Short name used in logs and metrics.
+        capacity: Jobs the backend can run concurrently right now.
+
+    Note:
+        Implementations do NOT need to inherit from this class.
+    """
+
+    backend_name: str
+
+    @property
+    def capacity(self) -> int:
+        """Jobs the backend can run concurrently."""
+        ...
+
+    async def initialize(self) -> None:
+        """Prepare the backend (discover or start containers)."""
+        ...
+
+    async def run(
+        self,
+        command: str,
+        timeout: float,
+        on_output: Optional[Callable[[str, bytes], None]] = None,
+    ) -> ToolResult:
+        """Run one command in a container.
+
+        Per ERR1, tool failures are returned as ToolResult with
+        success=False and an error_type, not raised.
+
+        Args:
+            command: Command line to run.
+            timeout: Seconds before the command is killed.
+            on_output: Called with ("stdout" | "stderr", data) chunks while
+                the command runs; stdout is then not retained.
+
+        Returns:
+            ToolResult of the command.
+        """
+        ...
+
+    async def shutdown(self) -> None:
+        """Release all backend resources."""
+        ...
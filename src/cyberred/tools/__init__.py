@@ -3,6 +3,8 @@
 This package contains the tool execution layer components including:
 - ScopeValidator: Hard-gate deterministic scope validation (FR20, FR21)
 - ScopeConfig: Configuration dataclass for scope definitions
+- ScopeBatchResult: Partitioned result of bulk scope validation
+- ScopeSnapshot: Immutable, versioned scope published by a validator
 
 Safety-Critical Components:
 - Scope validation is FAIL-CLOSED (deny on any error)
@@ -10,11 +12,12 @@ Safety-Critical Components:
 - Reserved IP ranges are ALWAYS blocked
 """
 
-from cyberred.tools.scope import ScopeValidator, ScopeConfig
+from cyberred.tools.scope import ScopeValidator, ScopeConfig, ScopeBatchResult, ScopeDenial, ScopeSnapshot
 from cyberred.tools.container_pool import ContainerPool, MockContainer, ContainerContext, RealContainer
+from cyberred.tools.container_autoscaler import ScalingPolicy
 from cyberred.tools.kali_executor import KaliExecutor, kali_execute, initialize_executor
 from cyberred.tools.manifest import ManifestLoader, ToolManifest
 from cyberred.tools.output import OutputProcessor, ProcessedOutput
 
-__all__ = ["ScopeValidator", "ScopeConfig", "ContainerPool", "MockContainer", "ContainerContext", "RealContainer", "KaliExecutor", "kali_execute", "initialize_executor", "ManifestLoader", "ToolManifest", "OutputProcessor", "ProcessedOutput"]
+__all__ = ["ScopeValidator", "ScopeConfig", "ScopeBatchResult", "ScopeDenial", "ScopeSnapshot", "ContainerPool", "ScalingPolicy", "MockContainer", "ContainerContext", "RealContainer", "KaliExecutor", "kali_execute", "initialize_executor", "ManifestLoader", "ToolManifest", "OutputProcessor", "ProcessedOutput"]
 
@@ -0,0 +1,455 @@
+"""Command Parser - Single-pass tokenizer and target extractor for scope checks.
+
+ScopeValidator used to scan a command three times: shlex.split() to check
+quote balance, a character state machine for injection detection, and a
+second shlex.split() plus freshly compiled regexes to find the target.
+This module does all of it in one pass:
+
+1. tokenize() walks the command once, producing POSIX shell words exactly
+   like shlex.split() while applying the injection rules per quoting
+   context.
+2. parse_command() walks the words once with the tool's ArgumentSchema and
+   collects every target, port spec and protocol (not just the last one).
+
+Argument schemas come from the ``arguments`` block of tools/manifest.yaml:
+
+    - name: nmap
+      arguments:
+        target_flags: []         # flag value is a target (URL/host)
+        port_flags: [-p]         # flag value is a port spec (80,443,1-1024)
+        value_flags: [-oX, -iL]  # flag consumes a value that is not a target
+
+Tools without a schema, and flags a schema does not mention, fall back to
+the original heuristics (-p is a port, -u is a URL, long flags swallow
+short/numeric values) plus one more: the word after an unknown short flag
+is its value (``-c 4``, ``-oX out.xml``, ``-P rockyou.txt``). A value or
+positional word only counts as a target if it is host-like: a URL, an
+IP address or network (including inet_aton forms such as ``0x7f.1``),
+or a DNS name that is not a file name. A flag
+value that is host-like is still a target, so ``nmap -sV evil.com`` is
+checked. Leading ``sudo``/``proxychains`` wrappers are skipped to find
+the tool.
+
+Usage:
+    from cyberred.tools.command_parser import load_argument_schemas, parse_command
+
+    schemas = load_argument_schemas("tools/manifest.yaml")
+    parsed = parse_command("nmap -p 80,443 -oX out.xml 10.0.0.1 10.0.0.2", schemas)
+    parsed.targets  # ["10.0.0.1", "10.0.0.2"]
+    parsed.ports    # [(80, 80), (443, 443)]
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from ipaddress import ip_address, ip_network
+from pathlib import Path
+from typing import Mapping, Optional, Union
+from urllib.parse import urlparse
+
+from cyberred.core.exceptions import ScopeViolationError
+from cyberred.tools.manifest import ManifestLoader
+
+# IPv4 (optionally CIDR) or IPv6-looking literal (at least one colon)
+IP_PATTERN = re.compile(
+    r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(?:/\d{1,2})?|"
+    r"[0-9a-fA-F]*:[0-9a-fA-F:]*(?:/\d{1,3})?)$"
+)
+
+# A DNS name of at least two labels with an alphabetic top-level label
+DNS_NAME_PATTERN = re.compile(
+    r"^(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}\.?$",
+    re.IGNORECASE,
+)
+
+# Dotted numeric/hex addresses inet_aton() accepts ("0x7f.1", "10.1"),
+# kept as targets so that validation denies them
+NUMERIC_HOST_PATTERN = re.compile(
+    r"^(?:0x[0-9a-f]+|\d+)(?:\.(?:0x[0-9a-f]+|\d+)){1,3}$", re.IGNORECASE
+)
+
+# Last labels that mark a word as a file name rather than a host
+# (real TLDs such as .sh, .py or .zip are deliberately not listed)
+FILE_EXTENSIONS = frozenset({
+    "bak", "cfg", "conf", "csv", "dic", "gnmap", "gz", "hash", "htm", "html",
+    "ini", "json", "key", "log", "lst", "nmap", "out", "pcap", "pcapng", "pem",
+    "pot", "tar", "tmp", "txt", "xml", "yaml", "yml",
+})
+
+# Wrappers that run the actual tool as their argument
+COMMAND_WRAPPERS = frozenset({"sudo", "proxychains", "proxychains4"})
+
+# URLs (any scheme: http://, ssh://, smb://, ...) whose authority is a target
+URL_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+
+# One item of a port spec: 80, 1-1024, T:80, U:53
+PORT_ITEM_PATTERN = re.compile(r"^(?:[TUS]:)?(\d{1,5})(?:-(\d{1,5}))?$")
+
+# Shell word separators (same set shlex uses)
+_WHITESPACE = frozenset(" \t\r\n")
+
+# Characters that are dangerous outside of quotes
+_UNQUOTED_DANGEROUS = frozenset(";|&`$()\n")
+
+
+@dataclass(frozen=True)
+class ArgumentSchema:
+    """How a tool's flags consume arguments.
+
+    Attributes:
+        target_flags: Flags whose value is a target (URL, host, IP).
+        port_flags: Flags whose value is a port spec.
+        value_flags: Flags whose value is neither (wordlists, output files).
+    """
+
+    target_flags: frozenset[str] = frozenset()
+    port_flags: frozenset[str] = frozenset()
+    value_flags: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, list[str]]) -> ArgumentSchema:
+        """Build a schema from a manifest ``arguments`` block."""
+        return cls(
+            target_flags=frozenset(data.get("target_flags", [])),
+            port_flags=frozenset(data.get("port_flags", [])),
+            value_flags=frozenset(data.get("value_flags", [])),
+        )
+
+
+# Behaviour for tools without a schema (the historical -p / -u handling)
+DEFAULT_SCHEMA = ArgumentSchema(
+    target_flags=frozenset({"-u"}),
+    port_flags=frozenset({"-p"}),
+)
+
+
+@dataclass
+class ParsedCommand:
+    """Everything scope-relevant extracted from a command.
+
+    Attributes:
+        tool: Basename of the executable (first word).
+        targets: Every target found, in order.
+        ports: Port intervals (start, end); single ports have start == end.
+        protocol: Protocol from a tcp:// or udp:// URL, if any.
+    """
+
+    tool: str = ""
+    targets: list[str] = field(default_factory=list)
+    ports: list[tuple[int, int]] = field(default_factory=list)
+    protocol: Optional[str] = None
+
+
+def load_argument_schemas(manifest_path: Union[str, Path]) -> dict[str, ArgumentSchema]:
+    """Load per-tool argument schemas from the tool manifest.
+
+    Args:
+        manifest_path: Path to tools/manifest.yaml.
+
+    Returns:
+        Mapping of tool name to ArgumentSchema for tools that define one.
+    """
+    loader = ManifestLoader(Path(manifest_path))
+    return {
+        tool.name: ArgumentSchema.from_dict(tool.arguments)
+        for tool in loader.load()
+        if tool.arguments
+    }
+
+
+def _parse_error(command: str, reason: str) -> ScopeViolationError:
+    return ScopeViolationError(
+        target="",
+        command=command,
+        scope_rule="parse_error",
+        message=f"Command parsing failed (unbalanced quotes?): {reason}",
+    )
+
+
+def tokenize(command: str) -> list[str]:
+    """Split a command into shell words and reject injection in one pass.
+
+    Word splitting matches shlex.split() (POSIX mode, no comments). The
+    injection rules are those of the hard gate:
+
+    - Single quotes: everything literal.
+    - Double quotes: ` and $ are rejected.
+    - Unquoted: ; | & ` $ ( ) and newline are rejected.
+    - A backslash outside single quotes escapes the next character.
+
+    Quote-balance errors take precedence over injection errors.
+
+    Args:
+        command: Normalized command string.
+
+    Returns:
+        List of shell words.
+
+    Raises:
+        ScopeViolationError: On unbalanced quotes or injection.
+    """
+    words: list[str] = []
+    word: list[str] = []
+    in_word = False
+    quote = ""
+    injection: Optional[ScopeViolationError] = None
+    i = 0
+    n = len(command)
+
+    while i < n:
+        char = command[i]
+
+        if quote == "'":
+            if char == "'":
+                quote = ""
+            else:
+                word.append(char)
+            i += 1
+            continue
+
+        if quote == '"':
+            if char == '"':
+                quote = ""
+            elif char == "\\":
+                if i + 1 >= n:
+                    raise _parse_error(command, "No escaped character")
+                escaped = command[i + 1]
+                # POSIX: only the quote and the backslash are escapable here
+                if escaped not in '"\\':
+                    word.append("\\")
+                word.append(escaped)
+                i += 2
+                continue
+            else:
+                if injection is None and char == "`":
+                    injection = ScopeViolationError(
+                        target="",
+                        command=command,
+                        scope_rule="injection_backtick_double_quote",
+                        message="Backtick execution detected in double quotes",
+                    )
+                elif injection is None and char == "$":
+                    injection = ScopeViolationError(
+                        target="",
+                        command=command,
+                        scope_rule="injection_dollar_double_quote",
+                        message="Variable/Command substitution ($) detected in double quotes",
+                    )
+                word.append(char)
+            i += 1
+            continue
+
+        # Unquoted context
+        if char == "\\":
+            if i + 1 >= n:
+                raise _parse_error(command, "No escaped character")
+            word.append(command[i + 1])
+            in_word = True
+            i += 2
+            continue
+
+        if injection is None and char in _UNQUOTED_DANGEROUS:
+            injection = ScopeViolationError(
+                target="",
+                command=command,
+                scope_rule=f"injection_unquoted_{char}",
+                message=f"Command injection detected: unquoted '{char}'",
+            )
+
+        if char in _WHITESPACE:
+            if in_word:
+                words.append("".join(word))
+                word = []
+                in_word = False
+        elif char == "'" or char == '"':
+            quote = char
+            in_word = True
+        else:
+            word.append(char)
+            in_word = True
+        i += 1
+
+    if quote:
+        raise _parse_error(command, "No closing quotation")
+    if injection is not None:
+        raise injection
+    if in_word:
+        words.append("".join(word))
+    return words
+
+
+def parse_port_spec(spec: str) -> list[tuple[int, int]]:
+    """Parse a port spec such as ``80,443,8000-8100,U:53``.
+
+    Unparseable items are ignored.
+
+    Args:
+        spec: Port specification.
+
+    Returns:
+        List of (start, end) intervals.
+    """
+    ports: list[tuple[int, int]] = []
+    for item in spec.split(","):
+        match = PORT_ITEM_PATTERN.match(item)
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else start
+            ports.append((start, end))
+    return ports
+
+
+def is_host_like(value: str) -> bool:
+    """Whether a word names a host: URL, IP/CIDR, DNS name or host:port.
+
+    Args:
+        value: Command word (flag value or positional argument).
+
+    Returns:
+        True if the word should be scope-checked as a target.
+    """
+    if URL_PATTERN.match(value):
+        return True
+    try:
+        ip_network(value, strict=False)
+        return True
+    except ValueError:
+        pass
+    host = value.split("/", 1)[0]
+    if host.count(":") == 1:
+        host = host.split(":", 1)[0]
+    try:
+        ip_address(host)
+        return True
+    except ValueError:
+        pass
+    if NUMERIC_HOST_PATTERN.match(host):
+        return True
+    return bool(DNS_NAME_PATTERN.match(host)) and (
+        host.rstrip(".").rsplit(".", 1)[-1].lower() not in FILE_EXTENSIONS
+    )
+
+
+def _add_target(parsed: ParsedCommand, value: str) -> None:
+    """Record a target value that may be a URL, IP/CIDR, host or host:port."""
+    if URL_PATTERN.match(value):
+        url = urlparse(value)
+        if url.hostname:
+            parsed.targets.append(url.hostname)
+        if url.port:
+            parsed.ports.append((url.port, url.port))
+        if url.scheme in ("tcp", "udp"):
+            parsed.protocol = url.scheme
+    elif IP_PATTERN.match(value):
+        parsed.targets.append(value)
+    elif ":" in value and value.count(":") == 1:
+        host_part, port_part = value.rsplit(":", 1)
+        parsed.targets.append(host_part)
+        if port_part.isdigit():
+            parsed.ports.append((int(port_part), int(port_part)))
+    else:
+        parsed.targets.append(value)
+
+
+def parse_command(
+    command: str,
+    schemas: Optional[Mapping[str, ArgumentSchema]] = None,
+) -> ParsedCommand:
+    """Tokenize a command and extract all targets, ports and protocol.
+
+    Args:
+        command: Normalized command string.
+        schemas: Per-tool argument schemas (see load_argument_schemas()).
+
+    Returns:
+        ParsedCommand with every extracted target.
+
+    Raises:
+        ScopeViolationError: On unbalanced quotes or injection.
+    """
+    words = tokenize(command)
+    parsed = ParsedCommand()
+    if not words:
+        return parsed
+
+    i = 0
+    while i < len(words) - 1 and (
+        words[i].rsplit("/", 1)[-1] in COMMAND_WRAPPERS
+        or (i > 0 and words[i].startswith("-"))
+    ):
+        i += 1
+    parsed.tool = words[i].rsplit("/", 1)[-1]
+    schema = (schemas or {}).get(parsed.tool)
+    count = len(words)
+    i += 1
+
+    while i < count:
+        arg = words[i]
+        has_next = i + 1 < count
+
+        if arg.startswith("-"):
+            flag, eq, inline = arg.partition("=")
+
+            # Tool schema first, then the default -p / -u handling
+            for active in (schema, DEFAULT_SCHEMA):
+                if active is None:
+                    continue
+                if flag in active.target_flags:
+                    kind = "target"
+                elif flag in active.port_flags:
+                    kind = "port"
+                elif flag in active.value_flags:
+                    kind = "value"
+                else:
+                    continue
+                break
+            else:
+                kind = ""
+
+            if kind:
+                if eq:
+                    value: Optional[str] = inline
+                    i += 1
+                elif has_next:
+                    value = words[i + 1]
+                    i += 2
+                else:
+                    value = None
+                    i += 1
+                if value is not None:
+                    if kind == "port":
+                        parsed.ports.extend(parse_port_spec(value))
+                    elif kind == "target" and (
+                        schema is not None or URL_PATTERN.match(value)
+                    ):
+                        # Without a schema only URLs after -u count as targets
+                        _add_target(parsed, value)
+                continue
+
+            # Unknown short flag: the next word is its value, and a target
+            # only if it names a host
+            if not arg.startswith("--") and not eq and has_next and not words[i + 1].startswith("-"):
+                if is_host_like(words[i + 1]):
+                    _add_target(parsed, words[i + 1])
+                i += 2
+                continue
+
+            # Unknown long flag: swallow a short or numeric value
+            if (
+                len(arg) > 2
+                and has_next
+                and not words[i + 1].startswith("-")
+                and (words[i + 1].isdigit() or len(words[i + 1]) <= 3)
+            ):
+                i += 2
+                continue
+            i += 1
+            continue
+
+        # Positional argument: URL, IP/CIDR, or a host name
+        if is_host_like(arg):
+            _add_target(parsed, arg)
+        i += 1
+
+    return parsed
@@ -0,0 +1,225 @@
+"""Output Compaction - fitting noisy tool output into a Tier 2 prompt.
+
+Tier 2 asks an LLM to extract findings from output no Tier 1 parser
+handles. A fixed-length cut spends the prompt on banners, progress bars
+and ANSI codes, while findings further down are cut off. compact()
+rewrites the output in stages:
+
+1. Clean: ANSI escapes and control characters are removed, carriage-
+   return redraws keep only their final state and very long lines are
+   shortened.
+2. Drop progress: lines that only report progress (percent done, ETAs,
+   "Progress:", "Stats:", "[STATUS]", text progress bars) are removed.
+3. Collapse repeats: a run of near-identical lines (equal once numbers,
+   hex strings and spacing are normalized) keeps its first REPEAT_KEEP
+   lines and a "[... N similar lines]" marker.
+4. Rank: lines are grouped into segments (split at blank lines, at most
+   SEGMENT_LINES lines each) scored by security-signal patterns
+   (SIGNALS): CVEs, credentials, open ports, success markers, ...
+5. Pack: the best-scoring segments that fit the token budget are kept,
+   in their original order, with "[... N lines omitted]" at the gaps.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each, close enough to
+budget a prompt section without a tokenizer.
+
+Usage:
+    from cyberred.tools.compaction import compact
+
+    result = compact(stdout, budget_tokens=1000)
+    prompt_section = result.text
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from cyberred.tools.parsers.patterns import strip_ansi
+
+CHARS_PER_TOKEN = 4
+
+# Lines kept from a run of near-identical lines
+REPEAT_KEEP = 3
+
+# Maximum lines per ranked segment
+SEGMENT_LINES = 12
+
+# Longer lines are shortened (minified JS, base64 blobs, ...)
+MAX_LINE_CHARS = 400
+
+_CONTROL = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+PROGRESS = re.compile(
+    r'\bprogress\s*:'
+    r'|^stats:'
+    r'|\[status\]'
+    r'|\d+(?:\.\d+)?\s*%\s*(?:done|complete)'
+    r'|^\d{1,3}(?:\.\d+)?\s*%$'
+    r'|(?-i:\bET[AC]):?\s+\d'
+    r'|[\[|][#=>\-.\u2588-\u258f ]{8,}[\]|]',
+    re.IGNORECASE,
+)
+
+# Numbers and hex strings, normalized away when comparing lines
+_VARIABLE = re.compile(r'\b[0-9a-f]{8,}\b|\d+', re.IGNORECASE)
+_SPACES = re.compile(r'\s+')
+
+# Security-signal patterns and their weights
+SIGNALS: List[Tuple[re.Pattern, int]] = [
+    (re.compile(p, re.IGNORECASE), weight) for p, weight in [
+        (r'CVE-\d{4}-\d{4,}', 5),
+        (r'vulnerab|exploitable|injectable|\bvuln\b', 5),
+        (r'passw|credential|secret|api[_-]?key|\btoken\b|\bhash', 4),
+        (r'\b(?:critical|high)\b', 3),
+        (r'\[\+\]|\[!\]|\bfound\b|\bsuccess|\bvalid\b|\blogin\b|authenticated|pwn', 3),
+        (r'\bopen\b|\b\d{1,5}/(?:tcp|udp)\b', 2),
+        (r'\badmin|\broot\b|privilege|\bsudo\b|\bsuid\b', 2),
+        (r'https?://\S+|\b(?:\d{1,3}\.){3}\d{1,3}\b', 1),
+        (r'\b(?:error|denied|failed|refused|timed? ?out)\b', 1),
+    ]
+]
+
+# Room left per kept segment for an omission marker
+_MARKER_CHARS = 32
+
+
+@dataclass(frozen=True)
+class CompactedOutput:
+    """Result of compact().
+
+    Attributes:
+        text: The compacted output.
+        chars_in: Length of the original output.
+        lines_in: Lines in the original output.
+        lines_kept: Original lines represented in text (including lines
+            summarized by a "similar lines" marker).
+    """
+
+    text: str
+    chars_in: int
+    lines_in: int
+    lines_kept: int
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def line_score(line: str) -> int:
+    """Security-signal score of a line (0 for noise)."""
+    return sum(weight for pattern, weight in SIGNALS if pattern.search(line))
+
+
+def _clean(text: str) -> List[str]:
+    """Stages 1 and 2: cleaned lines, progress lines removed."""
+    lines = []
+    for line in strip_ansi(text).split('\n'):
+        if '\r' in line:
+            # A terminal shows what was written after the last \r
+            line = next((part for part in reversed(line.split('\r')) if part.strip()), "")
+        line = _CONTROL.sub('', line).strip()
+        if len(line) > MAX_LINE_CHARS:
+            line = line[:MAX_LINE_CHARS] + " [...]"
+        if not PROGRESS.search(line):
+            lines.append(line)
+    return lines
+
+
+def _collapse(lines: List[str]) -> List[Tuple[str, int]]:
+    """Stage 3: (line, original lines it stands for), runs collapsed."""
+    out: List[Tuple[str, int]] = []
+    previous = None
+    run = 0
+    for line in lines:
+        if not line:
+            # Blank lines only separate segments: keep one
+            if out and out[-1][0]:
+                out.append(("", 1))
+            previous, run = None, 0
+            continue
+        shape = _SPACES.sub(' ', _VARIABLE.sub('0', line.lower()))
+        if shape == previous:
+            run += 1
+            if run > REPEAT_KEEP:
+                if run > REPEAT_KEEP + 1:
+                    out.pop()
+                similar = run - REPEAT_KEEP
+                out.append((f"[... {similar} similar lines]", similar))
+                continue
+        else:
+            previous, run = shape, 1
+        out.append((line, 1))
+    return out
+
+
+def _segments(entries: List[Tuple[str, int]]) -> List[List[Tuple[str, int]]]:
+    """Stage 4 grouping: split at blank lines, SEGMENT_LINES at most."""
+    segments: List[List[Tuple[str, int]]] = []
+    current: List[Tuple[str, int]] = []
+    for entry in entries:
+        if not entry[0] or len(current) == SEGMENT_LINES:
+            # Never empty: _collapse() leaves no leading or repeated blanks
+            segments.append(current)
+            current = []
+        if entry[0]:
+            current.append(entry)
+    if current:
+        segments.append(current)
+    return segments
+
+
+def compact(text: str, budget_tokens: int) -> CompactedOutput:
+    """Compact tool output to fit budget_tokens.
+
+    Args:
+        text: Raw tool output (stdout or stderr).
+        budget_tokens: Token budget for the result.
+
+    Returns:
+        The compacted output and how much of the original it covers.
+    """
+    lines_in = text.count('\n') + 1 if text else 0
+    segments = _segments(_collapse(_clean(text)))
+    budget = max(budget_tokens, 0) * CHARS_PER_TOKEN
+    texts = ['\n'.join(line for line, _ in segment) for segment in segments]
+    sizes = [sum(count for _, count in segment) for segment in segments]
+
+    if sum(len(t) + 1 for t in texts) <= budget:
+        selected = set(range(len(segments)))
+    else:
+        scores = [sum(line_score(line) for line, _ in segment) for segment in segments]
+        # The closing segment often summarizes the run
+        scores[-1] += 1
+        ranked = sorted(range(len(segments)), key=lambda i: (-scores[i], i))
+        selected = set()
+        remaining = budget
+        for index in ranked:
+            cost = len(texts[index]) + 1 + _MARKER_CHARS
+            if cost <= remaining:
+                selected.add(index)
+                remaining -= cost
+        if not selected:
+            # Not even one segment fits: cut the best one
+            best = ranked[0]
+            texts[best] = texts[best][:max(budget - 2 * _MARKER_CHARS, 0)]
+            selected.add(best)
+
+    parts: List[str] = []
+    omitted = 0
+    for index, segment_text in enumerate(texts):
+        if index not in selected:
+            omitted += sizes[index]
+            continue
+        if omitted:
+            parts.append(f"[... {omitted} lines omitted]")
+            omitted = 0
+        parts.append(segment_text)
+    if omitted:
+        parts.append(f"[... {omitted} lines omitted]")
+
+    return CompactedOutput(
+        text='\n'.join(parts),
+        chars_in=len(text),
+        lines_in=lines_in,
+        lines_kept=sum(sizes[i] for i in selected),
+    )
@@ -0,0 +1,312 @@
+"""Container Pool Autoscaler - Elastic sizing for ContainerPool.
+
+A fixed pool pays for idle Kali containers between phases and starves
+during recon bursts. With a ScalingPolicy the pool starts at min_size and
+an autoscaler task re-evaluates it every evaluate_interval seconds:
+
+- Scale up by scale_up_step (up to max_size) when pool pressure reaches
+  scale_up_pressure or the p95 acquire wait reaches scale_up_wait_p95_ms.
+  Standby containers (already started, not in the pool) are promoted
+  first, so the first containers of a burst are available immediately.
+- Reap containers idle for idle_timeout seconds, down to min_size, but not
+  within cooldown seconds of the last scale-up.
+- Container starts (pool growth and standby refill) are rate limited by a
+  token bucket (spawn_rate per second, spawn_burst at once).
+
+Every decision is recorded in ContainerPoolMetrics and logged.
+
+Usage:
+    from cyberred.tools.container_autoscaler import ScalingPolicy
+    from cyberred.tools.container_pool import ContainerPool
+
+    pool = ContainerPool(mode="real", scaling=ScalingPolicy(min_size=2, max_size=20))
+    await pool.initialize()
+    pool.metrics.get_metrics()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from cyberred.tools.container_pool import ContainerPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScalingPolicy:
+    """Bounds and thresholds for an elastic ContainerPool.
+
+    Attributes:
+        min_size: Containers kept in the pool at all times.
+        max_size: Upper bound on pool containers (standby not included).
+        standby_size: Started containers kept outside the pool for
+            instant scale-up.
+        scale_up_pressure: Pressure (in use / size) that triggers scale-up.
+        scale_up_wait_p95_ms: p95 acquire wait that triggers scale-up.
+        scale_up_step: Containers added per scale-up decision.
+        idle_timeout: Seconds a container must sit idle before reaping.
+        cooldown: Seconds after a scale-up during which nothing is reaped.
+        spawn_rate: Container starts allowed per second (sustained).
+        spawn_burst: Container starts allowed at once.
+        evaluate_interval: Seconds between scaling evaluations.
+        wait_window: Number of recent acquire waits used for the p95.
+    """
+
+    min_size: int = 2
+    max_size: int = 20
+    standby_size: int = 1
+    scale_up_pressure: float = 0.8
+    scale_up_wait_p95_ms: float = 250.0
+    scale_up_step: int = 2
+    idle_timeout: float = 300.0
+    cooldown: float = 60.0
+    spawn_rate: float = 1.0
+    spawn_burst: int = 4
+    evaluate_interval: float = 1.0
+    wait_window: int = 200
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0 or self.max_size < 1 or self.min_size > self.max_size:
+            raise ValueError(
+                f"Invalid pool bounds: min_size={self.min_size}, max_size={self.max_size}"
+            )
+        if self.standby_size < 0 or self.scale_up_step < 1:
+            raise ValueError("standby_size must be >= 0 and scale_up_step >= 1")
+        if self.spawn_rate <= 0 or self.spawn_burst < 1:
+            raise ValueError("spawn_rate must be > 0 and spawn_burst >= 1")
+
+
+class ContainerPoolMetrics:
+    """Acquire waits, scaling decisions and boot times for one ContainerPool."""
+
+    def __init__(self, wait_window: int = 200) -> None:
+        self._waits: deque[float] = deque(maxlen=wait_window)
+        # Boot time (ms) per container, and recent samples per boot mode
+        self._boot_ms: OrderedDict[str, float] = OrderedDict()
+        self._boots: Dict[str, deque[float]] = {}
+        self._boot_window = wait_window
+        self._counters: Dict[str, int] = {
+            "scale_ups": 0,
+            "scale_downs": 0,
+            "spawned": 0,
+            "spawn_failures": 0,
+            "spawn_throttled": 0,
+            "standby_promoted": 0,
+            "reaped": 0,
+            "acquire_timeouts": 0,
+        }
+        self._decisions: deque[Dict[str, Any]] = deque(maxlen=100)
+
+    def record_wait(self, wait_ms: float) -> None:
+        """Record how long one acquire() waited for a container."""
+        self._waits.append(wait_ms)
+
+    def clear_waits(self) -> None:
+        """Drop wait samples (after a scale-up they describe the old size)."""
+        self._waits.clear()
+
+    def wait_p95(self) -> float:
+        """p95 of recent acquire waits in milliseconds (0.0 if none)."""
+        return _p95(self._waits)
+
+    def record_boot(self, container_id: Optional[str], mode: str, boot_ms: float) -> None:
+        """Record how long a container took to come up.
+
+        Args:
+            container_id: Docker container ID (None if unknown).
+            mode: "cold" (started), "warm" (unpaused) or "restored" (CRIU).
+            boot_ms: Milliseconds until the container could run jobs.
+        """
+        self.increment(f"boots_{mode}")
+        if mode not in self._boots:
+            self._boots[mode] = deque(maxlen=self._boot_window)
+        self._boots[mode].append(boot_ms)
+        if container_id is not None:
+            self._boot_ms[container_id] = boot_ms
+            while len(self._boot_ms) > self._boot_window:
+                self._boot_ms.popitem(last=False)
+
+    def boot_ms(self, container_id: str) -> Optional[float]:
+        """Boot time of a container in milliseconds, if recorded."""
+        return self._boot_ms.get(container_id)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a named counter."""
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def record_decision(
+        self, action: str, reason: str, size_before: int, size_after: int
+    ) -> None:
+        """Record and log one scaling decision.
+
+        Args:
+            action: "up" or "down".
+            reason: What triggered it (pressure, wait_p95, min_size, idle).
+            size_before: Pool size (including pending spawns) before.
+            size_after: Target pool size after.
+        """
+        self.increment("scale_ups" if action == "up" else "scale_downs")
+        self._decisions.append({
+            "time": time.time(),
+            "action": action,
+            "reason": reason,
+            "size_before": size_before,
+            "size_after": size_after,
+        })
+        logger.info(
+            "container_pool_scale: action=%s reason=%s from=%d to=%d",
+            action, reason, size_before, size_after,
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get counters, wait statistics and recent decisions."""
+        return {
+            **self._counters,
+            "acquire_wait_p95_ms": self.wait_p95(),
+            "acquire_wait_samples": len(self._waits),
+            "boot_p95_ms": {mode: _p95(samples) for mode, samples in sorted(self._boots.items())},
+            "decisions": list(self._decisions),
+        }
+
+
+def _p95(samples: deque[float]) -> float:
+    """p95 of samples (0.0 if none)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
+
+
+class _TokenBucket:
+    """Token bucket limiting container starts."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float]) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def try_take(self) -> bool:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class ContainerAutoscaler:
+    """Periodically resizes a ContainerPool according to a ScalingPolicy."""
+
+    def __init__(
+        self,
+        pool: ContainerPool,
+        policy: ScalingPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the autoscaler.
+
+        Args:
+            pool: Pool to resize (real mode).
+            policy: Scaling bounds and thresholds.
+            clock: Monotonic clock, injectable for tests.
+        """
+        self._pool = pool
+        self._policy = policy
+        self._clock = clock
+        self._bucket = _TokenBucket(policy.spawn_rate, policy.spawn_burst, clock)
+        self._last_scale_up = float("-inf")
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the evaluation loop as a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the evaluation loop."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._policy.evaluate_interval)
+            try:
+                self.evaluate()
+            except Exception as e:
+                logger.warning("container_pool_scale_error: error=%s", str(e))
+
+    def evaluate(self) -> Optional[str]:
+        """Make one scaling decision.
+
+        Returns:
+            "up", "down", or None if the pool was left as is.
+        """
+        pool = self._pool
+        policy = self._policy
+        metrics = pool.metrics
+        size = pool.target_size
+        decision: Optional[str] = None
+
+        reason = ""
+        if size < policy.min_size:
+            reason = "min_size"
+        elif size < policy.max_size and not pool.pending_spawns:
+            # Wait for in-flight spawns before judging pressure again
+            if pool.pressure >= policy.scale_up_pressure:
+                reason = "pressure"
+            elif metrics.wait_p95() >= policy.scale_up_wait_p95_ms:
+                reason = "wait_p95"
+
+        if reason:
+            want = (
+                policy.min_size - size
+                if reason == "min_size"
+                else min(policy.scale_up_step, policy.max_size - size)
+            )
+            added = self._grow(want)
+            if added:
+                metrics.record_decision("up", reason, size, size + added)
+                metrics.clear_waits()
+                self._last_scale_up = self._clock()
+                decision = "up"
+        elif self._clock() - self._last_scale_up >= policy.cooldown:
+            reaped = pool.reap_idle(policy.idle_timeout, size - policy.min_size)
+            if reaped:
+                metrics.record_decision("down", "idle", size, size - reaped)
+                decision = "down"
+
+        self._refill_standby()
+        return decision
+
+    def _grow(self, count: int) -> int:
+        """Add up to count containers: standby first, then rate-limited spawns."""
+        added = self._pool.promote_standby(count)
+        for _ in range(count - added):
+            if not self._bucket.try_take():
+                self._pool.metrics.increment("spawn_throttled")
+                break
+            self._pool.spawn_container()
+            added += 1
+        return added
+
+    def _refill_standby(self) -> None:
+        """Start standby containers up to standby_size (rate-limited)."""
+        missing = self._policy.standby_size - self._pool.standby_target
+        for _ in range(missing):
+            if not self._bucket.try_take():
+                self._pool.metrics.increment("spawn_throttled")
+                return
+            self._pool.spawn_container(standby=True)
@@ -0,0 +1,206 @@
+"""Container Health Monitor - Docker health tracking off the event loop.
+
+ContainerPool used to call RealContainer.is_healthy() on every acquire and
+release, which is a synchronous Docker API reload() round-trip on the event
+loop. Health is now tracked by two daemon threads and cached by the pool:
+
+1. Events thread: follows the Docker events stream for container die, oom,
+   kill, stop, pause and unhealthy health_status events.
+2. Poll thread: every poll_interval seconds, one batched containers.list()
+   call reconciles every tracked container (catches anything the events
+   stream missed, e.g. after a reconnect).
+
+Unhealthy container IDs are handed back to the event loop with
+call_soon_threadsafe(); the callback never runs on a monitor thread.
+
+Usage:
+    from cyberred.tools.container_health import ContainerHealthMonitor
+
+    monitor = ContainerHealthMonitor(on_unhealthy=pool._on_health_event)
+    monitor.track(container_id)
+    monitor.start(asyncio.get_running_loop())
+    ...
+    monitor.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between batched containers.list() reconciliations
+DEFAULT_POLL_INTERVAL = 10.0
+
+# Docker event actions that make a container unusable
+UNHEALTHY_ACTIONS = frozenset({"die", "oom", "kill", "stop", "pause", "health_status: unhealthy"})
+
+
+def _default_client_factory() -> Any:
+    import docker
+
+    return docker.from_env()
+
+
+class ContainerHealthMonitor:
+    """Tracks Docker container health in background threads.
+
+    Attributes:
+        poll_interval: Seconds between batched status polls.
+    """
+
+    def __init__(
+        self,
+        on_unhealthy: Callable[[str], None],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            on_unhealthy: Called on the event loop with the ID of each
+                container that became unhealthy (at most once per ID).
+            poll_interval: Seconds between batched status polls.
+            client_factory: Returns a docker client (defaults to
+                docker.from_env()).
+        """
+        self.poll_interval = poll_interval
+        self._on_unhealthy = on_unhealthy
+        self._client_factory = client_factory or _default_client_factory
+        self._client: Any = None
+        self._tracked: set[str] = set()
+        self._reported: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._threads: list[threading.Thread] = []
+        self._events_stream: Any = None
+
+    @property
+    def running(self) -> bool:
+        """True while the monitor threads are active."""
+        return bool(self._threads) and not self._stop.is_set()
+
+    def track(self, container_id: str) -> None:
+        """Start tracking a container ID."""
+        with self._lock:
+            self._tracked.add(container_id)
+            self._reported.discard(container_id)
+
+    def untrack(self, container_id: str) -> None:
+        """Stop tracking a container ID."""
+        with self._lock:
+            self._tracked.discard(container_id)
+            self._reported.discard(container_id)
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the events and poll threads.
+
+        Args:
+            loop: Event loop on which on_unhealthy is invoked.
+        """
+        if self._threads:
+            return
+        self._loop = loop
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._events_loop, name="container-health-events", daemon=True),
+            threading.Thread(target=self._poll_loop, name="container-health-poll", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop the monitor threads (best effort, does not block long)."""
+        self._stop.set()
+        stream = self._events_stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads = []
+        self._events_stream = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def poll_once(self) -> list[str]:
+        """Check every tracked container with one containers.list() call.
+
+        A tracked container that is missing from the listing, or not
+        running, is reported unhealthy.
+
+        Returns:
+            IDs newly reported unhealthy by this poll.
+        """
+        with self._lock:
+            ids = list(self._tracked - self._reported)
+        if not ids:
+            return []
+        containers = self._get_client().containers.list(all=True, filters={"id": ids})
+        running = {c.id for c in containers if c.status == "running"}
+        unhealthy = []
+        for container_id in ids:
+            # Docker matches ID prefixes, so compare both ways
+            if not any(r.startswith(container_id) or container_id.startswith(r) for r in running):
+                unhealthy.append(container_id)
+        for container_id in unhealthy:
+            self._report(container_id)
+        return unhealthy
+
+    def handle_event(self, event: dict[str, Any]) -> None:
+        """Process one decoded Docker event.
+
+        Args:
+            event: Event dict from the Docker events stream.
+        """
+        action = event.get("Action") or event.get("status") or ""
+        if action not in UNHEALTHY_ACTIONS:
+            return
+        container_id = event.get("id") or event.get("Actor", {}).get("ID")
+        with self._lock:
+            tracked = container_id in self._tracked
+        if tracked:
+            self._report(container_id)
+
+    def _report(self, container_id: str) -> None:
+        """Hand an unhealthy container ID to the event loop once."""
+        with self._lock:
+            if container_id in self._reported or container_id not in self._tracked:
+                return
+            self._reported.add(container_id)
+        logger.warning("container_health_unhealthy: id=%s", container_id[:12])
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._on_unhealthy, container_id)
+
+    def _events_loop(self) -> None:
+        """Follow the Docker events stream until stopped."""
+        while not self._stop.is_set():
+            try:
+                self._events_stream = self._get_client().events(
+                    decode=True, filters={"type": "container"}
+                )
+                for event in self._events_stream:
+                    if self._stop.is_set():
+                        break
+                    self.handle_event(event)
+            except Exception as e:
+                logger.debug("container_health_events_error: error=%s", str(e))
+            # Stream ended or failed: back off, the poll thread covers the gap
+            self._stop.wait(self.poll_interval)
+
+    def _poll_loop(self) -> None:
+        """Run poll_once() every poll_interval seconds until stopped."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.debug("container_health_poll_error: error=%s", str(e))
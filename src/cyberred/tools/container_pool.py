@@ -4,12 +4,54 @@ import logging
 import time
 from pathlib import Path
 from typing import Optional, Literal
+from cyberred.core.blob_store import BlobStore, BlobWriter, RawOutput
 from cyberred.core.models import ToolResult
-from cyberred.core.exceptions import ContainerPoolExhausted
+from cyberred.core.exceptions import ContainerPoolExhausted, ExecChannelError
+from cyberred.core.exec_channel import DOCKER_BINARY, ExecChannel, OutputCallback
 from cyberred.protocols.container import ContainerProtocol
+from cyberred.tools.container_autoscaler import ContainerAutoscaler, ContainerPoolMetrics, ScalingPolicy
+from cyberred.tools.container_health import DEFAULT_POLL_INTERVAL, ContainerHealthMonitor
+from cyberred.tools.container_warm_pool import WarmPool
 
 logger = logging.getLogger(__name__)
 
+class _StoredOutput:
+    """on_output wrapper that also writes streamed stdout to a blob."""
+
+    def __init__(self, on_output: OutputCallback, writer: BlobWriter) -> None:
+        self._on_output = on_output
+        self._writer: Optional[BlobWriter] = writer
+
+    def __call__(self, stream: str, data: bytes) -> None:
+        if stream == "stdout" and self._writer is not None:
+            try:
+                self._writer.write(data)
+            except OSError as e:
+                logger.warning("output_store_failed: error=%s", str(e))
+                self.abort()
+        self._on_output(stream, data)
+
+    async def close(self) -> Optional[str]:
+        """Finish the blob; None if nothing was stored."""
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return None
+        if not writer.size:
+            writer.abort()
+            return None
+        try:
+            return await asyncio.to_thread(writer.close)
+        except OSError as e:
+            logger.warning("output_store_failed: error=%s", str(e))
+            return None
+
+    def abort(self) -> None:
+        """Drop the blob written so far."""
+        if self._writer is not None:
+            self._writer.abort()
+            self._writer = None
+
+
 class ContainerContext:
     def __init__(self, pool: 'ContainerPool', timeout: Optional[float] = None):
         self._pool = pool
@@ -31,37 +73,128 @@ class ContainerContext:
         return await self._pool._acquire_impl(timeout=self._timeout)
 
 class ContainerPool:
-    def __init__(self, mode: Literal["mock", "real"] = "mock", size: int = 20, latency_ms: int = 0):
+    """Pool of Kali containers.
+
+    In real mode, container health is cached rather than probed: a
+    ContainerHealthMonitor follows Docker events and polls in background
+    threads, and callers can report failures with mark_unhealthy().
+    acquire() and release() only touch in-memory state. Unhealthy
+    containers are quarantined (never handed out again) and replaced in
+    the background.
+
+    With a ScalingPolicy the pool is elastic: it starts at min_size (size
+    is ignored), keeps standby_size started containers outside the pool,
+    and a ContainerAutoscaler grows and shrinks it between min_size and
+    max_size. Acquire waits and scaling decisions are exported through
+    the metrics property.
+
+    With a WarmPool, new containers (initial fill, scale-up, replacement
+    of crashed containers) are taken pre-started and paused from the warm
+    pool and unpaused on demand instead of being cold started. Every
+    container's boot time is recorded in the metrics.
+
+    With a BlobStore, real containers write each run's raw stdout bytes to
+    the store (streamed runs as they arrive) and set ToolResult.output_ref;
+    stdout then holds only a preview and the full output is resolved by
+    hash (ToolResult.output(pool.blob_store)).
+
+    Implements ExecutionBackendProtocol, so an ExecutionScheduler can
+    dispatch jobs to it through run().
+    """
+
+    backend_name = "container_pool"
+
+    def __init__(
+        self,
+        mode: Literal["mock", "real"] = "mock",
+        size: int = 20,
+        latency_ms: int = 0,
+        health_poll_interval: float = DEFAULT_POLL_INTERVAL,
+        scaling: Optional[ScalingPolicy] = None,
+        warm_pool: Optional[WarmPool] = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
         self._mode = mode
-        self._size = size
+        self._size = scaling.min_size if scaling is not None else size
         self._latency_ms = latency_ms
         self._available: asyncio.Queue[ContainerProtocol] = asyncio.Queue()
         self._all_containers: list[ContainerProtocol] = []
         self._fixture_loader = FixtureLoader()
+        self._health_poll_interval = health_poll_interval
+        self._monitor: Optional[ContainerHealthMonitor] = None
+        self._unhealthy: set[ContainerProtocol] = set()
+        self._by_id: dict[str, ContainerProtocol] = {}
+        self._background: set[asyncio.Task] = set()
+        self._scaling = scaling
+        self._metrics = ContainerPoolMetrics(scaling.wait_window if scaling else 200)
+        self._autoscaler: Optional[ContainerAutoscaler] = None
+        self._clock = time.monotonic
+        self._standby: list[ContainerProtocol] = []
+        self._idle_since: dict[ContainerProtocol, float] = {}
+        self._pending_spawns = 0
+        self._pending_standby = 0
+        self._warm_pool = warm_pool
+        self._blob_store = blob_store
         
+    @property
+    def blob_store(self) -> Optional[BlobStore]:
+        """Store holding the raw stdout of results with an output_ref."""
+        return self._blob_store
+
     async def initialize(self) -> None:
         """Initialize the pool, pre-warming containers if in real mode."""
         if self._mode == "real":
             self._all_containers = [] 
-            async def _create_and_start_container():
-                container = RealContainer()
-                await container.start()
-                await self._available.put(container)
-                self._all_containers.append(container)
-
+            async def _create_and_start_container(standby: bool = False):
+                container = await self._start_container()
+                if standby:
+                    self._standby.append(container)
+                else:
+                    self._put_idle(container)
+                self._track(container)
+
+            standby_size = self._scaling.standby_size if self._scaling else 0
             async with asyncio.TaskGroup() as tg:
                 for _ in range(self._size):
                     tg.create_task(_create_and_start_container())
+                for _ in range(standby_size):
+                    tg.create_task(_create_and_start_container(standby=True))
+
+            self._monitor = ContainerHealthMonitor(
+                on_unhealthy=self._on_health_event,
+                poll_interval=self._health_poll_interval,
+            )
+            for container_id in self._by_id:
+                self._monitor.track(container_id)
+            self._monitor.start(asyncio.get_running_loop())
+
+            if self._scaling is not None:
+                self._autoscaler = ContainerAutoscaler(self, self._scaling, clock=self._clock)
+                self._autoscaler.start()
         
                      
     async def shutdown(self) -> None:
         """Shutdown all containers in the pool."""
         if self._mode == "real":
+             if self._autoscaler is not None:
+                 await self._autoscaler.stop()
+                 self._autoscaler = None
+             if self._monitor is not None:
+                 await asyncio.to_thread(self._monitor.stop)
+                 self._monitor = None
+             pending = list(self._background)
+             for task in pending:
+                 task.cancel()
+             await asyncio.gather(*pending, return_exceptions=True)
              # Stop all tracked containers
              async with asyncio.TaskGroup() as tg:
                  for container in self._all_containers:
                      tg.create_task(container.stop())
              self._all_containers.clear()
+             self._by_id.clear()
+             self._unhealthy.clear()
+             self._standby.clear()
+             self._idle_since.clear()
              # Also clear queue?
              while not self._available.empty():
                  try:
@@ -78,28 +211,75 @@ class ContainerPool:
 
     def acquire(self, timeout: Optional[float] = None) -> ContainerContext:
         return ContainerContext(self, timeout=timeout)
+
+    @property
+    def capacity(self) -> int:
+        """Jobs that can run at once (max_size when elastic).
+
+        An elastic pool reports max_size so callers queue in acquire(),
+        where waits drive the autoscaler.
+        """
+        if self._scaling is not None:
+            return self._scaling.max_size
+        return self._size
+
+    async def run(
+        self, command: str, timeout: float = 300.0, on_output: Optional[OutputCallback] = None
+    ) -> ToolResult:
+        """Run a command in a pooled container (ExecutionBackendProtocol).
+
+        Per ERR1, failures are returned as ToolResult; a crashed container
+        is quarantined on release.
+        """
+        start_time = time.perf_counter()
+        try:
+            async with self.acquire(timeout=timeout) as container:
+                try:
+                    result = await container.execute(command, timeout=timeout, on_output=on_output)
+                except Exception as e:
+                    logger.warning("container_pool_run_exception: command=%s error=%s", command[:50], str(e))
+                    return ToolResult(
+                        success=False,
+                        stdout="",
+                        stderr=str(e),
+                        exit_code=-1,
+                        duration_ms=int((time.perf_counter() - start_time) * 1000),
+                        error_type="EXECUTION_EXCEPTION"
+                    )
+                if result.error_type == "CONTAINER_CRASHED":
+                    self.mark_unhealthy(container)
+                return result
+        except ContainerPoolExhausted as e:
+            return ToolResult(
+                success=False,
+                stdout="",
+                stderr=f"Container pool exhausted: {e}",
+                exit_code=-1,
+                duration_ms=int((time.perf_counter() - start_time) * 1000),
+                error_type="POOL_EXHAUSTED"
+            )
         
     async def _acquire_impl(self, timeout: Optional[float] = None) -> ContainerProtocol:
         if self._mode == "mock":
             return MockContainer(fixture_loader=self._fixture_loader, latency_ms=self._latency_ms)
         
-        # Real mode: get from queue
-        try:
-            container = await asyncio.wait_for(self._available.get(), timeout=timeout)
-        except asyncio.TimeoutError:
-             raise ContainerPoolExhausted(f"Timeout waiting for container (timeout={timeout}s)")
-             
-        # Ensure health
-        if not container.is_healthy():
+        # Real mode: get from queue, skipping containers known to be unhealthy.
+        # Health comes from the cache kept by the monitor; no Docker calls here.
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = None if timeout is None else started + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
             try:
-                # Try to restart once
-                await container.stop()
-                await container.start()
-            except Exception:
-                # If restart fails, we still return it - execution might fail
-                pass
-                
-        return container
+                container = await asyncio.wait_for(self._available.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                 self._metrics.record_wait((loop.time() - started) * 1000)
+                 self._metrics.increment("acquire_timeouts")
+                 raise ContainerPoolExhausted(f"Timeout waiting for container (timeout={timeout}s)")
+            if container not in self._unhealthy:
+                self._metrics.record_wait((loop.time() - started) * 1000)
+                return container
+            self._quarantine(container)
         
     @property
     def pressure(self) -> float:
@@ -127,25 +307,237 @@ class ContainerPool:
         """Return count of containers currently in use."""
         return self._size - self.available_count
 
+    @property
+    def quarantined_count(self) -> int:
+        """Return count of containers marked unhealthy and awaiting replacement."""
+        return len(self._unhealthy)
+
+    @property
+    def standby_count(self) -> int:
+        """Return count of started standby containers outside the pool."""
+        return len(self._standby)
+
+    @property
+    def target_size(self) -> int:
+        """Return pool size including containers still being spawned."""
+        return self._size + self._pending_spawns
+
+    @property
+    def standby_target(self) -> int:
+        """Return standby count including standby containers being spawned."""
+        return len(self._standby) + self._pending_standby
+
+    @property
+    def pending_spawns(self) -> int:
+        """Return count of pool containers being spawned."""
+        return self._pending_spawns
+
+    @property
+    def metrics(self) -> ContainerPoolMetrics:
+        """Acquire-wait and scaling metrics for this pool."""
+        return self._metrics
+
+    def _put_idle(self, container: ContainerProtocol) -> None:
+        """Return a container to the idle queue, stamping its idle time."""
+        if self._scaling is not None:
+            self._idle_since[container] = self._clock()
+        self._available.put_nowait(container)
+
+    def _remove_idle(self, container: ContainerProtocol) -> bool:
+        """Pull a container out of the idle queue (in-memory only).
+
+        Returns:
+            True if the container was idle and has been removed.
+        """
+        idle = []
+        found = False
+        while not self._available.empty():
+            item = self._available.get_nowait()
+            if item is container:
+                found = True
+            else:
+                idle.append(item)
+        for item in idle:
+            self._available.put_nowait(item)
+        return found
+
+    def _run_background(self, coro) -> None:
+        """Run a coroutine as a tracked background task."""
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def spawn_container(self, standby: bool = False) -> None:
+        """Start a new container in the background.
+
+        Used by the autoscaler; rate limiting is the caller's job.
+
+        Args:
+            standby: Keep the container outside the pool as a standby.
+        """
+        if standby:
+            self._pending_standby += 1
+        else:
+            self._pending_spawns += 1
+        self._run_background(self._spawn(standby))
+
+    async def _start_container(self) -> ContainerProtocol:
+        """Bring up one container: from the warm pool if it has one, else cold."""
+        container = None
+        if self._warm_pool is not None:
+            container = await self._warm_pool.take()
+        if container is None:
+            container = RealContainer()
+            await container.start()
+        if self._blob_store is not None:
+            container.blob_store = self._blob_store
+        boot_ms = getattr(container, "boot_ms", None)
+        if isinstance(boot_ms, (int, float)):
+            self._metrics.record_boot(container.container_id, container.boot_mode, boot_ms)
+        return container
+
+    async def _spawn(self, standby: bool) -> None:
+        try:
+            container = await self._start_container()
+            self._track(container)
+            if standby:
+                self._standby.append(container)
+            else:
+                self._size += 1
+                self._put_idle(container)
+            self._metrics.increment("spawned")
+        except Exception as e:
+            self._metrics.increment("spawn_failures")
+            logger.warning("container_spawn_failed: error=%s", str(e))
+        finally:
+            if standby:
+                self._pending_standby -= 1
+            else:
+                self._pending_spawns -= 1
+
+    def promote_standby(self, count: int) -> int:
+        """Move up to count standby containers into the pool.
+
+        Returns:
+            Number of containers promoted.
+        """
+        promoted = 0
+        while promoted < count and self._standby:
+            container = self._standby.pop()
+            self._size += 1
+            self._put_idle(container)
+            promoted += 1
+        if promoted:
+            self._metrics.increment("standby_promoted", promoted)
+        return promoted
+
+    def reap_idle(self, idle_timeout: float, max_count: int) -> int:
+        """Stop up to max_count containers idle for at least idle_timeout.
+
+        Returns:
+            Number of containers reaped.
+        """
+        if max_count <= 0:
+            return 0
+        cutoff = self._clock() - idle_timeout
+        idle = []
+        while not self._available.empty():
+            idle.append(self._available.get_nowait())
+        expired = []
+        for container in idle:
+            if (
+                len(expired) < max_count
+                and container not in self._unhealthy
+                and self._idle_since.get(container, cutoff) <= cutoff
+            ):
+                expired.append(container)
+            else:
+                self._available.put_nowait(container)
+        for container in expired:
+            self._size -= 1
+            self._untrack(container)
+            self._run_background(container.stop())
+        if expired:
+            self._metrics.increment("reaped", len(expired))
+        return len(expired)
+
+    def _track(self, container: ContainerProtocol) -> None:
+        """Register a started container with the pool and health monitor."""
+        self._all_containers.append(container)
+        container_id = getattr(container, "container_id", None)
+        if isinstance(container_id, str):
+            self._by_id[container_id] = container
+            if self._monitor is not None:
+                self._monitor.track(container_id)
+
+    def _untrack(self, container: ContainerProtocol) -> None:
+        """Forget a container (it is being discarded)."""
+        if container in self._all_containers:
+            self._all_containers.remove(container)
+        self._idle_since.pop(container, None)
+        container_id = getattr(container, "container_id", None)
+        if isinstance(container_id, str):
+            self._by_id.pop(container_id, None)
+            if self._monitor is not None:
+                self._monitor.untrack(container_id)
+
+    def _on_health_event(self, container_id: str) -> None:
+        """Monitor callback (runs on the event loop)."""
+        container = self._by_id.get(container_id)
+        if container is not None:
+            self.mark_unhealthy(container)
+
+    def mark_unhealthy(self, container: ContainerProtocol) -> None:
+        """Record that a container is unhealthy.
+
+        Idle containers are pulled from the queue and quarantined at once;
+        containers in use are quarantined when released. Callers that see
+        a CONTAINER_CRASHED result should report it here.
+
+        Args:
+            container: The unhealthy container.
+        """
+        if self._mode != "real" or container in self._unhealthy:
+            return
+        if container in self._standby:
+            # Standby containers are not replaced here; the autoscaler refills
+            self._standby.remove(container)
+            self._untrack(container)
+            self._run_background(container.stop())
+            return
+        self._unhealthy.add(container)
+
+        # Pull it out of the idle queue if it is there
+        if self._remove_idle(container):
+            self._quarantine(container)
+
+    def _quarantine(self, container: ContainerProtocol) -> None:
+        """Take a container out of service and replace it in the background."""
+        logger.warning("container_quarantined: spawning replacement")
+        self._untrack(container)
+        self._run_background(self._replace(container))
+
+    async def _replace(self, container: ContainerProtocol) -> None:
+        """Stop a quarantined container and spawn its replacement."""
+        try:
+            await container.stop()
+        except Exception:
+            pass  # Best effort stop
+        finally:
+            self._unhealthy.discard(container)
+        await self._spawn_replacement()
+
     async def release(self, container: ContainerProtocol) -> None:
         if self._mode == "mock":
              if self._available.qsize() < self._size:
                  await self._available.put(container)
-        # For real containers, we always put them back if they are healthy.
-        # If not healthy, we discard them and spawn replacement per AC3.
+        # For real containers, put them back unless the cached health says
+        # otherwise; unhealthy ones are quarantined and replaced (AC3).
         elif self._mode == "real":
-            if container.is_healthy():
-                await self._available.put(container)
+            if container in self._unhealthy:
+                self._quarantine(container)
             else:
-                # Log that a container was unhealthy and discarded
-                logger.warning("container_unhealthy_discarded: spawning replacement")
-                try:
-                    await container.stop()
-                except Exception:
-                    pass  # Best effort stop
-                
-                # AC3: Spawn replacement asynchronously to maintain pool size
-                asyncio.create_task(self._spawn_replacement())
+                self._put_idle(container)
     
     async def _spawn_replacement(self) -> None:
         """Spawn a replacement container to maintain pool size.
@@ -154,10 +546,9 @@ class ContainerPool:
         Runs asynchronously in the background.
         """
         try:
-            container = RealContainer()
-            await container.start()
-            await self._available.put(container)
-            self._all_containers.append(container)
+            container = await self._start_container()
+            self._track(container)
+            self._put_idle(container)
             logger.info("container_replaced: pool size maintained")
         except Exception as e:
             logger.warning("container_replacement_failed: error=%s", str(e))
@@ -184,17 +575,48 @@ class FixtureLoader:
 from testcontainers.core.container import DockerContainer
 
 class RealContainer(ContainerProtocol):
-    """Real Kali container using testcontainers."""
+    """Real Kali container using testcontainers.
+
+    Commands run through a persistent ExecChannel started with the
+    container; exec_run() is only used when the agent cannot be started
+    (e.g. an image without python3).
+    """
     
     DEFAULT_IMAGE = "kalilinux/kali-rolling"
     NETWORK_MODE = "none"
     CAPABILITIES = ["NET_ADMIN", "NET_RAW"]
+    # Extra seconds granted to the agent to report a job it timed out
+    CHANNEL_GRACE = 5.0
+    # Bytes of stdout kept in results whose output is in the blob store
+    OUTPUT_PREVIEW = 65536
 
-    def __init__(self, image: str = DEFAULT_IMAGE):
+    def __init__(self, image: str = DEFAULT_IMAGE, blob_store: Optional[BlobStore] = None):
         self._image = image
+        # Where raw stdout is stored (ToolResult.output_ref), if anywhere
+        self.blob_store = blob_store
         self._container: Optional[DockerContainer] = None
+        self._container_id: Optional[str] = None
+        self._channel: Optional[ExecChannel] = None
+        # How the container last came up ("cold", "warm" or "restored")
+        # and how long that took in milliseconds
+        self.boot_mode: Optional[str] = None
+        self.boot_ms: Optional[float] = None
+
+    @property
+    def container_id(self) -> Optional[str]:
+        """Docker container ID once started, used for health tracking."""
+        return self._container_id
+
+    def _record_boot(self, mode: str, started: float) -> None:
+        self.boot_mode = mode
+        self.boot_ms = (time.perf_counter() - started) * 1000
+        logger.debug(
+            "container_booted: container=%s mode=%s boot_ms=%.1f",
+            self._container_id, mode, self.boot_ms,
+        )
 
     async def start(self) -> None:
+        started = time.perf_counter()
         # Step 1: Ensure image exists (prevent CI first-run timeouts)
         # Use simple docker client or testcontainers internals to pull if missing
         import docker
@@ -227,8 +649,96 @@ class RealContainer(ContainerProtocol):
         
         # Step 3: Start
         await asyncio.to_thread(self._container.start)
+        try:
+            container_id = self._container.get_wrapped_container().id
+            self._container_id = container_id if isinstance(container_id, str) else None
+        except Exception:
+            self._container_id = None
+        if self._container_id is not None:
+            self._channel = await self._open_channel(self._container_id)
+        self._record_boot("cold", started)
+
+    async def pause(self) -> None:
+        """Freeze the container (docker pause) until resume()."""
+        if not self._container:
+            raise RuntimeError("Container not started")
+        await asyncio.to_thread(self._container.get_wrapped_container().pause)
+
+    async def resume(self) -> None:
+        """Unpause a paused container; its boot time is the unpause time."""
+        if not self._container:
+            raise RuntimeError("Container not started")
+        started = time.perf_counter()
+        await asyncio.to_thread(self._container.get_wrapped_container().unpause)
+        self._record_boot("warm", started)
+
+    async def checkpoint(self, name: str, checkpoint_dir: str) -> None:
+        """Checkpoint the container with CRIU; the container stops.
+
+        The exec agent is closed first: CRIU cannot checkpoint a
+        container with exec sessions attached.
+
+        Raises:
+            RuntimeError: If the container is not started or the
+                checkpoint fails (e.g. Docker without experimental mode).
+        """
+        if not self._container_id:
+            raise RuntimeError("Container not started")
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+        await _docker(
+            "checkpoint", "create", "--checkpoint-dir", checkpoint_dir, self._container_id, name
+        )
+
+    @classmethod
+    async def restore(
+        cls, name: str, checkpoint_dir: str, image: str = DEFAULT_IMAGE
+    ) -> "RealContainer":
+        """Create a container and start it from a CRIU checkpoint.
+
+        The checkpoint's processes (and the memory they had resident)
+        come back as they were, so nothing is booted.
+
+        Raises:
+            RuntimeError: If the container cannot be created or restored.
+        """
+        import docker
+
+        started = time.perf_counter()
+        container = cls(image)
+        cap_args = [arg for cap in cls.CAPABILITIES for arg in ("--cap-add", cap)]
+        container_id = (
+            await _docker("create", "--network", cls.NETWORK_MODE, *cap_args, "-t", image)
+        ).strip()
+        try:
+            await _docker(
+                "start", "--checkpoint-dir", checkpoint_dir, "--checkpoint", name, container_id
+            )
+            wrapped = await asyncio.to_thread(docker.from_env().containers.get, container_id)
+        except Exception:
+            await _docker("rm", "-f", container_id, check=False)
+            raise
+        container._container = _RestoredContainer(wrapped)
+        container._container_id = container_id
+        container._channel = await container._open_channel(container_id)
+        container._record_boot("restored", started)
+        return container
+
+    async def _open_channel(self, container_id: str) -> Optional[ExecChannel]:
+        """Start the exec agent; None means fall back to exec_run()."""
+        channel = ExecChannel(container_id)
+        try:
+            await channel.start()
+        except ExecChannelError as e:
+            logger.debug("exec_channel_unavailable: %s", e.reason)
+            return None
+        return channel
 
     async def stop(self) -> None:
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
         if self._container:
             try:
                 await asyncio.to_thread(self._container.stop)
@@ -237,8 +747,11 @@ class RealContainer(ContainerProtocol):
                 pass
             finally:
                 self._container = None
+                self._container_id = None
 
-    async def execute(self, code: str, timeout: int = 30) -> ToolResult:
+    async def execute(
+        self, code: str, timeout: int = 30, on_output: Optional[OutputCallback] = None
+    ) -> ToolResult:
         if not self._container:
             raise RuntimeError("Container not started")
         
@@ -251,15 +764,35 @@ class RealContainer(ContainerProtocol):
             wrapped = self._container.get_wrapped_container()
             return wrapped.exec_run(cmd, demux=True)
 
+        # Streamed stdout is not retained, so it is stored as it arrives
+        stored = self._stored_output(on_output) if on_output is not None else None
+        if stored is not None:
+            on_output = stored
+
         start_time = time.perf_counter()
         try:
-            # exec_run returns ExecResult(exit_code, (stdout, stderr)) in newer docker SDK
-            result = await asyncio.wait_for(
-                asyncio.to_thread(_exec),
-                timeout=timeout
-            )
+            if self._channel is not None and self._channel.alive:
+                # Persistent agent enforces the timeout and kills the job
+                job = await asyncio.wait_for(
+                    self._channel.run(
+                        cmd, timeout=timeout, on_output=on_output,
+                        capture_stdout=on_output is None,
+                    ),
+                    timeout=timeout + self.CHANNEL_GRACE
+                )
+                if job.timed_out:
+                    raise asyncio.TimeoutError
+                result = (job.exit_code, (job.stdout, job.stderr))
+            else:
+                # exec_run returns ExecResult(exit_code, (stdout, stderr)) in newer docker SDK
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(_exec),
+                    timeout=timeout
+                )
         except asyncio.TimeoutError:
             # Per ERR1: Return structured result, don't raise
+            if stored is not None:
+                stored.abort()
             duration_ms = int((time.perf_counter() - start_time) * 1000)
             logger.warning("container_execute_timeout: command=%s timeout=%s", code[:50], timeout)
             return ToolResult(
@@ -270,13 +803,23 @@ class RealContainer(ContainerProtocol):
                 duration_ms=duration_ms,
                 error_type="TIMEOUT"
             )
+        except asyncio.CancelledError:
+            if stored is not None:
+                stored.abort()
+            raise
         except Exception as e:
             # Per ERR1: Wrap all exceptions in ToolResult
+            if stored is not None:
+                stored.abort()
             duration_ms = int((time.perf_counter() - start_time) * 1000)
             error_type = "EXECUTION_EXCEPTION"
             
             # Detect container crash (NotFound from docker SDK)
-            if "NotFound" in type(e).__name__ or "not found" in str(e).lower():
+            if (
+                isinstance(e, ExecChannelError)
+                or "NotFound" in type(e).__name__
+                or "not found" in str(e).lower()
+            ):
                 error_type = "CONTAINER_CRASHED"
                 logger.warning("container_crashed: command=%s error=%s", code[:50], str(e))
             else:
@@ -298,8 +841,19 @@ class RealContainer(ContainerProtocol):
         
         stdout_bytes = output[0] if output else b""
         stderr_bytes = output[1] if output else b""
+        if on_output is not None and stdout_bytes:
+            # exec_run fallback cannot stream: deliver everything at once
+            on_output("stdout", stdout_bytes)
+            stdout_bytes = b""
         
-        stdout_str = stdout_bytes.decode("utf-8", errors="replace") if stdout_bytes else ""
+        if stored is not None:
+            output_ref = await stored.close()
+        else:
+            output_ref = await self._store_output(stdout_bytes)
+        if output_ref is not None:
+            stdout_str = RawOutput(stdout_bytes).preview(self.OUTPUT_PREVIEW)
+        else:
+            stdout_str = stdout_bytes.decode("utf-8", errors="replace") if stdout_bytes else ""
         stderr_str = stderr_bytes.decode("utf-8", errors="replace") if stderr_bytes else ""
 
         # Set error_type for non-zero exit codes
@@ -313,14 +867,37 @@ class RealContainer(ContainerProtocol):
             stderr=stderr_str,
             exit_code=exit_code,
             duration_ms=duration_ms,
-            error_type=error_type
+            error_type=error_type,
+            output_ref=output_ref
         )
 
+    def _stored_output(self, on_output: OutputCallback) -> Optional[_StoredOutput]:
+        """Wrap on_output to also store streamed stdout; None without a store."""
+        if self.blob_store is None:
+            return None
+        try:
+            return _StoredOutput(on_output, self.blob_store.writer())
+        except OSError as e:
+            logger.warning("output_store_failed: container=%s error=%s", self._container_id, str(e))
+            return None
+
+    async def _store_output(self, stdout: bytes) -> Optional[str]:
+        """Write raw stdout to the blob store; None if not stored."""
+        if self.blob_store is None or not stdout:
+            return None
+        try:
+            return await asyncio.to_thread(self.blob_store.put, stdout)
+        except OSError as e:
+            # Losing the stored copy only costs the reference
+            logger.warning("output_store_failed: container=%s error=%s", self._container_id, str(e))
+            return None
+
     def is_healthy(self) -> bool:
         """Check if container is healthy (running).
         
-        Note: Uses sync Docker API call. For async context, consider
-        wrapping in asyncio.to_thread() when calling.
+        Note: Uses sync Docker API call. ContainerPool does not call this;
+        it relies on ContainerHealthMonitor. For async context, wrap in
+        asyncio.to_thread() when calling.
         """
         if not self._container:
             return False
@@ -332,12 +909,53 @@ class RealContainer(ContainerProtocol):
             return False
 
 
+class _RestoredContainer:
+    """Minimal DockerContainer stand-in for containers restored by the CLI."""
+
+    def __init__(self, wrapped) -> None:
+        self._wrapped = wrapped
+
+    def get_wrapped_container(self):
+        return self._wrapped
+
+    def stop(self) -> None:
+        self._wrapped.remove(force=True, v=True)
+
+
+async def _docker(*args: str, check: bool = True) -> str:
+    """Run a docker CLI command and return its stdout.
+
+    Raises:
+        RuntimeError: If check is set and the command fails.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        DOCKER_BINARY, *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if check and proc.returncode != 0:
+        raise RuntimeError(
+            f"docker {args[0]} failed: {stderr.decode(errors='replace').strip()}"
+        )
+    return stdout.decode(errors="replace")
+
+
 class MockContainer(ContainerProtocol):
     def __init__(self, fixture_loader: Optional['FixtureLoader'] = None, latency_ms: int = 0):
         self._fixture_loader = fixture_loader or FixtureLoader()
         self._latency_ms = latency_ms
 
-    async def execute(self, code: str, timeout: int = 30) -> ToolResult:
+    async def execute(
+        self, code: str, timeout: int = 30, on_output: Optional[OutputCallback] = None
+    ) -> ToolResult:
+        result = await self._execute(code)
+        if on_output is not None and result.stdout:
+            on_output("stdout", result.stdout.encode())
+            result.stdout = ""
+        return result
+
+    async def _execute(self, code: str) -> ToolResult:
         if self._latency_ms > 0:
             await asyncio.sleep(self._latency_ms / 1000.0)
 
@@ -0,0 +1,277 @@
+"""Container Warm Pool - Pre-started, paused Kali containers.
+
+A cold RealContainer.start() talks to Docker (from_env, images.get,
+possibly a pull), boots the container and starts its exec agent: tens of
+seconds, paid again at engagement startup and whenever a crashed
+container is replaced. A WarmPool does that work ahead of time:
+
+1. fill() brings up ``size`` containers, runs the warm-up commands in
+   each (so the tools' binaries and libraries are resident in the page
+   cache) and pauses them (docker pause: no CPU, memory kept).
+2. take() unpauses one (sub-second) and refills the pool in the
+   background.
+
+With ``checkpoint=True`` and a runtime that supports it (Docker in
+experimental mode with CRIU installed), fill() first boots and warms one
+template container, checkpoints it, and restores every pool container
+from that checkpoint instead of booting it. If checkpointing or a
+restore fails, the pool falls back to cold starts.
+
+Each container records how it came up (boot_mode "cold", "warm" or
+"restored") and how long that took (boot_ms); ContainerPool exports
+these through its metrics.
+
+Usage:
+    from cyberred.tools.container_pool import ContainerPool
+    from cyberred.tools.container_warm_pool import WarmPool, WarmStartPolicy
+
+    warm = WarmPool(WarmStartPolicy(size=4))
+    await warm.fill()  # at daemon start, ahead of any engagement
+    pool = ContainerPool(mode="real", size=4, warm_pool=warm)
+    await pool.initialize()  # unpauses warm containers
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    from cyberred.tools.container_pool import RealContainer
+
+logger = logging.getLogger(__name__)
+
+# Commands that pull the common tools into the page cache
+DEFAULT_WARMUP_COMMANDS = (
+    "nmap --version",
+    "masscan --version",
+    "nuclei -version",
+    "sqlmap --version",
+    "hydra -h",
+    "nikto -Version",
+    "ffuf -V",
+)
+
+
+@dataclass
+class WarmStartPolicy:
+    """Settings for a WarmPool.
+
+    Attributes:
+        size: Paused containers kept ready.
+        warmup_commands: Commands run in each container before pausing.
+        warmup_timeout: Seconds allowed per warm-up command.
+        checkpoint: Restore containers from a CRIU checkpoint when the
+            runtime supports it.
+        checkpoint_dir: Host directory holding the checkpoint.
+        checkpoint_name: Name of the checkpoint.
+        refill: Replace taken containers in the background.
+    """
+
+    size: int = 4
+    warmup_commands: tuple[str, ...] = DEFAULT_WARMUP_COMMANDS
+    warmup_timeout: int = 30
+    checkpoint: bool = False
+    checkpoint_dir: str = "/var/lib/cyberred/checkpoints"
+    checkpoint_name: str = "kali-warm"
+    refill: bool = True
+
+    def __post_init__(self) -> None:
+        if self.size < 0 or self.warmup_timeout < 1:
+            raise ValueError(
+                f"Invalid warm start policy: size={self.size} warmup_timeout={self.warmup_timeout}"
+            )
+
+
+def _default_factory() -> "RealContainer":
+    from cyberred.tools.container_pool import RealContainer
+
+    return RealContainer()
+
+
+async def _default_restorer(name: str, checkpoint_dir: str) -> "RealContainer":
+    from cyberred.tools.container_pool import RealContainer
+
+    return await RealContainer.restore(name, checkpoint_dir)
+
+
+async def checkpoint_supported() -> bool:
+    """Whether the local Docker daemon can checkpoint and restore containers."""
+    if shutil.which("criu") is None:
+        return False
+    from cyberred.tools.container_pool import _docker
+
+    try:
+        experimental = await _docker("info", "--format", "{{.ExperimentalBuild}}")
+    except (OSError, RuntimeError):
+        return False
+    return experimental.strip() == "true"
+
+
+class WarmPool:
+    """Pre-started, paused containers handed out by take().
+
+    Attributes:
+        policy: Warm start settings.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[WarmStartPolicy] = None,
+        container_factory: Callable[[], Any] = _default_factory,
+        restorer: Callable[[str, str], Awaitable[Any]] = _default_restorer,
+        checkpoint_probe: Callable[[], Awaitable[bool]] = checkpoint_supported,
+    ) -> None:
+        """Initialize the warm pool (call fill() to start containers).
+
+        Args:
+            policy: Warm start settings (defaults to WarmStartPolicy()).
+            container_factory: Creates an unstarted container.
+            restorer: Restores a started container from a checkpoint.
+            checkpoint_probe: Whether checkpoint/restore is supported.
+        """
+        self.policy = policy or WarmStartPolicy()
+        self._factory = container_factory
+        self._restorer = restorer
+        self._probe = checkpoint_probe
+        self._ready: list[Any] = []
+        self._pending = 0
+        self._restore = False
+        self._prepared = False
+        self._background: set[asyncio.Task] = set()
+        self._counters = {"taken": 0, "misses": 0, "prepare_failures": 0, "restore_failures": 0}
+
+    @property
+    def available(self) -> int:
+        """Paused containers ready to be taken."""
+        return len(self._ready)
+
+    @property
+    def restoring(self) -> bool:
+        """True if containers are restored from a checkpoint."""
+        return self._restore
+
+    async def fill(self) -> None:
+        """Bring the pool up to size (creating the checkpoint first if enabled)."""
+        if not self._prepared:
+            self._prepared = True
+            if self.policy.checkpoint and await self._probe():
+                self._restore = await self._create_checkpoint()
+        missing = self.policy.size - len(self._ready) - self._pending
+        if missing > 0:
+            await asyncio.gather(*(self._add() for _ in range(missing)))
+
+    async def take(self) -> Optional[Any]:
+        """Unpause and hand out a warm container (None if none is ready).
+
+        The caller owns the returned container; a replacement is prepared
+        in the background.
+        """
+        while self._ready:
+            container = self._ready.pop()
+            if self.policy.refill:
+                self._run_background(self._add())
+            try:
+                await container.resume()
+            except Exception as e:
+                logger.warning("warm_container_resume_failed: error=%s", str(e))
+                await self._discard(container)
+                continue
+            self._counters["taken"] += 1
+            return container
+        self._counters["misses"] += 1
+        return None
+
+    async def shutdown(self) -> None:
+        """Stop background refills and every paused container."""
+        pending = list(self._background)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        ready, self._ready = self._ready, []
+        await asyncio.gather(*(self._discard(c) for c in ready))
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Counters plus ready and pending container counts."""
+        return {
+            **self._counters,
+            "available": len(self._ready),
+            "pending": self._pending,
+            "restoring": self._restore,
+        }
+
+    async def _add(self) -> None:
+        """Prepare one paused container and add it to the pool."""
+        self._pending += 1
+        try:
+            container = await self._prepare()
+        except Exception as e:
+            self._counters["prepare_failures"] += 1
+            logger.warning("warm_container_prepare_failed: error=%s", str(e))
+            return
+        finally:
+            self._pending -= 1
+        self._ready.append(container)
+
+    async def _prepare(self) -> Any:
+        """Bring up, warm and pause one container."""
+        container = None
+        if self._restore:
+            try:
+                container = await self._restorer(self.policy.checkpoint_name, self.policy.checkpoint_dir)
+            except Exception as e:
+                # Fall back to cold starts for good
+                self._restore = False
+                self._counters["restore_failures"] += 1
+                logger.warning("warm_container_restore_failed: error=%s", str(e))
+        if container is None:
+            container = self._factory()
+            await container.start()
+            await self._warm(container)
+        try:
+            await container.pause()
+        except Exception:
+            await self._discard(container)
+            raise
+        return container
+
+    async def _warm(self, container: Any) -> None:
+        """Run the warm-up commands (failures only cost the warm-up)."""
+        for command in self.policy.warmup_commands:
+            await container.execute(command, timeout=self.policy.warmup_timeout)
+
+    async def _create_checkpoint(self) -> bool:
+        """Boot and warm a template container and checkpoint it.
+
+        Returns:
+            True if the checkpoint was created.
+        """
+        template = self._factory()
+        try:
+            await template.start()
+            await self._warm(template)
+            await template.checkpoint(self.policy.checkpoint_name, self.policy.checkpoint_dir)
+        except Exception as e:
+            logger.warning("warm_checkpoint_failed: error=%s", str(e))
+            return False
+        finally:
+            await self._discard(template)
+        logger.info(
+            "warm_checkpoint_created: name=%s dir=%s",
+            self.policy.checkpoint_name, self.policy.checkpoint_dir,
+        )
+        return True
+
+    async def _discard(self, container: Any) -> None:
+        try:
+            await container.stop()
+        except Exception:
+            pass  # Best effort stop
+
+    def _run_background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
@@ -1,7 +1,12 @@
 import asyncio
+import dataclasses
 import structlog
 from typing import Optional
+from cyberred.core.exec_channel import OutputCallback
 from cyberred.core.models import ToolResult
+from cyberred.core.result_cache import CacheKey, ResultCache
+from cyberred.core.scheduler import DEFAULT_AGENT, DEFAULT_ENGAGEMENT, ExecutionScheduler
+from cyberred.tools.command_parser import parse_command
 from cyberred.tools.container_pool import ContainerPool
 from cyberred.tools.scope import ScopeValidator
 
@@ -10,47 +15,134 @@ log = structlog.get_logger(__name__)
 DEFAULT_TIMEOUT_SECONDS = 300
 
 class KaliExecutor:
-    """Swarms-native kali_execute() tool implementation."""
+    """Swarms-native kali_execute() tool implementation.
+
+    With a scheduler, commands are submitted to the shared
+    ExecutionScheduler (admission control, per-engagement quotas, fair
+    queuing across agents) instead of acquiring from the pool directly.
+
+    With a result cache, successful runs of cacheable (idempotent recon)
+    tools are returned again for the same engagement, command, targets and
+    scope version without taking a container.
+    """
     
     def __init__(
         self, 
         pool: ContainerPool, 
         scope_validator: ScopeValidator,
-        default_timeout: int = DEFAULT_TIMEOUT_SECONDS
+        default_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        scheduler: Optional[ExecutionScheduler] = None,
+        cache: Optional[ResultCache] = None
     ):
         self._pool = pool
         self._scope_validator = scope_validator
         self._default_timeout = default_timeout
+        self._scheduler = scheduler
+        self._cache = cache
         
     async def execute(
         self, 
         code: str, 
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        on_output: Optional[OutputCallback] = None,
+        agent_id: str = DEFAULT_AGENT,
+        engagement_id: str = DEFAULT_ENGAGEMENT
     ) -> ToolResult:
         """Execute code in Kali container.
         
         Per ERR1: Tool execution failures are expected behavior, not exceptions.
         All error paths return ToolResult with success=False and appropriate error_type.
         ScopeViolationError is the only exception that propagates (critical security).
+
+        Pass on_output (e.g. OutputStream.feed from OutputProcessor.open_stream())
+        to receive output while the tool runs; stdout is then not retained.
+        agent_id and engagement_id are used for quotas and fair queuing when
+        a scheduler is configured; engagement_id also scopes cached results.
         """
-        from cyberred.core.exceptions import ContainerPoolExhausted
-        import time
-        
         timeout = timeout or self._default_timeout
-        start_time = time.perf_counter()
         
         # Scope validation BEFORE container acquisition (fail-closed)
         # ScopeViolationError is ALWAYS raised - security is not "expected failure"
         self._scope_validator.validate(command=code)
         log.debug("scope_validated", command=code[:50])
         
+        key = self._cache_key(code)
+        if key is not None:
+            cached = self._cache.get(engagement_id, key)
+            store = self._pool.blob_store
+            # A result whose stored output was evicted is run again
+            if cached is not None and (
+                cached.output_ref is None or store is None or cached.output_ref in store
+            ):
+                log.info("kali_execute_cache_hit", command=code[:50])
+                return self._replay(cached, on_output)
+        
+        result = await self._run(code, timeout, on_output, agent_id, engagement_id)
+        # Streamed runs do not retain stdout, so only captured runs are stored
+        if key is not None and on_output is None and result.success:
+            self._cache.put(engagement_id, key, result)
+        return result
+    
+    def _cache_key(self, code: str) -> Optional[CacheKey]:
+        """Cache key of a command, or None if its tool is not cached."""
+        if self._cache is None:
+            return None
+        # Same targets as the scope check: parse with the validator's schemas
+        parsed = parse_command(code, self._scope_validator.argument_schemas)
+        if not self._cache.cacheable(parsed.tool):
+            return None
+        return self._cache.key(
+            parsed.tool, code, parsed.targets, self._scope_validator.snapshot().version
+        )
+    
+    def _replay(self, result: ToolResult, on_output: Optional[OutputCallback]) -> ToolResult:
+        """Return a cached result, streaming its stdout if requested.
+
+        Stored output (output_ref) is streamed in full from the pool's
+        blob store rather than the preview kept in stdout.
+        """
+        if on_output is None:
+            return result
+        on_output("stdout", result.output(self._pool.blob_store).data)
+        return dataclasses.replace(result, stdout="")
+    
+    async def _run(
+        self,
+        code: str,
+        timeout: int,
+        on_output: Optional[OutputCallback],
+        agent_id: str,
+        engagement_id: str
+    ) -> ToolResult:
+        """Run a validated command through the scheduler or the pool."""
+        from cyberred.core.exceptions import ContainerPoolExhausted
+        import time
+        
+        start_time = time.perf_counter()
+        
+        if self._scheduler is not None:
+            # Same tool name as the cache key: /usr/bin/nmap and sudo nmap are nmap
+            tool = parse_command(code, self._scope_validator.argument_schemas).tool
+            return await self._scheduler.submit(
+                code,
+                tool=tool,
+                engagement_id=engagement_id,
+                agent_id=agent_id,
+                timeout=timeout,
+                on_output=on_output
+            )
+        
         try:
             async with self._pool.acquire(timeout=timeout) as container:
                 try:
-                    return await asyncio.wait_for(
-                        container.execute(code, timeout=timeout),
+                    result = await asyncio.wait_for(
+                        container.execute(code, timeout=timeout, on_output=on_output),
                         timeout=timeout
                     )
+                    if result.error_type == "CONTAINER_CRASHED":
+                        # Quarantined on release instead of handed out again
+                        self._pool.mark_unhealthy(container)
+                    return result
                 except asyncio.TimeoutError:
                     duration_ms = int((time.perf_counter() - start_time) * 1000)
                     log.warning("kali_execute_timeout", command=code[:50], timeout=timeout)
@@ -93,7 +185,10 @@ _executor: Optional[KaliExecutor] = None
 async def kali_execute(
     code: str,
     timeout: Optional[int] = None,
-    executor: Optional[KaliExecutor] = None
+    executor: Optional[KaliExecutor] = None,
+    on_output: Optional[OutputCallback] = None,
+    agent_id: str = DEFAULT_AGENT,
+    engagement_id: str = DEFAULT_ENGAGEMENT
 ) -> ToolResult:
     """Swarms-native kali_execute() tool.
     
@@ -104,13 +199,18 @@ async def kali_execute(
             raise RuntimeError("KaliExecutor not initialized. Call initialize_executor() first.")
         executor = _executor
     
-    return await executor.execute(code, timeout=timeout)
+    return await executor.execute(
+        code, timeout=timeout, on_output=on_output,
+        agent_id=agent_id, engagement_id=engagement_id
+    )
 
 def initialize_executor(
     pool: ContainerPool,
     scope_validator: ScopeValidator,
-    default_timeout: int = DEFAULT_TIMEOUT_SECONDS
+    default_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+    scheduler: Optional[ExecutionScheduler] = None,
+    cache: Optional[ResultCache] = None
 ) -> None:
     """Initialize the module-level executor singleton."""
     global _executor
-    _executor = KaliExecutor(pool, scope_validator, default_timeout)
+    _executor = KaliExecutor(pool, scope_validator, default_timeout, scheduler, cache)
@@ -1,7 +1,9 @@
 import yaml
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+from cyberred.core.scheduler import ToolProfile
 
 @dataclass
 class ToolManifest:
@@ -12,6 +14,9 @@ class ToolManifest:
     common_flags: List[str] = field(default_factory=list)
     output_format: str = "stdout"
     requires_root: bool = False
+    arguments: Dict[str, List[str]] = field(default_factory=dict)
+    resources: Dict[str, Any] = field(default_factory=dict)
+    cache: Dict[str, Any] = field(default_factory=dict)
 
 class ManifestLoader:
     """Load and query the Kali tool manifest."""
@@ -43,6 +48,9 @@ class ManifestLoader:
                     common_flags=tool.get("common_flags", []),
                     output_format=tool.get("output_format", "stdout"),
                     requires_root=tool.get("requires_root", False),
+                    arguments=tool.get("arguments") or {},
+                    resources=tool.get("resources") or {},
+                    cache=tool.get("cache") or {},
                 ))
         
         self._loaded = True
@@ -70,3 +78,40 @@ class ManifestLoader:
                 lines.append(f"- **{tool.name}**: {tool.description}")
         
         return "\n".join(lines)
+
+
+def load_tool_profiles(manifest_path: Union[str, Path]) -> Dict[str, ToolProfile]:
+    """Load per-tool resource profiles from the tool manifest.
+
+    Args:
+        manifest_path: Path to tools/manifest.yaml.
+
+    Returns:
+        Mapping of tool name to ToolProfile for tools with a resources block.
+    """
+    loader = ManifestLoader(Path(manifest_path))
+    return {
+        tool.name: ToolProfile.from_dict(tool.resources)
+        for tool in loader.load()
+        if tool.resources
+    }
+
+
+def load_cache_ttls(manifest_path: Union[str, Path]) -> Dict[str, float]:
+    """Load per-tool result cache TTLs from the tool manifest.
+
+    Only tools with a ``cache: {ttl: <seconds>}`` block opt in to result
+    caching (see core.result_cache.ResultCache).
+
+    Args:
+        manifest_path: Path to tools/manifest.yaml.
+
+    Returns:
+        Mapping of tool name to TTL in seconds.
+    """
+    loader = ManifestLoader(Path(manifest_path))
+    return {
+        tool.name: float(tool.cache["ttl"])
+        for tool in loader.load()
+        if tool.cache.get("ttl")
+    }
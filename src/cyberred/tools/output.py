@@ -4,6 +4,7 @@ import uuid
 import structlog
 import hashlib
 import threading
+import time
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from typing import List, Callable, Dict, Optional, TYPE_CHECKING
@@ -11,8 +12,14 @@ from pathlib import Path
 if TYPE_CHECKING:
     from cyberred.tools.parser_watcher import ParserWatcher
 from cyberred.core.models import Finding
+from cyberred.core.output_stream import LineStream
 from cyberred.llm import get_gateway, TaskComplexity, LLMGatewayNotInitializedError, LLMRequest
 from cyberred.tools.parsers.base import ParserFn
+from cyberred.tools.parsers.registry import ParserRegistry, RegisteredParser
+from cyberred.tools.parse_pool import ParsePool
+from cyberred.tools.compaction import compact, estimate_tokens
+from cyberred.tools.parser_learning import SampleStore
+from cyberred.tools.parsers.stream import LineParser, get_line_parser
 
 log = structlog.get_logger()
 
@@ -58,8 +65,14 @@ Respond with a JSON object:
 
 If no significant findings, respond with empty findings list.
 Note: Output may be partial or truncated if an error occurred. Still extract any useful findings from available data.
+Output is compacted: progress lines are removed, "[... N similar lines]" stands for repeated lines and "[... N lines omitted]" for low-signal lines left out.
 """
 
+# Token budget for STDOUT + STDERR in the Tier 2 prompt (about the size of
+# the former 4000 + 1000 character cut), and STDERR's share of it
+TIER2_TOKEN_BUDGET = 1250
+TIER2_STDERR_SHARE = 0.2
+
 @dataclass
 class ProcessedOutput:
     """Result of processing tool output.
@@ -67,7 +80,8 @@ class ProcessedOutput:
     Attributes:
         findings: List of structured Finding objects from parsing.
         summary: Human-readable summary of the output.
-        raw_truncated: First 4000 chars of stdout for debugging.
+        raw_truncated: First 4000 chars of stdout for debugging (last 4000
+            chars when the output was streamed).
         tier: Which tier produced this result (1, 2, or 3).
     """
     findings: List[Finding] = field(default_factory=list)
@@ -75,13 +89,95 @@ class ProcessedOutput:
     raw_truncated: str = ""
     tier: int = 3
 
+
+class OutputStream:
+    """Incremental Tier 1 parsing of a running tool's stdout.
+
+    feed() matches the on_output callback of the executors, so output is
+    parsed line by line as it arrives and each finding is handed to
+    on_finding immediately. Only the last max_raw_length characters of
+    stdout are kept (for raw_truncated).
+    """
+
+    def __init__(
+        self,
+        tool: str,
+        parser: LineParser,
+        max_raw_length: int = 4000,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ):
+        self._tool = tool
+        self._parser = parser
+        self._lines = LineStream(max_tail=max_raw_length)
+        self._on_finding = on_finding
+        self.findings: List[Finding] = []
+
+    def feed(self, stream: str, data: bytes) -> None:
+        """Consume an output chunk (stderr chunks are ignored)."""
+        if stream != "stdout":
+            return
+        for line in self._lines.feed(data):
+            self._parse_line(line)
+
+    def finish(self) -> ProcessedOutput:
+        """Parse any trailing partial line and return the result."""
+        for line in self._lines.finish():
+            self._parse_line(line)
+        self._emit(self._parser.finish())
+        log.info("stream_parsed", tool=self._tool, findings_count=len(self.findings),
+                 chars=self._lines.total_chars)
+        return ProcessedOutput(
+            findings=self.findings,
+            summary=f"Parsed {len(self.findings)} findings from {self._tool} (streamed)",
+            raw_truncated=self._lines.tail,
+            tier=1
+        )
+
+    def _parse_line(self, line: str) -> None:
+        try:
+            findings = self._parser.feed(line)
+        except Exception:
+            log.exception("stream_parser_failed", tool=self._tool, line=line[:100])
+            return
+        self._emit(findings)
+
+    def _emit(self, findings: List[Finding]) -> None:
+        for finding in findings:
+            self.findings.append(finding)
+            if self._on_finding is not None:
+                try:
+                    self._on_finding(finding)
+                except Exception:
+                    log.exception("stream_finding_callback_failed", tool=self._tool)
+
+
 class OutputProcessor:
-    """Routes tool output to appropriate parsers."""
-    
-    def __init__(self, max_raw_length: int = 4000, llm_timeout: int = 30, cache_enabled: bool = True, parsers_dir: Optional[Path] = None):
-        self._parsers: Dict[str, ParserFn] = {}
+    """Routes tool output to appropriate parsers.
+
+    With builtin_parsers=True, tools with a parser in tools/parsers are
+    routed to it without registering; the parser module is imported the
+    first time that tool's output is processed (see ParserRegistry).
+
+    With a parse_pool, process_async() parses large outputs in worker
+    processes instead of on the calling event loop.
+
+    Tier 2 prompts carry the output compacted to tier2_token_budget
+    tokens (see tools.compaction) rather than its first characters.
+
+    With a sample_store, Tier 2 results are recorded so template parsers
+    can be proposed for the tools that keep needing the LLM (see
+    tools.parser_learning).
+    """
+
+    def __init__(self, max_raw_length: int = 4000, llm_timeout: int = 30, cache_enabled: bool = True, parsers_dir: Optional[Path] = None, builtin_parsers: bool = False, parse_pool: Optional[ParsePool] = None, tier2_token_budget: int = TIER2_TOKEN_BUDGET, sample_store: Optional[SampleStore] = None):
+        self._parsers = ParserRegistry(builtins=builtin_parsers)
+        self._parse_pool = parse_pool
+        # tool -> Tier 1 parse counters (see get_parse_metrics())
+        self._parse_stats: Dict[str, Dict[str, float]] = {}
         self._max_raw_length = max_raw_length
         self._llm_timeout = llm_timeout
+        self._tier2_token_budget = tier2_token_budget
+        self._sample_store = sample_store
         self._cache_enabled = cache_enabled
         self._llm_cache: Dict[str, ProcessedOutput] = {}
         self._parsers_dir = parsers_dir
@@ -116,22 +212,48 @@ class OutputProcessor:
         return f"{tool.lower()}:{content_hash}"
         
     def register_parser(self, tool_name: str, parser: ParserFn) -> None:
-        """Register a Tier 1 parser for a tool."""
+        """Register a Tier 1 parser for a tool.
+
+        Replaces any previous parser atomically: process() calls already
+        running finish with the old one.
+        """
         with self._lock:
-            self._parsers[tool_name.lower()] = parser
+            self._parsers.register(tool_name, parser)
         log.info("parser_registered", tool=tool_name)
 
     def unregister_parser(self, tool_name: str) -> None:
         """Unregister a parser."""
-        tool_lower = tool_name.lower()
         with self._lock:
-            if tool_lower in self._parsers:
-                del self._parsers[tool_lower]
+            if self._parsers.unregister(tool_name):
                 log.info("parser_unregistered", tool=tool_name)
         
     def get_registered_parsers(self) -> List[str]:
-        """Return list of tools with registered parsers."""
-        return list(self._parsers.keys())
+        """Return list of tools with registered (or already loaded) parsers."""
+        return self._parsers.loaded()
+
+    def open_stream(
+        self,
+        tool: str,
+        agent_id: str,
+        target: str,
+        on_finding: Optional[Callable[[Finding], None]] = None,
+    ) -> Optional[OutputStream]:
+        """Start incremental parsing for a tool with a line parser.
+
+        Args:
+            tool: Tool name.
+            agent_id: Agent identifier.
+            target: Target being scanned.
+            on_finding: Called with each finding as soon as it is parsed.
+
+        Returns:
+            OutputStream to pass as on_output (feed) and finish afterwards,
+            or None if the tool has no line parser (use process()).
+        """
+        parser = get_line_parser(tool, agent_id, target)
+        if parser is None:
+            return None
+        return OutputStream(tool.lower(), parser, self._max_raw_length, on_finding)
     
     def process(self, stdout: str, stderr: str, tool: str, exit_code: int, agent_id: str, target: str, error_type: Optional[str] = None) -> ProcessedOutput:
         """Process tool output.
@@ -152,30 +274,82 @@ class OutputProcessor:
         """
         tool_lower = tool.lower()
         
-        parser = None
-        with self._lock:
-            parser = self._parsers.get(tool_lower)
+        parser = self._parsers.get(tool_lower)
             
         if parser:
             log.info("using_tier1_parser", tool=tool_lower)
+            start = time.perf_counter()
             try:
-                # Try to call parser with error_type if it accepts the parameter
-                import inspect
-                sig = inspect.signature(parser)
-                if 'error_type' in sig.parameters:
-                    findings = parser(stdout, stderr, exit_code, agent_id, target, error_type=error_type)
-                else:
-                    findings = parser(stdout, stderr, exit_code, agent_id, target)
-                return ProcessedOutput(
-                    findings=findings,
-                    summary=f"Parsed {len(findings)} findings from {tool}",
-                    raw_truncated=stdout[:self._max_raw_length],
-                    tier=1
-                )
+                # error_type is passed only to parsers that accept it
+                findings = parser(stdout, stderr, exit_code, agent_id, target, error_type=error_type)
+                return self._tier1_result(tool, findings, stdout, stderr, start, offloaded=False)
             except Exception:
                 log.exception("parser_failed", tool=tool_lower)
                 pass
         
+        return self._fallback(stdout, stderr, tool, exit_code, agent_id, target, error_type)
+
+    async def process_async(self, stdout: str, stderr: str, tool: str, exit_code: int, agent_id: str, target: str, error_type: Optional[str] = None) -> ProcessedOutput:
+        """process() for callers on an event loop.
+
+        Small outputs are parsed inline. Outputs the parse pool offloads
+        (see ParsePool.offloads()) are parsed in a worker process, and the
+        Tier 2/3 fallback runs in a thread, so the loop is never blocked
+        by a large parse or an LLM call. Arguments as for process().
+        """
+        tool_lower = tool.lower()
+        parser = self._parsers.get(tool_lower)
+        if parser:
+            offloaded = self._offloads(parser, stdout, stderr)
+            log.info("using_tier1_parser", tool=tool_lower, offloaded=offloaded)
+            start = time.perf_counter()
+            try:
+                if offloaded:
+                    findings = await self._parse_pool.parse(parser, stdout, stderr, exit_code, agent_id, target, error_type)
+                else:
+                    findings = parser(stdout, stderr, exit_code, agent_id, target, error_type=error_type)
+                return self._tier1_result(tool, findings, stdout, stderr, start, offloaded)
+            except Exception:
+                log.exception("parser_failed", tool=tool_lower)
+        
+        return await asyncio.to_thread(self._fallback, stdout, stderr, tool, exit_code, agent_id, target, error_type)
+
+    def _offloads(self, parser: RegisteredParser, stdout: str, stderr: str) -> bool:
+        return self._parse_pool is not None and self._parse_pool.offloads(parser, len(stdout) + len(stderr))
+
+    def _tier1_result(self, tool: str, findings: List[Finding], stdout: str, stderr: str, start: float, offloaded: bool) -> ProcessedOutput:
+        """Record parse metrics and build the Tier 1 result."""
+        tool_lower = tool.lower()
+        seconds = time.perf_counter() - start
+        chars = len(stdout) + len(stderr)
+        stats = self._parse_stats.setdefault(tool_lower, dict.fromkeys(("calls", "offloaded", "chars", "seconds"), 0))
+        stats["calls"] += 1
+        stats["offloaded"] += offloaded
+        stats["chars"] += chars
+        stats["seconds"] += seconds
+        log.info("tier1_parsed", tool=tool_lower, findings_count=len(findings), chars=chars,
+                 seconds=round(seconds, 4), offloaded=offloaded)
+        return ProcessedOutput(
+            findings=findings,
+            summary=f"Parsed {len(findings)} findings from {tool}",
+            raw_truncated=stdout[:self._max_raw_length],
+            tier=1
+        )
+
+    def get_parse_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Tier 1 parse counters per tool.
+
+        Returns:
+            tool -> {"calls", "offloaded" (calls run in the parse pool),
+            "chars" (stdout + stderr characters parsed), "seconds" (wall
+            time, including IPC for offloaded calls)}.
+        """
+        return {tool: dict(stats) for tool, stats in self._parse_stats.items()}
+
+    def _fallback(self, stdout: str, stderr: str, tool: str, exit_code: int, agent_id: str, target: str, error_type: Optional[str] = None) -> ProcessedOutput:
+        """Tier 2 (LLM summary), else Tier 3 (raw truncated)."""
+        tool_lower = tool.lower()
+        
         # Tier 2: Try LLM summarization
         try:
             return self._tier2_llm_summarize(stdout, stderr, tool, stdout[:self._max_raw_length], exit_code, agent_id, target, error_type)
@@ -216,12 +390,24 @@ class OutputProcessor:
         if error_type:
             error_context = f"Error Type: {error_type}\nNote: Output may be partial due to {error_type.replace('_', ' ').lower()}.\n"
         
+        # Fit the output into the budget; STDOUT gets what STDERR leaves
+        stderr_compacted = compact(stderr, int(self._tier2_token_budget * TIER2_STDERR_SHARE))
+        stdout_compacted = compact(stdout, self._tier2_token_budget - estimate_tokens(stderr_compacted.text))
+        log.info(
+            "tier2_compacted",
+            tool=tool.lower(),
+            chars_in=stdout_compacted.chars_in + stderr_compacted.chars_in,
+            chars_out=len(stdout_compacted.text) + len(stderr_compacted.text),
+            lines_in=stdout_compacted.lines_in + stderr_compacted.lines_in,
+            lines_kept=stdout_compacted.lines_kept + stderr_compacted.lines_kept,
+        )
+
         prompt = TIER2_SUMMARIZATION_PROMPT.format(
             tool=tool,
             exit_code=exit_code,
             error_context=error_context,
-            stdout=stdout[:4000],
-            stderr=stderr[:1000]
+            stdout=stdout_compacted.text,
+            stderr=stderr_compacted.text
         )
 
         request = LLMRequest(
@@ -256,7 +442,13 @@ class OutputProcessor:
                 signature=""
             )
             findings.append(finding)
-            
+
+        if self._sample_store is not None:
+            self._sample_store.record(tool, stdout, [
+                (finding.type, finding.severity, f.get("evidence", ""))
+                for finding, f in zip(findings, findings_data)
+            ])
+
         result = ProcessedOutput(
             findings=findings,
             summary=summary,
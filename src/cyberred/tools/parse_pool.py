@@ -0,0 +1,182 @@
+"""Parse Pool - Tier 1 parsing of large outputs in worker processes.
+
+Tier 1 parsers are CPU-bound (XML, regex-heavy ANSI stripping of
+linpeas/winpeas, BloodHound JSON). Run on the daemon's event loop, a
+200 MB dump stalls the TUI stream and IPC for seconds, and threads do not
+help under the GIL. ParsePool moves such parses to a process pool:
+
+- Size-based: outputs below ``threshold`` characters are not worth the
+  IPC and are parsed inline (see OutputProcessor.process_async()).
+- Warm workers: each worker imports the built-in parser modules when it
+  starts, so the first large parse does not pay for the imports.
+- Compact results: findings come back as plain field tuples (strings
+  shared between findings, such as agent_id and timestamp, are pickled
+  once) and are rebuilt without re-validation.
+
+Only built-in parsers (RegisteredParser.module set) can be offloaded;
+parsers registered at runtime or hot-reloaded are not importable in the
+workers and always run inline.
+
+Usage:
+    from cyberred.tools.output import OutputProcessor
+    from cyberred.tools.parse_pool import ParsePool
+
+    processor = OutputProcessor(builtin_parsers=True, parse_pool=ParsePool())
+    result = await processor.process_async(stdout, stderr, "bloodhound", 0, agent_id, target)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import importlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from cyberred.core.models import Finding
+from cyberred.tools.parsers.registry import (
+    BUILTIN_PARSERS,
+    PACKAGE,
+    RegisteredParser,
+    load_builtin,
+)
+
+log = structlog.get_logger()
+
+# Outputs from this many characters up are parsed in a worker
+DEFAULT_THRESHOLD = 1 << 20
+
+FINDING_FIELDS = tuple(f.name for f in dataclasses.fields(Finding))
+
+# A Finding as the tuple of its field values, in FINDING_FIELDS order
+FindingRow = Tuple[str, ...]
+
+# Worker-side parser cache (one per worker process)
+_worker_parsers: Dict[str, RegisteredParser] = {}
+
+
+def encode_findings(findings: Iterable[Finding]) -> List[FindingRow]:
+    """Findings as field tuples, for sending between processes."""
+    return [tuple(getattr(finding, name) for name in FINDING_FIELDS) for finding in findings]
+
+
+def decode_findings(rows: Iterable[FindingRow]) -> List[Finding]:
+    """Rebuild findings from encode_findings() rows.
+
+    The rows come from Findings that were validated when the worker
+    built them, so they are not validated again.
+    """
+    return [Finding.trusted(*row) for row in rows]
+
+
+def _preload(modules: Tuple[str, ...]) -> None:
+    """Worker initializer: import the parser modules up front."""
+    for module in modules:
+        importlib.import_module(f"{PACKAGE}.{module}")
+
+
+def _parse(
+    module: str,
+    stdout: str,
+    stderr: str,
+    exit_code: int,
+    agent_id: str,
+    target: str,
+    error_type: Optional[str],
+) -> List[FindingRow]:
+    """Worker entry point: run a built-in parser, return encoded findings."""
+    parser = _worker_parsers.get(module)
+    if parser is None:
+        parser = _worker_parsers[module] = RegisteredParser.wrap(load_builtin(module), module)
+    return encode_findings(parser(stdout, stderr, exit_code, agent_id, target, error_type=error_type))
+
+
+class ParsePool:
+    """Process pool for Tier 1 parsing of large outputs.
+
+    Worker processes are started on the first offloaded parse (spawned,
+    not forked, since the daemon runs threads). If a worker dies (OOM
+    kill, segfault) the pool is broken: it is discarded and the next
+    parse starts a fresh one.
+
+    Attributes:
+        threshold: Output size (stdout + stderr characters) from which
+            parses are offloaded.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        max_workers: Optional[int] = None,
+        preload: Iterable[str] = BUILTIN_PARSERS.values(),
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            threshold: Output size from which parses are offloaded.
+            max_workers: Worker processes (default: CPU count).
+            preload: Parser modules each worker imports at startup.
+        """
+        if threshold < 0:
+            raise ValueError(f"threshold must be >= 0: {threshold}")
+        self.threshold = threshold
+        self._max_workers = max_workers
+        self._preload = tuple(dict.fromkeys(preload))
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def offloads(self, parser: RegisteredParser, size: int) -> bool:
+        """Whether a parse of this size with this parser goes to a worker."""
+        return parser.module is not None and size >= self.threshold
+
+    async def parse(
+        self,
+        parser: RegisteredParser,
+        stdout: str,
+        stderr: str,
+        exit_code: int,
+        agent_id: str,
+        target: str,
+        error_type: Optional[str] = None,
+    ) -> List[Finding]:
+        """Run a built-in parser in a worker process.
+
+        Raises:
+            ValueError: If the parser is not a built-in.
+            BrokenProcessPool: If a worker died; the pool is restarted on
+                the next parse.
+            Exception: Whatever the parser raised in the worker.
+        """
+        if parser.module is None:
+            raise ValueError("only built-in parsers can run in the parse pool")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_preload,
+                initargs=(self._preload,),
+            )
+            log.info("parse_pool_started", max_workers=self._max_workers, preload=len(self._preload))
+        executor = self._executor
+        try:
+            rows = await asyncio.get_running_loop().run_in_executor(
+                executor, _parse, parser.module, stdout, stderr, exit_code, agent_id, target, error_type
+            )
+        except BrokenProcessPool:
+            # Concurrent parses on the same broken pool discard it only once
+            if self._executor is executor:
+                log.warning("parse_pool_broken", parser=parser.module)
+                self.shutdown(wait=False)
+            raise
+        # Rebuilding 100k+ findings takes a while too: off the loop
+        return await asyncio.to_thread(decode_findings, rows)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes (restarted on the next parse)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            log.info("parse_pool_stopped")
@@ -0,0 +1,387 @@
+"""Parser Learning - template parsers proposed from Tier 2 results.
+
+A tool without a Tier 1 parser goes to the LLM (Tier 2) on every run,
+although most such tools print findings as lines of a fixed shape
+("[+] Found user: alice", "Discovered open port 22/tcp on 10.0.0.5")
+that a few line patterns would extract for free. This module learns
+those patterns from what Tier 2 returned:
+
+- SampleStore records (stdout, findings) pairs per tool, keeping the
+  latest MAX_SAMPLES, and counts Tier 2 runs per tool. Only an excerpt
+  of stdout is kept: the evidence lines, CONTEXT_LINES around each (the
+  non-evidence lines validation needs) and at most MAX_SAMPLE_CHARS.
+- propose_parser() finds each finding's evidence in the output and
+  generalizes the evidence lines into templates: numbers, IPs and hex
+  strings become character classes, and fields that differ between
+  lines of the same shape become \\S+. Templates seen in fewer than
+  MIN_SUPPORT samples are dropped.
+- The rule table is validated by parsing every recorded sample again.
+  Rules matching lines that were not evidence for their finding type
+  (precision below MIN_PRECISION) are dropped, and a parser is only
+  proposed if the remaining rules find at least MIN_RECALL of the
+  recorded findings.
+- Proposals are never deployed automatically. Once an operator has
+  reviewed proposal.render(), proposal.build() can be registered with
+  OutputProcessor.register_parser(), or proposal.write() can save it to
+  the ParserWatcher directory, which loads it.
+
+Usage:
+    from cyberred.tools.parser_learning import SampleStore
+
+    store = SampleStore()
+    processor = OutputProcessor(sample_store=store)
+    ...
+    for tool in store.candidates():
+        proposal = store.propose(tool)
+        if proposal is not None and approved(proposal.render()):
+            proposal.write(parsers_dir)
+"""
+
+import re
+import threading
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import structlog
+
+from cyberred.core.models import Finding
+from cyberred.tools.parsers.common import create_finding
+from cyberred.tools.parsers.patterns import PatternSet, strip_ansi
+
+log = structlog.get_logger()
+
+# Samples kept per tool, and needed before proposing a parser
+MAX_SAMPLES = 20
+MIN_SAMPLES = 5
+
+# Output kept per sample: lines around each evidence line, and a size cap
+CONTEXT_LINES = 5
+MAX_SAMPLE_CHARS = 64 * 1024
+
+# Samples a line template must appear in
+MIN_SUPPORT = 2
+
+# Validation thresholds over the recorded samples
+MIN_PRECISION = 0.95
+MIN_RECALL = 0.9
+
+# Shorter evidence snippets are too ambiguous to locate in the output
+MIN_EVIDENCE_CHARS = 6
+
+_TOOL_NAME = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+
+_IPV4 = r'(?:\d{1,3}\.){3}\d{1,3}'
+_VALUE = re.compile(rf'(?P<ip>\b{_IPV4}\b)|(?P<hex>\b[0-9a-fA-F]{{8,}}\b)|(?P<num>\d+)')
+_VALUE_CLASSES = {"ip": _IPV4, "hex": r'[0-9a-fA-F]+', "num": r'\d+'}
+_ANY_FIELD = r'\S+'
+
+
+class Tier2Sample(NamedTuple):
+    """A Tier 2 result for a tool.
+
+    Attributes:
+        stdout: The tool's output.
+        findings: (type, severity, evidence) of each finding.
+    """
+
+    stdout: str
+    findings: Tuple[Tuple[str, str, str], ...]
+
+
+class TemplateRule(NamedTuple):
+    """A line template and the finding it produces.
+
+    Attributes:
+        pattern: Regex a whole (stripped) line must match.
+        type: Finding type.
+        severity: Finding severity.
+    """
+
+    pattern: str
+    type: str
+    severity: str
+
+
+class TemplateParser:
+    """Tier 1 parser producing one finding per line matching a rule.
+
+    The matched line is the finding's evidence; the first matching rule
+    (in table order) sets its type and severity.
+    """
+
+    def __init__(self, tool: str, rules: Sequence[TemplateRule]) -> None:
+        """Compile the rules.
+
+        Raises:
+            ValueError: If rules is empty.
+        """
+        self.tool = tool
+        self.rules = list(rules)
+        self._patterns = PatternSet(tool, [(str(i), f"^{rule.pattern}$") for i, rule in enumerate(self.rules)])
+
+    def match(self, line: str) -> Optional[TemplateRule]:
+        """The rule matching a stripped line, if any."""
+        match = self._patterns.match(line)
+        return self.rules[match.index] if match is not None else None
+
+    def __call__(self, stdout: str, stderr: str, exit_code: int, agent_id: str, target: str) -> List[Finding]:
+        findings = []
+        for line, match in self._patterns.scan(strip_ansi(stdout)):
+            rule = self.rules[match.index]
+            findings.append(create_finding(rule.type, rule.severity, target, line, agent_id, self.tool))
+        return findings
+
+
+@dataclass(frozen=True)
+class ParserProposal:
+    """A template parser proposed for a tool, pending operator review.
+
+    Attributes:
+        tool: Tool name.
+        rules: The rule table.
+        samples: Samples it was learned from and validated against.
+        precision: Share of matched lines that were evidence for the
+            rule's finding type.
+        recall: Share of recorded findings the parser reproduces.
+    """
+
+    tool: str
+    rules: Tuple[TemplateRule, ...]
+    samples: int
+    precision: float
+    recall: float
+
+    def build(self) -> TemplateParser:
+        """The parser, for OutputProcessor.register_parser()."""
+        return TemplateParser(self.tool, self.rules)
+
+    def render(self) -> str:
+        """Source of a parser module loadable by ParserWatcher."""
+        rules = "".join(
+            f"    TemplateRule({rule.pattern!r}, {rule.type!r}, {rule.severity!r}),\n"
+            for rule in self.rules
+        )
+        return (
+            f'"""Learned {self.tool} parser.\n\n'
+            f"Proposed from {self.samples} Tier 2 samples (precision {self.precision:.2f}, "
+            f"recall {self.recall:.2f})\n"
+            f'by cyberred.tools.parser_learning. Review the rules before deploying.\n"""\n\n'
+            f"from cyberred.tools.parser_learning import TemplateParser, TemplateRule\n\n"
+            f"RULES = [\n{rules}]\n\n"
+            f"parse = TemplateParser({self.tool!r}, RULES)\n"
+        )
+
+    def write(self, directory: Path) -> Path:
+        """Save the parser module as <directory>/<tool>.py.
+
+        Raises:
+            FileExistsError: If the tool already has a parser there.
+        """
+        path = Path(directory) / f"{self.tool}.py"
+        with open(path, "x") as f:
+            f.write(self.render())
+        log.info("learned_parser_written", tool=self.tool, path=str(path))
+        return path
+
+
+class SampleStore:
+    """Tier 2 samples per tool, for proposing parsers."""
+
+    def __init__(self, max_samples: int = MAX_SAMPLES, min_samples: int = MIN_SAMPLES) -> None:
+        self._max_samples = max_samples
+        self._min_samples = min_samples
+        self._samples: Dict[str, Deque[Tier2Sample]] = {}
+        self._runs: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, tool: str, stdout: str, findings: Iterable[Tuple[str, str, str]]) -> None:
+        """Record a Tier 2 result.
+
+        Args:
+            tool: Tool name.
+            stdout: The tool's output (only an excerpt is kept).
+            findings: (type, severity, evidence) of each finding.
+        """
+        tool = tool.lower()
+        sample = excerpt_sample(stdout, tuple(findings))
+        with self._lock:
+            if tool not in self._samples:
+                self._samples[tool] = deque(maxlen=self._max_samples)
+            self._samples[tool].append(sample)
+            self._runs[tool] += 1
+
+    def samples(self, tool: str) -> List[Tier2Sample]:
+        """Recorded samples for a tool, oldest first."""
+        with self._lock:
+            return list(self._samples.get(tool.lower(), ()))
+
+    def candidates(self) -> List[str]:
+        """Tools with enough samples, most Tier 2 runs first."""
+        with self._lock:
+            ready = [tool for tool, samples in self._samples.items() if len(samples) >= self._min_samples]
+            return sorted(ready, key=lambda tool: -self._runs[tool])
+
+    def propose(self, tool: str) -> Optional[ParserProposal]:
+        """Propose a parser for a tool (None without enough samples)."""
+        samples = self.samples(tool)
+        if len(samples) < self._min_samples:
+            return None
+        return propose_parser(tool.lower(), samples)
+
+
+def excerpt_sample(stdout: str, findings: Tuple[Tuple[str, str, str], ...]) -> Tier2Sample:
+    """A Tier 2 result with stdout cut down to what parser learning uses.
+
+    Keeps the evidence lines and CONTEXT_LINES on each side of them (all
+    lines if no evidence is found), in order and up to MAX_SAMPLE_CHARS.
+    Findings whose evidence lines were cut by the size cap are dropped,
+    so they do not count as missed; findings whose evidence is not in
+    the output are kept.
+
+    Args:
+        stdout: The tool's output.
+        findings: (type, severity, evidence) of each finding.
+
+    Returns:
+        The sample, with ANSI codes and surrounding whitespace stripped.
+    """
+    lines = [line.strip() for line in strip_ansi(stdout).split('\n')]
+    located = [(finding, _evidence_lines(lines, finding[2])) for finding in findings]
+    context: Set[int] = set()
+    for _, indexes in located:
+        for i in indexes:
+            context.update(range(max(0, i - CONTEXT_LINES), min(len(lines), i + CONTEXT_LINES + 1)))
+
+    kept: List[int] = []
+    size = 0
+    for i in sorted(context) if context else range(len(lines)):
+        size += len(lines[i]) + 1
+        if size > MAX_SAMPLE_CHARS:
+            break
+        kept.append(i)
+    kept_set = set(kept)
+    findings = tuple(finding for finding, indexes in located if not indexes or indexes & kept_set)
+    return Tier2Sample('\n'.join(lines[i] for i in kept), findings)
+
+
+def _field_template(field: str) -> str:
+    """Regex for a whitespace-separated field, its values generalized."""
+    parts = []
+    pos = 0
+    for m in _VALUE.finditer(field):
+        parts.append(re.escape(field[pos:m.start()]))
+        parts.append(_VALUE_CLASSES[m.lastgroup])
+        pos = m.end()
+    parts.append(re.escape(field[pos:]))
+    return "".join(parts)
+
+
+def _evidence_lines(lines: List[str], evidence: str) -> Set[int]:
+    """Indexes of the output lines containing the evidence."""
+    found: Set[int] = set()
+    for part in strip_ansi(evidence).split('\n'):
+        part = part.strip()
+        if len(part) >= MIN_EVIDENCE_CHARS:
+            found.update(i for i, line in enumerate(lines) if part in line)
+    return found
+
+
+def _induce_rules(prepared, min_support: int) -> List[TemplateRule]:
+    """Rules for the evidence line shapes seen in min_support samples."""
+    # Lines of one shape: same finding, field count and first field
+    groups: Dict[Tuple[str, str, int, str], List[Tuple[int, List[str]]]] = defaultdict(list)
+    for n, (lines, evidence) in enumerate(prepared):
+        for finding_type, severity, indexes in evidence:
+            for i in indexes:
+                fields = [_field_template(field) for field in lines[i].split()]
+                groups[(finding_type, severity, len(fields), fields[0])].append((n, fields))
+
+    rules = []
+    for (finding_type, severity, _, _), members in groups.items():
+        if len({n for n, _ in members}) < min_support:
+            continue
+        columns = zip(*(fields for _, fields in members))
+        fields = [column[0] if len(set(column)) == 1 else _ANY_FIELD for column in columns]
+        rules.append((fields.count(_ANY_FIELD), TemplateRule(r'\s+'.join(fields), finding_type, severity)))
+    # Most specific first
+    return [rule for _, rule in sorted(rules, key=lambda item: (item[0], -len(item[1].pattern)))]
+
+
+def _validate(tool: str, rules: List[TemplateRule], prepared) -> Tuple[Dict[TemplateRule, Tuple[int, int]], int, int]:
+    """Per-rule (true, false) matches, and findings reproduced out of all."""
+    parser = TemplateParser(tool, rules)
+    matches: Dict[TemplateRule, List[int]] = {rule: [0, 0] for rule in rules}
+    covered = total = 0
+    for lines, evidence in prepared:
+        matched = {}
+        for i, line in enumerate(lines):
+            rule = parser.match(line) if line else None
+            if rule is not None:
+                matched[i] = rule
+                correct = any(i in indexes and rule.type == t for t, _, indexes in evidence)
+                matches[rule][0 if correct else 1] += 1
+        for finding_type, _, indexes in evidence:
+            total += 1
+            if any(i in matched and matched[i].type == finding_type for i in indexes):
+                covered += 1
+    return {rule: (tp, fp) for rule, (tp, fp) in matches.items()}, covered, total
+
+
+def propose_parser(
+    tool: str,
+    samples: Sequence[Tier2Sample],
+    min_support: int = MIN_SUPPORT,
+    min_precision: float = MIN_PRECISION,
+    min_recall: float = MIN_RECALL,
+) -> Optional[ParserProposal]:
+    """Learn and validate a template parser from Tier 2 samples.
+
+    Args:
+        tool: Tool name (also the parser module's name).
+        samples: Recorded Tier 2 results for the tool.
+        min_support: Samples a line template must appear in.
+        min_precision: Minimum precision of each rule.
+        min_recall: Minimum share of findings reproduced.
+
+    Returns:
+        The proposal, or None if the samples do not support one.
+
+    Raises:
+        ValueError: If tool is not a valid parser module name.
+    """
+    if not _TOOL_NAME.match(tool):
+        raise ValueError(f"Invalid tool name for a parser module: {tool!r}")
+
+    prepared = []
+    for sample in samples:
+        lines = [line.strip() for line in strip_ansi(sample.stdout).split('\n')]
+        evidence = [
+            (finding_type, severity, _evidence_lines(lines, text))
+            for finding_type, severity, text in sample.findings
+        ]
+        prepared.append((lines, evidence))
+
+    rules = _induce_rules(prepared, min_support)
+    while rules:
+        stats, covered, total = _validate(tool, rules, prepared)
+        # Drop imprecise rules and rules shadowed by earlier ones
+        kept = [rule for rule in rules if stats[rule][0] and stats[rule][0] / sum(stats[rule]) >= min_precision]
+        if kept == rules:
+            break
+        rules = kept
+
+    if not rules:
+        log.info("learned_parser_rejected", tool=tool, samples=len(samples), reason="no_rules")
+        return None
+    true_matches = sum(tp for tp, _ in stats.values())
+    precision = true_matches / sum(tp + fp for tp, fp in stats.values())
+    recall = covered / total
+    if recall < min_recall:
+        log.info("learned_parser_rejected", tool=tool, samples=len(samples), reason="low_recall", recall=recall)
+        return None
+
+    log.info("learned_parser_proposed", tool=tool, samples=len(samples), rules=len(rules),
+             precision=precision, recall=recall)
+    return ParserProposal(tool, tuple(rules), len(samples), precision, recall)
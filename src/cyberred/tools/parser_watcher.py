@@ -71,6 +71,8 @@ class ParserWatcher(FileSystemEventHandler):
                     log.warning("invalid_parser_signature", parser=module_name, signature=str(sig))
                     return False
                     
+                # Swapped in atomically once fully loaded and validated;
+                # parses already running keep the previous implementation
                 self._processor.register_parser(module_name, parser_fn)
                 log.info("parser_reloaded", parser=module_name)
                 return True
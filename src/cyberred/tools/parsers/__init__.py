@@ -1,48 +1,21 @@
-"""Tier 1 Parser definitions."""
+"""Tier 1 Parser definitions.
 
-# Existing parsers (Stories 4.5-4.9)
-from .nmap import nmap_parser
-from .nuclei import nuclei_parser
-from .sqlmap import sqlmap_parser
-from .ffuf import ffuf_parser
-from .nikto import nikto_parser
-from .hydra import hydra_parser
+The <tool>_parser functions are imported on first access (PEP 562), so
+importing a single parser module does not import all of them. Parsers
+by tool name: see registry.ParserRegistry.
+"""
 
-# Reconnaissance parsers (Story 4.10)
-from .masscan import masscan_parser
-from .subfinder import subfinder_parser
-from .amass import amass_parser
-from .whatweb import whatweb_parser
-from .wafw00f import wafw00f_parser
-from .dnsrecon import dnsrecon_parser
-from .theharvester import theharvester_parser
-from .gobuster import gobuster_parser
+import importlib
+from typing import List
 
-# Exploitation parsers (Story 4.10)
-from .crackmapexec import crackmapexec_parser
-from .responder import responder_parser
-from .secretsdump import secretsdump_parser
-from .psexec import psexec_parser
-from .metasploit import metasploit_parser
-from .searchsploit import searchsploit_parser
+from .registry import BUILTIN_PARSERS, ParserRegistry, RegisteredParser
 
-# Post-exploitation parsers (Story 4.10)
-from .mimikatz import mimikatz_parser
-from .bloodhound import bloodhound_parser
-from .linpeas import linpeas_parser
-from .winpeas import winpeas_parser
-from .lazagne import lazagne_parser
-from .chisel import chisel_parser
-
-# Wireless parsers (Story 4.10)
-from .aircrack import aircrack_parser
-from .wifite import wifite_parser
-
-# Credential parsers (Story 4.10)
-from .john import john_parser
-from .hashcat import hashcat_parser
+_EXPORTS = {f"{module}_parser": module for module in BUILTIN_PARSERS.values()}
 
 __all__ = [
+    'BUILTIN_PARSERS',
+    'ParserRegistry',
+    'RegisteredParser',
     # Original parsers (6)
     'nmap_parser', 
     'nuclei_parser', 
@@ -80,3 +53,16 @@ __all__ = [
     'john_parser',
     'hashcat_parser',
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parser = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = parser
+    return parser
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,8 +1,12 @@
 """BloodHound/SharpHound output parser for structured finding extraction."""
 import json
-from typing import List
+from typing import Iterator, List, Optional
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.json_stream import JsonSource, iter_json_entries, peek_last_member
+
+# Top-level arrays holding AD objects
+ITEM_KEYS = ("data", "computers", "users", "groups")
 
 
 def bloodhound_parser(
@@ -27,51 +31,90 @@ def bloodhound_parser(
     Returns:
         List of Finding objects for AD objects
     """
-    findings: List[Finding] = []
-    
     if not stdout or not stdout.strip():
-        return findings
+        return []
     
-    # Try to parse as JSON
+    findings: List[Finding] = []
     try:
-        data = json.loads(stdout)
-        
-        # Handle different BloodHound JSON formats
-        if isinstance(data, dict):
-            # Check for data key (BloodHound v4+ format)
-            items = data.get("data", data.get("computers", data.get("users", data.get("groups", []))))
-            meta = data.get("meta", {})
-            object_type = meta.get("type", "").lower()
-            
-            if not object_type:
-                # Try to infer type from content
-                if "users" in data:
-                    object_type = "users"
-                    items = data["users"]
-                elif "computers" in data:
-                    object_type = "computers"
-                    items = data["computers"]
-                elif "groups" in data:
-                    object_type = "groups"
-                    items = data["groups"]
-            
-            findings.extend(_parse_bloodhound_items(items, object_type, agent_id, target))
-            
-        elif isinstance(data, list):
-            # Direct list of objects
-            for item in data:
-                findings.extend(_parse_bloodhound_item(item, agent_id, target))
-                
-        return findings
+        for finding in iter_bloodhound_findings(stdout, agent_id, target):
+            findings.append(finding)
     except json.JSONDecodeError:
-        pass
+        # If not JSON, return empty
+        return []
     
-    # If not JSON, return empty
     return findings
 
 
-def _parse_bloodhound_items(items: list, object_type: str, agent_id: str, target: str) -> List[Finding]:
+def iter_bloodhound_findings(
+    source: JsonSource,
+    agent_id: str,
+    target: str
+) -> Iterator[Finding]:
+    """
+    Stream Findings from a BloodHound JSON document.
+    
+    Objects are decoded one at a time (see json_stream), so memory does not
+    grow with the size of the domain. Reads a SharpHound file (items under
+    "data", or "computers"/"users"/"groups", typed by "meta") or a plain
+    list of objects.
+    
+    Args:
+        source: The document (str, bytes, a file or an iterable of chunks)
+        agent_id: The agent ID that ran the collection
+        target: The target domain that was collected
+        
+    Raises:
+        json.JSONDecodeError: If the document is malformed (findings before
+            the error have already been yielded)
+    """
+    batch = common.FindingBatch(agent_id, "bloodhound")
+    # SharpHound writes "meta" after "data": read it from the tail if possible
+    meta = peek_last_member(source, "meta") if not _is_chunk_iterable(source) else None
+    meta_type = _meta_type(meta)
+    # "data" items seen before their type is known (meta could not be peeked)
+    pending: List[dict] = []
+    
+    for entry in iter_json_entries(source):
+        if entry.key is None:
+            # Direct list of objects
+            if entry.item and isinstance(entry.value, dict):
+                yield from _parse_bloodhound_item(entry.value, agent_id, target, batch)
+        elif not entry.item:
+            if entry.key == "meta" and meta_type is None:
+                meta_type = _meta_type(entry.value)
+                yield from _parse_bloodhound_items(pending, meta_type or "", agent_id, target, batch)
+                pending = []
+        elif entry.key in ITEM_KEYS:
+            if entry.key == "data" and meta_type is None:
+                pending.append(entry.value)
+            else:
+                # Without a meta type, "users" etc. name their own type
+                object_type = meta_type or entry.key
+                yield from _parse_bloodhound_items([entry.value], object_type, agent_id, target, batch)
+    
+    yield from _parse_bloodhound_items(pending, "", agent_id, target, batch)
+
+
+def _is_chunk_iterable(source: JsonSource) -> bool:
+    return not isinstance(source, (str, bytes)) and not hasattr(source, "read")
+
+
+def _meta_type(meta: object) -> Optional[str]:
+    """Object type from a "meta" member (None if it has none)."""
+    if isinstance(meta, dict):
+        return meta.get("type", "").lower() or None
+    return None
+
+
+def _parse_bloodhound_items(
+    items: list,
+    object_type: str,
+    agent_id: str,
+    target: str,
+    batch: Optional[common.FindingBatch] = None
+) -> List[Finding]:
     """Parse a list of BloodHound items."""
+    batch = batch or common.FindingBatch(agent_id, "bloodhound")
     findings: List[Finding] = []
     
     for item in items:
@@ -101,20 +144,24 @@ def _parse_bloodhound_items(items: list, object_type: str, agent_id: str, target
             if is_high_value:
                 evidence += " [HIGH VALUE]"
             
-            findings.append(common.create_finding(
+            findings.append(batch.create(
                 type_val="ad_object",
                 severity=severity,
                 target=target,
-                evidence=evidence,
-                agent_id=agent_id,
-                tool="bloodhound"
+                evidence=evidence
             ))
     
     return findings
 
 
-def _parse_bloodhound_item(item: dict, agent_id: str, target: str) -> List[Finding]:
+def _parse_bloodhound_item(
+    item: dict,
+    agent_id: str,
+    target: str,
+    batch: Optional[common.FindingBatch] = None
+) -> List[Finding]:
     """Parse a single BloodHound item."""
+    batch = batch or common.FindingBatch(agent_id, "bloodhound")
     findings: List[Finding] = []
     
     properties = item.get("Properties", item)
@@ -130,13 +177,11 @@ def _parse_bloodhound_item(item: dict, agent_id: str, target: str) -> List[Findi
     
     evidence = f"AD {object_type}: {name}"
     
-    findings.append(common.create_finding(
+    findings.append(batch.create(
         type_val="ad_object",
         severity=severity,
         target=target,
-        evidence=evidence,
-        agent_id=agent_id,
-        tool="bloodhound"
+        evidence=evidence
     ))
     
     return findings
@@ -2,7 +2,12 @@ import uuid
 import hashlib
 from typing import Optional
 from datetime import datetime, timezone
-from cyberred.core.models import Finding
+from cyberred.core.models import (
+    Finding,
+    _validate_severity,
+    _validate_target,
+    _validate_uuid,
+)
 
 def generate_topic(target: str, finding_type: str) -> str:
     """
@@ -40,3 +45,62 @@ def create_finding(
         topic=topic,
         signature=""
     )
+
+class FindingBatch:
+    """
+    Factory for the findings of one parse run (same agent, tool and time).
+
+    Cheaper than create_finding() per finding for bulk output (a masscan
+    or nmap run can yield 50k open ports): agent_id is validated and the
+    timestamp taken once per batch, each distinct target is validated and
+    MD5-hashed once, and ids are generated here, so findings are built
+    without re-running Finding validation. Invalid input raises the same
+    ValueError as Finding().
+    """
+
+    def __init__(self, agent_id: str, tool: str) -> None:
+        self.agent_id = agent_id
+        self.tool = tool
+        self.timestamp = datetime.now(timezone.utc).isoformat()
+        # agent_id is checked on the first create(), as create_finding() would
+        self._agent_checked = False
+        # target -> topic prefix "findings:{target_hash}:"
+        self._prefixes: dict[str, str] = {}
+
+    def _prefix(self, target: str) -> str:
+        prefix = self._prefixes.get(target)
+        if prefix is None:
+            _validate_target(target, "target")
+            prefix = f"findings:{hashlib.md5(target.encode()).hexdigest()[:8]}:"
+            self._prefixes[target] = prefix
+        return prefix
+
+    def create(
+        self,
+        type_val: str,
+        severity: str,
+        target: str,
+        evidence: str,
+        topic: Optional[str] = None
+    ) -> Finding:
+        """
+        Same as create_finding() with the batch's agent_id and tool.
+        If topic is None, auto-generated as by generate_topic(target, type_val).
+        """
+        _validate_severity(severity)
+        if not self._agent_checked:
+            _validate_uuid(self.agent_id, "agent_id")
+            self._agent_checked = True
+        prefix = self._prefix(target)
+        return Finding.trusted(
+            id=str(uuid.uuid4()),
+            type=type_val,
+            severity=severity,
+            target=target,
+            evidence=evidence,
+            agent_id=self.agent_id,
+            timestamp=self.timestamp,
+            tool=self.tool,
+            topic=prefix + type_val if topic is None else topic,
+            signature=""
+        )
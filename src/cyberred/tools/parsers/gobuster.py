@@ -4,6 +4,13 @@ from typing import List
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
 
+# Pattern: /path (Status: 200) [Size: 1234]
+# Or: /path                    (Status: 200) [Size: 1234]
+DIR_PATTERN = re.compile(r'^(/\S+)\s+\(Status:\s*(\d+)\)(?:\s+\[Size:\s*(\d+)\])?', re.MULTILINE)
+
+# Pattern: Found: subdomain.example.com
+DNS_PATTERN = re.compile(r'Found:\s+(\S+)', re.IGNORECASE)
+
 
 def gobuster_parser(
     stdout: str,
@@ -50,63 +57,62 @@ def gobuster_parser(
 
 def _parse_dir_mode(stdout: str, agent_id: str, target: str) -> List[Finding]:
     """Parse gobuster dir mode output."""
-    findings: List[Finding] = []
+    return [
+        dir_match_to_finding(match, agent_id, target)
+        for match in DIR_PATTERN.finditer(stdout)
+    ]
+
+
+def dir_match_to_finding(match: re.Match, agent_id: str, target: str) -> Finding:
+    """Convert a DIR_PATTERN match to a Finding."""
+    path, status, size = match.groups()
+    status = int(status)
     
-    # Pattern: /path (Status: 200) [Size: 1234]
-    # Or: /path                    (Status: 200) [Size: 1234]
-    pattern = re.compile(r'^(/\S+)\s+\(Status:\s*(\d+)\)(?:\s+\[Size:\s*(\d+)\])?', re.MULTILINE)
+    # Determine if directory or file
+    is_dir = path.endswith('/') or (status in [301, 302] and not '.' in path.split('/')[-1])
+    finding_type = "directory" if is_dir else "file"
     
-    for match in pattern.finditer(stdout):
-        path, status, size = match.groups()
-        status = int(status)
-        
-        # Determine if directory or file
-        is_dir = path.endswith('/') or (status in [301, 302] and not '.' in path.split('/')[-1])
-        finding_type = "directory" if is_dir else "file"
-        
-        # Map severity based on status code
-        if status == 200:
-            severity = "info"
-        elif status == 403:
-            severity = "low"  # Forbidden might indicate something interesting
-        elif status in [301, 302]:
-            severity = "info"
-        else:
-            severity = "info"
-        
-        evidence = f"[{status}] {path}"
-        if size:
-            evidence += f" (Size: {size})"
-        
-        findings.append(common.create_finding(
-            type_val=finding_type,
-            severity=severity,
-            target=target,
-            evidence=evidence,
-            agent_id=agent_id,
-            tool="gobuster"
-        ))
+    # Map severity based on status code
+    if status == 200:
+        severity = "info"
+    elif status == 403:
+        severity = "low"  # Forbidden might indicate something interesting
+    elif status in [301, 302]:
+        severity = "info"
+    else:
+        severity = "info"
     
-    return findings
+    evidence = f"[{status}] {path}"
+    if size:
+        evidence += f" (Size: {size})"
+    
+    return common.create_finding(
+        type_val=finding_type,
+        severity=severity,
+        target=target,
+        evidence=evidence,
+        agent_id=agent_id,
+        tool="gobuster"
+    )
 
 
 def _parse_dns_mode(stdout: str, agent_id: str, target: str) -> List[Finding]:
     """Parse gobuster dns/vhost mode output."""
-    findings: List[Finding] = []
-    
-    # Pattern: Found: subdomain.example.com
-    pattern = re.compile(r'Found:\s+(\S+)', re.IGNORECASE)
-    
-    for match in pattern.finditer(stdout):
-        hostname = match.group(1).strip()
-        
-        findings.append(common.create_finding(
-            type_val="subdomain",
-            severity="info",
-            target=target,
-            evidence=f"Subdomain: {hostname}",
-            agent_id=agent_id,
-            tool="gobuster"
-        ))
+    return [
+        dns_match_to_finding(match, agent_id, target)
+        for match in DNS_PATTERN.finditer(stdout)
+    ]
+
+
+def dns_match_to_finding(match: re.Match, agent_id: str, target: str) -> Finding:
+    """Convert a DNS_PATTERN match to a Finding."""
+    hostname = match.group(1).strip()
     
-    return findings
+    return common.create_finding(
+        type_val="subdomain",
+        severity="info",
+        target=target,
+        evidence=f"Subdomain: {hostname}",
+        agent_id=agent_id,
+        tool="gobuster"
+    )
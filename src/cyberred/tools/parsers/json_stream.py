@@ -0,0 +1,227 @@
+"""Incremental JSON parsing for large tool outputs.
+
+BloodHound dumps, masscan -oJ and ffuf -o json hold their records in one
+big array. iter_json_entries() walks the top level of such a document
+and decodes one array element at a time, so the document is never held
+as one Python object tree; memory is bounded by the largest element:
+
+- A top-level array yields each element.
+- A top-level object yields each element of its array members (one at
+  a time) and every other member whole.
+
+Sources are read in chunks (str, bytes, binary or text files, or
+iterables of chunks), so a dump on disk need not be read into memory.
+Built on json.JSONDecoder.raw_decode (no extra dependency).
+
+Usage:
+    from cyberred.tools.parsers.json_stream import iter_json_entries
+
+    with open("users.json", "rb") as f:
+        for entry in iter_json_entries(f):
+            if entry.item and entry.key == "data":
+                handle(entry.value)
+"""
+
+import codecs
+import io
+import json
+import re
+from typing import IO, Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+JsonSource = Union[str, bytes, IO, Iterable[Union[str, bytes]]]
+
+# Size of the slices read from the source
+CHUNK_SIZE = 1 << 16
+
+# Bytes read from the end of a document by peek_last_member()
+TAIL_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonEntry(NamedTuple):
+    """One top-level value of a JSON document.
+
+    Attributes:
+        key: Member name (None for a top-level array or scalar).
+        value: The decoded value.
+        item: True if value is one element of an array.
+    """
+
+    key: Optional[str]
+    value: Any
+    item: bool
+
+
+def _text_chunks(source: JsonSource) -> Iterator[str]:
+    """Split a source into text chunks, decoding bytes as UTF-8."""
+    if isinstance(source, str):
+        for i in range(0, len(source), CHUNK_SIZE):
+            yield source[i:i + CHUNK_SIZE]
+        return
+    if isinstance(source, (bytes, bytearray)):
+        view = memoryview(source)
+        pieces: Iterable[Union[str, bytes]] = (
+            view[i:i + CHUNK_SIZE] for i in range(0, len(source), CHUNK_SIZE)
+        )
+    elif hasattr(source, "read"):
+        pieces = iter(lambda: source.read(CHUNK_SIZE), source.read(0))
+    else:
+        pieces = source
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for piece in pieces:
+        text = piece if isinstance(piece, str) else decoder.decode(piece)
+        if text:
+            yield text
+    # Raises on a UTF-8 sequence cut off at the end
+    decoder.decode(b"", final=True)
+
+
+class _Reader:
+    """Pull-style reader over a chunked JSON document."""
+
+    def __init__(self, source: JsonSource) -> None:
+        self._chunks = _text_chunks(source)
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk (dropping consumed text); False at EOF."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at EOF)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos:self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof or not self._fill():
+                    raise
+                continue
+            # A value ending at the buffer's end may continue (12|34, tr|ue)
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """Elements of the array at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def end(self) -> None:
+        """Check that only whitespace is left."""
+        if self.peek():
+            raise self._error("Extra data")
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+
+def iter_json_entries(source: JsonSource) -> Iterator[JsonEntry]:
+    """Top-level values of a JSON document, array elements one at a time.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed (entries
+            before the error have already been yielded).
+    """
+    reader = _Reader(source)
+    char = reader.peek()
+    if char == "[":
+        for value in reader.array():
+            yield JsonEntry(None, value, True)
+    elif char == "{":
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.expect("}")
+        else:
+            while True:
+                if reader.peek() != '"':
+                    raise reader._error("Expecting property name enclosed in double quotes")
+                key = reader.value()
+                reader.expect(":")
+                if reader.peek() == "[":
+                    for value in reader.array():
+                        yield JsonEntry(key, value, True)
+                else:
+                    yield JsonEntry(key, reader.value(), False)
+                if reader.peek() == "}":
+                    reader.expect("}")
+                    break
+                reader.expect(",")
+    else:
+        yield JsonEntry(None, reader.value(), False)
+    reader.end()
+
+
+def peek_last_member(source: Union[str, bytes, IO], key: str) -> Optional[Any]:
+    """Value of a document's last top-level member, if it is named key.
+
+    Reads only the tail of the document. Tools that write a summary after
+    the records (SharpHound's "meta") need it before streaming the
+    records. Only in-memory documents and seekable binary files can be
+    peeked; the file position is restored.
+
+    Returns:
+        The member's value, or None if the last member is not key, is
+        not within the tail, or the source cannot be peeked.
+    """
+    if isinstance(source, (str, bytes)):
+        tail = source[-TAIL_SIZE:]
+    elif not isinstance(source, io.TextIOBase) and getattr(source, "seekable", lambda: False)():
+        position = source.tell()
+        try:
+            size = source.seek(0, 2)
+            source.seek(max(position, size - TAIL_SIZE))
+            tail = source.read()
+        finally:
+            source.seek(position)
+    else:
+        return None
+    if isinstance(tail, bytes):
+        tail = tail.decode("utf-8", errors="ignore")
+    decoder = json.JSONDecoder()
+    marker = f'"{key}"'
+    start = tail.rfind(marker)
+    while start != -1:
+        colon = _WHITESPACE.match(tail, start + len(marker)).end()
+        if tail.startswith(":", colon):
+            try:
+                value, end = decoder.raw_decode(tail, _WHITESPACE.match(tail, colon + 1).end())
+            except json.JSONDecodeError:
+                value, end = None, -1
+            if end != -1 and tail[end:].strip() == "}":
+                return value
+        start = tail.rfind(marker, 0, start)
+    return None
@@ -3,12 +3,33 @@ import re
 from typing import List, Tuple
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.patterns import PatternSet, strip_ansi
 
+# Patterns for privilege escalation vectors: (rule, pattern, vector type, severity)
+PRIVESC_PATTERNS: List[Tuple[str, str, str, str]] = [
+    # SUID binaries
+    ("suid", r'(SUID|sgid).*?(/\S+)', "SUID/SGID binary", "high"),
+    # Capabilities
+    ("capability", r'(cap_\w+).*?(/\S+)', "Linux capability", "high"),
+    # Writable paths
+    ("writable", r'(Writable|writable).*?(/\S+)', "Writable path", "medium"),
+    # Cron jobs
+    ("cron", r'(\*/\d+|\d+\s+\*|\*\s+\d+).*?(/\S+)', "Cron job", "medium"),
+    # Sudo permissions
+    ("sudo", r'\(ALL\s*:\s*ALL\)\s*(NOPASSWD)?', "Sudo permission", "critical"),
+    # Docker/LXC
+    ("container_socket", r'(docker|lxc).*?socket', "Container socket", "critical"),
+    # Kernel exploits
+    ("kernel_cve", r'CVE-\d{4}-\d+', "Potential kernel exploit", "high"),
+]
 
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+VECTORS = {rule: (vector_type, severity) for rule, _, vector_type, severity in PRIVESC_PATTERNS}
+
+RULES = PatternSet("linpeas", [
+    # Section headers (marked with special characters)
+    ("section", r'^(?:=|#|\[\+\])'),
+    *((rule, pattern) for rule, pattern, _, _ in PRIVESC_PATTERNS),
+], flags=re.IGNORECASE)
 
 
 def linpeas_parser(
@@ -38,68 +59,40 @@ def linpeas_parser(
     if not stdout or not stdout.strip():
         return findings
     
-    # Strip ANSI codes for parsing
-    clean_output = strip_ansi(stdout)
-    
-    # Track current section for context
-    current_section = ""
-    
-    # Patterns for privilege escalation vectors
-    privesc_patterns: List[Tuple[str, str, str]] = [
-        # SUID binaries
-        (r'(SUID|sgid).*?(/\S+)', "SUID/SGID binary", "high"),
-        # Capabilities
-        (r'(cap_\w+).*?(/\S+)', "Linux capability", "high"),
-        # Writable paths
-        (r'(Writable|writable).*?(/\S+)', "Writable path", "medium"),
-        # Cron jobs
-        (r'(\*/\d+|\d+\s+\*|\*\s+\d+).*?(/\S+)', "Cron job", "medium"),
-        # Sudo permissions
-        (r'\(ALL\s*:\s*ALL\)\s*(NOPASSWD)?', "Sudo permission", "critical"),
-        # Docker/LXC
-        (r'(docker|lxc).*?socket', "Container socket", "critical"),
-        # Kernel exploits
-        (r'CVE-\d{4}-\d+', "Potential kernel exploit", "high"),
-    ]
-    
     seen_findings = set()
     
-    for line in clean_output.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Detect section headers (marked with special characters)
-        if line.startswith('=') or line.startswith('#') or line.startswith('[+]'):
-            current_section = line
+    # Strip ANSI codes for parsing
+    for line, match in RULES.scan(strip_ansi(stdout)):
+        if match.rule == "section":
             continue
         
         # Check for 95% or 99% indicators (linpeas high confidence markers)
         is_high_confidence = '95%' in line or '99%' in line or 'PE' in line
         
-        for pattern, vector_type, base_severity in privesc_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                # Extract relevant info
-                finding_key = f"{vector_type}:{match.group(0)[:50]}"
-                
-                if finding_key in seen_findings:
-                    continue
-                seen_findings.add(finding_key)
-                
-                severity = "critical" if is_high_confidence else base_severity
-                
-                description = line[:200]  # Truncate long lines
-                evidence = f"{vector_type}: {description}"
-                
-                findings.append(common.create_finding(
-                    type_val="privesc_vector",
-                    severity=severity,
-                    target=target,
-                    evidence=evidence,
-                    agent_id=agent_id,
-                    tool="linpeas"
-                ))
-                break
+        while match is not None:
+            vector_type, base_severity = VECTORS[match.rule]
+            # Extract relevant info
+            finding_key = f"{vector_type}:{match.text[:50]}"
+            
+            if finding_key in seen_findings:
+                # Already reported: try the next vector on this line
+                match = RULES.match(line, match.index + 1)
+                continue
+            seen_findings.add(finding_key)
+            
+            severity = "critical" if is_high_confidence else base_severity
+            
+            description = line[:200]  # Truncate long lines
+            evidence = f"{vector_type}: {description}"
+            
+            findings.append(common.create_finding(
+                type_val="privesc_vector",
+                severity=severity,
+                target=target,
+                evidence=evidence,
+                agent_id=agent_id,
+                tool="linpeas"
+            ))
+            break
     
     return findings
@@ -1,9 +1,16 @@
 """Masscan output parser for structured finding extraction."""
 import json
 import re
-from typing import List
+from typing import List, Optional
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.json_stream import JsonSource, iter_json_entries
+
+# Pattern: Discovered open port 80/tcp on 192.168.1.1
+STDOUT_PATTERN = re.compile(r'Discovered open port (\d+)/(\w+) on (\S+)')
+
+# JSON output (-oJ) is an array of host records
+JSON_ARRAY = re.compile(r'\s*\[')
 
 
 def masscan_parser(
@@ -30,17 +37,15 @@ def masscan_parser(
     """
     findings: List[Finding] = []
     
-    if not stdout or not stdout.strip():
+    if not stdout or stdout.isspace():
         return findings
     
     # Try JSON parsing first
-    try:
-        data = json.loads(stdout)
-        if isinstance(data, list):
-            findings.extend(_parse_json_output(data, agent_id, target))
-            return findings
-    except json.JSONDecodeError:
-        pass
+    if JSON_ARRAY.match(stdout):
+        try:
+            return _parse_json_output(stdout, agent_id, target)
+        except json.JSONDecodeError:
+            pass
     
     # Fall back to stdout regex parsing
     findings.extend(_parse_stdout_output(stdout, agent_id, target))
@@ -48,55 +53,77 @@ def masscan_parser(
     return findings
 
 
-def _parse_json_output(data: list, agent_id: str, target: str) -> List[Finding]:
-    """Parse masscan JSON output format."""
+def _parse_json_output(source: JsonSource, agent_id: str, target: str) -> List[Finding]:
+    """Parse masscan JSON output format, one host record at a time."""
     findings: List[Finding] = []
+    batch = common.FindingBatch(agent_id, "masscan")
     
-    for entry in data:
-        ip = entry.get("ip", target)
-        ports = entry.get("ports", [])
-        
-        for port_info in ports:
-            port = port_info.get("port")
-            proto = port_info.get("proto", "tcp")
-            status = port_info.get("status", "open")
-            
-            if port is None:
-                continue
-                
-            evidence = f"Port {port}/{proto} {status} on {ip}"
-            
-            findings.append(common.create_finding(
-                type_val="open_port",
-                severity="info",
-                target=ip,
-                evidence=evidence,
-                agent_id=agent_id,
-                tool="masscan"
-            ))
+    for entry in iter_json_entries(source):
+        findings.extend(json_entry_findings(entry.value, agent_id, target, batch))
     
     return findings
 
 
-def _parse_stdout_output(stdout: str, agent_id: str, target: str) -> List[Finding]:
-    """Parse masscan stdout format (non-JSON)."""
+def json_entry_findings(
+    entry: dict,
+    agent_id: str,
+    target: str,
+    batch: Optional[common.FindingBatch] = None
+) -> List[Finding]:
+    """Convert one masscan JSON host record to Findings.
+
+    Pass batch to share one finding factory across the records of a scan.
+    """
+    batch = batch or common.FindingBatch(agent_id, "masscan")
     findings: List[Finding] = []
+    ip = entry.get("ip", target)
+    ports = entry.get("ports", [])
     
-    # Pattern: Discovered open port 80/tcp on 192.168.1.1
-    pattern = re.compile(r'Discovered open port (\d+)/(\w+) on (\S+)')
-    
-    for match in pattern.finditer(stdout):
-        port, proto, ip = match.groups()
+    for port_info in ports:
+        port = port_info.get("port")
+        proto = port_info.get("proto", "tcp")
+        status = port_info.get("status", "open")
         
-        evidence = f"Port {port}/{proto} open on {ip}"
+        if port is None:
+            continue
+            
+        evidence = f"Port {port}/{proto} {status} on {ip}"
         
-        findings.append(common.create_finding(
+        findings.append(batch.create(
             type_val="open_port",
             severity="info",
             target=ip,
-            evidence=evidence,
-            agent_id=agent_id,
-            tool="masscan"
+            evidence=evidence
         ))
     
     return findings
+
+
+def _parse_stdout_output(stdout: str, agent_id: str, target: str) -> List[Finding]:
+    """Parse masscan stdout format (non-JSON)."""
+    batch = common.FindingBatch(agent_id, "masscan")
+    return [
+        stdout_match_to_finding(match, agent_id, batch)
+        for match in STDOUT_PATTERN.finditer(stdout)
+    ]
+
+
+def stdout_match_to_finding(
+    match: re.Match,
+    agent_id: str,
+    batch: Optional[common.FindingBatch] = None
+) -> Finding:
+    """Convert a STDOUT_PATTERN match to a Finding.
+
+    Pass batch to share one finding factory across the lines of a scan.
+    """
+    port, proto, ip = match.groups()
+    
+    evidence = f"Port {port}/{proto} open on {ip}"
+    
+    return (batch or common.FindingBatch(agent_id, "masscan")).create(
+        type_val="open_port",
+        severity="info",
+        target=ip,
+        evidence=evidence
+    )
@@ -3,6 +3,19 @@ import re
 from typing import List
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.patterns import PatternSet
+
+RULES = PatternSet("mimikatz", [
+    # Current user context
+    ("username", r'\*\s+Username\s*:\s*(\S+)'),
+    ("domain", r'\*\s+Domain\s*:\s*(\S+)'),
+    # Plaintext password
+    ("password", r'\*\s+Password\s*:\s*(\S+)'),
+    # NTLM hash
+    ("ntlm", r'\*\s+NTLM\s*:\s*([a-f0-9]{32})'),
+    # Kerberos ticket
+    ("kerberos", r'Kerberos.*?:\s*(\S+)'),
+], flags=re.IGNORECASE)
 
 
 def mimikatz_parser(
@@ -35,26 +48,19 @@ def mimikatz_parser(
     current_user = ""
     current_domain = ""
     
-    for line in stdout.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
+    for line, match in RULES.scan(stdout):
         # Track current user context
-        user_match = re.search(r'\*\s+Username\s*:\s*(\S+)', line, re.IGNORECASE)
-        if user_match:
-            current_user = user_match.group(1)
+        if match.rule == "username":
+            current_user = match.groups[0]
             continue
         
-        domain_match = re.search(r'\*\s+Domain\s*:\s*(\S+)', line, re.IGNORECASE)
-        if domain_match:
-            current_domain = domain_match.group(1)
+        if match.rule == "domain":
+            current_domain = match.groups[0]
             continue
         
         # Plaintext password
-        password_match = re.search(r'\*\s+Password\s*:\s*(\S+)', line, re.IGNORECASE)
-        if password_match:
-            password = password_match.group(1)
+        if match.rule == "password":
+            password = match.groups[0]
             
             # Skip null or empty passwords
             if password.lower() in ['(null)', 'null', '']:
@@ -73,9 +79,8 @@ def mimikatz_parser(
             continue
         
         # NTLM hash
-        ntlm_match = re.search(r'\*\s+NTLM\s*:\s*([a-f0-9]{32})', line, re.IGNORECASE)
-        if ntlm_match:
-            ntlm_hash = ntlm_match.group(1)
+        if match.rule == "ntlm":
+            ntlm_hash = match.groups[0]
             
             # Skip empty hashes
             if ntlm_hash == '31d6cfe0d16ae931b73c59d7e0c089c0':
@@ -94,9 +99,8 @@ def mimikatz_parser(
             continue
         
         # Kerberos ticket
-        krb_match = re.search(r'Kerberos.*?:\s*(\S+)', line, re.IGNORECASE)
-        if krb_match and ('ticket' in line.lower() or 'kirbi' in line.lower()):
-            ticket_info = krb_match.group(1)
+        if 'ticket' in line.lower() or 'kirbi' in line.lower():
+            ticket_info = match.groups[0]
             
             findings.append(common.create_finding(
                 type_val="credential",
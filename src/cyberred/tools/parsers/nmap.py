@@ -1,11 +1,214 @@
+"""Nmap parser: XML (-oX) and grepable (-oG) output to findings.
+
+XML is parsed incrementally: iter_nmap_elements() feeds the document to
+an XMLPullParser in chunks and hands out each top-level element of
+<nmaprun> (<host>, <scaninfo>, ...) once it is complete, then discards
+it. A /16 sweep whose XML runs to hundreds of MB is therefore processed
+one host at a time instead of as one tree. The same iterator backs
+nmap_parser (Tier 1), NmapXmlStream (findings per host while nmap runs)
+and mcp.nmap_adapter.NmapAdapter.
+
+Usage:
+    from cyberred.tools.parsers.nmap import iter_nmap_elements, host_findings
+
+    with open("scan.xml", "rb") as f:
+        for elem in iter_nmap_elements(f):
+            if elem.tag == "host":
+                findings = host_findings(elem, agent_id, target)
+"""
+
 import structlog
 import re
-from typing import List
+import xml.etree.ElementTree as ET
+from typing import IO, Iterable, Iterator, List, Optional, Union
 from cyberred.core.models import Finding
-from cyberred.tools.parsers.common import create_finding
+from cyberred.tools.parsers.common import FindingBatch
 
 log = structlog.get_logger()
 
+# A whole document, a binary or text file, or an iterable of chunks
+NmapXmlSource = Union[str, bytes, IO, Iterable[Union[str, bytes]]]
+
+# Size of the slices fed to the XML parser
+CHUNK_SIZE = 1 << 16
+
+
+def _chunks(source: NmapXmlSource) -> Iterator[Union[str, bytes]]:
+    """Split a source into chunks for the pull parser."""
+    if isinstance(source, (str, bytes)):
+        view = memoryview(source) if isinstance(source, bytes) else source
+        for i in range(0, len(source), CHUNK_SIZE):
+            yield view[i:i + CHUNK_SIZE]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+class NmapXmlStream:
+    """Incremental nmap XML parser.
+
+    feed() takes chunks of the document and returns the top-level
+    elements of <nmaprun> completed by them. Returned elements are
+    detached from the tree, so memory is bounded by the largest host.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root = None
+        self._depth = 0
+
+    def feed(self, chunk: Union[str, bytes]) -> List[ET.Element]:
+        """Parse a chunk; returns completed top-level elements.
+
+        Raises:
+            ET.ParseError: If the document is malformed.
+        """
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[ET.Element]:
+        """Finish the document; returns any remaining elements.
+
+        Raises:
+            ET.ParseError: If the document is malformed or incomplete.
+        """
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[ET.Element]:
+        completed = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                self._depth += 1
+                continue
+            self._depth -= 1
+            if self._depth == 1:
+                completed.append(elem)
+                # Detach it: the root keeps no finished children
+                del self._root[:]
+        return completed
+
+
+def iter_nmap_elements(source: NmapXmlSource) -> Iterator[ET.Element]:
+    """Yield each top-level element of <nmaprun> as soon as it is complete.
+
+    Args:
+        source: XML as str/bytes, a file opened in text or binary mode,
+            or an iterable of str/bytes chunks.
+
+    Raises:
+        ET.ParseError: If the document is malformed; elements before the
+            error have already been yielded.
+    """
+    stream = NmapXmlStream()
+    for chunk in _chunks(source):
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+def host_findings(
+    host: ET.Element,
+    agent_id: str,
+    target: str,
+    batch: Optional[FindingBatch] = None
+) -> List[Finding]:
+    """Findings of one <host>: status, OS match, scripts and open ports.
+
+    Args:
+        host: A <host> element.
+        agent_id: UUID of agent running the tool.
+        target: Fallback target if the host has no address.
+        batch: Finding factory shared across hosts (one per host if None).
+    """
+    batch = batch or FindingBatch(agent_id, "nmap")
+    findings: List[Finding] = []
+
+    # Extract host address (override target if found)
+    addr_elem = host.find('address')
+    host_addr = addr_elem.get('addr', target) if addr_elem is not None else target
+    
+    # Host status finding
+    status_elem = host.find('status')
+    if status_elem is not None:
+        state = status_elem.get('state', 'unknown')
+        findings.append(batch.create(
+            type_val="host_status",
+            severity="info",
+            target=host_addr,
+            evidence=f"Host is {state}"
+        ))
+        
+    # OS detection finding
+    os_elem = host.find('os')
+    if os_elem is not None:
+         match = os_elem.find('osmatch')
+         if match is not None:
+             name = match.get('name', 'unknown')
+             accuracy = match.get('accuracy', '')
+             evidence = f"OS Match: {name}"
+             if accuracy:
+                 evidence += f" ({accuracy}%)"
+             
+             findings.append(batch.create(
+                 type_val="os_detection",
+                 severity="info",
+                 target=host_addr,
+                 evidence=evidence
+             ))
+             
+    # Host Script findings
+    # Direct script children (rare/older nmap)
+    for script in host.findall('script'):
+        _create_script_finding(script, host_addr, batch, findings)
+        
+    # Hostscript children (standard nmap)
+    for script in host.findall('hostscript/script'):
+        _create_script_finding(script, host_addr, batch, findings)
+    
+    # Port findings
+    for port in host.findall('.//port'):
+        state_elem = port.find('state')
+        if state_elem is None or state_elem.get('state') != 'open':
+            continue
+            
+        portid = port.get('portid', '')
+        protocol = port.get('protocol', 'tcp')
+        
+        service_elem = port.find('service')
+        service = service_elem.get('name', '') if service_elem is not None else ''
+        product = service_elem.get('product', '') if service_elem is not None else ''
+        version = service_elem.get('version', '') if service_elem is not None else ''
+        
+        evidence = f"{portid}/{protocol} open {service}"
+        if product:
+            evidence += f" {product}"
+        if version:
+            evidence += f" {version}"
+            
+        # Clean up extra spaces
+        evidence = evidence.strip()
+        
+        findings.append(batch.create(
+            type_val="open_port",
+            severity="info",
+            target=host_addr,
+            evidence=evidence
+        ))
+        
+        # Port Script findings
+        for script in port.findall('script'):
+            _create_script_finding(script, host_addr, batch, findings)
+
+    return findings
+
+
 def nmap_parser(
     stdout: str, 
     stderr: str, 
@@ -16,6 +219,8 @@ def nmap_parser(
     """Parse nmap XML or grepable output to structured findings.
     
     Auto-detects format: tries XML first, falls back to grepable (-oG).
+    XML is parsed host by host; if it is malformed or cut short (e.g. the
+    scan timed out), findings of the hosts before the error are kept.
     
     Args:
         stdout: Nmap output (XML from -oX or grepable from -oG)
@@ -27,115 +232,28 @@ def nmap_parser(
     Returns:
         List of Finding objects for open ports, host status, OS, scripts
     """
-    findings: List[Finding] = []
-    
     # Auto-detect format and parse
     if _is_grepable_format(stdout):
         return _parse_grepable(stdout, agent_id, target)
     
-    # Try XML parsing
+    findings: List[Finding] = []
+    batch = FindingBatch(agent_id, "nmap")
     try:
-        import xml.etree.ElementTree as ET
-        root = ET.fromstring(stdout)
+        for elem in iter_nmap_elements(stdout):
+            if elem.tag == 'host':
+                findings.extend(host_findings(elem, agent_id, target, batch))
     except ET.ParseError:
-        log.warning("nmap_xml_parse_failed", target=target)
-        return []
-    
-    # Parse each host
-    for host in root.findall('host'):
-        # Extract host address (override target if found)
-        addr_elem = host.find('address')
-        host_addr = addr_elem.get('addr', target) if addr_elem is not None else target
-        
-        # Host status finding
-        status_elem = host.find('status')
-        if status_elem is not None:
-            state = status_elem.get('state', 'unknown')
-            findings.append(create_finding(
-                type_val="host_status",
-                severity="info",
-                target=host_addr,
-                evidence=f"Host is {state}",
-                agent_id=agent_id,
-                tool="nmap"
-            ))
-            
-        # OS detection finding
-        os_elem = host.find('os')
-        if os_elem is not None:
-             match = os_elem.find('osmatch')
-             if match is not None:
-                 name = match.get('name', 'unknown')
-                 accuracy = match.get('accuracy', '')
-                 evidence = f"OS Match: {name}"
-                 if accuracy:
-                     evidence += f" ({accuracy}%)"
-                 
-                 findings.append(create_finding(
-                     type_val="os_detection",
-                     severity="info",
-                     target=host_addr,
-                     evidence=evidence,
-                     agent_id=agent_id,
-                     tool="nmap"
-                 ))
-                 
-        # Host Script findings
-        # Direct script children (rare/older nmap)
-        for script in host.findall('script'):
-            _create_script_finding(script, host_addr, agent_id, findings)
-            
-        # Hostscript children (standard nmap)
-        for script in host.findall('hostscript/script'):
-            _create_script_finding(script, host_addr, agent_id, findings)
-        
-        # Port findings
-        for port in host.findall('.//port'):
-            state_elem = port.find('state')
-            if state_elem is None or state_elem.get('state') != 'open':
-                continue
-                
-            portid = port.get('portid', '')
-            protocol = port.get('protocol', 'tcp')
-            
-            service_elem = port.find('service')
-            service = service_elem.get('name', '') if service_elem is not None else ''
-            product = service_elem.get('product', '') if service_elem is not None else ''
-            version = service_elem.get('version', '') if service_elem is not None else ''
-            
-            evidence = f"{portid}/{protocol} open {service}"
-            if product:
-                evidence += f" {product}"
-            if version:
-                evidence += f" {version}"
-                
-            # Clean up extra spaces
-            evidence = evidence.strip()
-            
-            findings.append(create_finding(
-                type_val="open_port",
-                severity="info",
-                target=host_addr,
-                evidence=evidence,
-                agent_id=agent_id,
-                tool="nmap"
-            ))
-            
-            # Port Script findings
-            for script in port.findall('script'):
-                _create_script_finding(script, host_addr, agent_id, findings)
+        log.warning("nmap_xml_parse_failed", target=target, findings_count=len(findings))
+        return findings
             
     log.info("nmap_parsed", target=target, findings_count=len(findings))
     return findings
 
 
-
-
-
 def _create_script_finding(
     script_elem,
     target: str,
-    agent_id: str,
+    batch: FindingBatch,
     findings: List[Finding]
 ) -> None:
     """Helper to extract script info and create finding."""
@@ -143,13 +261,11 @@ def _create_script_finding(
     output = script_elem.get('output', '')
     evidence = f"Script: {script_id}\nOutput: {output}"
     
-    findings.append(create_finding(
+    findings.append(batch.create(
         type_val="nse_script",
         severity="info",
         target=target,
-        evidence=evidence,
-        agent_id=agent_id,
-        tool="nmap"
+        evidence=evidence
     ))
 
 
@@ -177,69 +293,81 @@ def _parse_grepable(stdout: str, agent_id: str, target: str) -> List[Finding]:
     # Nmap done at ...
     """
     findings: List[Finding] = []
+    batch = FindingBatch(agent_id, "nmap")
     
     for line in stdout.strip().split('\n'):
-        if not line.startswith('Host:'):
-            continue
-            
-        # Extract host IP
-        host_match = re.match(r'Host:\s+(\S+)', line)
-        if not host_match:
-            continue
-        host_addr = host_match.group(1)
+        findings.extend(grepable_line_findings(line, agent_id, batch))
+    
+    log.info("nmap_grepable_parsed", target=target, findings_count=len(findings))
+    return findings
+
+
+def grepable_line_findings(
+    line: str,
+    agent_id: str,
+    batch: Optional[FindingBatch] = None
+) -> List[Finding]:
+    """Findings of one grepable (-oG) line (none unless it is a Host: line).
+
+    Pass batch to share one finding factory across the lines of a scan.
+    """
+    findings: List[Finding] = []
+    if not line.startswith('Host:'):
+        return findings
+    batch = batch or FindingBatch(agent_id, "nmap")
         
-        # Check for Status line
-        if 'Status:' in line:
-            status_match = re.search(r'Status:\s+(\S+)', line)
-            if status_match:
-                state = status_match.group(1).lower()
-                findings.append(create_finding(
-                    type_val="host_status",
+    # Extract host IP
+    host_match = re.match(r'Host:\s+(\S+)', line)
+    if not host_match:
+        return findings
+    host_addr = host_match.group(1)
+    
+    # Check for Status line
+    if 'Status:' in line:
+        status_match = re.search(r'Status:\s+(\S+)', line)
+        if status_match:
+            state = status_match.group(1).lower()
+            findings.append(batch.create(
+                type_val="host_status",
+                severity="info",
+                target=host_addr,
+                evidence=f"Host is {state}"
+            ))
+    
+    # Check for Ports line
+    if 'Ports:' in line:
+        ports_match = re.search(r'Ports:\s*(.+?)(?:\t|$)', line)
+        if ports_match:
+            ports_str = ports_match.group(1)
+            # Parse each port: portid/state/proto/owner/service/rpcinfo/version/
+            for port_entry in ports_str.split(','):
+                port_entry = port_entry.strip()
+                if not port_entry:
+                    continue
+                # Format: port/state/proto/owner/service/rpcinfo/version/
+                parts = port_entry.split('/')
+                if len(parts) < 3:
+                    continue
+                
+                portid = parts[0].strip()
+                state = parts[1].strip()
+                proto = parts[2].strip()
+                service = parts[4].strip() if len(parts) > 4 else ''
+                version = parts[6].strip() if len(parts) > 6 else ''
+                
+                if state != 'open':
+                    continue
+                
+                evidence = f"{portid}/{proto} open {service}"
+                if version:
+                    evidence += f" {version}"
+                evidence = evidence.strip()
+                
+                findings.append(batch.create(
+                    type_val="open_port",
                     severity="info",
                     target=host_addr,
-                    evidence=f"Host is {state}",
-                    agent_id=agent_id,
-                    tool="nmap"
+                    evidence=evidence
                 ))
-        
-        # Check for Ports line
-        if 'Ports:' in line:
-            ports_match = re.search(r'Ports:\s*(.+?)(?:\t|$)', line)
-            if ports_match:
-                ports_str = ports_match.group(1)
-                # Parse each port: portid/state/proto/owner/service/rpcinfo/version/
-                for port_entry in ports_str.split(','):
-                    port_entry = port_entry.strip()
-                    if not port_entry:
-                        continue
-                    # Format: port/state/proto/owner/service/rpcinfo/version/
-                    parts = port_entry.split('/')
-                    if len(parts) < 3:
-                        continue
-                    
-                    portid = parts[0].strip()
-                    state = parts[1].strip()
-                    proto = parts[2].strip()
-                    service = parts[4].strip() if len(parts) > 4 else ''
-                    version = parts[6].strip() if len(parts) > 6 else ''
-                    
-                    if state != 'open':
-                        continue
-                    
-                    evidence = f"{portid}/{proto} open {service}"
-                    if version:
-                        evidence += f" {version}"
-                    evidence = evidence.strip()
-                    
-                    findings.append(create_finding(
-                        type_val="open_port",
-                        severity="info",
-                        target=host_addr,
-                        evidence=evidence,
-                        agent_id=agent_id,
-                        tool="nmap"
-                    ))
     
-    log.info("nmap_grepable_parsed", target=target, findings_count=len(findings))
     return findings
-
@@ -1,6 +1,7 @@
+import io
 import json
 import re
-from typing import List
+from typing import List, Optional
 
 import structlog
 
@@ -9,9 +10,15 @@ from cyberred.tools.parsers.common import create_finding
 
 log = structlog.get_logger()
 
+# Leading blank space and the first line after it
+FIRST_LINE = re.compile(r'\s*([^\n]*)')
+
 # Pattern for matching CVE IDs (e.g., CVE-2021-44228)
 CVE_PATTERN = re.compile(r"CVE-\d{4}-\d+", re.IGNORECASE)
 
+# Plain text line: [timestamp] [template-id] [protocol] [severity] url [extra]
+PLAIN_LINE_PATTERN = re.compile(r"^\[(.*?)\] \[(.*?)\] \[(.*?)\] \[(.*?)\] (\S+)(?: \[(.*)\])?")
+
 def nuclei_parser(
     stdout: str, 
     stderr: str, 
@@ -33,7 +40,7 @@ def nuclei_parser(
     """
     findings: List[Finding] = []
     
-    if not stdout.strip():
+    if not stdout or stdout.isspace():
         return findings
         
     if _is_json_format(stdout):
@@ -44,15 +51,16 @@ def nuclei_parser(
 
 def _is_json_format(stdout: str) -> bool:
     """Check if output is nuclei JSON format."""
-    first_line = stdout.strip().split('\n')[0]
+    # First non-blank line, without splitting the whole output
+    first_line = FIRST_LINE.match(stdout).group(1).rstrip()
     return first_line.startswith('{') and first_line.endswith('}')
 
 
 def _parse_json(stdout: str, agent_id: str, target: str) -> List[Finding]:
-    """Parse JSON Lines format output."""
+    """Parse JSON Lines format output, one record at a time."""
     findings: List[Finding] = []
     
-    for line in stdout.strip().split('\n'):
+    for line in io.StringIO(stdout):
         line = line.strip()
         if not line:
             continue
@@ -63,97 +71,107 @@ def _parse_json(stdout: str, agent_id: str, target: str) -> List[Finding]:
         except json.JSONDecodeError:
             log.warning("nuclei_json_parse_failed", line=line[:100])
             continue
+
+        findings.append(json_record_to_finding(data, agent_id, target))
             
-        # Task 3: Extract template ID and severity
-        template_id = data.get('template-id', 'unknown')
-        info = data.get('info', {})
-        severity = info.get('severity', 'info').lower()
-        if severity == "unknown":
-            severity = "info"
-            
-        # Task 4: Extract CVE information
-        cve_id = ""
-        classification = info.get('classification', {})
-        if classification:
-            cve_id = str(classification.get('cve-id', '') or '')
-            
-        if not cve_id:
-            metadata = info.get('metadata', {})
-            cve_id = str(metadata.get('cve-id', '') or '')
-            
-        # Task 6: Classify finding type
-        tags = info.get('tags', [])
-        finding_type = _classify_finding_type(cve_id, tags)
+    return findings
+
+
+def json_record_to_finding(data: dict, agent_id: str, target: str) -> Finding:
+    """Convert one decoded nuclei JSONL record to a Finding."""
+    # Task 3: Extract template ID and severity
+    template_id = data.get('template-id', 'unknown')
+    info = data.get('info', {})
+    severity = info.get('severity', 'info').lower()
+    if severity == "unknown":
+        severity = "info"
         
-        # Task 8: Extract CVSS
-        cvss_score = ""
-        if classification:
-            cvss = classification.get('cvss-score')
-            if cvss is not None:
-                cvss_score = str(cvss)
-            
-        matched_at = data.get('matched-at', target)
+    # Task 4: Extract CVE information
+    cve_id = ""
+    classification = info.get('classification', {})
+    if classification:
+        cve_id = str(classification.get('cve-id', '') or '')
         
-        # Build evidence
-        evidence_parts = [f"Template: {template_id}"]
-        if cve_id:
-            evidence_parts.append(f"CVE: {cve_id}")
-        if cvss_score:
-            evidence_parts.append(f"CVSS: {cvss_score}")
-            
-        evidence_parts.append(f"URL: {matched_at}")
+    if not cve_id:
+        metadata = info.get('metadata', {})
+        cve_id = str(metadata.get('cve-id', '') or '')
         
-        extracted = data.get('extracted-results', [])
-        if extracted:
-            evidence_parts.append(f"Extracted: {', '.join(extracted)}")
-            
-        evidence = " | ".join(evidence_parts)
+    # Task 6: Classify finding type
+    tags = info.get('tags', [])
+    finding_type = _classify_finding_type(cve_id, tags)
+    
+    # Task 8: Extract CVSS
+    cvss_score = ""
+    if classification:
+        cvss = classification.get('cvss-score')
+        if cvss is not None:
+            cvss_score = str(cvss)
         
-        findings.append(create_finding(
-            type_val=finding_type,
-            severity=severity,
-            target=target,
-            evidence=evidence,
-            agent_id=agent_id,
-            tool="nuclei"
-        ))
-            
-    return findings
+    matched_at = data.get('matched-at', target)
+    
+    # Build evidence
+    evidence_parts = [f"Template: {template_id}"]
+    if cve_id:
+        evidence_parts.append(f"CVE: {cve_id}")
+    if cvss_score:
+        evidence_parts.append(f"CVSS: {cvss_score}")
+        
+    evidence_parts.append(f"URL: {matched_at}")
+    
+    extracted = data.get('extracted-results', [])
+    if extracted:
+        evidence_parts.append(f"Extracted: {', '.join(extracted)}")
+        
+    evidence = " | ".join(evidence_parts)
+    
+    return create_finding(
+        type_val=finding_type,
+        severity=severity,
+        target=target,
+        evidence=evidence,
+        agent_id=agent_id,
+        tool="nuclei"
+    )
 
 
 def _parse_plain_text(stdout: str, agent_id: str, target: str) -> List[Finding]:
     """Parse plain text output format."""
     findings: List[Finding] = []
-    # [timestamp] [template-id] [protocol] [severity] url [extra]
-    regex = re.compile(r"^\[(.*?)\] \[(.*?)\] \[(.*?)\] \[(.*?)\] (\S+)(?: \[(.*)\])?")
     
     for line in stdout.strip().split('\n'):
-        match = regex.match(line.strip())
-        if not match:
-            continue
-            
-        timestamp, template_id, protocol, severity, url, extra = match.groups()
-        
-        evidence = f"Template: {template_id} | URL: {url}"
-        if extra:
-             evidence += f" | Extracted: {extra}"
-             
-        # Use regex for more accurate CVE detection in plain text
-        finding_type = "cve" if CVE_PATTERN.search(template_id) else "vulnerability"
-             
-        findings.append(create_finding(
-            type_val=finding_type,
-            severity=severity.lower(),
-            target=target,
-            evidence=evidence,
-            agent_id=agent_id,
-            tool="nuclei"
-        ))
+        finding = plain_line_to_finding(line, agent_id, target)
+        if finding is not None:
+            findings.append(finding)
     
     log.info("nuclei_parsed", target=target, findings_count=len(findings), format="plain_text")
     return findings
 
 
+def plain_line_to_finding(line: str, agent_id: str, target: str) -> Optional[Finding]:
+    """Convert one plain text nuclei line to a Finding (None if no match)."""
+    match = PLAIN_LINE_PATTERN.match(line.strip())
+    if not match:
+        return None
+        
+    timestamp, template_id, protocol, severity, url, extra = match.groups()
+    
+    evidence = f"Template: {template_id} | URL: {url}"
+    if extra:
+         evidence += f" | Extracted: {extra}"
+         
+    # Use regex for more accurate CVE detection in plain text
+    finding_type = "cve" if CVE_PATTERN.search(template_id) else "vulnerability"
+         
+    return create_finding(
+        type_val=finding_type,
+        severity=severity.lower(),
+        target=target,
+        evidence=evidence,
+        agent_id=agent_id,
+        tool="nuclei"
+    )
+
+
 def _classify_finding_type(cve_id: str, tags: List[str]) -> str:
     """Classify finding type based on CVE presence and tags."""
     if cve_id:
@@ -0,0 +1,186 @@
+"""Parser Registry - Tier 1 parsers by tool name, loaded on first use.
+
+- Lazy: built-in parsers are listed by module name (BUILTIN_PARSERS) and
+  imported the first time their tool's output is parsed, so a daemon
+  whose engagements never run aircrack or john never imports them.
+- Calling convention cached: whether a parser takes error_type is read
+  from its signature once, when it is registered, not on every call.
+- Atomic swap: the tool -> parser map is never mutated in place. Writers
+  (register, unregister, ParserWatcher hot reloads) build a new map and
+  replace it in one assignment, so lookups take no lock and a parse in
+  flight keeps the implementation it started with.
+
+Usage:
+    from cyberred.tools.parsers.registry import ParserRegistry
+
+    registry = ParserRegistry(builtins=True)
+    parser = registry.get("nmap")  # imports tools.parsers.nmap
+    if parser is not None:
+        findings = parser(stdout, stderr, exit_code, agent_id, target)
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+import structlog
+
+from cyberred.core.models import Finding
+from cyberred.tools.parsers.base import ParserFn
+
+log = structlog.get_logger()
+
+PACKAGE = "cyberred.tools.parsers"
+
+# Tool name -> module in tools/parsers defining <module>_parser
+BUILTIN_PARSERS: Dict[str, str] = {
+    # Web and service scanning (Stories 4.5-4.9)
+    "nmap": "nmap",
+    "nuclei": "nuclei",
+    "sqlmap": "sqlmap",
+    "ffuf": "ffuf",
+    "nikto": "nikto",
+    "hydra": "hydra",
+    # Reconnaissance (Story 4.10)
+    "masscan": "masscan",
+    "subfinder": "subfinder",
+    "amass": "amass",
+    "whatweb": "whatweb",
+    "wafw00f": "wafw00f",
+    "dnsrecon": "dnsrecon",
+    "theharvester": "theharvester",
+    "gobuster": "gobuster",
+    # Exploitation (Story 4.10)
+    "crackmapexec": "crackmapexec",
+    "responder": "responder",
+    "secretsdump": "secretsdump",
+    "psexec": "psexec",
+    "metasploit": "metasploit",
+    "searchsploit": "searchsploit",
+    # Post-exploitation (Story 4.10)
+    "mimikatz": "mimikatz",
+    "bloodhound": "bloodhound",
+    "linpeas": "linpeas",
+    "winpeas": "winpeas",
+    "lazagne": "lazagne",
+    "chisel": "chisel",
+    # Wireless (Story 4.10)
+    "aircrack": "aircrack",
+    "wifite": "wifite",
+    # Credentials (Story 4.10)
+    "john": "john",
+    "hashcat": "hashcat",
+}
+
+
+def load_builtin(module: str) -> ParserFn:
+    """Import tools/parsers/<module> and return its <module>_parser."""
+    return getattr(importlib.import_module(f"{PACKAGE}.{module}"), f"{module}_parser")
+
+
+def _takes_error_type(fn: ParserFn) -> bool:
+    try:
+        return "error_type" in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        # No introspectable signature: call with the base convention
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class RegisteredParser:
+    """A parser with its calling convention resolved.
+
+    Attributes:
+        fn: The parser function.
+        takes_error_type: Whether fn accepts an error_type keyword.
+        module: Built-in module defining fn (see BUILTIN_PARSERS), so
+            other processes can import it; None for registered parsers.
+    """
+
+    fn: ParserFn
+    takes_error_type: bool
+    module: Optional[str] = None
+
+    @classmethod
+    def wrap(cls, fn: ParserFn, module: Optional[str] = None) -> RegisteredParser:
+        """Inspect fn's signature (once) and wrap it."""
+        return cls(fn, _takes_error_type(fn), module)
+
+    def __call__(
+        self,
+        stdout: str,
+        stderr: str,
+        exit_code: int,
+        agent_id: str,
+        target: str,
+        error_type: Optional[str] = None,
+    ) -> List[Finding]:
+        """Run the parser, passing error_type only if it accepts one."""
+        if self.takes_error_type:
+            return self.fn(stdout, stderr, exit_code, agent_id, target, error_type=error_type)
+        return self.fn(stdout, stderr, exit_code, agent_id, target)
+
+
+class ParserRegistry:
+    """Tool name -> Tier 1 parser, with lazily loaded built-ins.
+
+    Tool names are case-insensitive. A registered parser overrides the
+    built-in of the same name; unregistering it falls back to the built-in.
+    """
+
+    def __init__(
+        self, builtins: bool = False, modules: Mapping[str, str] = BUILTIN_PARSERS
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            builtins: Resolve tools in modules to the built-in parsers.
+            modules: Tool name -> parser module (see BUILTIN_PARSERS).
+        """
+        self._modules: Mapping[str, str] = dict(modules) if builtins else {}
+        self._parsers: Mapping[str, RegisteredParser] = {}
+        # Serializes writers; readers use whichever map is current
+        self._lock = threading.RLock()
+
+    def get(self, tool: str) -> Optional[RegisteredParser]:
+        """Parser for a tool, importing its built-in on first use."""
+        tool = tool.lower()
+        parser = self._parsers.get(tool)
+        if parser is not None or tool not in self._modules:
+            return parser
+        with self._lock:
+            parser = self._parsers.get(tool)
+            if parser is None:
+                module = self._modules[tool]
+                parser = RegisteredParser.wrap(load_builtin(module), module)
+                self._parsers = {**self._parsers, tool: parser}
+                log.info("parser_loaded", tool=tool)
+        return parser
+
+    def register(self, tool: str, fn: ParserFn) -> RegisteredParser:
+        """Register (or atomically replace) a tool's parser."""
+        parser = RegisteredParser.wrap(fn)
+        with self._lock:
+            self._parsers = {**self._parsers, tool.lower(): parser}
+        return parser
+
+    def unregister(self, tool: str) -> bool:
+        """Remove a tool's parser; returns False if none was loaded."""
+        tool = tool.lower()
+        with self._lock:
+            if tool not in self._parsers:
+                return False
+            self._parsers = {k: v for k, v in self._parsers.items() if k != tool}
+        return True
+
+    def loaded(self) -> List[str]:
+        """Tools whose parser is registered or already imported."""
+        return list(self._parsers)
+
+    def available(self) -> List[str]:
+        """Tools with a parser, loaded or not."""
+        return sorted(set(self._parsers) | set(self._modules))
@@ -3,6 +3,20 @@ import re
 from typing import List
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.patterns import PatternSet
+
+RULES = PatternSet("responder", [
+    # NTLMv2 hash capture
+    # Pattern: [SMB] NTLMv2 Hash : DOMAIN\\user::DOMAIN:challenge:hash:hash
+    # or: [SMB] NTLMv2-SSP Hash : user::DOMAIN:...
+    ("ntlm_hash", r'\[(\w+)\]\s+NTLMv[12](?:-SSP)?\s+(?:Hash|Client)\s*:\s*(\S+)'),
+    # HTTP Basic Auth capture (other [HTTP] lines fall through to LDAP)
+    ("http_basic", r'^(?=.*(?-i:Basic)).*?\[HTTP\].*?(\S+)\s*:\s*(\S+)'),
+    # LDAP credential capture
+    ("ldap_cleartext", r'\[LDAP\].*?Cleartext.*?(\S+)\s*:\s*(\S+)'),
+], flags=re.IGNORECASE)
+
+IPV4 = re.compile(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})')
 
 
 def responder_parser(
@@ -32,27 +46,17 @@ def responder_parser(
     if not stdout or not stdout.strip():
         return findings
     
-    for line in stdout.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
+    for line, match in RULES.scan(stdout):
         # NTLMv2 hash capture
-        # Pattern: [SMB] NTLMv2 Hash : DOMAIN\user::DOMAIN:challenge:hash:hash
-        # or: [SMB] NTLMv2-SSP Hash : user::DOMAIN:...
-        ntlm_match = re.search(
-            r'\[(\w+)\]\s+NTLMv[12](?:-SSP)?\s+(?:Hash|Client)\s*:\s*(\S+)',
-            line, re.IGNORECASE
-        )
-        if ntlm_match:
-            protocol, hash_data = ntlm_match.groups()
+        if match.rule == "ntlm_hash":
+            protocol, hash_data = match.groups
             
             # Extract username from hash
             username = hash_data.split('::')[0] if '::' in hash_data else hash_data.split(':')[0]
             
             # Try to extract client IP
             client_ip = target
-            ip_match = re.search(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', line)
+            ip_match = IPV4.search(line)
             if ip_match:
                 client_ip = ip_match.group(1)
             
@@ -67,12 +71,8 @@ def responder_parser(
             continue
         
         # HTTP Basic Auth capture
-        http_match = re.search(
-            r'\[HTTP\].*?(\S+)\s*:\s*(\S+)',
-            line, re.IGNORECASE
-        )
-        if http_match and 'Basic' in line:
-            username, password = http_match.groups()
+        if match.rule == "http_basic":
+            username, password = match.groups
             
             findings.append(common.create_finding(
                 type_val="credential",
@@ -85,12 +85,8 @@ def responder_parser(
             continue
         
         # LDAP credential capture
-        ldap_match = re.search(
-            r'\[LDAP\].*?Cleartext.*?(\S+)\s*:\s*(\S+)',
-            line, re.IGNORECASE
-        )
-        if ldap_match:
-            username, password = ldap_match.groups()
+        if match.rule == "ldap_cleartext":
+            username, password = match.groups
             
             findings.append(common.create_finding(
                 type_val="credential",
@@ -3,6 +3,18 @@ import re
 from typing import List
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.patterns import PatternSet
+
+RULES = PatternSet("secretsdump", [
+    # Section headers
+    ("section", r'\[\*\]'),
+    # SAM/NTDS hash format: username:rid:lmhash:nthash:::
+    ("ntlm_hash", r'^([^:\n]+):(\d+):([a-f0-9]{32}):([a-f0-9]{32}):::'),
+    # Cleartext password (from LSA secrets or DPAPI)
+    ("cleartext", r'Cleartext:\s*(\S+)'),
+    # Kerberos keys
+    ("kerberos_key", r'^([^:\n]+):aes\d+[^:\n]*:([a-f0-9]+)'),
+], flags=re.IGNORECASE)
 
 
 def secretsdump_parser(
@@ -34,13 +46,9 @@ def secretsdump_parser(
     
     current_section = ""
     
-    for line in stdout.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
+    for line, match in RULES.scan(stdout):
         # Detect section headers
-        if '[*]' in line:
+        if match.rule == "section":
             if 'SAM' in line:
                 current_section = "SAM"
             elif 'LSA' in line:
@@ -52,9 +60,8 @@ def secretsdump_parser(
             continue
         
         # SAM/NTDS hash format: username:rid:lmhash:nthash:::
-        sam_match = re.match(r'^([^:]+):(\d+):([a-f0-9]{32}):([a-f0-9]{32}):::', line, re.IGNORECASE)
-        if sam_match:
-            username, rid, lm_hash, nt_hash = sam_match.groups()
+        if match.rule == "ntlm_hash":
+            username, rid, lm_hash, nt_hash = match.groups
             
             # Skip empty hashes
             if nt_hash == 'aad3b435b51404eeaad3b435b51404ee' or nt_hash == '31d6cfe0d16ae931b73c59d7e0c089c0':
@@ -73,9 +80,8 @@ def secretsdump_parser(
             continue
         
         # Cleartext password (from LSA secrets or DPAPI)
-        cleartext_match = re.search(r'Cleartext:\s*(\S+)', line, re.IGNORECASE)
-        if cleartext_match:
-            password = cleartext_match.group(1)
+        if match.rule == "cleartext":
+            password = match.groups[0]
             
             findings.append(common.create_finding(
                 type_val="credential",
@@ -88,9 +94,8 @@ def secretsdump_parser(
             continue
         
         # Kerberos keys
-        krb_match = re.match(r'^([^:]+):aes\d+[^:]*:([a-f0-9]+)', line, re.IGNORECASE)
-        if krb_match:
-            username, key = krb_match.groups()
+        if match.rule == "kerberos_key":
+            username, key = match.groups
             
             findings.append(common.create_finding(
                 type_val="credential",
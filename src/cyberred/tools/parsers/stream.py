@@ -0,0 +1,196 @@
+"""Line-oriented Tier 1 parsers for streamed tool output.
+
+The batch parsers need the whole stdout. For tools whose output is one
+record per line, these parsers turn each line into findings as it arrives,
+so findings can be published while the tool is still running and stdout
+never has to be held in memory. They share the per-record logic of the
+batch parsers, so a streamed run yields the same findings.
+
+Supported tools:
+- nuclei: JSONL (-jsonl) or plain text lines.
+- masscan: "Discovered open port" lines or -oJ records.
+- gobuster: dir mode "(Status: N)" lines and dns/vhost "Found:" lines.
+- ffuf: -json lines (one result per line).
+- nmap: -oX XML (findings per <host> as each host completes) or -oG lines.
+
+Usage:
+    from cyberred.tools.parsers.stream import get_line_parser
+
+    parser = get_line_parser("nuclei", agent_id, target)
+    for line in lines:
+        findings = parser.feed(line)
+    findings = parser.finish()
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+import structlog
+
+from cyberred.core.models import Finding
+from cyberred.tools.parsers import ffuf, gobuster, masscan, nmap, nuclei
+
+log = structlog.get_logger()
+
+
+class LineParser(ABC):
+    """Base class for incremental, line-at-a-time parsers.
+
+    Attributes:
+        agent_id: Agent that ran the tool.
+        target: Target that was scanned.
+    """
+
+    def __init__(self, agent_id: str, target: str) -> None:
+        self.agent_id = agent_id
+        self.target = target
+
+    @abstractmethod
+    def feed(self, line: str) -> List[Finding]:
+        """Parse one line of stdout (without its line ending)."""
+
+    def finish(self) -> List[Finding]:
+        """Return findings held back until the end of output."""
+        return []
+
+
+class NucleiLineParser(LineParser):
+    """Streams nuclei JSONL or plain text output.
+
+    The format is decided by the first non-empty line, as in nuclei_parser.
+    """
+
+    def __init__(self, agent_id: str, target: str) -> None:
+        super().__init__(agent_id, target)
+        self._json: Optional[bool] = None
+
+    def feed(self, line: str) -> List[Finding]:
+        line = line.strip()
+        if not line:
+            return []
+        if self._json is None:
+            self._json = line.startswith("{") and line.endswith("}")
+        if not self._json:
+            finding = nuclei.plain_line_to_finding(line, self.agent_id, self.target)
+            return [finding] if finding is not None else []
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            log.warning("nuclei_json_parse_failed", line=line[:100])
+            return []
+        return [nuclei.json_record_to_finding(data, self.agent_id, self.target)]
+
+
+class MasscanLineParser(LineParser):
+    """Streams masscan stdout lines or -oJ records (one host per line)."""
+
+    def feed(self, line: str) -> List[Finding]:
+        record = line.strip().strip(",")
+        if record.startswith("{"):
+            try:
+                entry = json.loads(record)
+            except json.JSONDecodeError:
+                entry = None
+            if isinstance(entry, dict):
+                return masscan.json_entry_findings(entry, self.agent_id, self.target)
+        match = masscan.STDOUT_PATTERN.search(line)
+        if match:
+            return [masscan.stdout_match_to_finding(match, self.agent_id)]
+        return []
+
+
+class GobusterLineParser(LineParser):
+    """Streams gobuster dir, dns and vhost mode lines."""
+
+    def feed(self, line: str) -> List[Finding]:
+        match = gobuster.DIR_PATTERN.match(line)
+        if match:
+            return [gobuster.dir_match_to_finding(match, self.agent_id, self.target)]
+        match = gobuster.DNS_PATTERN.search(line)
+        if match:
+            return [gobuster.dns_match_to_finding(match, self.agent_id, self.target)]
+        return []
+
+
+class FfufLineParser(LineParser):
+    """Streams ffuf -json output (one result object per line)."""
+
+    def feed(self, line: str) -> List[Finding]:
+        line = line.strip()
+        if not line.startswith("{"):
+            return []
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return []
+        # A whole -of json document printed on one line
+        results = data.get("results") if isinstance(data.get("results"), list) else [data]
+        return [
+            ffuf.result_to_finding(result, self.agent_id, self.target)
+            for result in results
+            if "url" in result
+        ]
+
+
+class NmapLineParser(LineParser):
+    """Streams nmap -oX XML (per completed <host>) or -oG lines.
+
+    The format is decided by the first non-empty line: XML if it starts
+    with "<", grepable otherwise. If the XML turns out malformed, the
+    findings already emitted stand and the rest is ignored.
+    """
+
+    def __init__(self, agent_id: str, target: str) -> None:
+        super().__init__(agent_id, target)
+        self._xml: Optional[nmap.NmapXmlStream] = None
+        self._format: Optional[str] = None
+
+    def feed(self, line: str) -> List[Finding]:
+        if self._format is None:
+            if not line.strip():
+                return []
+            self._format = "xml" if line.lstrip().startswith("<") else "grepable"
+            if self._format == "xml":
+                self._xml = nmap.NmapXmlStream()
+        if self._format == "grepable":
+            return nmap.grepable_line_findings(line, self.agent_id)
+        return self._hosts(line + "\n")
+
+    def finish(self) -> List[Finding]:
+        if self._format != "xml":
+            return []
+        return self._hosts(None)
+
+    def _hosts(self, chunk: Optional[str]) -> List[Finding]:
+        """Findings of the hosts completed by a chunk (None: end of output)."""
+        if self._xml is None:
+            return []
+        try:
+            elements = self._xml.feed(chunk) if chunk is not None else self._xml.close()
+        except ET.ParseError as e:
+            log.warning("nmap_xml_stream_failed", target=self.target, error=str(e))
+            self._xml = None
+            return []
+        findings: List[Finding] = []
+        for elem in elements:
+            if elem.tag == "host":
+                findings.extend(nmap.host_findings(elem, self.agent_id, self.target))
+        return findings
+
+
+# Tool name -> line parser class
+STREAM_PARSERS: Dict[str, Callable[[str, str], LineParser]] = {
+    "nuclei": NucleiLineParser,
+    "masscan": MasscanLineParser,
+    "gobuster": GobusterLineParser,
+    "ffuf": FfufLineParser,
+    "nmap": NmapLineParser,
+}
+
+
+def get_line_parser(tool: str, agent_id: str, target: str) -> Optional[LineParser]:
+    """Create a line parser for a tool, or None if it has none."""
+    factory = STREAM_PARSERS.get(tool.lower())
+    return factory(agent_id, target) if factory is not None else None
@@ -3,12 +3,7 @@ import re
 from typing import List
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
-
-
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+from cyberred.tools.parsers.patterns import strip_ansi
 
 
 def wifite_parser(
@@ -3,12 +3,39 @@ import re
 from typing import List, Tuple
 from cyberred.core.models import Finding
 from cyberred.tools.parsers import common
+from cyberred.tools.parsers.patterns import PatternSet, strip_ansi
 
+# Patterns for Windows privilege escalation vectors: (rule, pattern, vector type, severity)
+PRIVESC_PATTERNS: List[Tuple[str, str, str, str]] = [
+    # Unquoted service paths
+    ("unquoted_service_path", r'Unquoted.*?service.*?path', "Unquoted service path", "high"),
+    # Weak service permissions
+    ("weak_service_permissions", r'(SERVICE_ALL_ACCESS|SERVICE_CHANGE_CONFIG)', "Weak service permissions", "high"),
+    # Writable service binary paths
+    ("writable_service", r'Writable.*?service', "Writable service binary", "high"),
+    # AlwaysInstallElevated
+    ("always_install_elevated", r'AlwaysInstallElevated', "AlwaysInstallElevated enabled", "critical"),
+    # Stored credentials
+    ("stored_credentials", r'(Cached.*?credential|Credential.*?Manager)', "Stored credentials", "high"),
+    # AutoLogon credentials
+    ("autologon", r'AutoLogon.*?password', "AutoLogon credentials", "critical"),
+    # Registry permissions
+    ("registry_permissions", r'Registry.*?(writable|permissions)', "Registry permissions", "medium"),
+    # DLL hijacking
+    ("dll_hijacking", r'(DLL\s+hijack|missing\s+dll)', "DLL hijacking", "high"),
+    # Token impersonation
+    ("token_impersonation", r'(SeImpersonate|SeAssignPrimaryToken)', "Token impersonation", "high"),
+    # UAC bypass
+    ("uac", r'UAC.*?(bypass|disabled)', "UAC vulnerability", "high"),
+]
 
-def strip_ansi(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+VECTORS = {rule: (vector_type, severity) for rule, _, vector_type, severity in PRIVESC_PATTERNS}
+
+RULES = PatternSet(
+    "winpeas",
+    [(rule, pattern) for rule, pattern, _, _ in PRIVESC_PATTERNS],
+    flags=re.IGNORECASE,
+)
 
 
 def winpeas_parser(
@@ -38,65 +65,36 @@ def winpeas_parser(
     if not stdout or not stdout.strip():
         return findings
     
-    # Strip ANSI codes for parsing
-    clean_output = strip_ansi(stdout)
-    
-    # Patterns for Windows privilege escalation vectors
-    privesc_patterns: List[Tuple[str, str, str]] = [
-        # Unquoted service paths
-        (r'Unquoted.*?service.*?path', "Unquoted service path", "high"),
-        # Weak service permissions
-        (r'(SERVICE_ALL_ACCESS|SERVICE_CHANGE_CONFIG)', "Weak service permissions", "high"),
-        # Writable service binary paths
-        (r'Writable.*?service', "Writable service binary", "high"),
-        # AlwaysInstallElevated
-        (r'AlwaysInstallElevated', "AlwaysInstallElevated enabled", "critical"),
-        # Stored credentials
-        (r'(Cached.*?credential|Credential.*?Manager)', "Stored credentials", "high"),
-        # AutoLogon credentials
-        (r'AutoLogon.*?password', "AutoLogon credentials", "critical"),
-        # Registry permissions
-        (r'Registry.*?(writable|permissions)', "Registry permissions", "medium"),
-        # DLL hijacking
-        (r'(DLL\s+hijack|missing\s+dll)', "DLL hijacking", "high"),
-        # Token impersonation
-        (r'(SeImpersonate|SeAssignPrimaryToken)', "Token impersonation", "high"),
-        # UAC bypass
-        (r'UAC.*?(bypass|disabled)', "UAC vulnerability", "high"),
-    ]
-    
     seen_findings = set()
     
-    for line in clean_output.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-        
+    # Strip ANSI codes for parsing
+    for line, match in RULES.scan(strip_ansi(stdout)):
         # Check for high confidence markers
         is_high_confidence = any(marker in line for marker in ['[!]', '[+]', 'VULNERABLE', 'EXPLOITABLE'])
         
-        for pattern, vector_type, base_severity in privesc_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                finding_key = f"{vector_type}:{line[:50]}"
-                
-                if finding_key in seen_findings:
-                    continue
-                seen_findings.add(finding_key)
-                
-                severity = "critical" if is_high_confidence else base_severity
-                
-                description = line[:200]
-                evidence = f"{vector_type}: {description}"
-                
-                findings.append(common.create_finding(
-                    type_val="privesc_vector",
-                    severity=severity,
-                    target=target,
-                    evidence=evidence,
-                    agent_id=agent_id,
-                    tool="winpeas"
-                ))
-                break
+        while match is not None:
+            vector_type, base_severity = VECTORS[match.rule]
+            finding_key = f"{vector_type}:{line[:50]}"
+            
+            if finding_key in seen_findings:
+                # Already reported: try the next vector on this line
+                match = RULES.match(line, match.index + 1)
+                continue
+            seen_findings.add(finding_key)
+            
+            severity = "critical" if is_high_confidence else base_severity
+            
+            description = line[:200]
+            evidence = f"{vector_type}: {description}"
+            
+            findings.append(common.create_finding(
+                type_val="privesc_vector",
+                severity=severity,
+                target=target,
+                evidence=evidence,
+                agent_id=agent_id,
+                tool="winpeas"
+            ))
+            break
     
     return findings
@@ -14,6 +14,10 @@ Security Features:
 - Command injection detection (;, |, &&, ||, $(), `)
 - Reserved IP blocking (loopback, link-local, multicast, broadcast)
 - Fail-closed error handling (DENY on any error)
+- Bounded LRU of validation decisions, keyed by scope version
+- Aggregated audit counters for repeated (cached) decisions
+- Versioned, immutable scope snapshots swapped atomically on reload; readers
+  never take a lock and each snapshot carries the scope content hash
 
 Usage:
     from cyberred.tools import ScopeValidator
@@ -21,15 +25,29 @@ Usage:
     validator = ScopeValidator.from_file("scope.yaml")
     validator.validate(target="192.168.1.100", port=80, protocol="tcp")
     validator.validate(command="nmap -p 80 192.168.1.100")
+
+    # Filter a list of discovered hosts in one call
+    result = validator.validate_many(["10.0.0.5", "10.0.0.0/28", "app.example.com"])
+    result.allowed, result.denied
+
+    # Reload automatically when the scope file changes
+    validator.start_watching()
+    validator.snapshot().version, validator.snapshot().scope_hash
+
+    # Other scope change sources
+    roe_loader.add_listener(lambda target: validator.add_targets([target]))
+    _SettingsHolder.add_reload_listener(validator.handle_settings_reload)
 """
 
 from __future__ import annotations
 
+import json
 import logging
-import re
-import shlex
+import threading
+import time
 import unicodedata
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from ipaddress import (
     IPv4Address,
     IPv4Network,
@@ -39,13 +57,20 @@ from ipaddress import (
     ip_network,
 )
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Sequence, Union
 from urllib.parse import urlparse
 
 import structlog
 import yaml
 
 from cyberred.core.exceptions import ScopeViolationError
+from cyberred.core.hashing import calculate_bytes_hash
+from cyberred.tools.command_parser import ArgumentSchema, parse_command, tokenize
+from cyberred.tools.scope_matcher import CompiledScope
+
+if TYPE_CHECKING:
+    from cyberred.core.config import Settings
+    from cyberred.core.config_watcher import ConfigWatcher
 
 # Configure structlog to use stdlib logging for caplog compatibility
 structlog.configure(
@@ -77,6 +102,66 @@ INJECTION_PATTERNS = [
     (r"\n", "newline"),  # Newline injection
 ]
 
+# Blocks that reserved-range checks on CIDR targets must not overlap
+_ALWAYS_BLOCKED_NETWORKS = tuple(
+    ip_network(n)
+    for n in ("169.254.0.0/16", "224.0.0.0/4", "fe80::/10", "ff00::/8")
+)
+_LOOPBACK_NETWORKS = tuple(ip_network(n) for n in ("127.0.0.0/8", "::1/128"))
+# Non-global special-purpose space blocked unless allow_private: the
+# ranges ``is_private`` covers plus the rest of the IANA special-purpose
+# registries (shared 100.64/10, IETF 192.0.0/24, local NAT64 64:ff9b:1::/48).
+# Single addresses and CIDR ranges are both checked against this list.
+_PRIVATE_NETWORKS = tuple(
+    ip_network(n)
+    for n in (
+        "0.0.0.0/8", "10.0.0.0/8", "100.64.0.0/10", "127.0.0.0/8", "169.254.0.0/16",
+        "172.16.0.0/12", "192.0.0.0/24", "192.0.2.0/24", "192.168.0.0/16",
+        "198.18.0.0/15", "198.51.100.0/24", "203.0.113.0/24", "240.0.0.0/4",
+        "255.255.255.255/32",
+        "::/128", "::1/128", "::ffff:0:0/96", "64:ff9b:1::/48", "100::/64",
+        "2001::/23", "2001:db8::/32", "fc00::/7", "fe80::/10",
+    )
+)
+
+# Maximum number of validation decisions kept in the per-validator LRU
+DECISION_CACHE_SIZE = 4096
+
+# Seconds between aggregated audit summaries of cached decisions
+AUDIT_FLUSH_INTERVAL = 60.0
+
+# Scope rules that reflect an internal failure rather than a scope decision.
+# These are never cached so a transient fault cannot pin a denial.
+_UNCACHEABLE_RULES = frozenset({"validation_error"})
+
+
+@dataclass(frozen=True)
+class _Decision:
+    """Cached outcome of a single validate() call.
+
+    Attributes:
+        allowed: Whether the call was allowed.
+        target: Normalized target used for audit counters.
+        command: Command recorded on the violation (DENY only).
+        scope_rule: Violated scope rule (DENY only).
+        message: Violation message (DENY only).
+    """
+
+    allowed: bool
+    target: str
+    command: str = ""
+    scope_rule: str = ""
+    message: str = ""
+
+    def raise_violation(self) -> None:
+        """Re-raise the cached denial as a fresh ScopeViolationError."""
+        raise ScopeViolationError(
+            target=self.target,
+            command=self.command,
+            scope_rule=self.scope_rule,
+            message=self.message,
+        )
+
 
 @dataclass
 class ScopeConfig:
@@ -101,6 +186,89 @@ class ScopeConfig:
     allow_loopback: bool = False
 
 
+def scope_config_hash(config: ScopeConfig) -> str:
+    """SHA-256 of a canonical serialization of a ScopeConfig.
+
+    Used as the snapshot hash when scope does not come from a file (or has
+    been changed in memory since it was loaded).
+
+    Args:
+        config: Scope configuration.
+
+    Returns:
+        Hexadecimal hash string.
+    """
+    canonical = {
+        "allowed_networks": sorted(str(n) for n in config.allowed_networks),
+        "allowed_hostnames": sorted(config.allowed_hostnames),
+        "allowed_ports": None if config.allowed_ports is None else sorted(
+            str(p) for p in config.allowed_ports
+        ),
+        "allowed_protocols": None if config.allowed_protocols is None else sorted(
+            config.allowed_protocols
+        ),
+        "allow_private": config.allow_private,
+        "allow_loopback": config.allow_loopback,
+    }
+    return calculate_bytes_hash(json.dumps(canonical, sort_keys=True).encode())
+
+
+@dataclass(frozen=True)
+class ScopeSnapshot:
+    """One published version of a validator's scope.
+
+    Snapshots are never modified after publication. Readers grab the
+    current one with a single attribute read and use it for the whole
+    decision, so a concurrent reload never mixes two scopes.
+
+    Attributes:
+        version: Monotonic version, starting at 1 for each validator.
+        scope_hash: SHA-256 of the scope file bytes when loaded from a file
+            (equal to the checkpoint ``scope_hash``), otherwise
+            scope_config_hash() of the config.
+        config: The scope configuration this snapshot was compiled from.
+        compiled: Lookup structures compiled from config.
+    """
+
+    version: int
+    scope_hash: str
+    config: ScopeConfig
+    compiled: CompiledScope
+
+
+@dataclass(frozen=True)
+class ScopeDenial:
+    """A target rejected by ScopeValidator.validate_many().
+
+    Attributes:
+        target: The target exactly as it was passed in.
+        scope_rule: The scope rule that rejected it.
+        reason: Human-readable reason.
+    """
+
+    target: str
+    scope_rule: str
+    reason: str
+
+
+@dataclass
+class ScopeBatchResult:
+    """Partitioned result of ScopeValidator.validate_many().
+
+    Attributes:
+        allowed: In-scope targets, in input order.
+        denied: Rejected targets with reasons, in input order.
+    """
+
+    allowed: list[str] = field(default_factory=list)
+    denied: list[ScopeDenial] = field(default_factory=list)
+
+    @property
+    def all_allowed(self) -> bool:
+        """True if no target was denied."""
+        return not self.denied
+
+
 class ScopeValidator:
     """Hard-gate deterministic scope validator.
 
@@ -112,33 +280,95 @@ class ScopeValidator:
     - Fail-closed (deny on any error)
     - Logged to audit trail
 
+    Scope is held as an immutable ScopeSnapshot that is replaced, never
+    modified, on reload. Validation reads the current snapshot without
+    locking and pins it for the whole call.
+
+    Decisions are memoized in a bounded LRU keyed on the snapshot version
+    and the validate() arguments, so a decision can never be served for a
+    scope version other than the one it was computed against. The first
+    decision for a key is logged in full; repeats are folded into
+    per-target allow/deny counters that are flushed as a single
+    ``scope_validation_summary`` event every AUDIT_FLUSH_INTERVAL seconds.
+
     Attributes:
-        config: The scope configuration.
+        config: The scope configuration of the current snapshot.
     """
 
-    def __init__(self, config: ScopeConfig) -> None:
+    def __init__(
+        self,
+        config: ScopeConfig,
+        cache_size: int = DECISION_CACHE_SIZE,
+        source_path: Optional[Path] = None,
+        argument_schemas: Optional[Mapping[str, ArgumentSchema]] = None,
+        scope_hash: Optional[str] = None,
+    ) -> None:
         """Initialize ScopeValidator with configuration.
 
         Args:
             config: The scope configuration.
+            cache_size: Maximum cached decisions (0 disables the cache).
+            source_path: Scope file the config was loaded from, if any.
+            argument_schemas: Per-tool argument schemas used to extract
+                targets from commands (see load_argument_schemas()).
+            scope_hash: Content hash of the scope source. Defaults to
+                scope_config_hash(config).
 
         Raises:
             ValueError: If config is invalid.
         """
         if not isinstance(config, ScopeConfig):
             raise ValueError("config must be a ScopeConfig instance")
-        self.config = config
+        self._source_path = source_path
+        self._argument_schemas: Mapping[str, ArgumentSchema] = argument_schemas or {}
+        self._watcher: Optional[ConfigWatcher] = None
+
+        # Publication, decision cache and audit aggregation are guarded by
+        # _lock. Readers of _published never take it: it is one immutable
+        # (snapshot, config fingerprint) pair replaced by a single assignment.
+        self._lock = threading.Lock()
+        self._pinned = threading.local()
+        self._cache_size = cache_size
+        self._decisions: OrderedDict[tuple[Any, ...], _Decision] = OrderedDict()
+        self._audit_counts: dict[str, list[int]] = {}
+        self._last_audit_flush = time.monotonic()
+
+        self._published: Optional[tuple[ScopeSnapshot, tuple[Any, ...]]] = None
+        try:
+            self._publish(config, scope_hash)
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid scope configuration: {e}") from e
 
     @classmethod
-    def from_config(cls, config_dict: dict[str, Any]) -> ScopeValidator:
+    def from_config(
+        cls,
+        config_dict: dict[str, Any],
+        argument_schemas: Optional[Mapping[str, ArgumentSchema]] = None,
+    ) -> ScopeValidator:
         """Create ScopeValidator from configuration dictionary.
 
         Args:
             config_dict: Configuration dictionary with scope settings.
+            argument_schemas: Optional per-tool argument schemas.
 
         Returns:
             ScopeValidator instance.
 
+        Raises:
+            ValueError: If config is empty, malformed, or invalid.
+        """
+        return cls(cls.parse_config(config_dict), argument_schemas=argument_schemas)
+
+    @staticmethod
+    def parse_config(config_dict: dict[str, Any]) -> ScopeConfig:
+        """Build a ScopeConfig from a configuration dictionary.
+
+        Args:
+            config_dict: Configuration dictionary with scope settings.
+
+        Returns:
+            ScopeConfig instance.
+
         Raises:
             ValueError: If config is empty, malformed, or invalid.
         """
@@ -209,18 +439,49 @@ class ScopeValidator:
             allow_loopback=allow_loopback,
         )
 
-        return cls(config)
+        return config
 
     @classmethod
-    def from_file(cls, path: Union[str, Path]) -> ScopeValidator:
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        argument_schemas: Optional[Mapping[str, ArgumentSchema]] = None,
+    ) -> ScopeValidator:
         """Create ScopeValidator from YAML file.
 
         Args:
             path: Path to YAML configuration file.
+            argument_schemas: Optional per-tool argument schemas.
 
         Returns:
             ScopeValidator instance.
 
+        Raises:
+            FileNotFoundError: If file does not exist.
+            ValueError: If file contains invalid configuration.
+        """
+        path = Path(path)
+        config, scope_hash = cls.load_file(path)
+        return cls(
+            config,
+            source_path=path,
+            argument_schemas=argument_schemas,
+            scope_hash=scope_hash,
+        )
+
+    @classmethod
+    def load_file(cls, path: Union[str, Path]) -> tuple[ScopeConfig, str]:
+        """Read and parse a scope file, hashing the exact bytes parsed.
+
+        The hash equals calculate_file_hash(path), i.e. the ``scope_hash``
+        a checkpoint records for the same file.
+
+        Args:
+            path: Path to YAML configuration file.
+
+        Returns:
+            Tuple of (ScopeConfig, SHA-256 of the file contents).
+
         Raises:
             FileNotFoundError: If file does not exist.
             ValueError: If file contains invalid configuration.
@@ -229,10 +490,202 @@ class ScopeValidator:
         if not path.exists():
             raise FileNotFoundError(f"Scope file not found: {path}")
 
-        with open(path) as f:
-            config_dict = yaml.safe_load(f)
+        data = path.read_bytes()
+        return cls.parse_config(yaml.safe_load(data)), calculate_bytes_hash(data)
+
+    @property
+    def config(self) -> ScopeConfig:
+        """Scope configuration of the snapshot in use."""
+        return self._active_snapshot().config
+
+    @property
+    def scope_hash(self) -> str:
+        """Content hash of the current scope snapshot."""
+        return self._active_snapshot().scope_hash
+
+    @property
+    def argument_schemas(self) -> Mapping[str, ArgumentSchema]:
+        """Per-tool argument schemas used to extract command targets."""
+        return self._argument_schemas
+
+    def snapshot(self) -> ScopeSnapshot:
+        """Return the current scope snapshot (lock-free).
+
+        Returns:
+            The latest published ScopeSnapshot.
+        """
+        return self._current()
+
+    def _publish(
+        self,
+        config: ScopeConfig,
+        scope_hash: Optional[str] = None,
+        based_on: Optional[int] = None,
+    ) -> Optional[ScopeSnapshot]:
+        """Compile config and swap it in as the next snapshot version.
+
+        Compilation happens outside the lock; only the reference swap and
+        cache reset are serialized, so readers are never blocked.
 
-        return cls.from_config(config_dict)
+        Args:
+            config: Scope configuration to publish.
+            scope_hash: Content hash of its source, if known.
+            based_on: Version config was derived from. If another snapshot
+                was published since, nothing is published.
+
+        Returns:
+            The published snapshot, or None if based_on is out of date.
+
+        Raises:
+            TypeError: If config is corrupt and cannot be compiled.
+        """
+        key = self._config_key(config)
+        compiled = CompiledScope.compile(config)
+        digest = scope_hash or scope_config_hash(config)
+        with self._lock:
+            if based_on is not None and self._published[0].version != based_on:  # type: ignore[index]
+                return None
+            version = 1 if self._published is None else self._published[0].version + 1
+            snapshot = ScopeSnapshot(
+                version=version, scope_hash=digest, config=config, compiled=compiled
+            )
+            self._published = (snapshot, key)
+            self._decisions = OrderedDict()
+        return snapshot
+
+    def reload(self, config: ScopeConfig, scope_hash: Optional[str] = None) -> ScopeSnapshot:
+        """Atomically publish a new scope configuration.
+
+        Compiles the new scope into the next snapshot version and swaps it
+        in. Validations already running finish against the snapshot they
+        started with; every later call sees the new one. Pending audit
+        counters are flushed first so counts never span two versions.
+
+        Args:
+            config: The new scope configuration.
+            scope_hash: Content hash of the scope source, if known.
+
+        Returns:
+            The published snapshot.
+
+        Raises:
+            ValueError: If config is not a ScopeConfig.
+        """
+        if not isinstance(config, ScopeConfig):
+            raise ValueError("config must be a ScopeConfig instance")
+        self.flush_audit()
+        snapshot = self._publish(config, scope_hash)
+        assert snapshot is not None
+        self._log_reload(snapshot)
+        return snapshot
+
+    def _log_reload(self, snapshot: ScopeSnapshot) -> None:
+        config = snapshot.config
+        log.info(
+            "scope_reloaded",
+            version=snapshot.version,
+            scope_hash=snapshot.scope_hash,
+            networks=len(config.allowed_networks),
+            hostnames=len(config.allowed_hostnames),
+        )
+
+    def add_targets(self, targets: Sequence[str]) -> ScopeSnapshot:
+        """Publish a new snapshot with additional allowed targets.
+
+        Intended as the RoELoader listener for operator-authorized targets.
+        The latest config is copied, never modified. If another reload is
+        published while the copy is merged (e.g. a scope file narrowing the
+        scope), the merge is redone on top of it, so it is never undone.
+
+        Args:
+            targets: IPs, CIDR ranges or hostnames to allow.
+
+        Returns:
+            The published snapshot.
+        """
+        self.flush_audit()
+        while True:
+            latest = self._published[0]  # type: ignore[index]
+            current = latest.config
+            networks = list(current.allowed_networks)
+            hostnames = list(current.allowed_hostnames)
+            for target in targets:
+                network = self._parse_network(target)
+                if network is not None:
+                    if network not in networks:
+                        networks.append(network)
+                elif target.lower() not in hostnames:
+                    hostnames.append(target.lower())
+            snapshot = self._publish(
+                replace(current, allowed_networks=networks, allowed_hostnames=hostnames),
+                based_on=latest.version,
+            )
+            if snapshot is not None:
+                self._log_reload(snapshot)
+                return snapshot
+
+    def handle_settings_reload(self, settings: Settings, changed_paths: Sequence[str]) -> None:
+        """Config hot-reload listener: follow ``engagement.scope_path``.
+
+        Args:
+            settings: The newly applied settings.
+            changed_paths: Dotted config paths that changed.
+        """
+        if "engagement.scope_path" not in changed_paths:
+            return
+        scope_path = settings.engagement.scope_path
+        if not scope_path:
+            return
+        self._source_path = Path(scope_path)
+        if self._watcher is not None:
+            self.start_watching()
+        self._handle_scope_file_change(self._source_path)
+
+    def start_watching(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Reload scope automatically when the scope file changes.
+
+        Args:
+            path: Scope file to watch. Defaults to the file the validator
+                was loaded from.
+
+        Raises:
+            ValueError: If no path is given and none is known.
+        """
+        from cyberred.core.config_watcher import ConfigWatcher
+
+        if path is not None:
+            self._source_path = Path(path)
+        if self._source_path is None:
+            raise ValueError("No scope file to watch")
+
+        self.stop_watching()
+        self._watcher = ConfigWatcher(
+            config_path=self._source_path,
+            callback=self._handle_scope_file_change,
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop watching the scope file. Safe to call when not watching."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _handle_scope_file_change(self, path: Path) -> None:
+        """ConfigWatcher callback: reload scope from the changed file.
+
+        An unreadable or invalid file replaces the scope with an empty one
+        (deny everything) until it is fixed (fail-closed).
+
+        Args:
+            path: Path to the changed scope file.
+        """
+        try:
+            config, scope_hash = type(self).load_file(path)
+        except Exception as e:
+            log.error("scope_reload_failed", path=str(path), error=str(e))
+            config, scope_hash = ScopeConfig(), None
+        self.reload(config, scope_hash)
 
     def _normalize_input(self, text: Optional[str]) -> str:
         """Apply NFKC normalization to prevent Unicode bypass attacks.
@@ -327,14 +780,163 @@ class ScopeValidator:
         if ip.is_unspecified:
             return True
 
-        # Block private IPs if not allowed (but don't block documentation ranges)
-        # IPv6 documentation range 2001:db8::/32 is NOT private, it's "reserved"
-        # but we should allow it when explicitly in scope
-        if not self.config.allow_private and ip.is_private:
+        # Block private and other non-global special-purpose IPs if not
+        # allowed, with the same list used for CIDR ranges
+        if not self.config.allow_private and (
+            ip.is_private or any(ip in network for network in _PRIVATE_NETWORKS)
+        ):
             return True
 
         return False
 
+    @staticmethod
+    def _config_key(cfg: ScopeConfig) -> tuple[Any, ...]:
+        """Cheap identity fingerprint of a scope config.
+
+        Changes whenever the config object, one of its lists, or a list
+        length changes, so in-place edits of a published config are
+        republished as a new version. Edits that keep identity and length
+        are not detected; use reload() instead.
+
+        Raises:
+            TypeError: If a required config list has been corrupted to None.
+        """
+        ports = cfg.allowed_ports
+        protocols = cfg.allowed_protocols
+        return (
+            id(cfg),
+            id(cfg.allowed_networks),
+            len(cfg.allowed_networks),
+            id(cfg.allowed_hostnames),
+            len(cfg.allowed_hostnames),
+            id(ports),
+            None if ports is None else len(ports),
+            id(protocols),
+            None if protocols is None else len(protocols),
+        )
+
+    def _active_snapshot(self) -> ScopeSnapshot:
+        """Snapshot pinned by the running validation, else the latest."""
+        pinned: Optional[ScopeSnapshot] = getattr(self._pinned, "snapshot", None)
+        return pinned if pinned is not None else self._published[0]  # type: ignore[index]
+
+    def _current(self) -> ScopeSnapshot:
+        """Return the snapshot to validate against.
+
+        Inside a validation this is the pinned snapshot. Otherwise it is the
+        latest published one, republished first if its config was edited in
+        place.
+
+        Raises:
+            TypeError: If the published config has been corrupted.
+        """
+        pinned: Optional[ScopeSnapshot] = getattr(self._pinned, "snapshot", None)
+        if pinned is not None:
+            return pinned
+        snapshot, key = self._published  # type: ignore[misc]
+        if self._config_key(snapshot.config) != key:
+            snapshot = self._publish(snapshot.config)
+        return snapshot
+
+    def _matcher(self) -> CompiledScope:
+        """Return the compiled scope of the current snapshot.
+
+        Returns:
+            CompiledScope for the current config.
+        """
+        return self._current().compiled
+
+    def _lookup_decision(self, key: tuple[Any, ...]) -> Optional[_Decision]:
+        """Return the cached decision for key, if still valid."""
+        with self._lock:
+            decision = self._decisions.get(key)
+            if decision is not None:
+                self._decisions.move_to_end(key)
+            return decision
+
+    def _store_decision(
+        self, key: tuple[Any, ...], decision: _Decision, version: int
+    ) -> None:
+        """Cache a decision unless a newer scope was published meanwhile."""
+        if self._cache_size <= 0:
+            return
+        with self._lock:
+            if version != self._published[0].version:  # type: ignore[index]
+                return
+            self._decisions[key] = decision
+            if len(self._decisions) > self._cache_size:
+                self._decisions.popitem(last=False)
+
+    def _record_cached_decision(self, decision: _Decision) -> None:
+        """Fold a cache hit into the aggregated audit counters."""
+        with self._lock:
+            counts = self._audit_counts.setdefault(decision.target, [0, 0])
+            counts[0 if decision.allowed else 1] += 1
+            due = time.monotonic() - self._last_audit_flush >= AUDIT_FLUSH_INTERVAL
+        if due:
+            self.flush_audit()
+
+    def flush_audit(self) -> None:
+        """Emit pending cached-decision counters as one audit event."""
+        with self._lock:
+            counts = self._audit_counts
+            self._audit_counts = {}
+            self._last_audit_flush = time.monotonic()
+        if not counts:
+            return
+        log.info(
+            "scope_validation_summary",
+            targets={
+                target: {"allow": allow, "deny": deny}
+                for target, (allow, deny) in counts.items()
+            },
+            allow=sum(c[0] for c in counts.values()),
+            deny=sum(c[1] for c in counts.values()),
+        )
+
+    def _is_reserved_network(self, network: Union[IPv4Network, IPv6Network]) -> bool:
+        """Check if a CIDR range touches any reserved address space.
+
+        A range is reserved if its first or last address is reserved, or if
+        it overlaps a blocked block (loopback, link-local, multicast, and
+        private space unless allowed) anywhere in between.
+
+        Args:
+            network: Network to check.
+
+        Returns:
+            True if any part of the range should be blocked.
+        """
+        if self._is_reserved(network.network_address) or self._is_reserved(
+            network.broadcast_address
+        ):
+            return True
+
+        blocked = list(_ALWAYS_BLOCKED_NETWORKS)
+        if not self.config.allow_loopback:
+            blocked.extend(_LOOPBACK_NETWORKS)
+        if not self.config.allow_private:
+            blocked.extend(_PRIVATE_NETWORKS)
+        return any(
+            b.version == network.version and network.overlaps(b)  # type: ignore[arg-type]
+            for b in blocked
+        )
+
+    def _is_network_in_scope(self, network: Union[IPv4Network, IPv6Network]) -> bool:
+        """Check if an entire CIDR range is within allowed scope.
+
+        Args:
+            network: Network to check.
+
+        Returns:
+            True if every address of the range is in scope.
+        """
+        try:
+            return self._matcher().contains_network(network)
+        except (TypeError, AttributeError):
+            # Fail-closed on any error
+            return False
+
     def _is_ip_in_scope(self, ip: Union[IPv4Address, IPv6Address]) -> bool:
         """Check if IP address is within allowed scope.
 
@@ -345,13 +947,7 @@ class ScopeValidator:
             True if IP is in scope.
         """
         try:
-            if not self.config.allowed_networks:
-                return False
-
-            for network in self.config.allowed_networks:
-                if ip in network:
-                    return True
-            return False
+            return self._matcher().contains_ip(ip)
         except (TypeError, AttributeError):
             # Fail-closed on any error
             return False
@@ -367,19 +963,7 @@ class ScopeValidator:
         Returns:
             True if hostname is in scope.
         """
-        hostname = hostname.lower()
-
-        for allowed in self.config.allowed_hostnames:
-            if allowed.startswith("*."):
-                # Wildcard match
-                suffix = allowed[1:]  # Remove the leading "*"
-                if hostname.endswith(suffix) or hostname == allowed[2:]:
-                    return True
-            elif hostname == allowed:
-                # Exact match
-                return True
-
-        return False
+        return self._matcher().contains_hostname(hostname.lower())
 
     def _is_port_allowed(self, port: int) -> bool:
         """Check if port is allowed.
@@ -390,22 +974,19 @@ class ScopeValidator:
         Returns:
             True if port is allowed (or no port restrictions).
         """
-        if self.config.allowed_ports is None:
-            return True  # No restrictions
+        return self._matcher().port_allowed(port)
 
-        if not self.config.allowed_ports:
-            return False  # Empty list = block all
+    def _is_port_range_allowed(self, start: int, end: int) -> bool:
+        """Check if every port in an inclusive range is allowed.
 
-        for allowed in self.config.allowed_ports:
-            if isinstance(allowed, int):
-                if port == allowed:
-                    return True
-            elif isinstance(allowed, tuple):
-                start, end = allowed
-                if start <= port <= end:
-                    return True
+        Args:
+            start: First port of the range.
+            end: Last port of the range.
 
-        return False
+        Returns:
+            True if the whole range is allowed (or no port restrictions).
+        """
+        return self._matcher().port_range_allowed(start, end)
 
     def _is_protocol_allowed(self, protocol: str) -> bool:
         """Check if protocol is allowed.
@@ -416,16 +997,14 @@ class ScopeValidator:
         Returns:
             True if protocol is allowed (or no protocol restrictions).
         """
-        if self.config.allowed_protocols is None:
-            return True  # No restrictions
-
-        return protocol.lower() in self.config.allowed_protocols
+        return self._matcher().protocol_allowed(protocol)
 
     def _check_injection(self, command: str) -> None:
         """Check for command injection patterns.
 
-        Uses a robust state machine to parse quotes and detect dangerous
-        shell metacharacters outside of safe contexts.
+        Delegates to the single-pass tokenizer, which validates quote
+        balance and detects dangerous shell metacharacters outside of safe
+        quoting contexts.
 
         Args:
             command: Command string to check.
@@ -433,189 +1012,79 @@ class ScopeValidator:
         Raises:
             ScopeViolationError: If injection pattern detected.
         """
-        # 1. Validate quote balance with shlex
-        try:
-            shlex.split(command)
-        except ValueError as e:
-            raise ScopeViolationError(
-                target="",
-                command=command,
-                scope_rule="parse_error",
-                message=f"Command parsing failed (unbalanced quotes?): {e}",
-            )
-
-        # 2. State machine to check characters in context
-        in_single_quote = False
-        in_double_quote = False
-        escaped = False
-
-        for i, char in enumerate(command):
-            # Handle escapes
-            if escaped:
-                escaped = False
-                continue
-
-            # Backslash handling
-            if char == "\\":
-                # Inside single quotes, backslash is literal (mostly), so it doesn't escape the next char
-                # effectively. However, in this simple parser, if we are in single quotes,
-                # we ignore everything anyway until the closing quote.
-                # If NOT in single quotes, backslash escapes the next char.
-                if not in_single_quote:
-                    escaped = True
-                continue
-
-            # Handle quote toggling
-            if char == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-                continue
-            elif char == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-                continue
-
-            # --- Safety Checks ---
-
-            # Context 1: Single Quotes '...'
-            # Everything is literal. Safe.
-            if in_single_quote:
-                continue
-
-            # Context 2: Double Quotes "..."
-            # Dangerous: ` (backtick), $ (substitution/variable)
-            # Safe: ; | & (literal in double quotes)
-            if in_double_quote:
-                if char == "`":
-                    raise ScopeViolationError(
-                        target="",
-                        command=command,
-                        scope_rule="injection_backtick_double_quote",
-                        message="Backtick execution detected in double quotes",
-                    )
-                if char == "$":
-                    # We block all $ in double quotes to be safe against $(...) and $VAR
-                    raise ScopeViolationError(
-                        target="",
-                        command=command,
-                        scope_rule="injection_dollar_double_quote",
-                        message="Variable/Command substitution ($) detected in double quotes",
-                    )
-
-            # Context 3: Unquoted
-            # Dangerous: ; | & ` $ ( ) \n
-            else:
-                if char in ";|&`$()\n":
-                    raise ScopeViolationError(
-                        target="",
-                        command=command,
-                        scope_rule=f"injection_unquoted_{char}",
-                        message=f"Command injection detected: unquoted '{char}'",
-                    )
+        tokenize(command)
 
     def _parse_target_from_command(
         self, command: str
     ) -> tuple[Optional[str], Optional[int], Optional[str]]:
         """Extract target, port, and protocol from command string.
 
+        Single-target view of parse_command(): the last target and the
+        first port. validate() itself checks every target and port.
+
         Args:
             command: Command string to parse.
 
         Returns:
             Tuple of (target, port, protocol).
         """
-        # Parse command into arguments
         try:
-            args = shlex.split(command)
-        except ValueError:
+            parsed = parse_command(command, self._argument_schemas)
+        except ScopeViolationError:
             return None, None, None
 
-        target = None
-        port = None
-        protocol = None
+        target = parsed.targets[-1] if parsed.targets else None
+        port = parsed.ports[0][0] if parsed.ports else None
+        return target, port, parsed.protocol
 
-        # Look for IP addresses, hostnames, URLs in arguments
-        ip_pattern = re.compile(
-            r"^(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(?:/\d{1,2})?|"
-            r"[0-9a-fA-F:]+(?:/\d{1,3})?)$"
-        )
-        url_pattern = re.compile(r"^(https?|ftp|tcp|udp)://")
-
-        i = 0
-        while i < len(args):
-            arg = args[i]
-
-            # Skip flags that take no argument
-            if arg.startswith("-") and len(arg) == 2 and arg not in ("-p", "-u"):
-                i += 1
-                continue
-                
-            # Skip flags that take an argument (like -c 4 in ping)
-            if arg.startswith("-") and arg not in ("-p", "-u"):
-                # Skip this flag and its argument
-                if i + 1 < len(args) and not args[i + 1].startswith("-"):
-                    # Check if next arg looks like a value (not IP/hostname)
-                    next_arg = args[i + 1]
-                    if next_arg.isdigit() or len(next_arg) <= 3:
-                        i += 2
-                        continue
-                i += 1
-                continue
-
-            # Check for -p port flag
-            if arg == "-p" and i + 1 < len(args):
-                port_str = args[i + 1].split(",")[0]  # Take first port
-                try:
-                    port = int(port_str)
-                except ValueError:
-                    pass
-                i += 2
-                continue
-
-            # Check for URL
-            if url_pattern.match(arg):
-                parsed = urlparse(arg)
-                target = parsed.hostname
-                if parsed.port:
-                    port = parsed.port
-                if parsed.scheme in ("tcp", "udp"):
-                    protocol = parsed.scheme
-                i += 1
-                continue
-
-            # Check for -u URL flag (sqlmap style)
-            if arg == "-u" and i + 1 < len(args):
-                url_arg = args[i + 1]
-                if url_pattern.match(url_arg):
-                    parsed = urlparse(url_arg)
-                    target = parsed.hostname
-                    if parsed.port:
-                        port = parsed.port
-                i += 2
-                continue
-
-            # Check for IP address or CIDR
-            if ip_pattern.match(arg):
-                target = arg
-                i += 1
-                continue
-
-            # Check for hostname-like patterns (contains dot, no special chars)
-            if "." in arg and not arg.startswith("-"):
-                # Could be hostname or IP:port
-                if ":" in arg and not arg.count(":") > 1:  # Not IPv6
-                    host_part, port_part = arg.rsplit(":", 1)
-                    target = host_part
-                    try:
-                        port = int(port_part)
-                    except ValueError:
-                        pass
-                else:
-                    target = arg
-                i += 1
-                continue
-
-            i += 1
-
-        return target, port, protocol
+    @staticmethod
+    def _split_target(
+        target: Optional[str], port: Optional[int]
+    ) -> tuple[Optional[str], Optional[int]]:
+        """Strip URL scheme/path and host:port suffix from a normalized target.
+
+        Args:
+            target: Normalized target string.
+            port: Explicit port, if any.
+
+        Returns:
+            Tuple of (host, port).
+        """
+        # Handle URL in target
+        if target and (
+            target.startswith("http://") or target.startswith("https://")
+        ):
+            parsed = urlparse(target)
+            target = parsed.hostname
+            if parsed.port and port is None:
+                port = parsed.port
+
+        # Handle host:port format
+        if target and ":" in target and target.count(":") == 1:
+            host_part, port_part = target.rsplit(":", 1)
+            try:
+                port = int(port_part)
+                target = host_part
+            except ValueError:
+                pass
+
+        return target, port
+
+    @staticmethod
+    def _parse_network(target: str) -> Optional[Union[IPv4Network, IPv6Network]]:
+        """Parse target as an IP address or CIDR range.
+
+        Args:
+            target: Host part of the target.
+
+        Returns:
+            Network (a single address becomes a /32 or /128), or None if the
+            target is not an IP literal.
+        """
+        try:
+            return ip_network(target, strict=False)
+        except ValueError:
+            return None
 
     def _log_validation(
         self, target: str, decision: str, reason: str, **extra: Any
@@ -647,6 +1116,8 @@ class ScopeValidator:
 
         This is the main entry point for scope validation. It validates
         targets against the configured scope and returns True if allowed.
+        Repeated calls with the same arguments are answered from the
+        decision cache.
 
         Args:
             target: Target IP address, hostname, or URL.
@@ -661,138 +1132,215 @@ class ScopeValidator:
             ScopeViolationError: If target is out of scope or validation fails.
         """
         try:
-            # If command is provided, extract target from it
-            if command is not None:
-                command = self._normalize_input(command)
-                self._check_injection(command)
-                cmd_target, cmd_port, cmd_protocol = self._parse_target_from_command(
-                    command
-                )
-                if cmd_target:
-                    target = cmd_target
-                if cmd_port and port is None:
-                    port = cmd_port
-                if cmd_protocol and protocol is None:
-                    protocol = cmd_protocol
-
-            # Normalize target
-            if target is not None:
-                target = self._normalize_input(target)
-
-            # Handle URL in target
-            if target and (
-                target.startswith("http://") or target.startswith("https://")
-            ):
-                parsed = urlparse(target)
-                target = parsed.hostname
-                if parsed.port and port is None:
-                    port = parsed.port
-
-            # Handle host:port format
-            if target and ":" in target and target.count(":") == 1:
-                host_part, port_part = target.rsplit(":", 1)
-                try:
-                    port = int(port_part)
-                    target = host_part
-                except ValueError:
-                    pass
-
-            # Validate target is provided
-            if not target:
-                raise ScopeViolationError(
-                    target="",
-                    command=command or "",
-                    scope_rule="missing_target",
-                    message="No target provided for validation",
+            snapshot = self._current()
+            key = (snapshot.version, target, port, protocol, command)
+            hash(key)
+        except Exception:
+            # Corrupt scope or unhashable input: uncached path fails closed
+            return self._validate_uncached(target, port, protocol, command)
+
+        decision = self._lookup_decision(key)
+        if decision is not None:
+            self._record_cached_decision(decision)
+            if not decision.allowed:
+                decision.raise_violation()
+            return True
+
+        self._pinned.snapshot = snapshot
+        try:
+            normalized = self._validate_uncached(target, port, protocol, command)
+        except ScopeViolationError as e:
+            if e.scope_rule not in _UNCACHEABLE_RULES:
+                self._store_decision(
+                    key,
+                    _Decision(
+                        allowed=False,
+                        target=e.target,
+                        command=e.command,
+                        scope_rule=e.scope_rule,
+                        message=str(e),
+                    ),
+                    snapshot.version,
                 )
+            raise
+        finally:
+            self._pinned.snapshot = None
 
-            # Try to parse as IP address
-            is_ip = False
-            ip_obj: Optional[Union[IPv4Address, IPv6Address]] = None
-            try:
-                # Handle CIDR notation by extracting base IP
-                if "/" in target:
-                    base_ip = target.split("/")[0]
-                    ip_obj = ip_address(base_ip)
-                else:
-                    ip_obj = ip_address(target)
-                is_ip = True
-            except ValueError:
-                is_ip = False
-
-            # Validate IP addresses
-            if is_ip and ip_obj:
-                # Check reserved ranges (ALWAYS blocked)
-                if self._is_reserved(ip_obj):
-                    self._log_validation(
-                        target, "DENY", "Reserved IP address", is_reserved=True
-                    )
-                    raise ScopeViolationError(
-                        target=target,
-                        command=command or "",
-                        scope_rule="reserved_ip",
-                        message=f"Reserved IP address: {target}",
-                    )
-
-                # Check if in allowed networks
-                if not self._is_ip_in_scope(ip_obj):
-                    self._log_validation(target, "DENY", "IP not in allowed networks")
-                    raise ScopeViolationError(
-                        target=target,
-                        command=command or "",
-                        scope_rule="ip_out_of_scope",
-                        message=f"IP {target} not in allowed networks",
-                    )
-
-            # Validate hostnames
-            elif not is_ip:  # pragma: no branch
-                if not self._is_hostname_in_scope(target):
-                    self._log_validation(target, "DENY", "Hostname not in scope")
-                    raise ScopeViolationError(
-                        target=target,
-                        command=command or "",
-                        scope_rule="hostname_out_of_scope",
-                        message=f"Hostname {target} not in allowed list",
-                    )
-
-            # Validate port if provided
-            if port is not None:
-                if not self._is_port_allowed(port):
-                    self._log_validation(
-                        target, "DENY", f"Port {port} not allowed", port=port
-                    )
-                    raise ScopeViolationError(
-                        target=target,
-                        command=command or "",
-                        scope_rule="port_blocked",
-                        message=f"Port {port} not in allowed list",
-                    )
-
-            # Validate protocol if provided
-            if protocol is not None:
-                if not self._is_protocol_allowed(protocol):
-                    self._log_validation(
-                        target,
-                        "DENY",
-                        f"Protocol {protocol} not allowed",
-                        protocol=protocol,
-                    )
-                    raise ScopeViolationError(
-                        target=target,
-                        command=command or "",
-                        scope_rule="protocol_blocked",
-                        message=f"Protocol {protocol} not in allowed list",
-                    )
-
-            # All checks passed
-            self._log_validation(
-                target,
-                "ALLOW",
-                "Target in scope",
-                port=port,
-                protocol=protocol,
+        self._store_decision(
+            key, _Decision(allowed=True, target=normalized), snapshot.version
+        )
+        return True
+
+    def validate_many(
+        self,
+        targets: Iterable[str],
+        port: Optional[int] = None,
+        protocol: Optional[str] = None,
+    ) -> ScopeBatchResult:
+        """Validate a list of targets in one pass without raising.
+
+        Applies the same rules as validate() to each target (IP, CIDR,
+        hostname, URL or host:port). Single IPs of each family are checked
+        together in one sorted sweep over the compiled integer ranges, and
+        CIDR targets must lie entirely inside the scope. Results are audited
+        as a single ``scope_validation_batch`` event.
+
+        Args:
+            targets: Targets to validate.
+            port: Port applied to every target without its own port.
+            protocol: Protocol applied to every target.
+
+        Returns:
+            ScopeBatchResult with allowed targets and denials.
+        """
+        targets = list(targets)
+        try:
+            snapshot = self._current()
+        except Exception as e:
+            # Fail-closed: a corrupt scope denies the whole batch
+            reason = f"Scope validation failed (fail-closed): {e}"
+            result = ScopeBatchResult(
+                denied=[ScopeDenial(str(t), "validation_error", reason) for t in targets]
             )
-            return True
+            self._log_batch(result)
+            return result
+
+        self._pinned.snapshot = snapshot
+        try:
+            result = self._validate_batch(snapshot.compiled, targets, port, protocol)
+        finally:
+            self._pinned.snapshot = None
+        self._log_batch(result)
+        return result
+
+    def _validate_batch(
+        self,
+        matcher: CompiledScope,
+        targets: list[str],
+        port: Optional[int],
+        protocol: Optional[str],
+    ) -> ScopeBatchResult:
+        """validate_many() body, run against one pinned snapshot."""
+        denials: list[Optional[ScopeDenial]] = [None] * len(targets)
+        ports: list[Optional[int]] = [None] * len(targets)
+        pending_ips: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+
+        def deny(idx: int, rule: str, reason: str) -> None:
+            denials[idx] = ScopeDenial(str(targets[idx]), rule, reason)
+
+        for idx, raw in enumerate(targets):
+            try:
+                host, ports[idx] = self._split_target(self._normalize_input(raw), port)
+                if not host:
+                    deny(idx, "missing_target", "No target provided for validation")
+                    continue
+                network = self._parse_network(host)
+                if network is None:
+                    if not matcher.contains_hostname(host.lower()):
+                        deny(idx, "hostname_out_of_scope", f"Hostname {host} not in allowed list")
+                elif network.num_addresses == 1:
+                    if self._is_reserved(network.network_address):
+                        deny(idx, "reserved_ip", f"Reserved IP address: {host}")
+                    else:
+                        pending_ips[network.version].append(
+                            (idx, int(network.network_address))
+                        )
+                elif self._is_reserved_network(network):
+                    deny(idx, "reserved_ip", f"Reserved IP address: {host}")
+                elif not matcher.contains_network(network):
+                    deny(idx, "ip_out_of_scope", f"IP {host} not in allowed networks")
+            except ScopeViolationError as e:
+                deny(idx, e.scope_rule, str(e))
+            except Exception as e:
+                deny(idx, "validation_error", f"Scope validation failed (fail-closed): {e}")
+
+        for version, items in pending_ips.items():
+            flags = matcher.contains_ips([value for _, value in items], version)
+            for (idx, _), in_scope in zip(items, flags):
+                if not in_scope:
+                    deny(idx, "ip_out_of_scope", f"IP {targets[idx]} not in allowed networks")
+
+        protocol_ok = protocol is None or matcher.protocol_allowed(protocol)
+
+        result = ScopeBatchResult()
+        for idx, raw in enumerate(targets):
+            denial = denials[idx]
+            if denial is None:
+                target_port = ports[idx]
+                if target_port is not None and not matcher.port_allowed(target_port):
+                    denial = ScopeDenial(raw, "port_blocked", f"Port {target_port} not in allowed list")
+                elif not protocol_ok:
+                    denial = ScopeDenial(raw, "protocol_blocked", f"Protocol {protocol} not in allowed list")
+            if denial is None:
+                result.allowed.append(raw)
+            else:
+                result.denied.append(denial)
+        return result
+
+    def _log_batch(self, result: ScopeBatchResult) -> None:
+        """Log a validate_many() result as one audit event.
+
+        Args:
+            result: The batch result.
+        """
+        rules: dict[str, int] = {}
+        for denial in result.denied:
+            rules[denial.scope_rule] = rules.get(denial.scope_rule, 0) + 1
+        log.info(
+            "scope_validation_batch",
+            total=len(result.allowed) + len(result.denied),
+            allowed=len(result.allowed),
+            denied=len(result.denied),
+            denied_rules=rules,
+            denied_targets=[d.target for d in result.denied],
+        )
+
+    def _validate_uncached(
+        self,
+        target: Optional[str] = None,
+        port: Optional[int] = None,
+        protocol: Optional[str] = None,
+        command: Optional[str] = None,
+    ) -> str:
+        """Run the full validation pipeline without consulting the cache.
+
+        When a command is given, every target it names is validated (the
+        explicit target is only used if the command names none), together
+        with every port it names unless an explicit port is given.
+
+        Args:
+            target: Target IP address, hostname, or URL.
+            port: Port number to validate.
+            protocol: Protocol to validate (tcp, udp, icmp).
+            command: Command string to parse and validate.
+
+        Returns:
+            The normalized target(s) that were allowed, comma separated.
+
+        Raises:
+            ScopeViolationError: If target is out of scope or validation fails.
+        """
+        try:
+            targets: list[Optional[str]] = [target]
+            cmd_ports: list[tuple[int, int]] = []
+
+            # If command is provided, extract targets from it (single pass)
+            if command is not None:
+                command = self._normalize_input(command)
+                parsed = parse_command(command, self._argument_schemas)
+                if parsed.targets:
+                    targets = list(parsed.targets)
+                if port is None:
+                    cmd_ports = parsed.ports
+                if parsed.protocol and protocol is None:
+                    protocol = parsed.protocol
+
+            allowed = []
+            for target in targets:
+                allowed.append(
+                    self._validate_target(target, port, cmd_ports, protocol, command)
+                )
+            return ", ".join(allowed)
 
         except ScopeViolationError:
             # Re-raise scope violations
@@ -808,3 +1356,141 @@ class ScopeValidator:
                 scope_rule="validation_error",
                 message=f"Scope validation failed (fail-closed): {e}",
             ) from e
+
+    def _validate_target(
+        self,
+        target: Optional[str],
+        port: Optional[int],
+        cmd_ports: list[tuple[int, int]],
+        protocol: Optional[str],
+        command: Optional[str],
+    ) -> str:
+        """Validate a single target with its port(s) and protocol.
+
+        Args:
+            target: Target IP address, CIDR, hostname, or URL.
+            port: Explicit port, if any.
+            cmd_ports: Port intervals taken from the command (used when no
+                explicit or target-embedded port is present).
+            protocol: Protocol to validate.
+            command: Normalized command, for violation context.
+
+        Returns:
+            The normalized target.
+
+        Raises:
+            ScopeViolationError: If the target is out of scope.
+        """
+        # Normalize target
+        if target is not None:
+            target = self._normalize_input(target)
+        target, port = self._split_target(target, port)
+
+        # Validate target is provided
+        if not target:
+            raise ScopeViolationError(
+                target="",
+                command=command or "",
+                scope_rule="missing_target",
+                message="No target provided for validation",
+            )
+
+        # Validate IP addresses and CIDR ranges
+        network = self._parse_network(target)
+        if network is not None:
+            reserved = (
+                self._is_reserved(network.network_address)
+                if network.num_addresses == 1
+                else self._is_reserved_network(network)
+            )
+            if reserved:
+                self._log_validation(
+                    target, "DENY", "Reserved IP address", is_reserved=True
+                )
+                raise ScopeViolationError(
+                    target=target,
+                    command=command or "",
+                    scope_rule="reserved_ip",
+                    message=f"Reserved IP address: {target}",
+                )
+
+            # Check if in allowed networks (whole range for CIDR targets)
+            in_scope = (
+                self._is_ip_in_scope(network.network_address)
+                if network.num_addresses == 1
+                else self._is_network_in_scope(network)
+            )
+            if not in_scope:
+                self._log_validation(target, "DENY", "IP not in allowed networks")
+                raise ScopeViolationError(
+                    target=target,
+                    command=command or "",
+                    scope_rule="ip_out_of_scope",
+                    message=f"IP {target} not in allowed networks",
+                )
+
+        # Validate hostnames
+        elif not self._is_hostname_in_scope(target):
+            self._log_validation(target, "DENY", "Hostname not in scope")
+            raise ScopeViolationError(
+                target=target,
+                command=command or "",
+                scope_rule="hostname_out_of_scope",
+                message=f"Hostname {target} not in allowed list",
+            )
+
+        # Validate port(s) if provided
+        port_ranges = [(port, port)] if port is not None else cmd_ports
+        for start, end in port_ranges:
+            if start == end:
+                port_allowed = self._is_port_allowed(start)
+                label = str(start)
+            else:
+                port_allowed = self._is_port_range_allowed(start, end)
+                label = f"{start}-{end}"
+            if not port_allowed:
+                self._log_validation(
+                    target, "DENY", f"Port {label} not allowed", port=label
+                )
+                raise ScopeViolationError(
+                    target=target,
+                    command=command or "",
+                    scope_rule="port_blocked",
+                    message=f"Port {label} not in allowed list",
+                )
+
+        # Validate protocol if provided
+        if protocol is not None:
+            if not self._is_protocol_allowed(protocol):
+                self._log_validation(
+                    target,
+                    "DENY",
+                    f"Protocol {protocol} not allowed",
+                    protocol=protocol,
+                )
+                raise ScopeViolationError(
+                    target=target,
+                    command=command or "",
+                    scope_rule="protocol_blocked",
+                    message=f"Protocol {protocol} not in allowed list",
+                )
+
+        # All checks passed
+        if port is None and cmd_ports:
+            self._log_validation(
+                target,
+                "ALLOW",
+                "Target in scope",
+                port=None,
+                ports=[f"{a}-{b}" if a != b else str(a) for a, b in cmd_ports],
+                protocol=protocol,
+            )
+        else:
+            self._log_validation(
+                target,
+                "ALLOW",
+                "Target in scope",
+                port=port,
+                protocol=protocol,
+            )
+        return target
@@ -0,0 +1,218 @@
+"""Compiled Scope Matcher - O(log n) lookup structures for scope validation.
+
+ScopeValidator used to walk every allowed network, hostname pattern and
+port entry linearly on each call. Large enterprise RoEs carry thousands of
+entries, and every KaliExecutor.execute() goes through the validator, so the
+ScopeConfig is compiled once into lookup structures:
+
+- IP networks: per-family sorted, merged integer intervals searched with
+  bisect. Scope only needs membership, not the most specific route, so
+  collapsed intervals answer the same question as a longest-prefix-match
+  tree with one binary search.
+- Hostnames: reversed-label trie (com -> example -> www). Exact entries mark
+  the terminal node, wildcard entries (*.example.com) mark the node at which
+  every deeper name (and the root domain itself) is in scope.
+- Ports: sorted, merged intervals searched with bisect.
+- Protocols: frozenset.
+
+Matching semantics are identical to the original linear checks.
+
+Usage:
+    from cyberred.tools.scope_matcher import CompiledScope
+
+    compiled = CompiledScope.compile(config)
+    compiled.contains_ip(ip_address("192.168.1.10"))
+    compiled.contains_hostname("www.example.com")
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from cyberred.tools.scope import ScopeConfig
+
+
+class _IntervalSet:
+    """Sorted, non-overlapping closed integer intervals with bisect lookup."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals: Iterable[tuple[int, int]]) -> None:
+        merged: list[list[int]] = []
+        for start, end in sorted(intervals):
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        self.starts: list[int] = [m[0] for m in merged]
+        self.ends: list[int] = [m[1] for m in merged]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, value: int) -> bool:
+        """Check whether value falls inside any interval."""
+        idx = bisect_right(self.starts, value) - 1
+        return idx >= 0 and value <= self.ends[idx]
+
+    def covers(self, start: int, end: int) -> bool:
+        """Check whether [start, end] lies entirely inside one interval."""
+        idx = bisect_right(self.starts, start) - 1
+        return idx >= 0 and end <= self.ends[idx]
+
+    def contains_many(self, values: Sequence[int]) -> list[bool]:
+        """Membership for many values in one merge-join sweep.
+
+        Sorts the probes once and walks them alongside the intervals, so a
+        batch of n values costs O(n log n + m) instead of n binary searches.
+
+        Args:
+            values: Integer values to test.
+
+        Returns:
+            Membership flags in the same order as values.
+        """
+        result = [False] * len(values)
+        starts, ends = self.starts, self.ends
+        j, count = 0, len(starts)
+        for i in sorted(range(len(values)), key=values.__getitem__):
+            value = values[i]
+            while j < count and ends[j] < value:
+                j += 1
+            if j == count:
+                break
+            result[i] = starts[j] <= value
+        return result
+
+
+class _LabelNode:
+    """Node in the reversed-label hostname trie."""
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _LabelNode] = {}
+        self.exact = False
+        self.wildcard = False
+
+
+@dataclass(frozen=True)
+class CompiledScope:
+    """Immutable lookup structures compiled from a ScopeConfig.
+
+    Attributes:
+        ipv4: Merged IPv4 integer intervals.
+        ipv6: Merged IPv6 integer intervals.
+        hostnames: Root of the reversed-label hostname trie.
+        ports: Merged port intervals, or None when all ports are allowed.
+        protocols: Allowed protocols, or None when all protocols are allowed.
+    """
+
+    ipv4: _IntervalSet
+    ipv6: _IntervalSet
+    hostnames: _LabelNode
+    ports: Optional[_IntervalSet]
+    protocols: Optional[frozenset[str]]
+
+    @classmethod
+    def compile(cls, config: ScopeConfig) -> CompiledScope:
+        """Compile a ScopeConfig into lookup structures.
+
+        Args:
+            config: Scope configuration to compile.
+
+        Returns:
+            CompiledScope instance.
+        """
+        v4: list[tuple[int, int]] = []
+        v6: list[tuple[int, int]] = []
+        for network in config.allowed_networks:
+            bounds = (int(network.network_address), int(network.broadcast_address))
+            (v4 if network.version == 4 else v6).append(bounds)
+
+        root = _LabelNode()
+        for pattern in config.allowed_hostnames:
+            wildcard = pattern.startswith("*.")
+            node = root
+            for label in reversed((pattern[2:] if wildcard else pattern).split(".")):
+                node = node.children.setdefault(label, _LabelNode())
+            if wildcard:
+                node.wildcard = True
+            else:
+                node.exact = True
+
+        ports: Optional[_IntervalSet] = None
+        if config.allowed_ports is not None:
+            port_intervals: list[tuple[int, int]] = []
+            for allowed in config.allowed_ports:
+                if isinstance(allowed, int):
+                    port_intervals.append((allowed, allowed))
+                elif isinstance(allowed, tuple):
+                    port_intervals.append((allowed[0], allowed[1]))
+            ports = _IntervalSet(port_intervals)
+
+        protocols: Optional[frozenset[str]] = None
+        if config.allowed_protocols is not None:
+            protocols = frozenset(config.allowed_protocols)
+
+        return cls(
+            ipv4=_IntervalSet(v4),
+            ipv6=_IntervalSet(v6),
+            hostnames=root,
+            ports=ports,
+            protocols=protocols,
+        )
+
+    def _family(self, version: int) -> _IntervalSet:
+        return self.ipv4 if version == 4 else self.ipv6
+
+    def contains_ip(self, ip: Union[IPv4Address, IPv6Address]) -> bool:
+        """Check whether an IP address is inside an allowed network."""
+        return self._family(ip.version).contains(int(ip))
+
+    def contains_network(self, network: Union[IPv4Network, IPv6Network]) -> bool:
+        """Check whether every address of a network is inside the scope."""
+        return self._family(network.version).covers(
+            int(network.network_address), int(network.broadcast_address)
+        )
+
+    def contains_ips(self, values: Sequence[int], version: int) -> list[bool]:
+        """Batch membership for integer addresses of one IP family."""
+        return self._family(version).contains_many(values)
+
+    def contains_hostname(self, hostname: str) -> bool:
+        """Check whether a (lowercased) hostname matches an allowed pattern."""
+        node = self.hostnames
+        for label in reversed(hostname.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                return False
+            node = child
+            if node.wildcard:
+                return True
+        return node.exact
+
+    def port_allowed(self, port: int) -> bool:
+        """Check whether a port is allowed (None = no restrictions)."""
+        if self.ports is None:
+            return True
+        return self.ports.contains(port)
+
+    def port_range_allowed(self, start: int, end: int) -> bool:
+        """Check whether every port in [start, end] is allowed."""
+        if self.ports is None:
+            return True
+        return self.ports.covers(start, end)
+
+    def protocol_allowed(self, protocol: str) -> bool:
+        """Check whether a protocol is allowed (None = no restrictions)."""
+        if self.protocols is None:
+            return True
+        return protocol.lower() in self.protocols
@@ -0,0 +1,516 @@
+"""Synthetic tool outputs for the Tier 1 parser benchmarks and fuzzing.
+
+Each corpus renders the output of one tool format with a given number of
+records (hosts, results, dump entries, ...), mixed with the banners and
+non-matching lines real runs print. Output is a pure function of
+(records, seed), so benchmark baselines and differential checks always
+compare the same input.
+
+CORPORA covers every parser in BUILTIN_PARSERS, in each output format
+the parser reads. run_parser() calls a built-in parser the way the
+ParserRegistry would, except for parsers that still take
+(stdout, agent_id, target). mutate() derives fuzz inputs from a corpus:
+truncated, with lines dropped or repeated, colored, with CRLF endings,
+with garbage lines, or with characters flipped.
+
+Usage:
+    from tests.load.parser_corpus import CORPORA, mutate, run_parser
+
+    corpus = CORPORA["nmap_xml"]
+    stdout = corpus.generate(1000)
+    findings = run_parser(corpus, stdout)
+    fuzzed = mutate(stdout, "truncate", random.Random(1))
+"""
+
+import inspect
+import json
+import random
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from cyberred.core.models import Finding
+from cyberred.tools.parsers.registry import BUILTIN_PARSERS, load_builtin
+
+AGENT_ID = "00000000-0000-0000-0000-000000000001"
+
+USERS = ["alice", "bob", "carol", "dave", "svc_sql", "svc_backup", "administrator", "krbtgt"]
+WORDS = ["admin", "backup", "api", "dev", "login", "static", "uploads", "config", "old", "test"]
+SERVICES = [(22, "ssh", "OpenSSH", "8.9p1"), (80, "http", "nginx", "1.18.0"), (443, "https", "Apache httpd", "2.4.52"),
+            (445, "microsoft-ds", "Samba smbd", "4.6.2"), (3306, "mysql", "MySQL", "8.0.32"), (8080, "http-proxy", "", "")]
+SEVERITIES = ["info", "low", "medium", "high", "critical"]
+
+
+def _ip(i: int) -> str:
+    return f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}"
+
+
+def _hex(rng: random.Random, length: int = 32) -> str:
+    return f"{rng.getrandbits(length * 4):0{length}x}"
+
+
+def nmap_xml(rng: random.Random, records: int) -> str:
+    out = ['<?xml version="1.0" encoding="UTF-8"?>', '<nmaprun scanner="nmap" args="nmap -sV -oX -">',
+           '<scaninfo type="syn" protocol="tcp" numservices="1000"/>']
+    for i in range(records):
+        out.append(f'<host starttime="1" endtime="2"><status state="up" reason="syn-ack"/>'
+                   f'<address addr="{_ip(i)}" addrtype="ipv4"/><hostnames/><ports>')
+        for port, name, product, version in rng.sample(SERVICES, rng.randint(1, 3)):
+            state = rng.choice(["open", "open", "closed", "filtered"])
+            out.append(f'<port protocol="tcp" portid="{port}"><state state="{state}" reason="syn-ack"/>'
+                       f'<service name="{name}" product="{product}" version="{version}"/>')
+            if state == "open" and rng.random() < 0.3:
+                out.append(f'<script id="vulners" output="CVE-2023-{rng.randint(1000, 9999)} 7.5"/>')
+            out.append('</port>')
+        out.append('</ports></host>')
+    out.append('<runstats><finished time="2" exit="success"/></runstats></nmaprun>')
+    return "\n".join(out) + "\n"
+
+
+def nmap_grepable(rng: random.Random, records: int) -> str:
+    out = ["# Nmap 7.94 scan initiated as: nmap -sV -oG - 10.0.0.0/16"]
+    for i in range(records):
+        out.append(f"Host: {_ip(i)} ()\tStatus: Up")
+        ports = ", ".join(f"{port}/{rng.choice(['open', 'closed'])}/tcp//{name}//{product} {version}/"
+                          for port, name, product, version in rng.sample(SERVICES, rng.randint(1, 3)))
+        out.append(f"Host: {_ip(i)} ()\tPorts: {ports}")
+    out.append("# Nmap done -- 65536 IP addresses scanned")
+    return "\n".join(out) + "\n"
+
+
+def masscan_list(rng: random.Random, records: int) -> str:
+    out = ["Starting masscan 1.3.2 (http://bit.ly/14GZzcT)", "Initiating SYN Stealth Scan"]
+    for i in range(records):
+        out.append(f"Discovered open port {rng.choice(SERVICES)[0]}/tcp on {_ip(i)}")
+    return "\n".join(out) + "\n"
+
+
+def masscan_json(rng: random.Random, records: int) -> str:
+    entries = [
+        json.dumps({"ip": _ip(i), "timestamp": str(1700000000 + i), "ports": [
+            {"port": port, "proto": "tcp", "status": "open", "reason": "syn-ack", "ttl": 64}
+            for port, _, _, _ in rng.sample(SERVICES, rng.randint(1, 2))]})
+        for i in range(records)
+    ]
+    return "[\n" + "\n,\n".join(entries) + "\n]\n"
+
+
+def nuclei_jsonl(rng: random.Random, records: int) -> str:
+    out = []
+    for i in range(records):
+        cve = f"CVE-2023-{rng.randint(1000, 9999)}" if rng.random() < 0.4 else ""
+        info = {"name": f"Check {i}", "severity": rng.choice(SEVERITIES),
+                "tags": ["cve", "rce"] if cve else ["exposure", "config"]}
+        if cve:
+            info["classification"] = {"cve-id": [cve]}
+        out.append(json.dumps({
+            "template-id": cve.lower() or f"exposed-{rng.choice(WORDS)}", "info": info, "type": "http",
+            "host": f"https://{_ip(i)}", "matched-at": f"https://{_ip(i)}/{rng.choice(WORDS)}",
+            "timestamp": "2024-01-01T10:00:00Z",
+        }))
+    return "\n".join(out) + "\n"
+
+
+def nuclei_plain(rng: random.Random, records: int) -> str:
+    out = []
+    for i in range(records):
+        template = f"CVE-2023-{rng.randint(1000, 9999)}" if rng.random() < 0.3 else f"tech-detect:{rng.choice(WORDS)}"
+        extra = f" [{rng.choice(WORDS)}]" if rng.random() < 0.5 else ""
+        out.append(f"[2024-01-01 10:00:{i % 60:02d}] [{template}] [http] [{rng.choice(SEVERITIES)}] "
+                   f"https://{_ip(i)}/{rng.choice(WORDS)}{extra}")
+    return "\n".join(out) + "\n"
+
+
+def gobuster_dir(rng: random.Random, records: int) -> str:
+    out = ["===============================================================", "Gobuster v3.6",
+           "===============================================================", "Starting gobuster in directory enumeration mode"]
+    for i in range(records):
+        status = rng.choice([200, 204, 301, 302, 403])
+        suffix = rng.choice(["", ".php", ".bak", "/"])
+        out.append(f"/{rng.choice(WORDS)}{i}{suffix}                (Status: {status}) [Size: {rng.randint(0, 50000)}]")
+    out.append("Finished")
+    return "\n".join(out) + "\n"
+
+
+def gobuster_dns(rng: random.Random, records: int) -> str:
+    out = ["Gobuster v3.6", "[+] Domain: example.com", "Starting gobuster in DNS enumeration mode"]
+    out.extend(f"Found: {rng.choice(WORDS)}{i}.example.com" for i in range(records))
+    return "\n".join(out) + "\n"
+
+
+def ffuf_json(rng: random.Random, records: int) -> str:
+    results = [
+        {"input": {"FUZZ": f"{rng.choice(WORDS)}{i}"}, "position": i, "status": rng.choice([200, 301, 403]),
+         "length": rng.randint(0, 50000), "words": rng.randint(1, 900), "lines": rng.randint(1, 90),
+         "content-type": "text/html", "redirectlocation": "", "url": f"http://10.0.0.5/{rng.choice(WORDS)}{i}",
+         "host": "10.0.0.5"}
+        for i in range(records)
+    ]
+    return json.dumps({"commandline": "ffuf -u http://10.0.0.5/FUZZ -of json", "time": "2024-01-01T10:00:00Z",
+                       "results": results, "config": {"method": "GET", "threads": 40}}) + "\n"
+
+
+def bloodhound(rng: random.Random, records: int) -> str:
+    data = [
+        {"Properties": {"name": f"{rng.choice(USERS).upper()}{i}@CORP.LOCAL", "domain": "CORP.LOCAL",
+                        "enabled": True, "admincount": 1 if rng.random() < 0.05 else 0,
+                        "description": "x" * rng.randint(0, 80)},
+         "ObjectIdentifier": f"S-1-5-21-1004336348-1177238915-682003330-{1000 + i}", "Aces": []}
+        for i in range(records)
+    ]
+    return json.dumps({"data": data, "meta": {"type": "users", "count": records, "version": 5}}) + "\n"
+
+
+def linpeas(rng: random.Random, records: int) -> str:
+    vectors = [
+        "-rwsr-xr-x 1 root root 55528 Jan  1 00:00 SUID: /usr/bin/mount{i}",
+        "/usr/bin/python3.{i} = cap_setuid+ep /usr/bin/python3",
+        "Writable folder: /opt/app{i}/bin",
+        "*/5 * * * * root /usr/local/bin/backup{i}.sh",
+        "(ALL : ALL) NOPASSWD: /usr/bin/vim{i}",
+        "\x1b[1;31mVulnerable to CVE-2021-{i} (sudo Baron Samedit)\x1b[0m",
+    ]
+    out = ["\x1b[1;34m════════════════════════════╣ System Information ╠════════════════════════════\x1b[0m"]
+    for i in range(records):
+        out.extend(f"drwxr-xr-x  2 root root 4096 Jan  1 00:00 /usr/share/doc/pkg-{i}-{j}" for j in range(rng.randint(0, 4)))
+        out.append(rng.choice(vectors).format(i=i))
+    return "\n".join(out) + "\n"
+
+
+def winpeas(rng: random.Random, records: int) -> str:
+    vectors = [
+        "    Unquoted service path found: C:\\Program Files\\App {i}\\svc.exe",
+        "    Svc{i}: SERVICE_CHANGE_CONFIG granted to Everyone",
+        "    AlwaysInstallElevated set to 1 in HKLM",
+        "    AutoLogon password: Winter{i}!",
+        "    SeImpersonatePrivilege: SE_PRIVILEGE_ENABLED ({i})",
+        "    Potential DLL hijacking in C:\\Apps\\tool{i}",
+    ]
+    out = ["ÉÍÍÍÍÍÍÍÍÍÍ¹ System Information"]
+    for i in range(records):
+        out.extend(f"    C:\\Windows\\System32\\drivers\\file{i}_{j}.sys" for j in range(rng.randint(0, 4)))
+        out.append(rng.choice(vectors).format(i=i))
+    return "\n".join(out) + "\n"
+
+
+def mimikatz(rng: random.Random, records: int) -> str:
+    out = ["  .#####.   mimikatz 2.2.0 (x64)", "mimikatz # sekurlsa::logonpasswords"]
+    for i in range(records):
+        user = f"{rng.choice(USERS)}{i}"
+        out += [f"Authentication Id : 0 ; {100000 + i} (00000000:{i:08x})", "Session           : Interactive from 1",
+                "\tmsv :", f"\t * Username : {user}", "\t * Domain   : CORP", f"\t * NTLM     : {_hex(rng)}",
+                "\twdigest :", f"\t * Username : {user}", "\t * Domain   : CORP",
+                f"\t * Password : {rng.choice(['(null)', f'Summer{i}!'])}"]
+    return "\n".join(out) + "\n"
+
+
+def secretsdump(rng: random.Random, records: int) -> str:
+    out = ["Impacket v0.11.0 - Copyright 2023 Fortra", "[*] Dumping Domain Credentials (domain\\uid:rid:lmhash:nthash)"]
+    for i in range(records):
+        user = f"CORP\\{rng.choice(USERS)}{i}"
+        out.append(f"{user}:{1000 + i}:aad3b435b51404eeaad3b435b51404ee:{_hex(rng)}:::")
+        if rng.random() < 0.3:
+            out.append(f"{user}:aes256-cts-hmac-sha1-96:{_hex(rng, 64)}")
+    out.append("[*] Dumping cached domain logon information")
+    out.extend(f"CORP\\svc{i}:Cleartext: Pass{i}!" for i in range(records // 20))
+    return "\n".join(out) + "\n"
+
+
+def responder(rng: random.Random, records: int) -> str:
+    out = ["[+] Listening for events..."]
+    for i in range(records):
+        kind = rng.random()
+        if kind < 0.6:
+            out += [f"[SMB] NTLMv2-SSP Client   : {_ip(i)}", f"[SMB] NTLMv2-SSP Username : CORP\\{rng.choice(USERS)}",
+                    f"[SMB] NTLMv2-SSP Hash     : {rng.choice(USERS)}::CORP:{_hex(rng, 16)}:{_hex(rng)}:{_hex(rng, 64)}"]
+        elif kind < 0.8:
+            out.append(f"[HTTP] Basic Client   : {_ip(i)} {rng.choice(USERS)}:Spring{i}")
+        else:
+            out.append(f"[LDAP] Cleartext Client : {_ip(i)} {rng.choice(USERS)} : Autumn{i}")
+        out.append(f"[*] Skipping previously captured hash for {rng.choice(USERS)}")
+    return "\n".join(out) + "\n"
+
+
+def crackmapexec(rng: random.Random, records: int) -> str:
+    out = []
+    for i in range(records):
+        out.append(f"SMB         {_ip(i)}    445    DC{i:04d}           [*] Windows Server 2019 (name:DC{i}) (domain:corp.local)")
+        kind = rng.random()
+        if kind < 0.5:
+            pwn = " (Pwn3d!)" if rng.random() < 0.3 else ""
+            out.append(f"SMB         {_ip(i)}    445    DC{i:04d}           [+] CORP\\{rng.choice(USERS)}:Passw0rd{i}{pwn}")
+        elif kind < 0.8:
+            out.append(f"SMB         {_ip(i)}    445    DC{i:04d}           ADMIN$          READ,WRITE      Remote Admin")
+        else:
+            out.append(f"SMB         {_ip(i)}    445    DC{i:04d}           [-] CORP\\{rng.choice(USERS)}:wrong STATUS_LOGON_FAILURE")
+    return "\n".join(out) + "\n"
+
+
+def hydra(rng: random.Random, records: int) -> str:
+    out = ["Hydra v9.5 (c) 2023 by van Hauser/THC", "[DATA] max 16 tasks per 1 server, overall 16 tasks"]
+    for i in range(records):
+        port, service = rng.choice([(22, "ssh"), (21, "ftp"), (3306, "mysql"), (445, "smb")])
+        out.append(f"[{port}][{service}] host: {_ip(i)}   login: {rng.choice(USERS)}   password: Pass{i}")
+        out.append(f"[STATUS] {rng.randint(10, 900)}.00 tries/min, {i} tries in 00:{i % 60:02d}h")
+    return "\n".join(out) + "\n"
+
+
+def nikto(rng: random.Random, records: int) -> str:
+    out = ["- Nikto v2.5.0", "+ Target IP:          10.0.0.5", "+ Server: Apache/2.4.52 (Ubuntu)"]
+    for i in range(records):
+        ref = f"CVE-2003-{rng.randint(1000, 9999)}" if rng.random() < 0.3 else f"OSVDB-{rng.randint(1, 99999)}"
+        out.append(f"+ {ref}: /{rng.choice(WORDS)}{i}/: This might be interesting, directory listing found.")
+    out.append("+ 8102 requests: 0 error(s) and 12 item(s) reported on remote host")
+    return "\n".join(out) + "\n"
+
+
+def sqlmap(rng: random.Random, records: int) -> str:
+    out = ["        ___", "       __H__", " ___ ___[.]_____ ___ ___  {1.7.2#stable}",
+           "sqlmap identified the following injection point(s) with a total of 52 HTTP(s) requests:"]
+    for i in range(records):
+        out += ["---", f"Parameter: p{i} ({rng.choice(['GET', 'POST'])})"]
+        for kind in rng.sample(["boolean-based blind", "error-based", "time-based blind", "UNION query"], rng.randint(1, 3)):
+            out += [f"    Type: {kind}", f"    Title: {kind} technique {i}", f"    Payload: p{i}=1' AND {i}={i}-- -", ""]
+    out += ["---", "back-end DBMS: MySQL >= 5.5", "available databases [3]:", "[*] information_schema", "[*] app", "[*] mysql"]
+    return "\n".join(out) + "\n"
+
+
+def subdomain_jsonl(rng: random.Random, records: int) -> str:
+    return "\n".join(
+        json.dumps({"host": f"{rng.choice(WORDS)}{i}.example.com", "input": "example.com", "source": rng.choice(["crtsh", "dnsdumpster"])})
+        for i in range(records)
+    ) + "\n"
+
+
+def amass_jsonl(rng: random.Random, records: int) -> str:
+    return "\n".join(
+        json.dumps({"name": f"{rng.choice(WORDS)}{i}.example.com", "domain": "example.com",
+                    "addresses": [{"ip": _ip(i), "cidr": "10.0.0.0/8", "asn": 64512}], "tag": "cert", "sources": ["crtsh"]})
+        for i in range(records)
+    ) + "\n"
+
+
+def whatweb(rng: random.Random, records: int) -> str:
+    entries = [
+        {"target": f"http://{_ip(i)}", "http_status": 200, "plugins": {
+            "IP": {"string": [_ip(i)]}, "HTTPServer": {"string": ["nginx"]},
+            rng.choice(["Apache", "nginx", "WordPress", "PHP", "jQuery"]): {"version": [f"{rng.randint(1, 9)}.{rng.randint(0, 20)}"]},
+            "Title": {"string": [f"Site {i}"]}}}
+        for i in range(records)
+    ]
+    return json.dumps(entries) + "\n"
+
+
+def wafw00f(rng: random.Random, records: int) -> str:
+    entries = [
+        {"url": f"https://{_ip(i)}", "detected": rng.random() < 0.5,
+         "firewall": rng.choice(["Cloudflare", "ModSecurity", "AWS WAF"]), "manufacturer": "Vendor"}
+        for i in range(records)
+    ]
+    return json.dumps(entries) + "\n"
+
+
+def dnsrecon(rng: random.Random, records: int) -> str:
+    entries = [{"type": "ScanInfo", "arguments": "dnsrecon -d example.com -j -"}] + [
+        {"type": rng.choice(["A", "AAAA", "CNAME", "MX", "TXT"]), "name": f"{rng.choice(WORDS)}{i}.example.com",
+         "address": _ip(i), "domain": "example.com"}
+        for i in range(records)
+    ]
+    return json.dumps(entries) + "\n"
+
+
+def theharvester(rng: random.Random, records: int) -> str:
+    out = ["*******************************************************************", "* theHarvester 4.4.0 *",
+           "[*] Target: example.com", "", "[*] Emails found: " + str(records), "----------------------"]
+    out.extend(f"{rng.choice(USERS)}.{i}@example.com" for i in range(records))
+    out += ["", "[*] Hosts found: " + str(records), "---------------------"]
+    out.extend(f"{rng.choice(WORDS)}{i}.example.com:{_ip(i)}" for i in range(records))
+    return "\n".join(out) + "\n"
+
+
+def searchsploit(rng: random.Random, records: int) -> str:
+    results = [
+        {"Title": f"Apache {rng.randint(1, 2)}.{rng.randint(0, 4)}.{i} - Remote Code Execution", "EDB-ID": str(10000 + i),
+         "Date_Published": "2021-10-06", "Type": "remote", "Platform": rng.choice(["linux", "windows", "multiple"]),
+         "Path": f"/usr/share/exploitdb/exploits/linux/remote/{10000 + i}.py"}
+        for i in range(records)
+    ]
+    return json.dumps({"SEARCH": "apache", "DB_PATH_EXPLOIT": "/usr/share/exploitdb", "RESULTS_EXPLOIT": results}) + "\n"
+
+
+def metasploit(rng: random.Random, records: int) -> str:
+    out = ["[*] Started reverse TCP handler on 10.0.0.1:4444"]
+    for i in range(records):
+        kind = rng.random()
+        if kind < 0.4:
+            out.append(f"[*] Meterpreter session {i + 1} opened (10.0.0.1:4444 -> {_ip(i)}:49{i % 1000:03d}) at 2024-01-01 10:00:00 +0000")
+        elif kind < 0.7:
+            out.append(f"[+] {_ip(i)}:445 - Host is likely VULNERABLE to MS17-010! - Windows Server 2016")
+        else:
+            out.append(f"[*] {_ip(i)}:445 - Connecting to target for exploitation.")
+    return "\n".join(out) + "\n"
+
+
+def psexec(rng: random.Random, records: int) -> str:
+    out = ["Impacket v0.11.0 - Copyright 2023 Fortra"]
+    for i in range(records):
+        out += [f"[*] Requesting shares on {_ip(i)}..... using {rng.choice(USERS)}", "[*] Found writable share ADMIN$",
+                f"[*] Uploading file {_hex(rng, 8)}.exe", "[*] Opening SVCManager on 10.0.0.5.....",
+                f"[*] Creating service {_hex(rng, 4)} on 10.0.0.5.....", "[*] Starting service ....."]
+    out += ["Microsoft Windows [Version 10.0.17763.4252]", "(c) 2018 Microsoft Corporation. All rights reserved.",
+            "C:\\Windows\\system32> whoami", "nt authority\\system"]
+    return "\n".join(out) + "\n"
+
+
+def lazagne(rng: random.Random, records: int) -> str:
+    out = ["|====================================================================|", "|                        The LaZagne Project                         |"]
+    for i in range(records):
+        out += ["", f"------------------- {rng.choice(['Chrome', 'Firefox', 'Filezilla', 'Wifi'])} passwords -----------------", "",
+                "[+] Password found !!!", f"URL: https://site{i}.example.com", f"Login: {rng.choice(USERS)}{i}",
+                f"Password: Secret{i}!"]
+    out.append("[+] 0 passwords have been found.")
+    return "\n".join(out) + "\n"
+
+
+def john(rng: random.Random, records: int) -> str:
+    out = ["Using default input encoding: UTF-8", "Loaded 1000 password hashes with 1000 different salts",
+           "Press 'q' or Ctrl-C to abort, almost any other key for status"]
+    out.extend(f"{rng.choice(USERS)}{i}:Winter{i}!" for i in range(records))
+    out.append(f"{records}g 0:00:00:03 DONE (2024-01-01 10:00) 0.3g/s 1234p/s")
+    return "\n".join(out) + "\n"
+
+
+def hashcat(rng: random.Random, records: int) -> str:
+    out = ["hashcat (v6.2.6) starting", "Hash.Mode........: 1000 (NTLM)", "Speed.#1.........:  1234.5 MH/s"]
+    out.extend(f"{_hex(rng)}:Autumn{i}!" for i in range(records))
+    out += ["Session..........: hashcat", "Status...........: Cracked", f"Recovered........: {records}/{records} (100.00%) Digests"]
+    return "\n".join(out) + "\n"
+
+
+def aircrack(rng: random.Random, records: int) -> str:
+    out = []
+    for i in range(records):
+        bssid = ":".join(f"{rng.randint(0, 255):02X}" for _ in range(6))
+        out += [f"   #  BSSID              ESSID                     Encryption", f"   1  {bssid}  ESSID: \"net{i}\"  WPA ({rng.randint(1, 9)} handshake)",
+                f"Read {rng.randint(1000, 99999)} packets.", f"                         KEY FOUND! [ Passphrase{i} ]"]
+    return "\n".join(out) + "\n"
+
+
+def wifite(rng: random.Random, records: int) -> str:
+    out = ["\x1b[1;32m.               .    \x1b[0m", " wifite2 2.7.0"]
+    for i in range(records):
+        bssid = ":".join(f"{rng.randint(0, 255):02X}" for _ in range(6))
+        out += [f" [+] Target: net{i} ({bssid})", f" [+] ESSID: \"net{i}\"",
+                rng.choice([" [+] Handshake captured", " [+] PMKID captured", f" [+] Cracked: Key: \"Pass{i}word\""])]
+    return "\n".join(out) + "\n"
+
+
+def chisel(rng: random.Random, records: int) -> str:
+    out = ["2024/01/01 10:00:00 server: Fingerprint abc123", "2024/01/01 10:00:00 server: Listening on http://0.0.0.0:8080"]
+    for i in range(records):
+        out.append(rng.choice([
+            f"2024/01/01 10:00:{i % 60:02d} client: Connected (Latency {rng.randint(1, 90)}ms)",
+            f"2024/01/01 10:00:{i % 60:02d} proxy: R:{1024 + i} => 127.0.0.1:{rng.choice(SERVICES)[0]}",
+            f"2024/01/01 10:00:{i % 60:02d} session#{i}: tun: SSH connected",
+        ]))
+    return "\n".join(out) + "\n"
+
+
+class Corpus(NamedTuple):
+    """A synthetic output format.
+
+    Attributes:
+        name: Corpus name (benchmark id).
+        tool: Tool whose parser reads it.
+        render: (rng, records) -> output.
+        target: Target passed to the parser.
+    """
+
+    name: str
+    tool: str
+    render: Callable[[random.Random, int], str]
+    target: str = "10.0.0.5"
+
+    def generate(self, records: int, seed: int = 0) -> str:
+        """Output with the given number of records."""
+        return self.render(random.Random(f"{self.name}:{seed}"), records)
+
+
+CORPORA: Dict[str, Corpus] = {corpus.name: corpus for corpus in [
+    Corpus("nmap_xml", "nmap", nmap_xml, "10.0.0.0/16"),
+    Corpus("nmap_grepable", "nmap", nmap_grepable, "10.0.0.0/16"),
+    Corpus("masscan_list", "masscan", masscan_list, "10.0.0.0/16"),
+    Corpus("masscan_json", "masscan", masscan_json, "10.0.0.0/16"),
+    Corpus("nuclei_jsonl", "nuclei", nuclei_jsonl),
+    Corpus("nuclei_plain", "nuclei", nuclei_plain),
+    Corpus("gobuster_dir", "gobuster", gobuster_dir),
+    Corpus("gobuster_dns", "gobuster", gobuster_dns, "example.com"),
+    Corpus("ffuf_json", "ffuf", ffuf_json),
+    Corpus("bloodhound", "bloodhound", bloodhound, "corp.local"),
+    Corpus("linpeas", "linpeas", linpeas),
+    Corpus("winpeas", "winpeas", winpeas),
+    Corpus("mimikatz", "mimikatz", mimikatz),
+    Corpus("secretsdump", "secretsdump", secretsdump),
+    Corpus("responder", "responder", responder),
+    Corpus("crackmapexec", "crackmapexec", crackmapexec),
+    Corpus("hydra", "hydra", hydra),
+    Corpus("nikto", "nikto", nikto),
+    Corpus("sqlmap", "sqlmap", sqlmap),
+    Corpus("subfinder_jsonl", "subfinder", subdomain_jsonl, "example.com"),
+    Corpus("amass_jsonl", "amass", amass_jsonl, "example.com"),
+    Corpus("whatweb_json", "whatweb", whatweb),
+    Corpus("wafw00f_json", "wafw00f", wafw00f),
+    Corpus("dnsrecon_json", "dnsrecon", dnsrecon, "example.com"),
+    Corpus("theharvester", "theharvester", theharvester, "example.com"),
+    Corpus("searchsploit_json", "searchsploit", searchsploit),
+    Corpus("metasploit", "metasploit", metasploit),
+    Corpus("psexec", "psexec", psexec),
+    Corpus("lazagne", "lazagne", lazagne),
+    Corpus("john", "john", john),
+    Corpus("hashcat", "hashcat", hashcat),
+    Corpus("aircrack", "aircrack", aircrack),
+    Corpus("wifite", "wifite", wifite),
+    Corpus("chisel", "chisel", chisel),
+]}
+
+
+def run_parser(corpus: Corpus, stdout: str) -> List[Finding]:
+    """Run the corpus tool's built-in parser on stdout."""
+    parser = load_builtin(BUILTIN_PARSERS[corpus.tool])
+    # ffuf, hydra and nikto parsers take (stdout, agent_id, target)
+    if list(inspect.signature(parser).parameters)[1] == "agent_id":
+        return parser(stdout, AGENT_ID, corpus.target)
+    return parser(stdout, "", 0, AGENT_ID, corpus.target)
+
+
+# Mutations keeping every remaining line intact
+LINE_MUTATIONS: Tuple[str, ...] = ("drop", "duplicate", "crlf", "garbage")
+MUTATIONS: Tuple[str, ...] = ("truncate", "ansi", "flip") + LINE_MUTATIONS
+
+_GARBAGE = "\x00\ufffd{}[]<>:\"'\\/ abc123"
+
+
+def mutate(text: str, mutation: str, rng: random.Random) -> str:
+    """A fuzzed variant of text (see MUTATIONS)."""
+    lines = text.split("\n")
+    if mutation == "truncate":
+        return text[:rng.randrange(len(text) + 1)]
+    if mutation == "drop":
+        return "\n".join(line for line in lines if rng.random() > 0.1)
+    if mutation == "duplicate":
+        return "\n".join(line for line in lines for _ in range(2 if rng.random() < 0.1 else 1))
+    if mutation == "ansi":
+        return "\n".join(f"\x1b[1;3{rng.randint(1, 7)}m{line}\x1b[0m" if rng.random() < 0.2 else line for line in lines)
+    if mutation == "crlf":
+        return text.replace("\n", "\r\n")
+    if mutation == "garbage":
+        out = []
+        for line in lines:
+            out.append(line)
+            if rng.random() < 0.05:
+                out.append("".join(rng.choice(_GARBAGE) for _ in range(rng.randint(0, 40))))
+        return "\n".join(out)
+    if mutation == "flip":
+        chars = list(text)
+        for _ in range(max(1, len(chars) // 500)):
+            chars[rng.randrange(len(chars))] = rng.choice(_GARBAGE + "\n")
+        return "".join(chars)
+    raise ValueError(f"Unknown mutation: {mutation}")
@@ -0,0 +1,89 @@
+"""Load tests for streaming BloodHound JSON parsing.
+
+SharpHound dumps of a large domain hold 100k+ objects in one "data" array.
+Streaming must keep peak memory bounded by one object rather than the
+whole decoded document. Bounds are generous; the printed numbers are what
+matters when comparing changes.
+"""
+
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from cyberred.tools.parsers.bloodhound import bloodhound_parser, iter_bloodhound_findings
+
+OBJECTS = 100_000
+AGENT_ID = "00000000-0000-0000-0000-000000000001"
+
+USER = (
+    '{{"ObjectIdentifier": "S-1-5-21-1004336348-1177238915-682003330-{i}", '
+    '"Properties": {{"name": "USER{i}@CORP.LOCAL", "domain": "CORP.LOCAL", '
+    '"enabled": true, "admincount": {admin}, "lastlogon": 1700000000, '
+    '"description": "Service account {i}"}}, '
+    '"Aces": [{{"PrincipalSID": "S-1-5-21-512", "RightName": "GenericAll", "IsInherited": false}}], '
+    '"SPNTargets": [], "HasSIDHistory": []}}'
+)
+
+
+@pytest.fixture(scope="module")
+def users_json(tmp_path_factory):
+    path = tmp_path_factory.mktemp("bloodhound") / "users.json"
+    with open(path, "w") as f:
+        f.write('{"data": [\n')
+        f.write(",\n".join(USER.format(i=i, admin=int(i % 1000 == 0)) for i in range(OBJECTS)))
+        f.write(f'\n], "meta": {{"methods": 1, "type": "users", "count": {OBJECTS}, "version": 5}}}}\n')
+    return path
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.load
+def test_streaming_parse_memory_is_bounded(users_json):
+    def loaded():
+        with open(users_json, "rb") as f:
+            doc = json.load(f)
+        return sum(1 for item in doc["data"] if item["Properties"]["admincount"])
+
+    def streamed():
+        with open(users_json, "rb") as f:
+            return sum(
+                1 for finding in iter_bloodhound_findings(f, AGENT_ID, "corp.local")
+                if finding.severity == "high"
+            )
+
+    loaded_admins, loaded_s, loaded_peak = _measure(loaded)
+    stream_admins, stream_s, stream_peak = _measure(streamed)
+
+    size_mb = users_json.stat().st_size / 1e6
+    print(
+        f"\nBloodHound JSON {size_mb:.1f} MB, {OBJECTS} objects: "
+        f"json.load {loaded_s:.2f}s peak {loaded_peak / 1e6:.1f} MB, "
+        f"streamed {stream_s:.2f}s peak {stream_peak / 1e6:.1f} MB"
+    )
+    assert stream_admins == loaded_admins == OBJECTS // 1000
+    assert stream_peak * 10 < loaded_peak
+
+
+@pytest.mark.load
+def test_parser_throughput(users_json):
+    stdout = users_json.read_text()
+
+    start = time.perf_counter()
+    findings = bloodhound_parser(stdout, "", 0, AGENT_ID, "corp.local")
+    elapsed = time.perf_counter() - start
+
+    print(f"\nbloodhound_parser: {len(findings)} findings in {elapsed:.2f}s "
+          f"({OBJECTS / elapsed:.0f} objects/s)")
+    assert len(findings) == OBJECTS
+    assert findings[0].evidence == "AD user: USER0@CORP.LOCAL [HIGH VALUE]"
+    assert elapsed < 60
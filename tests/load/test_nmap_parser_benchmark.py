@@ -0,0 +1,93 @@
+"""Load tests for streaming nmap XML parsing.
+
+A /16 sweep produces XML with tens of thousands of <host> elements. The
+streaming parser must keep peak memory bounded by one host rather than
+the whole tree. Bounds are generous; the printed numbers are what matters
+when comparing changes.
+"""
+
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from cyberred.tools.parsers.nmap import iter_nmap_elements, nmap_parser
+
+HOSTS = 10_000
+
+HOST = """<host starttime="1" endtime="2"><status state="up" reason="syn-ack"/>
+<address addr="10.{a}.{b}.1" addrtype="ipv4"/><hostnames/>
+<ports>
+<port protocol="tcp" portid="22"><state state="open" reason="syn-ack"/><service name="ssh" product="OpenSSH" version="8.9"/></port>
+<port protocol="tcp" portid="80"><state state="open" reason="syn-ack"/><service name="http" product="nginx"/></port>
+<port protocol="tcp" portid="443"><state state="closed" reason="reset"/></port>
+</ports>
+</host>
+"""
+
+
+@pytest.fixture(scope="module")
+def scan_xml(tmp_path_factory):
+    path = tmp_path_factory.mktemp("nmap") / "sweep.xml"
+    with open(path, "w") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<nmaprun scanner="nmap">\n')
+        f.write('<scaninfo type="syn" protocol="tcp" numservices="1000"/>\n')
+        for i in range(HOSTS):
+            f.write(HOST.format(a=i // 256, b=i % 256))
+        f.write("</nmaprun>\n")
+    return path
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.load
+def test_streaming_parse_memory_is_bounded(scan_xml):
+    def tree():
+        root = ET.parse(scan_xml).getroot()
+        return sum(
+            1 for host in root.findall("host") for port in host.findall(".//port")
+            if port.find("state").get("state") == "open"
+        )
+
+    def streamed():
+        with open(scan_xml, "rb") as f:
+            return sum(
+                1 for elem in iter_nmap_elements(f) if elem.tag == "host"
+                for port in elem.findall(".//port")
+                if port.find("state").get("state") == "open"
+            )
+
+    tree_ports, tree_s, tree_peak = _measure(tree)
+    stream_ports, stream_s, stream_peak = _measure(streamed)
+
+    size_mb = scan_xml.stat().st_size / 1e6
+    print(
+        f"\nnmap XML {size_mb:.1f} MB, {HOSTS} hosts: "
+        f"tree {tree_s:.2f}s peak {tree_peak / 1e6:.1f} MB, "
+        f"streamed {stream_s:.2f}s peak {stream_peak / 1e6:.1f} MB"
+    )
+    assert stream_ports == tree_ports == 2 * HOSTS
+    assert stream_peak * 10 < tree_peak
+
+
+@pytest.mark.load
+def test_parser_throughput(scan_xml):
+    stdout = scan_xml.read_text()
+
+    start = time.perf_counter()
+    findings = nmap_parser(stdout, "", 0, "00000000-0000-0000-0000-000000000001", "10.0.0.0/16")
+    elapsed = time.perf_counter() - start
+
+    print(f"\nnmap_parser: {len(findings)} findings in {elapsed:.2f}s "
+          f"({HOSTS / elapsed:.0f} hosts/s)")
+    assert len(findings) == 3 * HOSTS
+    assert elapsed < 60
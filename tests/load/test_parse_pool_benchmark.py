@@ -0,0 +1,74 @@
+"""Load tests for offloading Tier 1 parses to the parse pool.
+
+Parsing a large output inline stalls the event loop (TUI stream, IPC)
+for the whole parse; through the parse pool the loop keeps ticking. The
+test measures the longest gap between 10 ms ticks of a heartbeat task
+during each parse. Bounds are generous; the printed numbers are what
+matters when comparing changes.
+"""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from cyberred.tools.output import OutputProcessor
+from cyberred.tools.parse_pool import ParsePool
+
+LINES = 200_000
+AGENT_ID = str(uuid.uuid4())
+
+
+@pytest.fixture(scope="module")
+def masscan_output():
+    return "".join(
+        f"Discovered open port {1 + i % 1000}/tcp on 10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}\n"
+        for i in range(LINES)
+    )
+
+
+async def _max_stall(processor, output):
+    """Run process_async and return (result, elapsed, longest loop stall)."""
+    stalls = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            stalls.append(now - last - 0.01)
+            last = now
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    result = await processor.process_async(output, "", "masscan", 0, AGENT_ID, "10.0.0.0/8")
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+    return result, elapsed, max(stalls, default=0.0)
+
+
+@pytest.mark.load
+async def test_offloaded_parse_keeps_loop_responsive(masscan_output):
+    inline = OutputProcessor(builtin_parsers=True)
+    pool = ParsePool(threshold=1 << 20, max_workers=1, preload=["masscan"])
+    offloaded = OutputProcessor(builtin_parsers=True, parse_pool=pool)
+    try:
+        # Warm the worker so process startup is not measured
+        await offloaded.process_async(masscan_output[:2_000_000], "", "masscan", 0, AGENT_ID, "10.0.0.0/8")
+        inline_result, inline_s, inline_stall = await _max_stall(inline, masscan_output)
+        pool_result, pool_s, pool_stall = await _max_stall(offloaded, masscan_output)
+    finally:
+        pool.shutdown()
+
+    print(
+        f"\n{len(masscan_output) / 1e6:.1f} MB, {len(pool_result.findings)} findings: "
+        f"inline {inline_s:.2f}s (max stall {inline_stall * 1000:.0f} ms), "
+        f"pool {pool_s:.2f}s (max stall {pool_stall * 1000:.0f} ms)"
+    )
+    assert len(pool_result.findings) == len(inline_result.findings) == LINES
+    assert offloaded.get_parse_metrics()["masscan"]["offloaded"] == 2
+    assert pool_stall < inline_stall
@@ -0,0 +1,133 @@
+"""Benchmarks of every Tier 1 parser against stored baselines.
+
+Each corpus in parser_corpus is parsed in a fresh process, so its peak
+RSS belongs to that parse alone, and reported as MB/s, findings/s and
+peak RSS (with the growth over the RSS held before parsing). Results are
+compared with parser_baselines.json. A corpus is flagged if:
+- its finding count differs (corpora are deterministic), or
+- MB/s falls, or RSS growth rises, by more than the threshold.
+
+Environment:
+    PARSER_BENCH_RECORDS: Records per corpus (default 20000). Baselines
+        only apply to runs with the same count.
+    PARSER_BENCH_THRESHOLD: Tolerated relative regression (default 0.5).
+    PARSER_BENCH_UPDATE: Set to 1 to rewrite the baselines from this run.
+
+Throughput baselines depend on the machine: refresh them
+(PARSER_BENCH_UPDATE=1) on the machine you compare changes on.
+"""
+
+import json
+import multiprocessing
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cyberred.tools.parsers.registry import BUILTIN_PARSERS, load_builtin
+from tests.load.parser_corpus import CORPORA, run_parser
+
+BASELINES = Path(__file__).with_name("parser_baselines.json")
+RECORDS = int(os.environ.get("PARSER_BENCH_RECORDS", 20_000))
+THRESHOLD = float(os.environ.get("PARSER_BENCH_THRESHOLD", 0.5))
+UPDATE = os.environ.get("PARSER_BENCH_UPDATE") == "1"
+
+# RSS growth below this is noise (allocator arenas, import caches)
+RSS_SLACK_MB = 16
+
+
+def _rss_mb() -> float:
+    """Peak RSS of this process so far, in MB.
+
+    VmHWM (Linux) starts afresh with the child's own image, whereas
+    ru_maxrss also carries the forking parent's RSS across exec.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(name: str, path: str) -> dict:
+    """Parse a corpus file and report throughput and memory (in a child)."""
+    corpus = CORPORA[name]
+    load_builtin(BUILTIN_PARSERS[corpus.tool])
+    with open(path, encoding="utf-8") as f:
+        stdout = f.read()
+    rss_before = _rss_mb()
+
+    start = time.perf_counter()
+    findings = run_parser(corpus, stdout)
+    elapsed = time.perf_counter() - start
+
+    peak = _rss_mb()
+    size_mb = len(stdout.encode()) / 1e6
+    return {
+        "records": RECORDS,
+        "mb": round(size_mb, 2),
+        "findings": len(findings),
+        "mb_per_s": round(size_mb / elapsed, 2),
+        "findings_per_s": round(len(findings) / elapsed),
+        "peak_rss_mb": round(peak, 1),
+        "rss_growth_mb": round(peak - rss_before, 1),
+    }
+
+
+def regressions(result: dict, baseline: dict) -> list:
+    """Reasons a result regressed from its baseline (empty if none)."""
+    if baseline.get("records") != result["records"]:
+        return []
+    problems = []
+    if result["findings"] != baseline["findings"]:
+        problems.append(f"findings {baseline['findings']} -> {result['findings']}")
+    if result["mb_per_s"] < baseline["mb_per_s"] * (1 - THRESHOLD):
+        problems.append(f"MB/s {baseline['mb_per_s']} -> {result['mb_per_s']}")
+    if result["rss_growth_mb"] > baseline["rss_growth_mb"] * (1 + THRESHOLD) + RSS_SLACK_MB:
+        problems.append(f"RSS growth {baseline['rss_growth_mb']} -> {result['rss_growth_mb']} MB")
+    return problems
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    stored = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    results = {}
+    yield stored, results
+    if UPDATE and results:
+        BASELINES.write_text(json.dumps({**stored, **results}, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="module")
+def executor():
+    # A fresh process per parse (max_tasks_per_child=1) isolates peak RSS
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn"), max_tasks_per_child=1
+    ) as pool:
+        yield pool
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("name", sorted(CORPORA))
+def test_parser_benchmark(name, baselines, executor, tmp_path):
+    stored, results = baselines
+    path = tmp_path / f"{name}.out"
+    path.write_text(CORPORA[name].generate(RECORDS), encoding="utf-8")
+
+    result = executor.submit(measure, name, str(path)).result()
+    results[name] = result
+
+    print(
+        f"\n{name}: {result['mb']} MB, {result['findings']} findings, "
+        f"{result['mb_per_s']} MB/s, {result['findings_per_s']} findings/s, "
+        f"peak RSS {result['peak_rss_mb']} MB (+{result['rss_growth_mb']} MB)"
+    )
+    assert result["findings"] > 0
+    if not UPDATE and name in stored:
+        assert not regressions(result, stored[name]), f"{name} regressed: {regressions(result, stored[name])}"
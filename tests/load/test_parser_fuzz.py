@@ -0,0 +1,111 @@
+"""Differential and fuzz tests of the Tier 1 parsers.
+
+Differential: for tools with a line parser, streaming a corpus through
+OutputProcessor.open_stream (in 4 KiB chunks, split mid-line) must yield
+the same findings as the batch parser on the whole output.
+
+Fuzz: every corpus is mutated (see parser_corpus.MUTATIONS) under fixed
+seeds. Processing the result must neither raise nor hang: a parser that
+fails hands over to the Tier 2/3 fallback. Mutations that keep lines
+intact must also keep streaming and batch parsing in agreement, except
+for whole-document formats: there the batch parser rejects a broken
+document outright, while the stream keeps the records read before it.
+
+Environment:
+    PARSER_FUZZ_SEEDS: Seeds per corpus and mutation (default 5).
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from cyberred.llm import LLMGatewayNotInitializedError
+from cyberred.tools.output import OutputProcessor
+from cyberred.tools.parsers.stream import STREAM_PARSERS
+from tests.load.parser_corpus import AGENT_ID, CORPORA, LINE_MUTATIONS, MUTATIONS, mutate, run_parser
+
+SEEDS = int(os.environ.get("PARSER_FUZZ_SEEDS", 5))
+# Keeps one-line documents (ffuf -of json) under the stream's line cap
+DIFFERENTIAL_RECORDS = 2_000
+FUZZ_RECORDS = 50
+CHUNK = 4096
+# Per processed output; fuzz corpora are a few KB
+MAX_SECONDS = 2.0
+
+STREAMED = sorted(name for name, corpus in CORPORA.items() if corpus.tool in STREAM_PARSERS)
+DOCUMENTS = {"nmap_xml", "masscan_json", "ffuf_json"}
+
+
+def key(finding):
+    return (finding.type, finding.severity, finding.target, finding.evidence, finding.tool, finding.topic)
+
+
+def stream(processor, corpus, stdout):
+    """Findings from feeding stdout through an OutputStream in chunks."""
+    output = processor.open_stream(corpus.tool, AGENT_ID, corpus.target)
+    data = stdout.encode()
+    for i in range(0, len(data), CHUNK):
+        output.feed("stdout", data[i:i + CHUNK])
+    return output.finish().findings
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return OutputProcessor(builtin_parsers=True)
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("name", STREAMED)
+def test_stream_matches_batch(name, processor):
+    corpus = CORPORA[name]
+    stdout = corpus.generate(DIFFERENTIAL_RECORDS)
+
+    batch = [key(f) for f in run_parser(corpus, stdout)]
+    assert batch
+    assert [key(f) for f in stream(processor, corpus, stdout)] == batch
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("name", sorted(CORPORA))
+def test_mutated_output_never_breaks_processing(name, processor):
+    corpus = CORPORA[name]
+    base = corpus.generate(FUZZ_RECORDS)
+    fallbacks = Counter()
+
+    with patch("cyberred.tools.output.get_gateway", side_effect=LLMGatewayNotInitializedError()):
+        for mutation in MUTATIONS:
+            for seed in range(SEEDS):
+                stdout = mutate(base, mutation, random.Random(f"{name}:{mutation}:{seed}"))
+
+                start = time.perf_counter()
+                result = processor.process(stdout, "", corpus.tool, 0, AGENT_ID, corpus.target)
+                elapsed = time.perf_counter() - start
+
+                assert result.tier in (1, 3), (mutation, seed)
+                assert elapsed < MAX_SECONDS, (mutation, seed, elapsed)
+                if result.tier == 3:
+                    fallbacks[mutation] += 1
+
+    if fallbacks:
+        print(f"\n{name}: fell back to Tier 3 on {dict(fallbacks)}")
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("mutation", LINE_MUTATIONS)
+@pytest.mark.parametrize("name", [name for name in STREAMED if name not in DOCUMENTS])
+def test_stream_matches_batch_when_mutated(name, mutation, processor):
+    corpus = CORPORA[name]
+    base = corpus.generate(FUZZ_RECORDS)
+
+    for seed in range(SEEDS):
+        stdout = mutate(base, mutation, random.Random(f"{name}:{mutation}:{seed}"))
+        try:
+            batch = run_parser(corpus, stdout)
+        except Exception:
+            # The batch parser rejected the document; the fuzz test covers it
+            continue
+        assert [key(f) for f in stream(processor, corpus, stdout)] == [key(f) for f in batch], seed
@@ -0,0 +1,93 @@
+"""Load tests for single-pass rule matching in line parsers.
+
+A full linpeas run on a busy host prints tens of thousands of lines, most
+of which match no rule. Matching each line against a PatternSet (one
+regex call) must beat the per-rule re.search() loop the parsers used,
+with identical findings. Bounds are generous; the printed numbers are
+what matters when comparing changes.
+"""
+
+import re
+import time
+
+import pytest
+
+from cyberred.tools.parsers import linpeas
+from cyberred.tools.parsers.patterns import strip_ansi
+
+LINES = 50_000
+AGENT_ID = "00000000-0000-0000-0000-000000000001"
+
+# Mostly noise, as in real dumps, with a vector every few hundred lines
+NOISE = [
+    "drwxr-xr-x  2 root root 4096 Jan  1 00:00 /usr/share/doc/package-{i}",
+    "\x1b[1;32m  tcp   LISTEN 0 128 127.0.0.1:{i} 0.0.0.0:*\x1b[0m",
+    "  root      {i}  0.0  0.1  16956  5432 ?  Ss   10:00   0:00 /sbin/init splash",
+    "Linux version 5.15.0-{i}-generic (buildd@lcy02-amd64-032) (gcc version 11.4.0)",
+]
+VECTORS = [
+    "-rwsr-xr-x 1 root root 55528 Jan  1 00:00 SUID: /usr/bin/mount{i}",
+    "/usr/bin/python3.{i} = cap_setuid+ep /usr/bin/python3",
+    "Vulnerable to CVE-2021-{i} (sudo Baron Samedit) 95%",
+]
+
+
+@pytest.fixture(scope="module")
+def dump():
+    lines = []
+    for i in range(LINES):
+        if i % 250 == 0:
+            lines.append(VECTORS[(i // 250) % len(VECTORS)].format(i=i))
+        else:
+            lines.append(NOISE[i % len(NOISE)].format(i=i))
+    return "\n".join(lines)
+
+
+def search_loop(stdout):
+    """The per-rule loop (vector types by line), as the parser did it."""
+    patterns = [(pattern, vector_type) for _, pattern, vector_type, _ in linpeas.PRIVESC_PATTERNS]
+    vectors = []
+    for line in strip_ansi(stdout).split('\n'):
+        line = line.strip()
+        if not line or line.startswith(('=', '#', '[+]')):
+            continue
+        for pattern, vector_type in patterns:
+            if re.search(pattern, line, re.IGNORECASE):
+                vectors.append(vector_type)
+                break
+    return vectors
+
+
+@pytest.mark.load
+def test_single_pass_beats_per_rule_loop(dump):
+    start = time.perf_counter()
+    looped = search_loop(dump)
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [
+        linpeas.VECTORS[match.rule][0]
+        for _, match in linpeas.RULES.scan(strip_ansi(dump))
+        if match.rule != "section"
+    ]
+    scan_s = time.perf_counter() - start
+
+    print(
+        f"\nlinpeas {LINES} lines, {len(linpeas.PRIVESC_PATTERNS)} rules: "
+        f"re.search loop {loop_s:.2f}s, PatternSet {scan_s:.2f}s "
+        f"({loop_s / scan_s:.1f}x)"
+    )
+    assert scanned == looped
+    assert scan_s < loop_s
+
+
+@pytest.mark.load
+def test_parser_throughput(dump):
+    start = time.perf_counter()
+    findings = linpeas.linpeas_parser(dump, "", 0, AGENT_ID, "10.0.0.5")
+    elapsed = time.perf_counter() - start
+
+    print(f"\nlinpeas_parser: {len(findings)} findings in {elapsed:.2f}s "
+          f"({LINES / elapsed:.0f} lines/s)")
+    assert findings
+    assert elapsed < 30
@@ -0,0 +1,49 @@
+"""Load tests for per-command scope validation latency.
+
+Every tool execution goes through ScopeValidator.validate(command=...), so
+tokenizing and target extraction sit on the hot path. Bounds are generous;
+the printed numbers are what matters when comparing changes.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from cyberred.tools.command_parser import load_argument_schemas
+from cyberred.tools.scope import ScopeValidator
+
+MANIFEST = Path(__file__).resolve().parents[2] / "tools" / "manifest.yaml"
+
+COMMANDS = [
+    "nmap -sV -p 22,80,443,8000-8100 -oX out.xml --script vuln 10.1.{i}.1 10.1.{i}.2",
+    "gobuster dir -u http://app{i}.example.com -w /usr/share/wordlists/common.txt -t 50",
+    "sqlmap -u 'http://app{i}.example.com/item?id=1' --batch --level 3",
+    "nuclei -u https://api{i}.example.com -severity high,critical -o out.json",
+]
+
+
+@pytest.mark.load
+def test_command_validation_latency():
+    validator = ScopeValidator.from_config(
+        {
+            "allowed_targets": ["10.0.0.0/8", "*.example.com"],
+            "allow_private": True,
+        },
+        argument_schemas=load_argument_schemas(MANIFEST),
+    )
+    commands = [c.format(i=i % 250) for i in range(2000) for c in COMMANDS]
+
+    start = time.perf_counter()
+    for command in commands:
+        validator.validate(command=command)
+    uncached_us = (time.perf_counter() - start) / len(commands) * 1e6
+
+    start = time.perf_counter()
+    for command in commands:
+        validator.validate(command=command)
+    cached_us = (time.perf_counter() - start) / len(commands) * 1e6
+
+    print(f"\nscope validate(command): uncached {uncached_us:.1f}us, cached {cached_us:.1f}us")
+    assert uncached_us < 2000
+    assert cached_us < uncached_us
@@ -0,0 +1,178 @@
+"""Tests for the content-addressed raw output blob store."""
+
+import hashlib
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cyberred.core.blob_store import BLOB_SUFFIX, BlobStore, RawOutput
+from cyberred.core.models import ToolResult
+
+
+def test_put_get_and_dedup(tmp_path):
+    store = BlobStore(tmp_path / "blobs")
+    data = b"22/tcp open ssh\n" * 1000
+
+    digest = store.put(data)
+
+    assert digest == hashlib.sha256(data).hexdigest()
+    path = store.path(digest)
+    assert path == tmp_path / "blobs" / digest[:2] / f"{digest}{BLOB_SUFFIX}"
+    assert path.stat().st_size < len(data) // 10
+    assert store.get(digest) == data
+    assert store.size(digest) == len(data)
+    # Same content, same blob
+    mtime = path.stat().st_mtime_ns
+    assert store.put(memoryview(data)) == digest
+    assert path.stat().st_mtime_ns == mtime
+    assert digest in store and "0" * 64 not in store and 42 not in store
+
+    assert store.delete(digest) and not store.delete(digest)
+    with pytest.raises(FileNotFoundError):
+        store.get(digest)
+
+
+def test_invalid_digests_are_rejected(tmp_path):
+    store = BlobStore(tmp_path)
+    with pytest.raises(ValueError, match="Invalid blob digest"):
+        store.path("../../etc/passwd")
+    assert "../x" not in store
+
+
+def test_failed_write_leaves_no_partial_blob(tmp_path):
+    store = BlobStore(tmp_path)
+    with patch("cyberred.core.blob_store.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            store.put(b"data")
+    assert not list(tmp_path.rglob("*.tmp")) and not list(tmp_path.rglob(f"*{BLOB_SUFFIX}"))
+
+
+def test_writer_streams_chunks_into_one_blob(tmp_path):
+    store = BlobStore(tmp_path)
+    chunks = [b"80/tcp open http\n" * 5000, b"", b"443/tcp open https\n"]
+
+    writer = store.writer()
+    for chunk in chunks:
+        writer.write(chunk)
+    digest = writer.close()
+
+    data = b"".join(chunks)
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert writer.size == len(data)
+    # Streamed frames carry no size header
+    assert store.get(digest) == data and store.size(digest) == len(data)
+
+    # Content already stored: the second copy is dropped
+    writer = store.writer()
+    writer.write(data)
+    assert writer.close() == digest
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_writer_abort_and_failed_close_leave_nothing(tmp_path):
+    store = BlobStore(tmp_path)
+    writer = store.writer()
+    writer.write(b"partial")
+    writer.abort()
+    writer.abort()
+
+    writer = store.writer()
+    writer.write(b"data")
+    with patch("cyberred.core.blob_store.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            writer.close()
+    assert not list(tmp_path.rglob("*.tmp")) and not list(tmp_path.rglob(f"*{BLOB_SUFFIX}"))
+
+
+def test_raw_output_previews_decode_only_a_slice(tmp_path):
+    data = "héllo wörld".encode()
+    output = RawOutput(data)
+
+    assert len(output) == len(data) and output.digest is None
+    assert output.text() == "héllo wörld"
+    # A character cut off by the slice is dropped, not replaced
+    assert output.preview(2) == "h"
+    assert output.preview(3) == "hé"
+    assert output.tail(4) == "rld"
+    assert output.tail(5) == "örld"
+    assert output.tail(0) == ""
+
+    store = BlobStore(tmp_path)
+    stored = store.open(store.put(b"abc\xff"))
+    assert stored.data == b"abc\xff" and len(stored) == 4
+    assert stored.text() == "abc�"
+    with pytest.raises(ValueError, match="together"):
+        RawOutput(store=store)
+
+
+def test_tool_result_references_stored_output(tmp_path):
+    store = BlobStore(tmp_path)
+    digest = store.put(b"big output")
+    result = ToolResult(True, "big output", "", 0, 10, output_ref=digest)
+
+    restored = ToolResult.from_json(result.to_json())
+    assert restored.stdout == "" and restored.output_ref == digest
+    assert restored.output(store).text() == "big output"
+
+    inline = ToolResult(True, "small", "", 0, 10)
+    assert ToolResult.from_json(inline.to_json()) == inline
+    assert inline.output().text() == "small"
+
+
+def _set_age(store, digest, seconds_ago):
+    stamp = time.time() - seconds_ago
+    os.utime(store.path(digest), (stamp, stamp))
+
+
+def test_max_bytes_evicts_oldest_blobs_first(tmp_path):
+    blobs = [os.urandom(4000) for _ in range(4)]  # incompressible
+    store = BlobStore(tmp_path, max_bytes=13_000)
+    first, second, third = (store.put(data) for data in blobs[:3])
+    for age, digest in enumerate((third, second, first), start=1):
+        _set_age(store, digest, age * 100)
+    # Reusing a blob makes it the most recent one
+    assert store.put(blobs[0]) == first
+
+    fourth = store.put(blobs[3])
+
+    assert second not in store
+    assert first in store and third in store and fourth in store
+    assert store.usage <= 13_000
+
+
+def test_max_bytes_counts_streamed_blobs_and_deletes(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=10_000)
+    old = store.put(os.urandom(6000))
+    _set_age(store, old, 100)
+    assert store.usage > 6000
+    assert store.delete(old) and store.usage == 0
+
+    old = store.put(os.urandom(6000))
+    _set_age(store, old, 100)
+    writer = store.writer()
+    writer.write(os.urandom(6000))
+    streamed = writer.close()
+
+    assert old not in store and streamed in store
+    # A single blob over the limit is kept
+    huge = store.put(os.urandom(20_000))
+    assert huge in store and streamed not in store
+
+
+def test_usage_scan_and_unbounded_store(tmp_path):
+    unbounded = BlobStore(tmp_path)
+    digests = [unbounded.put(os.urandom(4000)) for _ in range(3)]
+    assert unbounded.put(os.urandom(4000)) and all(d in unbounded for d in digests)
+
+    assert BlobStore(tmp_path).usage == sum(p.stat().st_size for p in tmp_path.glob("*/*.zst"))
+
+    # A bounded store opened on existing blobs counts them first
+    bounded = BlobStore(tmp_path, max_bytes=13_000)
+    for age, digest in enumerate(reversed(digests), start=1):
+        _set_age(bounded, digest, age * 100)
+    bounded.put(os.urandom(4000))
+    assert digests[0] not in bounded and digests[1] not in bounded and digests[2] in bounded
+    with pytest.raises(ValueError, match="size limit"):
+        BlobStore(tmp_path, max_bytes=-1)
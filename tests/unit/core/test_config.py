@@ -11,7 +11,7 @@ from typing import Generator
 
 import pytest
 import yaml
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from cyberred.core.config import (
     Settings,
@@ -819,3 +819,26 @@ class TestHotReloadHandler:
         assert not get_reload_status()["watch_active"]
 
 
+
+    def test_reload_listeners_receive_changed_paths(self, tmp_path: Path) -> None:
+        """Reload listeners run after a safe reload; failures are contained."""
+        from cyberred.core.config import _SettingsHolder
+        
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("engagement:\n  scope_path: /a/scope.yaml\n")
+        _SettingsHolder.get(force_reload=True, system_config_path=config_file)
+        
+        received = []
+        _SettingsHolder.add_reload_listener(lambda s, paths: received.append((s, paths)))
+        _SettingsHolder.add_reload_listener(MagicMock(side_effect=RuntimeError("boom")))
+        
+        config_file.write_text("engagement:\n  scope_path: /b/scope.yaml\n")
+        _SettingsHolder._handle_config_change(config_file)
+        
+        assert len(received) == 1
+        settings, paths = received[0]
+        assert paths == ["engagement.scope_path"]
+        assert settings.engagement.scope_path == "/b/scope.yaml"
+        
+        _SettingsHolder.reset()
+        assert _SettingsHolder._reload_listeners == []
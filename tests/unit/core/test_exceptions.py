@@ -349,3 +349,12 @@ class TestExceptionReprAndStr:
         assert isinstance(error.context, dict)
         assert error.context["target"] == "192.168.1.1"
 
+
+    def test_exec_channel_error_context_and_repr(self):
+        """ExecChannelError carries container and reason."""
+        from cyberred.core.exceptions import ExecChannelError
+
+        error = ExecChannelError("red-kali-worker-1", "agent exited")
+        assert error.context == {"container_id": "red-kali-worker-1", "reason": "agent exited"}
+        assert "agent exited" in str(error)
+        assert "ExecChannelError" in repr(error)
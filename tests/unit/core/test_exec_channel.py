@@ -0,0 +1,199 @@
+"""Tests for the persistent exec channel.
+
+The agent runs under the local Python interpreter instead of
+``docker exec``, so the real protocol is exercised end to end.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from cyberred.core.exceptions import ExecChannelError
+from cyberred.core.exec_channel import ExecChannel, ExecResult
+
+
+@pytest.fixture
+async def channel():
+    ch = ExecChannel("local", exec_prefix=[sys.executable])
+    await ch.start()
+    yield ch
+    await ch.close()
+
+
+def _py(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+@pytest.mark.asyncio
+async def test_run_returns_demuxed_output(channel):
+    result = await channel.run(_py("import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"))
+    assert result == ExecResult(exit_code=3, stdout=b"out\n", stderr=b"err\n")
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_concurrently(channel):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results = await asyncio.gather(*(
+        channel.run(_py(f"import time; time.sleep(0.3); print({i})")) for i in range(8)
+    ))
+    assert loop.time() - start < 2.0
+    assert [r.stdout for r in results] == [f"{i}\n".encode() for i in range(8)]
+
+
+@pytest.mark.asyncio
+async def test_job_timeout_kills_process(channel):
+    result = await channel.run(_py("import time; time.sleep(10)"), timeout=0.2)
+    assert result.timed_out
+    assert result.exit_code != 0
+
+
+@pytest.mark.asyncio
+async def test_missing_binary_reports_error(channel):
+    result = await channel.run(["definitely-not-a-binary-xyz"])
+    assert result.exit_code == 127
+    assert b"definitely-not-a-binary-xyz" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_cancel_kills_job_and_channel_stays_usable(channel):
+    task = asyncio.create_task(channel.run(_py("import time; time.sleep(10)")))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    result = await channel.run(["echo", "still alive"])
+    assert result.stdout == b"still alive\n"
+
+
+@pytest.mark.asyncio
+async def test_output_streams_to_callback(channel):
+    chunks = []
+
+    def on_output(stream, data):
+        chunks.append((stream, data))
+        raise RuntimeError("callback errors are logged, not fatal")
+
+    result = await channel.run(
+        _py("import sys; sys.stdout.write('a'); sys.stdout.flush(); sys.stderr.write('b')"),
+        on_output=on_output,
+    )
+    assert result.exit_code == 0
+    assert ("stdout", b"a") in chunks
+    assert ("stderr", b"b") in chunks
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_jobs_and_rejects_new_ones(channel):
+    task = asyncio.create_task(channel.run(_py("import time; time.sleep(10)")))
+    await asyncio.sleep(0.3)
+    await channel.close()
+    with pytest.raises(ExecChannelError):
+        await task
+    assert not channel.alive
+    with pytest.raises(ExecChannelError, match="channel closed"):
+        await channel.run(["true"])
+
+
+@pytest.mark.asyncio
+async def test_agent_exit_closes_channel(channel):
+    channel._proc.kill()
+    await asyncio.wait_for(channel._reader, timeout=5)
+    assert not channel.alive
+
+
+@pytest.mark.asyncio
+async def test_protocol_error_closes_channel(channel):
+    channel._dispatch = None  # Any frame now raises inside the read loop
+    task = asyncio.create_task(channel.run(["echo", "x"]))
+    with pytest.raises(ExecChannelError, match="protocol error"):
+        await task
+    assert not channel.alive
+
+
+@pytest.mark.asyncio
+async def test_frames_for_unknown_jobs_are_ignored(channel):
+    channel._dispatch({"id": 999, "exit": 0})
+
+
+@pytest.mark.asyncio
+async def test_start_failure_raises():
+    ch = ExecChannel("missing", exec_prefix=["/nonexistent/python3"])
+    with pytest.raises(ExecChannelError, match="agent failed to start"):
+        await ch.start()
+    assert not ch.alive
+
+
+@pytest.mark.asyncio
+async def test_start_without_ready_frame_raises():
+    ch = ExecChannel("broken", exec_prefix=[sys.executable, "-c", "print('{}')", "--"])
+    with pytest.raises(ExecChannelError, match="did not report ready"):
+        await ch.start()
+
+
+@pytest.mark.asyncio
+async def test_terminate_kills_unresponsive_agent(monkeypatch):
+    # Ignores stdin EOF, so close() has to kill it
+    ch = ExecChannel(
+        "stuck",
+        exec_prefix=[sys.executable, "-c", "print('{\"ready\": true}', flush=True); import time; time.sleep(30)", "--"],
+    )
+    await ch.start()
+    real_wait_for = asyncio.wait_for
+
+    async def short_wait_for(aw, timeout):
+        return await real_wait_for(aw, min(timeout, 0.2))
+
+    monkeypatch.setattr("cyberred.core.exec_channel.asyncio.wait_for", short_wait_for)
+    await ch.close()
+    assert ch._proc.returncode is not None
+
+
+@pytest.mark.asyncio
+async def test_default_prefix_uses_docker_exec():
+    ch = ExecChannel("red-kali-worker-1")
+    assert ch._prefix == ["/usr/bin/docker", "exec", "-i", "red-kali-worker-1", "python3"]
+    await ch.close()  # Never started: no-op
+
+
+@pytest.mark.asyncio
+async def test_cancel_after_channel_died_does_not_send(channel):
+    task = asyncio.create_task(channel.run(_py("import time; time.sleep(10)")))
+    await asyncio.sleep(0.3)
+    channel._closed = True
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_fail_pending_skips_finished_jobs(channel):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    channel._jobs[42] = type("Job", (), {"future": future})()
+    channel._fail_pending("closed")
+    assert future.result() is None
+    del channel._jobs[42]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_exit_frame_is_ignored(channel):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result("first")
+    channel._jobs[43] = type("Job", (), {"future": future})()
+    channel._dispatch({"id": 43, "exit": 1})
+    assert future.result() == "first"
+    del channel._jobs[43]
+
+
+@pytest.mark.asyncio
+async def test_streamed_stdout_is_not_captured(channel):
+    chunks = []
+    result = await channel.run(
+        _py("print('streamed')"),
+        on_output=lambda stream, data: chunks.append(data),
+        capture_stdout=False,
+    )
+    assert result.stdout == b""
+    assert b"".join(chunks) == b"streamed\n"
@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cyberred.core.kill_chain import KillChain, Phase
+from cyberred.core.models import Finding
+from cyberred.core.normalization import FindingEnricher, ServiceVersion
+from cyberred.intelligence.base import IntelResult
+
+AGENT_ID = str(uuid.uuid4())
+CVE = IntelResult(source="nvd", cve_id="CVE-2021-41773", severity="critical", priority=1,
+                  confidence=1.0, exploit_available=True, exploit_path=None)
+
+
+def tool_result(tool, findings):
+    """The ToolResult fields KillChain reads."""
+    return SimpleNamespace(tool_name=tool, success=True, findings=findings, errors=[])
+
+
+def orchestrator(*results):
+    orch = AsyncMock()
+    orch.run_phase_tools.return_value = list(results)
+    return orch
+
+
+@pytest.mark.asyncio
+async def test_context_from_mixed_finding_types():
+    """Adapter dicts, Tier 1 findings and LLM types all reach the context."""
+    chain = KillChain("10.0.0.5", orchestrator(
+        tool_result("nmap", [
+            {"type": "port_scan", "severity": "info", "host": "10.0.0.5", "ports": [{"port": 22, "service": "ssh"}]},
+            Finding(id=str(uuid.uuid4()), type="open_port", severity="info", target="10.0.0.6",
+                    evidence="80/tcp open http Apache httpd 2.4.49", agent_id=AGENT_ID,
+                    timestamp=datetime.now(timezone.utc).isoformat(), tool="nmap",
+                    topic="findings:0:open_port", signature=""),
+        ]),
+        tool_result("subfinder", [{"type": "recon", "severity": "info", "subdomains": ["dev.example.com"]}]),
+        tool_result("custom", [
+            {"type": "SQL Injection", "severity": "High"},
+            {"type": "Valid credentials", "severity": "critical"},
+            {"type": "meterpreter session", "severity": "critical"},
+        ]),
+    ))
+
+    result = await chain.advance()
+
+    context = chain.context
+    assert context.services == {"10.0.0.5": {22: "ssh"}, "10.0.0.6": {80: "http"}}
+    assert context.discovered_hosts == {"10.0.0.5", "10.0.0.6", "dev.example.com"}
+    assert [v["type"] for v in context.vulnerabilities] == ["SQL Injection"]
+    assert (len(context.credentials), len(context.shells)) == (1, 1)
+    assert result.has_high_findings
+    assert result.next_phase == Phase.ENUMERATION
+
+
+@pytest.mark.asyncio
+async def test_enricher_runs_once_per_phase():
+    cache = AsyncMock()
+    cache.get_many.return_value = {ServiceVersion("apache httpd", "2.4.49"): [CVE]}
+    chain = KillChain("10.0.0.5", orchestrator(
+        tool_result("nmap", [
+            {"type": "port_scan", "host": f"10.0.0.{n}",
+             "ports": [{"port": 80, "service": "http", "product": "Apache httpd", "version": "2.4.49"}]}
+            for n in range(5)
+        ]),
+    ), enricher=FindingEnricher(cache))
+
+    await chain.advance()
+
+    cache.get_many.assert_awaited_once()
+    assert chain.context.intelligence == {"apache httpd 2.4.49": [CVE]}
+    assert chain.context.to_dict()["vulnerable_services"] == ["apache httpd 2.4.49"]
@@ -143,6 +143,44 @@ class TestFinding:
 
         assert reconstructed.id == original.id
 
+    def test_finding_is_slotted(self) -> None:
+        """Finding uses __slots__ (no per-instance __dict__)."""
+        finding = Finding(
+            id=VALID_UUID_1,
+            type="open_port",
+            severity="info",
+            target="10.0.0.1",
+            evidence="evidence",
+            agent_id=VALID_UUID_2,
+            timestamp="2025-12-31T12:00:00Z",
+            tool="nmap",
+            topic="topic",
+            signature="sig",
+        )
+
+        assert not hasattr(finding, "__dict__")
+        assert finding.to_dict()["target"] == "10.0.0.1"
+        assert json.loads(finding.to_json()) == finding.to_dict()
+
+    def test_finding_trusted_skips_validation(self) -> None:
+        """Finding.trusted() builds without re-validating fields."""
+        finding = Finding.trusted(
+            id="not-a-uuid",
+            type="open_port",
+            severity="info",
+            target="10.0.0.1",
+            evidence="evidence",
+            agent_id=VALID_UUID_2,
+            timestamp="2025-12-31T12:00:00Z",
+            tool="nmap",
+            topic="topic",
+            signature="",
+        )
+
+        assert finding.id == "not-a-uuid"
+        with pytest.raises(ValueError, match="Invalid UUID"):
+            Finding.from_json(finding.to_dict())
+
 
 class TestAgentAction:
     """Tests for AgentAction dataclass including new validation logic."""
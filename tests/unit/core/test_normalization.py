@@ -0,0 +1,178 @@
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cyberred.core.models import Finding
+from cyberred.core.normalization import (
+    FindingCategory,
+    FindingEnricher,
+    ServiceVersion,
+    TYPE_TABLE,
+    canonical_severity,
+    canonical_type,
+    normalize,
+)
+from cyberred.intelligence.base import IntelResult
+
+AGENT_ID = str(uuid.uuid4())
+OPENSSH = ServiceVersion("openssh", "8.9p1 Ubuntu 3")
+APACHE = ServiceVersion("apache httpd", "2.4.49")
+CVE = IntelResult(source="nvd", cve_id="CVE-2021-41773", severity="critical", priority=1,
+                  confidence=1.0, exploit_available=True, exploit_path=None)
+
+
+def tier1(type_val, evidence, target="10.0.0.5", severity="info"):
+    return Finding(id=str(uuid.uuid4()), type=type_val, severity=severity, target=target,
+                   evidence=evidence, agent_id=AGENT_ID, timestamp=datetime.now(timezone.utc).isoformat(),
+                   tool="nmap", topic=f"findings:0:{type_val}", signature="")
+
+
+@pytest.mark.parametrize("raw, category", [
+    ("open_port", FindingCategory.SERVICE),
+    ("port_scan", FindingCategory.SERVICE),
+    ("nse_script", FindingCategory.FINGERPRINT),
+    ("web_vulnerability", FindingCategory.VULNERABILITY),
+    ("shell_access", FindingCategory.ACCESS),
+    ("Open-Port", FindingCategory.SERVICE),
+    # Tier 2 types chosen by the LLM
+    ("SQL Injection", FindingCategory.VULNERABILITY),
+    ("exposed admin panel", FindingCategory.VULNERABILITY),
+    ("Leaked API key", FindingCategory.CREDENTIAL),
+    ("sudo misconfiguration", FindingCategory.PRIVESC),
+    ("hidden directory", FindingCategory.CONTENT),
+    ("OS fingerprint", FindingCategory.FINGERPRINT),
+    ("interesting", FindingCategory.OTHER),
+    ("", FindingCategory.OTHER),
+    ("reverse shell", FindingCategory.ACCESS),
+    ("Meterpreter session opened", FindingCategory.ACCESS),
+    ("Valid login", FindingCategory.CREDENTIAL),
+    # Weaknesses and failed attempts are not access or credentials
+    ("broken_access_control", FindingCategory.VULNERABILITY),
+    ("Session fixation", FindingCategory.VULNERABILITY),
+    ("session hijacking", FindingCategory.VULNERABILITY),
+    ("auth bypass", FindingCategory.VULNERABILITY),
+    ("shellshock", FindingCategory.VULNERABILITY),
+    ("access_denied", FindingCategory.OTHER),
+    ("login_page", FindingCategory.OTHER),
+    ("session cookie", FindingCategory.OTHER),
+    # Bare words that only look like weaknesses or secrets
+    ("Domain Controller", FindingCategory.HOST),
+    ("SQL Server", FindingCategory.OTHER),
+    ("SQL injection", FindingCategory.VULNERABILITY),
+    ("ssh_key", FindingCategory.CREDENTIAL),
+    ("SSH private key", FindingCategory.CREDENTIAL),
+    ("authorized keys", FindingCategory.CREDENTIAL),
+    ("key exchange algorithms", FindingCategory.OTHER),
+])
+def test_canonical_type(raw, category):
+    assert canonical_type(raw) == category
+
+
+def test_type_table_covers_categories():
+    assert set(TYPE_TABLE.values()) == set(FindingCategory) - {FindingCategory.OTHER}
+
+
+@pytest.mark.parametrize("raw, severity", [
+    ("CRITICAL", "critical"), ("moderate", "medium"), (" Low ", "low"),
+    ("unknown", "info"), (None, "info"), ("bogus", "info"),
+])
+def test_canonical_severity(raw, severity):
+    assert canonical_severity(raw) == severity
+
+
+def test_normalize_tier1_open_port():
+    finding = normalize(tier1("open_port", "22/tcp open ssh OpenSSH 8.9p1 Ubuntu 3"))
+
+    assert finding["type"] == "open_port"
+    assert finding["category"] == FindingCategory.SERVICE
+    assert finding["host"] == "10.0.0.5"
+    assert finding["ports"] == [{
+        "port": 22, "protocol": "tcp", "service": "ssh", "product": "OpenSSH",
+        "version": "8.9p1 Ubuntu 3", "service_version": OPENSSH,
+    }]
+
+
+@pytest.mark.parametrize("evidence, port", [
+    ("Port 443/tcp open on 10.0.0.5", (443, "unknown", None)),
+    ("80/tcp open http", (80, "http", None)),
+    ("8080/tcp open http-proxy nginx", (8080, "http-proxy", None)),
+    ("garbled", None),
+])
+def test_normalize_tier1_port_evidence(evidence, port):
+    ports = normalize(tier1("open_port", evidence))["ports"]
+
+    assert [(p["port"], p["service"], p["service_version"]) for p in ports] == ([port] if port else [])
+
+
+def test_normalize_adapter_findings():
+    port_scan = normalize({
+        "type": "port_scan", "severity": "info", "host": "10.0.0.7",
+        "ports": [{"port": "80", "service": "http", "product": "Apache httpd", "version": "2.4.49"},
+                  {"port": 21, "proto": "tcp", "service": None}],
+    })
+    high_risk = normalize({"type": "port_scan", "severity": "medium", "host": "10.0.0.7", "port": "3306"})
+    vuln = normalize({"type": "vulnerability", "severity": "unknown", "name": "x"})
+
+    assert [(p["port"], p["service"], p["service_version"]) for p in port_scan["ports"]] == [
+        (80, "http", APACHE), (21, "unknown", None)]
+    assert [p["port"] for p in high_risk["ports"]] == [3306]
+    assert (vuln["category"], vuln["severity"], vuln["host"]) == (FindingCategory.VULNERABILITY, "info", None)
+
+
+def test_normalize_recon_hosts():
+    assert normalize({"type": "recon", "subdomains": ["a.example.com", "b.example.com"]})["hosts"] == [
+        "a.example.com", "b.example.com"]
+    assert normalize({"type": "recon", "subdomain": "dev.example.com"})["hosts"] == ["dev.example.com"]
+    assert normalize(tier1("subdomain", "api.example.com", target="api.example.com"))["hosts"] == ["api.example.com"]
+    assert normalize(tier1("email", "admin@example.com", target="example.com"))["hosts"] == []
+
+
+def findings_for(*pairs_per_agent):
+    """Port findings of several agents scanning the same services."""
+    return [
+        normalize(tier1("open_port", f"{port}/tcp open svc {sv.service} {sv.version}"))
+        for port, sv in pairs_per_agent
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enrich_joins_each_pair_once():
+    cache = AsyncMock()
+    cache.get_many.return_value = {ServiceVersion("apache httpd", "2.4.49"): [CVE], OPENSSH: None}
+    aggregator = AsyncMock()
+    aggregator.query.return_value = []
+    findings = findings_for((80, APACHE), (22, OPENSSH), (8080, APACHE), (2222, OPENSSH)) + [
+        normalize(tier1("open_port", "25/tcp open smtp")),
+        normalize({"type": "credential", "severity": "critical"}),
+    ]
+
+    intel = await FindingEnricher(cache, aggregator).enrich(findings)
+
+    cache.get_many.assert_awaited_once_with([APACHE, OPENSSH])
+    aggregator.query.assert_awaited_once_with("openssh", "8.9p1 Ubuntu 3")
+    assert intel == {APACHE: [CVE], OPENSSH: []}
+    assert [f["ports"][0].get("intel") for f in findings[:5]] == [[CVE], [], [CVE], [], None]
+
+
+@pytest.mark.asyncio
+async def test_enrich_cache_only_and_failures():
+    cache = AsyncMock()
+    cache.get_many.return_value = {APACHE: None}
+    findings = findings_for((80, APACHE))
+
+    assert await FindingEnricher(cache).enrich(findings) == {}
+    assert findings[0]["ports"][0]["intel"] == []
+
+    aggregator = AsyncMock()
+    aggregator.query.side_effect = TimeoutError("sources down")
+    assert await FindingEnricher(cache, aggregator).enrich(findings) == {}
+
+
+@pytest.mark.asyncio
+async def test_enrich_without_service_versions():
+    cache = AsyncMock()
+
+    assert await FindingEnricher(cache).enrich([normalize({"type": "recon"})]) == {}
+    cache.get_many.assert_not_awaited()
@@ -0,0 +1,130 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cyberred.core.config import _SettingsHolder
+from cyberred.core.event_bus import EventBus
+from cyberred.core.exceptions import ScopeViolationError
+from cyberred.core.orchestrator import Orchestrator
+from cyberred.core.roe_loader import RoELoader
+
+# Orchestrators whose scope watchers are stopped after each test
+_watched: list[Orchestrator] = []
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep RoE persistence and reload listeners out of the real config."""
+    monkeypatch.setattr(
+        "cyberred.core.orchestrator.RoELoader", lambda: RoELoader(str(tmp_path / "roe.yaml"))
+    )
+    monkeypatch.setattr(_SettingsHolder, "_reload_listeners", [])
+    yield
+    while _watched:
+        _watched.pop().scope_validator.stop_watching()
+
+
+@pytest.fixture
+def scope_file(tmp_path):
+    path = tmp_path / "scope.yaml"
+    path.write_text("scope:\n  allowed_targets:\n    - 93.184.216.34\n")
+    return path
+
+
+def orchestrator(scope_path=None):
+    with patch("cyberred.core.orchestrator.CouncilOfExperts"):
+        orch = Orchestrator(EventBus(), scope_path=scope_path)
+    if orch.scope_validator is not None:
+        _watched.append(orch)
+    return orch
+
+
+def test_scope_validator_uses_manifest_argument_schemas(scope_file):
+    validator = orchestrator(str(scope_file)).scope_validator
+
+    # --excludefile takes a file name per the nmap schema; heuristics would treat it as a target
+    validator.validate(command="nmap -p 80 --excludefile hosts.skip 93.184.216.34")
+    with pytest.raises(ScopeViolationError):
+        validator.validate(command="nmap --excludefile hosts.skip 10.0.0.1")
+
+
+def test_argument_schemas_missing_manifest(scope_file):
+    with patch("cyberred.core.orchestrator.TOOL_MANIFEST_PATH", "/nonexistent/manifest.yaml"):
+        validator = orchestrator(str(scope_file)).scope_validator
+
+    with pytest.raises(ScopeViolationError):
+        validator.validate(command="nmap --excludefile hosts.skip 93.184.216.34")
+
+
+def test_no_scope_path():
+    assert orchestrator().scope_validator is None
+    assert _SettingsHolder._reload_listeners == []
+
+
+def test_tool_orchestrator_follows_scope_version(scope_file):
+    orch = orchestrator(str(scope_file))
+    scope_version = orch.tool_orchestrator._scope_version
+
+    assert scope_version() == 1
+    orch.scope_validator.add_targets(["93.184.216.35"])
+    assert scope_version() == 2
+    assert orchestrator().tool_orchestrator._scope_version() == 0
+
+
+def test_roe_authorization_publishes_scope_snapshot(scope_file):
+    orch = orchestrator(str(scope_file))
+    version = orch.scope_validator.snapshot().version
+
+    orch.roe_loader.authorize_target("93.184.216.35", persist=True)
+
+    assert orch.scope_validator.snapshot().version == version + 1
+    assert orch.scope_validator.validate(target="93.184.216.35") is True
+    # Session-only authorizations do not widen the hard-gate scope
+    orch.roe_loader.authorize_target("93.184.216.36")
+    assert orch.scope_validator.snapshot().version == version + 1
+
+
+def test_scope_file_and_settings_are_watched(scope_file, tmp_path):
+    orch = orchestrator(str(scope_file))
+    validator = orch.scope_validator
+
+    assert validator._watcher is not None and validator._watcher.is_running
+    assert _SettingsHolder._reload_listeners == [validator.handle_settings_reload]
+
+    moved = tmp_path / "moved.yaml"
+    moved.write_text("scope:\n  allowed_targets:\n    - 93.184.216.40\n")
+    settings = MagicMock()
+    settings.engagement.scope_path = str(moved)
+    for listener in _SettingsHolder._reload_listeners:
+        listener(settings, ["engagement.scope_path"])
+    assert validator.validate(target="93.184.216.40") is True
+
+
+def test_roe_reload_invalidates_cached_denial(scope_file):
+    orch = orchestrator(str(scope_file))
+    validator = orch.scope_validator
+    # The second call is served from the decision cache
+    for _ in range(2):
+        with pytest.raises(ScopeViolationError):
+            validator.validate(command="nmap -p 80 93.184.216.35")
+
+    orch.roe_loader.authorize_target("93.184.216.35", persist=True)
+
+    assert validator.validate(command="nmap -p 80 93.184.216.35") is True
+
+
+def test_scope_file_watch_invalidates_cached_decision(scope_file):
+    validator = orchestrator(str(scope_file)).scope_validator
+    for _ in range(2):
+        assert validator.validate(command="nmap -p 80 93.184.216.34") is True
+    version = validator.snapshot().version
+
+    scope_file.write_text("scope:\n  allowed_targets:\n    - 93.184.216.35\n")
+    deadline = time.monotonic() + 5
+    while validator.snapshot().version == version and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert validator.snapshot().version > version
+    with pytest.raises(ScopeViolationError):
+        validator.validate(command="nmap -p 80 93.184.216.34")
@@ -0,0 +1,54 @@
+"""Tests for bounded output stream helpers."""
+
+from cyberred.core.output_stream import LineStream, RingBuffer
+
+
+def test_ring_buffer_keeps_last_characters():
+    buf = RingBuffer(5)
+    buf.append("")
+    buf.append("abc")
+    assert buf.getvalue() == "abc" and not buf.truncated
+    buf.append("defg")
+    assert buf.getvalue() == "cdefg"
+    assert len(buf) == 5
+    assert buf.total == 7 and buf.truncated
+
+
+def test_ring_buffer_drops_whole_chunks():
+    buf = RingBuffer(4)
+    for part in ("ab", "cd", "ef"):
+        buf.append(part)
+    assert buf.getvalue() == "cdef"
+
+
+def test_ring_buffer_oversized_append():
+    buf = RingBuffer(3)
+    buf.append("ab")
+    buf.append("123456")
+    assert buf.getvalue() == "456"
+
+
+def test_line_stream_splits_across_chunks():
+    stream = LineStream()
+    assert stream.feed(b"80/tcp open\r\n443/tcp op") == ["80/tcp open"]
+    assert stream.feed(b"en\n") == ["443/tcp open"]
+    assert stream.feed(b"") == []
+    assert stream.feed(b"tail") == []
+    assert stream.finish() == ["tail"]
+    assert stream.finish() == []
+    assert stream.total_chars == len("80/tcp open\r\n443/tcp open\ntail")
+
+
+def test_line_stream_decodes_split_multibyte_characters():
+    stream = LineStream()
+    data = "héllo\n".encode()
+    assert stream.feed(data[:2]) == []
+    assert stream.feed(data[2:]) == ["héllo"]
+    assert stream.feed(b"\xff\n") == ["�"]
+
+
+def test_line_stream_bounds_partial_line_and_tail():
+    stream = LineStream(max_tail=4, max_line=8)
+    assert stream.feed(b"0123456789") == ["0123456789"]
+    assert stream.finish() == []
+    assert stream.tail == "6789"
@@ -0,0 +1,67 @@
+"""Tests for the engagement-scoped tool result cache."""
+
+import pytest
+
+from cyberred.core.models import ToolResult
+from cyberred.core.result_cache import ResultCache, normalize_command
+
+OK = ToolResult(True, "22/tcp open ssh", "", 0, 10)
+
+
+def test_normalize_command():
+    assert normalize_command("nmap  -sV   '10.0.0.1'") == "nmap -sV 10.0.0.1"
+    assert normalize_command('whatweb "http://a b"') == "whatweb 'http://a b'"
+    # Unbalanced quotes fall back to whitespace normalization
+    assert normalize_command("nmap  'x") == normalize_command("nmap 'x")
+
+
+def test_key_ignores_quoting_and_target_order():
+    key = ResultCache.key("nmap", "nmap -sV a b", ["b", "a", "a"], 1)
+    assert key == ResultCache.key("nmap", "nmap  -sV 'a' b", ["a", "b"], 1)
+    assert key != ResultCache.key("nmap", "nmap -sV a b", ["a", "b"], 2)
+
+
+def test_only_tools_with_a_ttl_are_cached():
+    with pytest.raises(ValueError, match="max_entries"):
+        ResultCache({}, max_entries=0)
+    cache = ResultCache({"nmap": 60, "hydra": 0})
+    assert cache.cacheable("nmap") and not cache.cacheable("hydra")
+    assert cache.ttl("nmap") == 60.0 and cache.ttl("hydra") == 0.0
+
+    key = cache.key("hydra", "hydra x", ["x"])
+    assert not cache.put("eng", key, OK)
+    assert cache.get("eng", key) is None
+    assert cache.get_metrics()["misses"] == 0
+
+
+def test_entries_expire_and_are_scoped_per_engagement():
+    now = [0.0]
+    cache = ResultCache({"nmap": 60}, clock=lambda: now[0])
+    key = cache.key("nmap", "nmap 10.0.0.1", ["10.0.0.1"])
+
+    assert cache.get("eng-1", key) is None
+    assert cache.put("eng-1", key, OK)
+    assert cache.get("eng-1", key) is OK
+    assert cache.get("eng-2", key) is None
+
+    now[0] = 60.0
+    assert cache.get("eng-1", key) is None
+    metrics = cache.get_metrics()
+    assert metrics["hits"] == 1 and metrics["misses"] == 3 and metrics["expired"] == 1
+    assert metrics["entries"] == 0 and metrics["hit_ratio"] == 0.25
+
+
+def test_lru_eviction_and_clear():
+    cache = ResultCache({"nmap": 60}, max_entries=2)
+    keys = [cache.key("nmap", f"nmap 10.0.0.{i}", []) for i in range(3)]
+    cache.put("a", keys[0], OK)
+    cache.put("b", keys[1], OK)
+    cache.get("a", keys[0])  # Most recently used
+    cache.put("a", keys[2], OK)
+
+    assert cache.get("b", keys[1]) is None
+    assert cache.get_metrics()["evictions"] == 1
+    assert cache.clear("a") == 2
+    assert cache.put("b", keys[1], OK)
+    assert cache.clear() == 1
+    assert cache.get_metrics()["entries"] == 0
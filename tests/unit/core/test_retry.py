@@ -0,0 +1,120 @@
+"""Tests for the tool execution retry layer."""
+
+import pytest
+
+from cyberred.core.models import ToolResult
+from cyberred.core.retry import (
+    CIRCUIT_OPEN,
+    CLOSED,
+    DETERMINISTIC,
+    HALF_OPEN,
+    OPEN,
+    REFUSED,
+    TRANSIENT,
+    CircuitBreaker,
+    CircuitBreakers,
+    RetryPolicy,
+    classify_error,
+    classify_result,
+)
+
+
+def _failed(stderr="boom", exit_code=1, error_type="NON_ZERO_EXIT"):
+    return ToolResult(False, "", stderr, exit_code, 10, error_type)
+
+
+OK = ToolResult(True, "out", "", 0, 10)
+
+
+@pytest.mark.parametrize(
+    "error,exit_code,expected",
+    [
+        ("nmap: unrecognized option '--bad'", 1, DETERMINISTIC),
+        ("sh: 1: nuclei: command not found", None, DETERMINISTIC),
+        ("open /etc/shadow: permission denied", 1, DETERMINISTIC),
+        ("", 127, DETERMINISTIC),
+        ("Connection reset by peer", 1, TRANSIENT),
+        ("could not resolve host: temporary failure", 1, TRANSIENT),
+        ("something odd happened", 1, TRANSIENT),
+    ],
+)
+def test_classify_error(error, exit_code, expected):
+    assert classify_error(error, exit_code) == expected
+
+
+def test_classify_result():
+    assert classify_result(OK) is None
+    assert classify_result(_failed(error_type="POOL_EXHAUSTED")) == REFUSED
+    assert classify_result(_failed(error_type=CIRCUIT_OPEN)) == REFUSED
+    assert classify_result(_failed("usage: x", error_type="TIMEOUT")) == TRANSIENT
+    assert classify_result(_failed(error_type="CONTAINER_CRASHED")) == TRANSIENT
+    assert classify_result(_failed(exit_code=2)) == DETERMINISTIC
+    # Exit codes only mean something for processes that ran
+    assert classify_result(_failed(exit_code=2, error_type="EXECUTION_EXCEPTION")) == TRANSIENT
+
+
+def test_retry_policy_delays_attempts_and_budget():
+    with pytest.raises(ValueError, match="Invalid retry policy"):
+        RetryPolicy(max_attempts=0)
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=3.0, budget=10.0)
+    assert [policy.delay(n) for n in (1, 2, 3)] == [1.0, 2.0, 3.0]
+    assert policy.should_retry(1, elapsed=0.0)
+    assert not policy.should_retry(4, elapsed=0.0)
+    # The caller's limit is capped by the policy, and never below one attempt
+    assert not policy.should_retry(2, elapsed=0.0, attempts=2)
+    assert not policy.should_retry(1, elapsed=0.0, attempts=0)
+    assert policy.should_retry(1, elapsed=0.0, attempts=9)
+    # No retry starts once its delay would exhaust the budget
+    assert not policy.should_retry(1, elapsed=9.5)
+    assert RetryPolicy(budget=0).should_retry(1, elapsed=1e6)
+
+
+def test_circuit_breaker_lifecycle():
+    with pytest.raises(ValueError, match="Invalid circuit breaker"):
+        CircuitBreaker(failure_threshold=0)
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=30, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN and not breaker.allow()
+
+    now[0] = 30.0
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+    # A failed probe reopens the circuit
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    now[0] = 60.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+
+def test_circuit_breakers_per_tool():
+    breakers = CircuitBreakers(failure_threshold=1, cooldown=60)
+    assert breakers.get("nmap") is breakers.get("nmap")
+
+    breakers.record("nikto", _failed("connection reset by peer"))
+    breakers.record("nmap", _failed(error_type="POOL_EXHAUSTED"))
+    breakers.record("nuclei", OK)
+    # Per-target and usage failures do not count against the tool
+    breakers.record("ffuf", _failed("could not resolve host: bad.example.com"))
+    breakers.record("ffuf", _failed(exit_code=2))
+
+    assert not breakers.allow("nikto")
+    assert breakers.allow("nmap")
+    assert breakers.allow("ffuf") and breakers.get("ffuf").failures == 0
+    assert breakers.get_metrics() == {"nikto": {"state": OPEN, "failures": 1}}
+    refusal = breakers.refusal("nikto")
+    assert refusal.error_type == CIRCUIT_OPEN
+    assert "1 consecutive failures" in refusal.stderr
+
+    # Failures while already open do not log the opening again
+    breakers.record("nikto", _failed())
+    assert breakers.get("nikto").failures == 2
@@ -0,0 +1,38 @@
+"""Unit tests for cyberred.core.roe_loader module."""
+
+from unittest.mock import MagicMock
+
+import yaml
+
+from cyberred.core.roe_loader import RoELoader
+
+
+def test_persisted_target_notifies_listeners(tmp_path):
+    loader = RoELoader(str(tmp_path / "roe.yaml"))
+    loader.load()
+    listener = MagicMock()
+    failing = MagicMock(side_effect=RuntimeError("boom"))
+    loader.add_listener(failing)
+    loader.add_listener(listener)
+
+    loader.authorize_target("https://10.1.1.1/login", persist=True)
+    loader.authorize_target("10.1.1.1", persist=True)  # already persisted
+    loader.authorize_target("10.2.2.2")  # session only
+
+    listener.assert_called_once_with("10.1.1.1")
+    failing.assert_called_once_with("10.1.1.1")
+    roe = yaml.safe_load((tmp_path / "roe.yaml").read_text())
+    assert roe["allowed_ips"].count("10.1.1.1") == 1
+    assert "10.2.2.2" not in roe["allowed_ips"]
+
+
+def test_persisting_does_not_change_the_defaults(tmp_path):
+    for name in ("first.yaml", "second.yaml"):
+        loader = RoELoader(str(tmp_path / name))
+        loader.load()
+        listener = MagicMock()
+        loader.add_listener(listener)
+        loader.authorize_target("10.3.3.3", persist=True)
+        listener.assert_called_once_with("10.3.3.3")
+
+    assert "10.3.3.3" not in RoELoader.DEFAULT_ROE["allowed_ips"]
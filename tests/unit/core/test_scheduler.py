@@ -0,0 +1,629 @@
+"""Tests for the unified execution scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cyberred.core import scheduler as scheduler_module
+from cyberred.core.blob_store import BlobStore
+from cyberred.core.models import ToolResult
+from cyberred.core.scheduler import (
+    EngagementQuota,
+    ExecutionScheduler,
+    SchedulerMetrics,
+    SchedulerPolicy,
+    ToolProfile,
+)
+from cyberred.core.retry import CircuitBreakers, RetryPolicy
+from cyberred.protocols import ExecutionBackendProtocol
+
+
+class FakeBackend:
+    """Backend whose jobs block until the gate opens."""
+
+    backend_name = "fake"
+
+    def __init__(self, capacity: int = 2) -> None:
+        self.slots = capacity
+        self.gate = asyncio.Event()
+        self.started: list[str] = []
+        self.initialized = False
+        self.shut_down = False
+
+    @property
+    def capacity(self) -> int:
+        return self.slots
+
+    async def initialize(self) -> None:
+        self.initialized = True
+
+    async def shutdown(self) -> None:
+        self.shut_down = True
+
+    async def run(self, command, timeout, on_output=None):
+        self.started.append(command)
+        await self.gate.wait()
+        if command.startswith("fail"):
+            return ToolResult(False, "", "boom", 1, 1, "NON_ZERO_EXIT")
+        if command.startswith("usage"):
+            return ToolResult(False, "", "usage: nmap [options]", 1, 1, "NON_ZERO_EXIT")
+        if command.startswith("raise"):
+            raise RuntimeError("backend broke")
+        return ToolResult(True, f"out:{command}", "", 0, 1)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fake_backend_satisfies_protocol():
+    assert isinstance(FakeBackend(), ExecutionBackendProtocol)
+
+
+def test_policy_and_quota_validation():
+    with pytest.raises(ValueError, match=">= 0"):
+        SchedulerPolicy(max_concurrent=-1)
+    with pytest.raises(ValueError, match="Invalid scheduler policy"):
+        SchedulerPolicy(queue_timeout=0)
+    with pytest.raises(ValueError, match="Unknown admission"):
+        SchedulerPolicy(admission="lifo")
+    with pytest.raises(ValueError, match="duration_alpha"):
+        SchedulerPolicy(duration_alpha=0)
+    with pytest.raises(ValueError, match="Invalid tool profile"):
+        ToolProfile(cpu=0)
+    scheduler = ExecutionScheduler(FakeBackend())
+    with pytest.raises(ValueError):
+        scheduler.set_quota("e1", max_concurrent=-1)
+
+
+def test_quota_defaults_and_capacity_cap():
+    scheduler = ExecutionScheduler(
+        FakeBackend(capacity=10),
+        SchedulerPolicy(max_concurrent=3, engagement_concurrency=2, engagement_queue_depth=5),
+    )
+    assert scheduler.capacity == 3
+    assert scheduler.quota("any") == EngagementQuota(2, 5)
+    scheduler.set_quota("e1", max_concurrent=1)
+    assert scheduler.quota("e1") == EngagementQuota(1, 0)
+
+
+def test_metrics_percentiles():
+    metrics = SchedulerMetrics(wait_window=100)
+    assert metrics.wait_percentile(0.95) == 0.0
+    for ms in range(1, 101):
+        metrics.record_wait(float(ms))
+    data = metrics.get_metrics()
+    assert data["queue_wait_p50_ms"] == 51.0
+    assert data["queue_wait_p95_ms"] == 96.0
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_on_backend_and_records_metrics():
+    backend = FakeBackend()
+    backend.gate.set()
+    scheduler = ExecutionScheduler(backend)
+    await scheduler.initialize()
+    assert backend.initialized
+
+    result = await scheduler.submit("nmap x", tool="nmap", engagement_id="e1", agent_id="a1")
+
+    assert result.stdout == "out:nmap x"
+    assert scheduler.backend is backend
+    assert scheduler.metrics.get_metrics()["completed"] == 1
+    metrics = scheduler.get_metrics()
+    assert metrics["backend"] == "fake"
+    assert metrics["submitted"] == metrics["dispatched"] == metrics["completed"] == 1
+    assert metrics["by_tool"] == {"nmap": 1}
+    assert metrics["running"] == metrics["queued"] == 0
+    assert metrics["engagements"] == {}
+
+
+@pytest.mark.asyncio
+async def test_capacity_limits_running_jobs():
+    backend = FakeBackend(capacity=2)
+    scheduler = ExecutionScheduler(backend)
+    tasks = [asyncio.create_task(scheduler.submit(f"job{i}")) for i in range(3)]
+    await _settle()
+    assert backend.started == ["job0", "job1"]
+    assert (scheduler.running_count, scheduler.queued_count) == (2, 1)
+    assert scheduler.get_metrics()["engagements"] == {"default": {"running": 2, "queued": 1}}
+
+    backend.gate.set()
+    results = await asyncio.gather(*tasks)
+    assert all(r.success for r in results)
+    assert backend.started == ["job0", "job1", "job2"]
+
+
+@pytest.mark.asyncio
+async def test_agents_are_served_fairly():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    tasks = [asyncio.create_task(scheduler.submit(f"a{i}", agent_id="a")) for i in range(4)]
+    await _settle()
+    tasks.append(asyncio.create_task(scheduler.submit("b0", agent_id="b")))
+    await _settle()
+    assert scheduler.get_metrics()["agents_waiting"] == 2
+
+    backend.gate.set()
+    await asyncio.gather(*tasks)
+    # b0 is not stuck behind agent a's backlog
+    assert backend.started == ["a0", "b0", "a1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_engagement_concurrency_quota():
+    backend = FakeBackend(capacity=4)
+    scheduler = ExecutionScheduler(backend)
+    scheduler.set_quota("e1", max_concurrent=1)
+    tasks = [
+        asyncio.create_task(scheduler.submit("e1-a", engagement_id="e1", agent_id="x")),
+        asyncio.create_task(scheduler.submit("e1-b", engagement_id="e1", agent_id="y")),
+        asyncio.create_task(scheduler.submit("e2-a", engagement_id="e2", agent_id="z")),
+    ]
+    await _settle()
+    assert backend.started == ["e1-a", "e2-a"]
+    assert scheduler.get_metrics()["engagements"]["e1"] == {"running": 1, "queued": 1}
+
+    # Raising the quota dispatches the waiting job at once
+    scheduler.set_quota("e1", max_concurrent=2)
+    await _settle()
+    assert backend.started == ["e1-a", "e2-a", "e1-b"]
+    backend.gate.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_when_queues_are_full():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend, SchedulerPolicy(max_queue_depth=2))
+    scheduler.set_quota("e1", max_queued=1)
+    tasks = [asyncio.create_task(scheduler.submit("run", engagement_id="e1"))]
+    await _settle()
+    tasks.append(asyncio.create_task(scheduler.submit("wait", engagement_id="e1")))
+    await _settle()
+
+    rejected = await scheduler.submit("more", engagement_id="e1")
+    assert rejected.error_type == "POOL_EXHAUSTED"
+    assert "engagement queue quota" in rejected.stderr
+
+    tasks.append(asyncio.create_task(scheduler.submit("other", engagement_id="e2")))
+    await _settle()
+    rejected = await scheduler.submit("overflow", engagement_id="e3")
+    assert "queue full" in rejected.stderr
+    assert scheduler.get_metrics()["rejected"] == 2
+
+    backend.gate.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_returns_pool_exhausted():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend, SchedulerPolicy(queue_timeout=0.05))
+    running = asyncio.create_task(scheduler.submit("slow"))
+    await _settle()
+
+    result = await scheduler.submit("late", agent_id="other")
+
+    assert result.error_type == "POOL_EXHAUSTED"
+    assert "no execution slot" in result.stderr
+    assert scheduler.queued_count == 0
+    assert scheduler.get_metrics()["queue_timeouts"] == 1
+    backend.gate.set()
+    await running
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_job_is_dequeued():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    running = asyncio.create_task(scheduler.submit("slow"))
+    waiting = asyncio.create_task(scheduler.submit("queued"))
+    behind = asyncio.create_task(scheduler.submit("behind"))
+    await _settle()
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.queued_count == 1
+    backend.gate.set()
+    await asyncio.gather(running, behind)
+    assert backend.started == ["slow", "behind"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_running_job_releases_slot():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    running = asyncio.create_task(scheduler.submit("slow"))
+    await _settle()
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_after_grant_releases_slot(monkeypatch):
+    scheduler = ExecutionScheduler(FakeBackend(capacity=1))
+
+    async def granted_then_cancelled(future, timeout):
+        await future
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", granted_then_cancelled)
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.submit("x")
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_after_grant_releases_slot(monkeypatch):
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    running = asyncio.create_task(scheduler.submit("slow"))
+    await _settle()
+
+    async def granted_then_timed_out(future, timeout):
+        # The slot is granted just as the queue wait expires
+        backend.gate.set()
+        await running
+        assert future.result() is True
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", granted_then_timed_out)
+    result = await scheduler.submit("late")
+
+    assert result.error_type == "POOL_EXHAUSTED"
+    assert (scheduler.running_count, scheduler.queued_count) == (0, 0)
+    assert scheduler.get_metrics()["queue_timeouts"] == 1
+    assert backend.started == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_timeout_after_skip_does_not_dequeue(monkeypatch):
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    running = asyncio.create_task(scheduler.submit("slow"))
+    await _settle()
+
+    async def cancelled_then_timed_out(future, timeout):
+        # wait_for cancelled the grant; dispatch skips the job before it dequeues
+        future.cancel()
+        backend.gate.set()
+        await running
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", cancelled_then_timed_out)
+    result = await scheduler.submit("late")
+
+    assert result.error_type == "POOL_EXHAUSTED"
+    assert (scheduler.running_count, scheduler.queued_count) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_cancel_after_shutdown_does_not_release(monkeypatch):
+    scheduler = ExecutionScheduler(FakeBackend(capacity=0))
+
+    async def shutdown_then_cancelled(future, timeout):
+        await scheduler.shutdown()
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", shutdown_then_cancelled)
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.submit("x")
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_job_cancelled_before_dequeue_is_not_granted(monkeypatch):
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend)
+    running = asyncio.create_task(scheduler.submit("slow"))
+    await _settle()
+
+    async def cancelled_then_slot_freed(future, timeout):
+        # The running job finishes before the cancelled submit() dequeues
+        future.cancel()
+        backend.gate.set()
+        await running
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", cancelled_then_slot_freed)
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.submit("queued")
+    assert running.result().success
+    assert (scheduler.running_count, scheduler.queued_count) == (0, 0)
+    assert backend.started == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_skips_cancelled_queued_jobs(monkeypatch):
+    scheduler = ExecutionScheduler(FakeBackend(capacity=0))
+
+    async def cancelled_then_shutdown(future, timeout):
+        future.cancel()
+        await scheduler.shutdown()
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(scheduler_module.asyncio, "wait_for", cancelled_then_shutdown)
+    with pytest.raises(asyncio.CancelledError):
+        await scheduler.submit("x")
+    assert (scheduler.running_count, scheduler.queued_count) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_fails_queued_jobs_and_rejects_new_ones():
+    backend = FakeBackend(capacity=0)
+    scheduler = ExecutionScheduler(backend)
+    waiting = asyncio.create_task(scheduler.submit("queued"))
+    await _settle()
+
+    await scheduler.shutdown()
+
+    result = await waiting
+    assert "shut down" in result.stderr
+    assert backend.shut_down
+    assert (await scheduler.submit("late")).error_type == "POOL_EXHAUSTED"
+    await scheduler.initialize()
+    backend.slots = 1
+    backend.gate.set()
+    assert (await scheduler.submit("again")).success
+
+
+@pytest.mark.asyncio
+async def test_backend_failures_are_results():
+    backend = FakeBackend()
+    backend.gate.set()
+    scheduler = ExecutionScheduler(backend)
+
+    failed = await scheduler.submit("fail")
+    raised = await scheduler.submit("raise")
+
+    assert failed.error_type == "NON_ZERO_EXIT"
+    assert raised.error_type == "EXECUTION_EXCEPTION"
+    assert "backend broke" in raised.stderr
+    assert scheduler.get_metrics()["failed"] == 2
+    assert scheduler.running_count == 0
+
+
+@pytest.mark.asyncio
+async def test_execute_task_is_worker_pool_compatible():
+    backend = FakeBackend()
+    backend.gate.set()
+    bus = AsyncMock()
+    scheduler = ExecutionScheduler(backend, event_bus=bus, retry_policy=RetryPolicy(base_delay=0))
+
+    assert await scheduler.execute_task("nmap x", "nmap", agent_id="a1") == "out:nmap x"
+    assert await scheduler.execute_task("fail", "nmap", retries=3) == "ERROR: boom"
+    assert backend.started.count("fail") == 3
+    assert bus.publish.await_args.args[1]["text"].startswith("✗ [nmap] Failed")
+
+    # Refused jobs are not retried
+    await scheduler.shutdown()
+    assert (await scheduler.execute_task("late", "nmap", retries=3)).startswith("ERROR: Execution unavailable")
+    assert scheduler.get_metrics()["rejected"] == 1
+
+    # retries=0 still runs once
+    assert await ExecutionScheduler(backend).execute_task("x", "t", retries=0) == "out:x"
+
+
+@pytest.mark.asyncio
+async def test_execute_task_fails_fast_on_deterministic_errors():
+    backend = FakeBackend()
+    backend.gate.set()
+    scheduler = ExecutionScheduler(backend, retry_policy=RetryPolicy(base_delay=0))
+
+    assert await scheduler.execute_task("usage", "nmap", retries=3) == "ERROR: usage: nmap [options]"
+    assert backend.started.count("usage") == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_task_reads_stored_stdout(tmp_path):
+    store = BlobStore(tmp_path)
+    backend = FakeBackend()
+    backend.run = AsyncMock(return_value=ToolResult(True, "80/tcp", "", 0, 1, output_ref=store.put(b"80/tcp open")))
+    scheduler = ExecutionScheduler(backend)
+
+    # Backends without a store keep stdout as is
+    assert await scheduler.execute_task("nmap x", "nmap") == "80/tcp"
+    backend.blob_store = store
+    assert await scheduler.execute_task("nmap x", "nmap") == "80/tcp open"
+    # Streamed output is not read back into memory
+    assert await scheduler.execute_task("nmap x", "nmap", on_output=MagicMock()) == "80/tcp"
+
+
+@pytest.mark.asyncio
+async def test_execute_task_resets_stream_before_retries():
+    backend = FakeBackend()
+    backend.gate.set()
+    scheduler = ExecutionScheduler(backend, retry_policy=RetryPolicy(max_attempts=2, base_delay=0))
+    resets = []
+
+    await scheduler.execute_task("fail", "nmap", on_retry=lambda: resets.append(1))
+
+    # The policy caps the caller's three attempts at two
+    assert backend.started.count("fail") == 2
+    assert resets == [1]
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_refuses_failing_tool():
+    now = [0.0]
+    backend = FakeBackend()
+    backend.gate.set()
+    breakers = CircuitBreakers(failure_threshold=2, cooldown=60, clock=lambda: now[0])
+    scheduler = ExecutionScheduler(backend, breakers=breakers)
+
+    for _ in range(2):
+        await scheduler.submit("fail", tool="nikto")
+    refused = await scheduler.execute_task("ok", "nikto", retries=3)
+
+    assert refused.startswith("ERROR: Circuit open for nikto")
+    assert "ok" not in backend.started
+    metrics = scheduler.get_metrics()
+    assert metrics["circuit_open"] == 1
+    assert metrics["circuits"] == {"nikto": {"state": "open", "failures": 2}}
+    # Other tools are unaffected
+    assert (await scheduler.submit("ok", tool="nmap")).success
+
+    # After the cooldown one probe closes the circuit again
+    now[0] = 60.0
+    assert (await scheduler.submit("ok", tool="nikto")).success
+    assert scheduler.get_metrics()["circuits"] == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_is_released():
+    backend = FakeBackend(capacity=1)
+    breakers = CircuitBreakers(failure_threshold=1, cooldown=0)
+    breakers.get("nikto").record_failure()
+    scheduler = ExecutionScheduler(backend, breakers=breakers)
+
+    probe = asyncio.create_task(scheduler.submit("probe", tool="nikto"))
+    await _settle()
+    assert not breakers.allow("nikto")
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert breakers.allow("nikto")
+
+
+def test_tool_profile_from_dict_and_duration_learning():
+    profile = ToolProfile.from_dict({"expected_duration": "600", "max_concurrent": 4})
+    assert profile == ToolProfile(expected_duration=600.0, cpu=1.0, max_concurrent=4)
+
+    scheduler = ExecutionScheduler(
+        FakeBackend(), SchedulerPolicy(duration_alpha=0.5), profiles={"nmap": profile}
+    )
+    assert scheduler.profile("unknown") == ToolProfile()
+    assert scheduler.expected_duration("nmap") == 600.0
+    scheduler.observe_duration("nmap", 200.0)
+    assert scheduler.expected_duration("nmap") == 400.0
+
+
+@pytest.mark.asyncio
+async def test_observed_durations_update_estimates():
+    backend = FakeBackend()
+    backend.gate.set()
+    scheduler = ExecutionScheduler(backend, SchedulerPolicy(duration_alpha=1.0))
+
+    await scheduler.submit("ok", tool="whatweb")
+    await scheduler.submit("fail", tool="nikto")
+    await scheduler.submit("raise", tool="sqlmap")
+
+    # FakeBackend reports 1ms; exceptions say nothing about the tool
+    assert scheduler.expected_duration("whatweb") == 0.001
+    assert scheduler.expected_duration("nikto") == 0.001
+    assert scheduler.expected_duration("sqlmap") == 30.0
+    tools = scheduler.get_metrics()["tools"]
+    assert tools["whatweb"] == {"running": 0, "expected_duration_s": 0.001}
+
+
+@pytest.mark.asyncio
+async def test_tool_concurrency_cap():
+    backend = FakeBackend(capacity=4)
+    scheduler = ExecutionScheduler(backend)
+    scheduler.set_profile("hydra", ToolProfile(max_concurrent=1))
+    tasks = [
+        asyncio.create_task(scheduler.submit("hydra-1", tool="hydra", agent_id="x")),
+        asyncio.create_task(scheduler.submit("hydra-2", tool="hydra", agent_id="y")),
+        asyncio.create_task(scheduler.submit("nmap-1", tool="nmap", agent_id="z")),
+    ]
+    await _settle()
+    assert backend.started == ["hydra-1", "nmap-1"]
+    assert scheduler.get_metrics()["tools"]["hydra"]["running"] == 1
+
+    # Raising the cap dispatches the waiting job at once
+    scheduler.set_profile("hydra", ToolProfile(max_concurrent=2))
+    await _settle()
+    assert backend.started == ["hydra-1", "nmap-1", "hydra-2"]
+    backend.gate.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.get_metrics()["tools"]["hydra"]["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cpu_budget_bounds_running_jobs():
+    backend = FakeBackend(capacity=4)
+    scheduler = ExecutionScheduler(
+        backend,
+        SchedulerPolicy(cpu_budget=2.0),
+        profiles={"masscan": ToolProfile(cpu=3.0), "whatweb": ToolProfile(cpu=0.5)},
+    )
+    tasks = [
+        asyncio.create_task(scheduler.submit("masscan", tool="masscan", agent_id="x")),
+        asyncio.create_task(scheduler.submit("whatweb", tool="whatweb", agent_id="y")),
+    ]
+    await _settle()
+    # An oversized job runs alone rather than never
+    assert backend.started == ["masscan"]
+    assert scheduler.get_metrics()["cpu_in_use"] == 3.0
+
+    backend.gate.set()
+    await asyncio.gather(*tasks)
+    assert backend.started == ["masscan", "whatweb"]
+    assert scheduler.get_metrics()["cpu_in_use"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_fair_queuing_weights_agents_by_cost():
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(
+        backend,
+        profiles={"sqlmap": ToolProfile(expected_duration=900), "whatweb": ToolProfile(expected_duration=5)},
+    )
+    blocker = asyncio.create_task(scheduler.submit("blocker", agent_id="z"))
+    await _settle()
+    tasks = [asyncio.create_task(scheduler.submit(f"sqlmap{i}", tool="sqlmap", agent_id="s")) for i in range(2)]
+    tasks += [asyncio.create_task(scheduler.submit(f"whatweb{i}", tool="whatweb", agent_id="w")) for i in range(3)]
+    await _settle()
+
+    backend.gate.set()
+    await asyncio.gather(blocker, *tasks)
+    # One sqlmap run costs as much as many whatweb runs
+    assert backend.started == ["blocker", "sqlmap0", "whatweb0", "whatweb1", "whatweb2", "sqlmap1"]
+
+
+@pytest.mark.asyncio
+async def test_sjf_admission_runs_short_jobs_first():
+    now = [0.0]
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(
+        backend,
+        SchedulerPolicy(admission="sjf"),
+        clock=lambda: now[0],
+        profiles={"nikto": ToolProfile(expected_duration=300), "whatweb": ToolProfile(expected_duration=5)},
+    )
+    blocker = asyncio.create_task(scheduler.submit("blocker", agent_id="z"))
+    await _settle()
+    tasks = [asyncio.create_task(scheduler.submit("nikto", tool="nikto", agent_id="n"))]
+    await _settle()
+    now[0] = 100.0
+    tasks.append(asyncio.create_task(scheduler.submit("whatweb", tool="whatweb", agent_id="w")))
+    await _settle()
+
+    # Aged by 100s, nikto (300 - 100) still sorts after whatweb (5)
+    backend.gate.set()
+    await asyncio.gather(blocker, *tasks)
+    assert backend.started == ["blocker", "whatweb", "nikto"]
+    assert scheduler.get_metrics()["admission"] == "sjf"
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_is_recorded_per_tool():
+    now = [0.0]
+    backend = FakeBackend(capacity=1)
+    scheduler = ExecutionScheduler(backend, clock=lambda: now[0])
+    first = asyncio.create_task(scheduler.submit("nmap", tool="nmap"))
+    await _settle()
+    second = asyncio.create_task(scheduler.submit("nikto", tool="nikto"))
+    await _settle()
+    now[0] = 2.0
+
+    backend.gate.set()
+    await asyncio.gather(first, second)
+    waits = scheduler.get_metrics()["queue_wait_p95_ms_by_tool"]
+    assert waits == {"nikto": 2000.0, "nmap": 0.0}
+    assert scheduler.metrics.wait_percentile(0.95, "missing") == 0.0
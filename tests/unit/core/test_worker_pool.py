@@ -0,0 +1,230 @@
+"""Tests for WorkerPool command execution over exec channels."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cyberred.core.exceptions import ExecChannelError
+from cyberred.core.exec_channel import ExecResult
+from cyberred.core.worker_pool import WorkerPool
+
+
+@pytest.fixture
+def channel_cls():
+    with patch("cyberred.core.worker_pool.ExecChannel") as cls:
+        channel = cls.return_value
+        channel.alive = True
+        channel.start = AsyncMock()
+        channel.close = AsyncMock()
+        channel.run = AsyncMock(return_value=ExecResult(0, b"80/tcp open", b""))
+        yield cls
+
+
+@pytest.mark.asyncio
+async def test_run_in_docker_reuses_channel(channel_cls):
+    pool = WorkerPool()
+    assert await pool._run_in_docker("w-1", "nmap -p 80 10.0.0.1") == "80/tcp open"
+    assert await pool._run_in_docker("w-1", "whatweb 'http://x y'") == "80/tcp open"
+
+    channel_cls.assert_called_once_with("w-1")
+    channel_cls.return_value.run.assert_awaited_with(
+        ["whatweb", "http://x y"], on_output=None, capture_stdout=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_in_docker_channel_nonzero_exit(channel_cls):
+    channel_cls.return_value.run.return_value = ExecResult(1, b"", b"bad flag")
+    pool = WorkerPool()
+    assert await pool._run_in_docker("w-1", "nmap --bad") == "ERROR: bad flag"
+
+
+@pytest.mark.asyncio
+async def test_run_in_docker_reopens_dead_channel(channel_cls):
+    pool = WorkerPool()
+    await pool._run_in_docker("w-1", "id")
+    channel_cls.return_value.alive = False
+    await pool._run_in_docker("w-1", "id")
+    assert channel_cls.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_in_docker_falls_back_to_docker_exec(channel_cls):
+    channel_cls.return_value.start.side_effect = ExecChannelError("w-1", "no python3")
+    proc = MagicMock(returncode=0)
+    proc.communicate = AsyncMock(return_value=(b"ok", b""))
+    pool = WorkerPool()
+
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn:
+        assert await pool._run_in_docker("w-1", "id") == "ok"
+        assert await pool._run_in_docker("w-1", "id") == "ok"
+
+    # The agent is not retried for a container where it failed
+    assert channel_cls.call_count == 1
+    assert spawn.await_args.args[:3] == ("/usr/bin/docker", "exec", "w-1")
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_channels(channel_cls):
+    pool = WorkerPool()
+    await pool._run_in_docker("w-1", "id")
+    await pool.shutdown()
+    channel_cls.return_value.close.assert_awaited_once()
+    assert pool._channels == {}
+
+
+@pytest.mark.asyncio
+async def test_run_in_docker_streams_without_capturing(channel_cls):
+    channel_cls.return_value.run.return_value = ExecResult(0, b"", b"")
+    on_output = MagicMock()
+    pool = WorkerPool()
+    assert await pool._run_in_docker("w-1", "nuclei -jsonl", on_output=on_output) == ""
+    channel_cls.return_value.run.assert_awaited_with(
+        ["nuclei", "-jsonl"], on_output=on_output, capture_stdout=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_docker_exec_fallback_delivers_output_once(channel_cls):
+    channel_cls.return_value.start.side_effect = ExecChannelError("w-1", "no python3")
+    proc = MagicMock(returncode=0)
+    proc.communicate = AsyncMock(return_value=(b"line 1\nline 2\n", b""))
+    on_output = MagicMock()
+    pool = WorkerPool()
+
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+        assert await pool._run_in_docker("w-1", "id", on_output=on_output) == ""
+
+    on_output.assert_called_once_with("stdout", b"line 1\nline 2\n")
+
+
+def test_worker_pool_is_execution_backend():
+    from cyberred.protocols import ExecutionBackendProtocol
+
+    pool = WorkerPool(pool_size=4)
+    assert isinstance(pool, ExecutionBackendProtocol)
+    assert pool.capacity == 4
+    pool._initialized = True
+    pool.worker_states = {"w-1": "idle", "w-2": "busy"}
+    assert pool.capacity == 2
+
+
+@pytest.mark.asyncio
+async def test_run_returns_tool_result(channel_cls):
+    pool = WorkerPool()
+    pool._initialized = True
+    pool.available_workers.put_nowait("w-1")
+
+    result = await pool.run("nmap -p 80 10.0.0.1", timeout=5)
+
+    assert result.success and result.stdout == "80/tcp open"
+    # Worker goes back to the queue
+    await asyncio.sleep(0)
+    assert pool.available_workers.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_run_initializes_and_reports_no_workers(channel_cls):
+    pool = WorkerPool()
+    with patch.object(pool, "initialize", AsyncMock()) as init:
+        result = await pool.run("id", timeout=0.01)
+    init.assert_awaited()
+    assert result.error_type == "POOL_EXHAUSTED"
+
+
+@pytest.mark.asyncio
+async def test_run_times_out(channel_cls):
+    async def slow(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    channel_cls.return_value.run = slow
+    pool = WorkerPool()
+    pool._initialized = True
+    pool.available_workers.put_nowait("w-1")
+
+    result = await pool.run("sleep 100", timeout=0.05)
+
+    assert result.error_type == "TIMEOUT"
+
+
+@pytest.mark.asyncio
+async def test_run_job_maps_failures(channel_cls):
+    pool = WorkerPool()
+    channel_cls.return_value.run.side_effect = ExecChannelError("w-1", "agent exited")
+    crashed = await pool._run_job("w-1", "id")
+    assert crashed.error_type == "CONTAINER_CRASHED"
+
+    channel_cls.return_value.run.side_effect = OSError("no such file")
+    assert await pool._run_in_docker("w-1", "id") == "ERROR: OS Error no such file"
+
+    channel_cls.return_value.run.side_effect = RuntimeError("boom")
+    failed = await pool._run_job("w-1", "id")
+    assert failed.error_type == "EXECUTION_EXCEPTION"
+    assert failed.stderr == "Exception boom"
+
+
+@pytest.mark.asyncio
+async def test_execute_task_retries_only_transient_failures(channel_cls):
+    from cyberred.core.retry import RetryPolicy
+
+    pool = WorkerPool(retry_policy=RetryPolicy(base_delay=0))
+    pool._initialized = True
+    pool.available_workers.put_nowait("w-1")
+    run = channel_cls.return_value.run
+    resets = []
+
+    # Crashes are transient: retried, then the last error is reported
+    run.side_effect = ExecChannelError("w-1", "agent exited")
+    result = await pool.execute_task("id", "id", retries=2, on_retry=lambda: resets.append(1))
+    assert result.startswith("ERROR: Task failed after 2 attempt(s)")
+    assert run.await_count == 2 and resets == [1]
+
+    # Usage errors fail fast
+    run.reset_mock()
+    run.side_effect = None
+    run.return_value = ExecResult(2, b"", b"nmap: unrecognized option '--bad'")
+    result = await pool.execute_task("nmap --bad", "nmap", retries=3)
+    assert result.startswith("ERROR: Task failed after 1 attempt(s)")
+    assert run.await_count == 1
+
+    # Docker socket permission problems get their own message
+    run.return_value = ExecResult(1, b"", b"dial unix /var/run/docker.sock: permission denied")
+    assert await pool.execute_task("id", "id") == "ERROR: Docker socket permission denied. Run with sudo."
+
+
+@pytest.mark.asyncio
+async def test_execute_task_timeout_is_transient(channel_cls):
+    from cyberred.core.retry import RetryPolicy
+
+    async def slow(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    channel_cls.return_value.run = slow
+    bus = AsyncMock()
+    pool = WorkerPool(event_bus=bus, retry_policy=RetryPolicy(base_delay=0))
+    pool._initialized = True
+    pool.available_workers.put_nowait("w-1")
+
+    result = await pool.execute_task("sleep 100", "sleep", retries=2, timeout=0.01)
+
+    assert result == "ERROR: Task failed after 2 attempt(s). Last error: Timeout after 0.01s"
+    texts = [call.args[1].get("text") for call in bus.publish.await_args_list]
+    assert "[TIMEOUT] Attempt 2/2" in texts
+
+
+@pytest.mark.asyncio
+async def test_execute_task_success_publishes_output(channel_cls):
+    bus = AsyncMock()
+    pool = WorkerPool(event_bus=bus)
+    pool._initialized = True
+    pool.available_workers.put_nowait("w-1")
+
+    assert await pool.execute_task("nmap 10.0.0.1", "nmap") == "80/tcp open"
+    channel_cls.return_value.run.return_value = ExecResult(0, b"x" * 400, b"")
+    assert len(await pool.execute_task("nmap 10.0.0.1", "nmap")) == 400
+
+    texts = [call.args[1].get("text") for call in bus.publish.await_args_list]
+    assert "✓ [nmap] Complete (11 bytes)" in texts
+    assert "80/tcp open" in texts
+    assert "x" * 300 + "... (100 more bytes)" in texts
@@ -396,3 +396,48 @@ def test_make_archive_key_special_chars(mock_redis):
     key = cache._make_archive_key("Apache HTTP Server", "2.4:test")
     assert key == "intel:archive:apache_http_server:2.4_test"
 
+
+
+@pytest.mark.asyncio
+async def test_get_many_one_round_trip(mock_redis):
+    """Test get_many looks up unique pairs with a single MGET."""
+    intel_result = IntelResult(
+        source="test", cve_id="CVE-TEST", severity="high",
+        priority=3, confidence=1.0, exploit_available=True, exploit_path=None
+    )
+    mock_redis.mget = AsyncMock(return_value=[
+        json.dumps({"results": [json.loads(intel_result.to_json())], "cached_at": "2023-10-26T12:00:00Z"}),
+        None,
+        json.dumps([]),
+    ])
+
+    cache = IntelligenceCache(mock_redis)
+    found = await cache.get_many([
+        ("Apache", "2.4.49"), ("OpenSSH", "8.9p1"), ("Apache", "2.4.49"), ("vsftpd", "2.3.4"),
+    ])
+
+    mock_redis.mget.assert_awaited_once_with(
+        "intel:apache:2.4.49", "intel:openssh:8.9p1", "intel:vsftpd:2.3.4")
+    assert found == {("Apache", "2.4.49"): [intel_result], ("OpenSSH", "8.9p1"): None, ("vsftpd", "2.3.4"): []}
+
+
+@pytest.mark.asyncio
+async def test_get_many_bad_entries_are_misses(mock_redis):
+    """Test corrupt entries are deleted and treated as misses."""
+    mock_redis.mget = AsyncMock(return_value=["{not json", json.dumps({"results": [{"bad": 1}]})])
+
+    cache = IntelligenceCache(mock_redis)
+    found = await cache.get_many([("Apache", "2.4.49"), ("nginx", "1.18")])
+
+    assert found == {("Apache", "2.4.49"): None, ("nginx", "1.18"): None}
+    mock_redis.delete.assert_awaited_once_with("intel:apache:2.4.49")
+
+
+@pytest.mark.asyncio
+async def test_get_many_error_and_empty(mock_redis):
+    """Test get_many degrades to misses on Redis errors."""
+    mock_redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+    cache = IntelligenceCache(mock_redis)
+
+    assert await cache.get_many([("Apache", "2.4.49")]) == {("Apache", "2.4.49"): None}
+    assert await cache.get_many([]) == {}
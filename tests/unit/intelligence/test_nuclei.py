@@ -1,3 +1,5 @@
+import itertools
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
@@ -405,8 +407,9 @@ class TestNucleiSourceErrorHandling:
         
         mock_rglob.return_value = []
         
-        # Simulate 5 second build time (> 4.0s threshold)
-        mock_time.side_effect = [0.0, 5.0]
+        # Simulate 5 second build time (> 4.0s threshold); later calls (log
+        # timestamps, when a timestamping structlog config is loaded) see 5.0
+        mock_time.side_effect = itertools.chain([0.0], itertools.repeat(5.0))
         
         # Should complete but log warning internally
         index = source._build_index()
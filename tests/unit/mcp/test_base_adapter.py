@@ -0,0 +1,58 @@
+"""Unit tests for streamed parsing in cyberred.mcp.base_adapter."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from cyberred.core.models import ToolResult
+from cyberred.core.retry import RetryPolicy
+from cyberred.core.scheduler import ExecutionScheduler
+from cyberred.mcp.nuclei_adapter import NucleiAdapter
+
+LINES = [
+    json.dumps({"template-id": "cve-2021-41773", "matched-at": "http://10.0.0.5/cgi-bin/",
+                "info": {"name": "Apache path traversal", "severity": "critical"}}),
+    json.dumps({"template-id": "exposed-panel", "matched-at": "http://10.0.0.5/admin",
+                "info": {"name": "Admin panel", "severity": "high"}}),
+]
+
+
+class FlakyBackend:
+    """Streams one finding and crashes, then streams the full run."""
+
+    backend_name = "flaky"
+    capacity = 1
+
+    def __init__(self):
+        self.attempts = 0
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def run(self, command, timeout, on_output=None):
+        self.attempts += 1
+        if self.attempts == 1:
+            on_output("stdout", (LINES[0] + "\n").encode())
+            return ToolResult(False, "", "connection reset by peer", -1, 1, "CONTAINER_CRASHED")
+        output = "\n".join(LINES) + "\n"
+        on_output("stdout", output.encode())
+        return ToolResult(True, "", "", 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_retried_attempt_does_not_republish_findings():
+    backend = FlakyBackend()
+    scheduler = ExecutionScheduler(backend, retry_policy=RetryPolicy(base_delay=0))
+    bus = AsyncMock()
+    adapter = NucleiAdapter(scheduler, event_bus=bus)
+
+    result = await adapter.execute("http://10.0.0.5")
+
+    published = [c.args[1]["finding"] for c in bus.publish.await_args_list if c.args[0] == "swarm:finding"]
+    assert backend.attempts == 2
+    assert result.success and len(result.findings) == 2
+    assert published == result.findings
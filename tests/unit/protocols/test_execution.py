@@ -0,0 +1,63 @@
+"""Unit tests for ExecutionBackendProtocol.
+
+Tests verify:
+1. Compliant classes pass isinstance() checks
+2. Non-compliant classes fail isinstance() checks
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from cyberred.core.models import ToolResult
+from cyberred.protocols import ExecutionBackendProtocol
+
+
+class CompliantBackend:
+    """A minimal compliant backend for testing."""
+
+    backend_name = "test"
+
+    @property
+    def capacity(self) -> int:
+        return 1
+
+    async def initialize(self) -> None:
+        pass
+
+    async def run(
+        self,
+        command: str,
+        timeout: float,
+        on_output: Optional[Callable[[str, bytes], None]] = None,
+    ) -> ToolResult:
+        return ToolResult(True, command, "", 0, 0)
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class MissingRunBackend:
+    """Backend without run()."""
+
+    backend_name = "broken"
+    capacity = 1
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def test_compliant_backend_passes_isinstance():
+    assert isinstance(CompliantBackend(), ExecutionBackendProtocol)
+
+
+def test_backend_without_run_fails_isinstance():
+    assert not isinstance(MissingRunBackend(), ExecutionBackendProtocol)
+
+
+async def test_compliant_backend_run_returns_tool_result():
+    result = await CompliantBackend().run("id", timeout=1)
+    assert result.success and result.stdout == "id"
@@ -328,3 +328,48 @@ class TestBloodhoundEdgeCases:
         stdout = '''[{"Properties": {"name": "TEST@CORP.LOCAL"}, "ObjectType": "User"}]'''
         findings = bloodhound.bloodhound_parser(stdout, '', 0, agent_id, "corp.local")
         assert findings[0].target == "corp.local"
+
+
+@pytest.mark.unit
+class TestBloodhoundStreaming:
+    """Test streaming (iter_bloodhound_findings) sources and meta ordering."""
+
+    USERS = '{"data": [{"Properties": {"name": "ADMIN@CORP.LOCAL", "admincount": 1}}, {"Properties": {"name": "BOB@CORP.LOCAL"}}], "meta": {"type": "users"}}'
+
+    def test_meta_after_data_from_file(self, agent_id, tmp_path):
+        path = tmp_path / "users.json"
+        path.write_text(self.USERS)
+        with open(path, "rb") as f:
+            findings = list(bloodhound.iter_bloodhound_findings(f, agent_id, "corp.local"))
+        assert [f.evidence for f in findings] == ["AD user: ADMIN@CORP.LOCAL [HIGH VALUE]", "AD user: BOB@CORP.LOCAL"]
+        assert findings[0].severity == "high"
+
+    def test_meta_after_data_from_chunks(self, agent_id):
+        """Unpeekable sources hold "data" items until meta arrives."""
+        chunks = [self.USERS[:40], self.USERS[40:]]
+        findings = list(bloodhound.iter_bloodhound_findings(chunks, agent_id, "corp.local"))
+        assert [f.evidence for f in findings] == ["AD user: ADMIN@CORP.LOCAL [HIGH VALUE]", "AD user: BOB@CORP.LOCAL"]
+
+    def test_meta_before_data(self, agent_id):
+        stdout = '{"meta": {"type": "groups"}, "data": [{"Properties": {"name": "DOMAIN ADMINS@CORP.LOCAL"}}], "extra": 1}'
+        findings = list(bloodhound.iter_bloodhound_findings([stdout], agent_id, "corp.local"))
+        assert findings[0].evidence == "AD group: DOMAIN ADMINS@CORP.LOCAL [HIGH VALUE]"
+
+    def test_meta_without_type(self, agent_id):
+        stdout = '{"data": [{"Properties": {"name": "X@CORP.LOCAL"}}], "meta": {"count": 1}, "data2": []}'
+        findings = list(bloodhound.iter_bloodhound_findings([stdout], agent_id, "corp.local"))
+        assert [f.evidence for f in findings] == ["AD : X@CORP.LOCAL"]
+
+    def test_each_object_array_is_typed_by_its_key(self, agent_id):
+        stdout = '{"users": [{"Properties": {"name": "U@CORP.LOCAL"}}], "computers": [{"Properties": {"name": "DC01.CORP.LOCAL"}}], "gpos": [{"Properties": {"name": "GPO"}}]}'
+        findings = bloodhound.bloodhound_parser(stdout, "", 0, agent_id, "corp.local")
+        assert [f.evidence for f in findings] == ["AD user: U@CORP.LOCAL", "AD computer: DC01.CORP.LOCAL"]
+
+    def test_non_object_list_items_skipped(self, agent_id):
+        findings = bloodhound.bloodhound_parser('[1, {"name": "A@CORP.LOCAL"}]', "", 0, agent_id, "corp.local")
+        assert [f.evidence for f in findings] == ["AD object: A@CORP.LOCAL"]
+
+    def test_truncated_dump_returns_empty(self, agent_id):
+        """As with json.loads, a malformed dump yields no findings."""
+        stdout = self.USERS[:-30]
+        assert bloodhound.bloodhound_parser(stdout, "", 0, agent_id, "corp.local") == []
@@ -68,3 +68,52 @@ def test_create_finding_custom_topic():
     )
     
     assert finding.topic == custom_topic
+
+def test_finding_batch_matches_create_finding():
+    """FindingBatch builds the same fields as create_finding."""
+    agent_id_val = str(uuid.uuid4())
+    batch = common.FindingBatch(agent_id_val, "masscan")
+    finding = batch.create(
+        type_val="open_port",
+        severity="info",
+        target="10.0.0.1",
+        evidence="Port 80/tcp open on 10.0.0.1"
+    )
+    
+    assert isinstance(finding, Finding)
+    assert finding.agent_id == agent_id_val
+    assert finding.tool == "masscan"
+    assert finding.topic == common.generate_topic("10.0.0.1", "open_port")
+    assert finding.timestamp == batch.timestamp
+    assert finding.signature == ""
+    assert UUID(finding.id)
+    # Round-trips through the validating constructor
+    assert Finding.from_json(finding.to_json()) == finding
+
+def test_finding_batch_shares_timestamp_and_topics():
+    """One timestamp per batch; topic hashes reused per target."""
+    batch = common.FindingBatch(str(uuid.uuid4()), "nmap")
+    first = batch.create("open_port", "info", "10.0.0.1", "22/tcp")
+    second = batch.create("nse_script", "info", "10.0.0.1", "ssh-hostkey")
+    other = batch.create("open_port", "info", "10.0.0.2", "80/tcp", topic="my:topic")
+    
+    assert first.timestamp == second.timestamp == other.timestamp
+    assert first.id != second.id
+    assert second.topic == common.generate_topic("10.0.0.1", "nse_script")
+    assert other.topic == "my:topic"
+
+def test_finding_batch_validates_inputs():
+    """FindingBatch rejects what Finding() would reject."""
+    batch = common.FindingBatch(str(uuid.uuid4()), "nmap")
+    with pytest.raises(ValueError, match="Invalid severity"):
+        batch.create("open_port", "bogus", "10.0.0.1", "e")
+    with pytest.raises(ValueError, match="whitespace"):
+        batch.create("open_port", "info", "10.0.0.1 x", "e")
+    # Rejected targets are not cached as valid
+    with pytest.raises(ValueError, match="whitespace"):
+        batch.create("open_port", "info", "10.0.0.1 x", "e")
+    
+    # agent_id is checked on first use, like create_finding
+    bad = common.FindingBatch("not-a-uuid", "nmap")
+    with pytest.raises(ValueError, match="Invalid UUID"):
+        bad.create("open_port", "info", "10.0.0.1", "e")
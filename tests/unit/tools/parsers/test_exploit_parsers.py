@@ -114,6 +114,22 @@ class TestResponderParser:
         findings = responder.responder_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
         assert all(f.severity in ["high", "critical"] for f in findings if f.type == "credential")
 
+    def test_http_basic_and_ldap_cleartext(self, agent_id):
+        stdout = '''[HTTP] Basic Client : 192.168.1.60
+[HTTP] Client : bob : hunter2
+[LDAP] Cleartext Client : 192.168.1.61'''
+        findings = responder.responder_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence for f in findings] == [
+            "[HTTP] Basic Auth captured: Client:192.168.1.60",
+            "[LDAP] Cleartext credential: Client:192.168.1.61",
+        ]
+        assert all(f.severity == "critical" for f in findings)
+
+    def test_http_line_without_basic_falls_through_to_ldap(self, agent_id):
+        stdout = '''[HTTP] relayed to [LDAP] Cleartext svc : Pass1'''
+        findings = responder.responder_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence for f in findings] == ["[LDAP] Cleartext credential: svc:Pass1"]
+
 
 # ============================================================================
 # SECRETSDUMP PARSER TESTS  
@@ -171,6 +187,23 @@ CORP\\DC01$:aes128-cts-hmac-sha1-96:11223344aabbccdd'''
         cred_findings = [f for f in findings if f.type == "credential"]
         assert all(f.severity == "critical" for f in cred_findings)
 
+    def test_sections_label_hashes(self, agent_id):
+        stdout = '''[*] Dumping LSA Secrets
+CORP\\svc_sql:Cleartext: SqlPass1
+[*] Using the DRSUAPI method to get NTDS.DIT secrets
+krbtgt:502:aad3b435b51404eeaad3b435b51404ee:f3bc61e97fb14d18c42bcbf6c3a9055f:::
+[*] Kerberos keys grabbed
+krbtgt:aes256-cts-hmac-sha1-96:b6a43a5c1f7a9b3e
+[*] Cleaning up...
+[*] Dumping local SAM hashes
+Guest:501:aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0:::'''
+        findings = secretsdump.secretsdump_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence for f in findings] == [
+            "[Cleartext] Password: SqlPass1",
+            "[NTDS] krbtgt:f3bc61e97fb14d18c42bcbf6c3a9055f",
+            "[Kerberos] krbtgt AES key",
+        ]
+
 
 # ============================================================================
 # PSEXEC PARSER TESTS
@@ -0,0 +1,121 @@
+"""Unit tests for incremental JSON parsing."""
+import io
+import json
+
+import pytest
+
+from cyberred.tools.parsers import json_stream
+from cyberred.tools.parsers.json_stream import JsonEntry, iter_json_entries, peek_last_member
+
+DOC = {
+    "data": [{"name": "A", "n": 12345}, {"name": "Bé", "ok": True}, [1, 2]],
+    "count": 3,
+    "meta": {"type": "users", "version": 5},
+}
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Force values to span many chunks."""
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", 3)
+
+
+@pytest.mark.unit
+class TestIterJsonEntries:
+
+    def test_object_members_and_array_items(self):
+        entries = list(iter_json_entries(json.dumps(DOC)))
+        assert entries == [
+            JsonEntry("data", {"name": "A", "n": 12345}, True),
+            JsonEntry("data", {"name": "Bé", "ok": True}, True),
+            JsonEntry("data", [1, 2], True),
+            JsonEntry("count", 3, False),
+            JsonEntry("meta", {"type": "users", "version": 5}, False),
+        ]
+
+    def test_top_level_array_and_scalar(self):
+        assert list(iter_json_entries(' [ 1 , "x" ] ')) == [JsonEntry(None, 1, True), JsonEntry(None, "x", True)]
+        assert list(iter_json_entries("[]")) == []
+        assert list(iter_json_entries("{}")) == []
+        assert list(iter_json_entries('{"a": []}')) == []
+        assert list(iter_json_entries("42")) == [JsonEntry(None, 42, False)]
+
+    def test_sources_split_across_chunks(self, small_chunks, tmp_path):
+        """Values, numbers, literals and UTF-8 characters split between chunks."""
+        text = json.dumps(DOC, indent=2, ensure_ascii=False)
+        expected = list(iter_json_entries(json.dumps(DOC)))
+        path = tmp_path / "doc.json"
+        path.write_text(text, encoding="utf-8")
+        data = text.encode("utf-8")
+
+        assert list(iter_json_entries(text)) == expected
+        assert list(iter_json_entries(data)) == expected
+        assert list(iter_json_entries([data[:5], data[5:9], "", data[9:]])) == expected
+        with open(path, "rb") as f:
+            assert list(iter_json_entries(f)) == expected
+        with open(path, encoding="utf-8") as f:
+            assert list(iter_json_entries(f)) == expected
+        assert list(iter_json_entries("1234")) == [JsonEntry(None, 1234, False)]
+
+    def test_truncated_multibyte_tail(self):
+        """An incomplete UTF-8 sequence at the end is decoded on flush."""
+        with pytest.raises(UnicodeDecodeError):
+            list(iter_json_entries([b'"\xc3']))
+
+    @pytest.mark.parametrize("doc", [
+        '{"a": 1 "b": 2}',
+        '{"a": 1,}',
+        '{1: 2}',
+        '[1 2]',
+        '[1, 2] x',
+        '{"a" 1}',
+        '[{"a": 1}, {"b": ',
+        '',
+    ])
+    def test_malformed(self, doc):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_entries(doc))
+
+    def test_entries_before_error_are_yielded(self):
+        entries = iter_json_entries('[{"a": 1}, oops]')
+        assert next(entries) == JsonEntry(None, {"a": 1}, True)
+        with pytest.raises(json.JSONDecodeError):
+            next(entries)
+
+
+@pytest.mark.unit
+class TestPeekLastMember:
+
+    def test_last_member(self):
+        doc = json.dumps(DOC)
+        assert peek_last_member(doc, "meta") == {"type": "users", "version": 5}
+        assert peek_last_member(doc.encode(), "meta") == {"type": "users", "version": 5}
+        assert peek_last_member(doc, "count") is None
+
+    def test_key_inside_values_is_ignored(self):
+        doc = '{"data": [{"meta": 1}, {"x": "\\"meta\\": 2"}], "meta" : {"type": "groups"} }'
+        assert peek_last_member(doc, "meta") == {"type": "groups"}
+        assert peek_last_member('{"data": [{"meta": 1}]}', "meta") is None
+        assert peek_last_member('{"data": [{"meta": [1,}]}', "meta") is None
+        assert peek_last_member('["meta"]', "meta") is None
+
+    def test_seekable_binary_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(json_stream, "TAIL_SIZE", 40)
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(DOC))
+        with open(path, "rb") as f:
+            f.read(2)
+            assert peek_last_member(f, "meta") == {"type": "users", "version": 5}
+            assert f.tell() == 2
+
+    def test_unpeekable_sources(self, tmp_path):
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(DOC))
+        with open(path) as f:
+            assert peek_last_member(f, "meta") is None
+        assert peek_last_member(NonSeekable(), "meta") is None
+
+
+class NonSeekable(io.RawIOBase):
+    def seekable(self):
+        return False
@@ -165,3 +165,17 @@ Discovered open port 22/tcp on 192.168.1.2
         
         assert len(findings) == 1
         assert "udp" in findings[0].evidence.lower()
+
+    def test_masscan_truncated_json_falls_back_to_stdout(self):
+        """A JSON array cut off mid-record is re-read with the stdout regex."""
+        stdout = '[\n{"ip": "10.0.0.1", "ports": [{"port": 80\nDiscovered open port 22/tcp on 10.0.0.2\n'
+        findings = masscan.masscan_parser(stdout, '', 0, str(uuid.uuid4()), "10.0.0.0/24")
+
+        assert [f.target for f in findings] == ["10.0.0.2"]
+
+    def test_masscan_json_port_without_number_skipped(self):
+        """Port records without a port number yield no finding."""
+        stdout = '[{"ip": "10.0.0.1", "ports": [{"proto": "tcp"}, {"port": 443}]}]'
+        findings = masscan.masscan_parser(stdout, '', 0, str(uuid.uuid4()), "10.0.0.1")
+
+        assert [f.evidence for f in findings] == ["Port 443/tcp open on 10.0.0.1"]
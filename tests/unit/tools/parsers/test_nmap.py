@@ -463,3 +463,67 @@ Host: 192.168.1.100 ()	Status:
         host_findings = [f for f in findings if f.type == "host_status"]
         assert len(host_findings) == 0
 
+
+
+SCAN_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<nmaprun scanner="nmap">
+  <scaninfo type="syn" protocol="tcp" numservices="1000"/>
+  <taskprogress task="SYN Stealth Scan" percent="50.00"/>
+  <host>
+    <status state="up"/>
+    <address addr="10.0.0.1" addrtype="ipv4"/>
+    <ports><port protocol="tcp" portid="22"><state state="open"/><service name="ssh"/></port></ports>
+  </host>
+  <host>
+    <status state="up"/>
+    <address addr="10.0.0.2" addrtype="ipv4"/>
+    <ports><port protocol="tcp" portid="80"><state state="open"/><service name="http"/></port></ports>
+  </host>
+  <runstats><finished time="1"/></runstats>
+</nmaprun>
+"""
+
+
+@pytest.mark.unit
+class TestNmapStreaming:
+    """Incremental XML parsing shared by the parser, stream and adapter."""
+
+    def test_elements_from_str_bytes_files_and_chunks(self, tmp_path, monkeypatch):
+        import io
+        from cyberred.tools.parsers import nmap as nmap_module
+        from cyberred.tools.parsers.nmap import iter_nmap_elements
+
+        monkeypatch.setattr(nmap_module, "CHUNK_SIZE", 7)
+        path = tmp_path / "scan.xml"
+        path.write_text(SCAN_XML)
+        expected = ["scaninfo", "taskprogress", "host", "host", "runstats"]
+        sources = [
+            SCAN_XML,
+            SCAN_XML.encode(),
+            io.StringIO(SCAN_XML),
+            iter(SCAN_XML.splitlines(keepends=True)),
+        ]
+        for source in sources:
+            assert [e.tag for e in iter_nmap_elements(source)] == expected
+        with open(path, "rb") as f:
+            assert [e.tag for e in iter_nmap_elements(f)] == expected
+
+    def test_completed_elements_are_detached(self):
+        from cyberred.tools.parsers.nmap import NmapXmlStream
+
+        stream = NmapXmlStream()
+        head, tail = SCAN_XML.split("<runstats>")
+        hosts = [e for e in stream.feed(head) if e.tag == "host"]
+        assert [h.find("address").get("addr") for h in hosts] == ["10.0.0.1", "10.0.0.2"]
+        assert len(stream._root) == 0
+        assert [e.tag for e in stream.feed("<runstats>" + tail) + stream.close()] == ["runstats"]
+
+    def test_truncated_xml_keeps_completed_hosts(self):
+        uuid_str = "00000000-0000-0000-0000-000000000001"
+        truncated = SCAN_XML[:SCAN_XML.index("<host>", SCAN_XML.index("10.0.0.1"))]
+
+        findings = nmap_parser(truncated, "", 0, uuid_str, "10.0.0.0/24")
+
+        assert [(f.type, f.target) for f in findings] == [
+            ("host_status", "10.0.0.1"), ("open_port", "10.0.0.1")
+        ]
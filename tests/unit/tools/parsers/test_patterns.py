@@ -0,0 +1,97 @@
+"""Unit tests for precompiled line rule tables."""
+import re
+
+import pytest
+
+from cyberred.tools.parsers.patterns import PatternSet, RuleMatch, strip_ansi
+
+RULES = [
+    ("suid", r'(SUID|sgid).*?(/\S+)'),
+    ("cve", r'CVE-\d{4}-\d+'),
+    ("anchored", r'^(\w+):(\d+):'),
+    ("basic", r'^(?=.*(?-i:Basic)).*?\[HTTP\]\s*(\S+)'),
+]
+
+
+def search_loop(rules, line, flags):
+    """What the parsers did before: re.search each rule in turn."""
+    for index, (rule, pattern) in enumerate(rules):
+        m = re.search(pattern, line, flags)
+        if m:
+            return RuleMatch(rule, index, m.group(0), m.groups())
+    return None
+
+
+@pytest.mark.unit
+class TestPatternSet:
+
+    @pytest.mark.parametrize("line", [
+        "SUID binary /usr/bin/find CVE-2021-3156",
+        "CVE-2021-3156 before sgid /usr/bin/x",
+        "nothing here",
+        "admin:500: also CVE-2020-1234",
+        "admin:500:",
+        "  admin:500:",
+        "[HTTP] basic user",
+        "[HTTP] Basic user",
+        "[http] alice Basic",
+    ])
+    def test_same_answer_as_search_loop(self, line):
+        """First matching rule, its leftmost match and its own groups."""
+        patterns = PatternSet("test", RULES, flags=re.IGNORECASE)
+        assert patterns.match(line) == search_loop(RULES, line, re.IGNORECASE)
+
+    def test_match_from_later_rule(self):
+        """start skips higher-priority rules (fall-through on a matched line)."""
+        patterns = PatternSet("test", RULES, flags=re.IGNORECASE)
+        line = "SUID /usr/bin/find CVE-2021-3156"
+
+        first = patterns.match(line)
+        second = patterns.match(line, first.index + 1)
+
+        assert (first.rule, second.rule) == ("suid", "cve")
+        assert second == RuleMatch("cve", 1, "CVE-2021-3156", ())
+        assert patterns.match(line, second.index + 1) is None
+        assert patterns.match(line, len(RULES)) is None
+
+    def test_scan_strips_lines_and_counts_hits(self):
+        patterns = PatternSet("test", RULES)
+        text = "  SUID /bin/su  \r\n\n   \nCVE-2021-1\nnoise\nCVE-2022-2\n"
+
+        assert list(patterns.scan(text)) == [
+            ("SUID /bin/su", RuleMatch("suid", 0, "SUID /bin/su", ("SUID", "/bin/su"))),
+            ("CVE-2021-1", RuleMatch("cve", 1, "CVE-2021-1", ())),
+            ("CVE-2022-2", RuleMatch("cve", 1, "CVE-2022-2", ())),
+        ]
+        assert patterns.hits() == {"suid": 1, "cve": 2, "anchored": 0, "basic": 0}
+
+    def test_hit_spanning_lines_does_not_hide_next_line(self):
+        """Over the whole output, [^:]+ runs from "abc" into the next line."""
+        patterns = PatternSet("test", [("user", r'^([^:]+):')])
+
+        assert list(patterns.scan("abc\ndef:1\n")) == [
+            ("def:1", RuleMatch("user", 0, "def:", ("def",))),
+        ]
+
+    def test_hits_recorded_when_scan_stops_early(self):
+        patterns = PatternSet("test", RULES)
+        scan = patterns.scan("CVE-2021-1\nCVE-2021-2\n")
+        next(scan)
+        scan.close()
+
+        assert patterns.hits()["cve"] == 1
+
+    @pytest.mark.parametrize("rules, error", [
+        ([], ValueError),
+        ([("a", "x"), ("a", "y")], ValueError),
+        ([("a", "(")], re.error),
+    ])
+    def test_invalid_tables(self, rules, error):
+        with pytest.raises(error):
+            PatternSet("test", rules)
+
+
+@pytest.mark.unit
+def test_strip_ansi():
+    assert strip_ansi("\x1b[1;31mSUID\x1b[0m /bin/su\x1bM") == "SUID /bin/su"
+
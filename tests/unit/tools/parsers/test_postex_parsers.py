@@ -162,6 +162,22 @@ class TestLinpeasParser:
         # Parser may or may not detect this specific format
         assert isinstance(findings, list)
 
+    def test_section_headers_skipped(self, agent_id):
+        stdout = '''[+] SUID - Check easy privesc /usr/bin/find
+=== Writable folders /tmp
+# cap_setuid /usr/bin/python3
+drwxrwxrwt root writable /var/tmp'''
+        findings = linpeas.linpeas_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence for f in findings] == ["Writable path: drwxrwxrwt root writable /var/tmp"]
+
+    def test_repeated_vector_falls_through_to_next(self, agent_id):
+        """A line whose first vector was already reported is checked for the others."""
+        stdout = '''SUID /usr/bin/find writable /tmp
+SUID /usr/bin/find writable /tmp
+SUID /usr/bin/find writable /tmp'''
+        findings = linpeas.linpeas_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence.split(":")[0] for f in findings] == ["SUID/SGID binary", "Writable path"]
+
 
 # ============================================================================
 # WINPEAS PARSER TESTS
@@ -209,6 +225,13 @@ DefaultPassword: AdminPassword123!'''
         assert len(findings) >= 1
         assert not any("\x1b" in f.evidence for f in findings)
 
+    def test_repeated_line_falls_through_to_next_vector(self, agent_id):
+        stdout = '''SeImpersonatePrivilege: UAC disabled
+SeImpersonatePrivilege: UAC disabled
+SeImpersonatePrivilege: UAC disabled'''
+        findings = winpeas.winpeas_parser(stdout=stdout, stderr='', exit_code=0, agent_id=agent_id, target="192.168.1.1")
+        assert [f.evidence.split(":")[0] for f in findings] == ["Token impersonation", "UAC vulnerability"]
+
 
 # ============================================================================
 # LAZAGNE PARSER TESTS
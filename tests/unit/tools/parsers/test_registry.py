@@ -0,0 +1,128 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import cyberred.tools.parsers as parsers
+from cyberred.tools.parsers.registry import (
+    BUILTIN_PARSERS,
+    ParserRegistry,
+    RegisteredParser,
+    load_builtin,
+)
+
+AGENT_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def base_parser(stdout, stderr, exit_code, agent_id, target):
+    return ["base"]
+
+
+def error_parser(stdout, stderr, exit_code, agent_id, target, error_type=None):
+    return [error_type]
+
+
+def test_registered_parser_calling_convention():
+    """error_type is passed only to parsers that accept it."""
+    assert RegisteredParser.wrap(base_parser).takes_error_type is False
+    assert RegisteredParser.wrap(error_parser).takes_error_type is True
+    assert RegisteredParser.wrap(base_parser)("", "", 0, AGENT_ID, "t", error_type="TIMEOUT") == ["base"]
+    assert RegisteredParser.wrap(error_parser)("", "", 0, AGENT_ID, "t", error_type="TIMEOUT") == ["TIMEOUT"]
+
+
+def test_registered_parser_without_signature():
+    """Callables without an introspectable signature use the base convention."""
+    class Opaque:
+        @property
+        def __signature__(self):
+            raise ValueError("no signature")
+
+        def __call__(self, *args):
+            return list(args)
+
+    parser = RegisteredParser.wrap(Opaque())
+    assert parser.takes_error_type is False
+    assert parser("o", "e", 0, AGENT_ID, "t", error_type="TIMEOUT") == ["o", "e", 0, AGENT_ID, "t"]
+
+
+def test_builtins_loaded_on_first_get():
+    """Built-in parsers are imported and cached on first lookup."""
+    registry = ParserRegistry(builtins=True)
+    assert registry.loaded() == []
+    assert "john" in registry.available()
+
+    parser = registry.get("NMAP")
+
+    assert parser.fn is parsers.nmap_parser
+    assert registry.get("nmap") is parser
+    assert registry.loaded() == ["nmap"]
+
+
+def test_builtins_disabled_by_default():
+    """Without builtins only registered parsers resolve."""
+    registry = ParserRegistry()
+    assert registry.get("nmap") is None
+    assert registry.available() == []
+
+
+def test_register_overrides_and_unregister_falls_back():
+    """A registered parser shadows the built-in until unregistered."""
+    registry = ParserRegistry(builtins=True)
+    registry.register("Nmap", base_parser)
+    assert registry.get("nmap").fn is base_parser
+
+    assert registry.unregister("nmap") is True
+    assert registry.unregister("nmap") is False
+    assert registry.get("nmap").fn is parsers.nmap_parser
+
+
+def test_register_swaps_map_atomically():
+    """Writers replace the map; a snapshot taken before stays unchanged."""
+    registry = ParserRegistry()
+    registry.register("tool", base_parser)
+    before = registry._parsers
+
+    registry.register("tool", error_parser)
+
+    assert before["tool"].fn is base_parser
+    assert registry.get("tool").fn is error_parser
+
+
+def test_first_get_rechecks_under_lock():
+    """A parser registered while a lookup waited for the lock wins."""
+    registry = ParserRegistry(builtins=True)
+    results = []
+    with registry._lock:
+        thread = threading.Thread(target=lambda: results.append(registry.get("hydra")))
+        thread.start()
+        thread.join(timeout=0.2)  # blocked on the lock after its miss
+        registry.register("hydra", base_parser)
+    thread.join()
+
+    assert results[0].fn is base_parser
+
+
+def test_every_builtin_resolves():
+    """Each BUILTIN_PARSERS entry names a module with a <module>_parser."""
+    for module in BUILTIN_PARSERS.values():
+        assert callable(load_builtin(module))
+
+
+def test_package_exports_are_lazy():
+    """Package attributes resolve to parser functions on access."""
+    assert parsers.hashcat_parser is load_builtin("hashcat")
+    assert "wifite_parser" in dir(parsers)
+    with pytest.raises(AttributeError):
+        parsers.not_a_parser
+
+
+def test_output_import_skips_unused_parsers():
+    """Importing the output pipeline does not import wireless/credential parsers."""
+    code = (
+        "import sys, cyberred.tools.output; "
+        "print(sorted(m for m in sys.modules if m.startswith('cyberred.tools.parsers.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    for module in ("aircrack", "wifite", "john", "hashcat", "mimikatz", "lazagne"):
+        assert f"cyberred.tools.parsers.{module}'" not in out
@@ -0,0 +1,176 @@
+"""Unit tests for the line-oriented streaming parsers."""
+import json
+import uuid
+
+import pytest
+
+from cyberred.tools.parsers import ffuf, gobuster, masscan, nmap, nuclei
+from cyberred.tools.parsers.stream import (
+    STREAM_PARSERS,
+    FfufLineParser,
+    GobusterLineParser,
+    LineParser,
+    NmapLineParser,
+    MasscanLineParser,
+    NucleiLineParser,
+    get_line_parser,
+)
+
+AGENT_ID = str(uuid.uuid4())
+TARGET = "example.com"
+
+
+def _stream(parser: LineParser, stdout: str):
+    findings = []
+    for line in stdout.split("\n"):
+        findings.extend(parser.feed(line))
+    findings.extend(parser.finish())
+    return findings
+
+
+def _key(findings):
+    return [(f.type, f.severity, f.evidence) for f in findings]
+
+
+NMAP_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<nmaprun scanner="nmap">
+  <host>
+    <status state="up"/>
+    <address addr="10.0.0.1" addrtype="ipv4"/>
+    <ports><port protocol="tcp" portid="22"><state state="open"/><service name="ssh"/></port></ports>
+  </host>
+  <host>
+    <status state="up"/>
+    <address addr="10.0.0.2" addrtype="ipv4"/>
+    <ports><port protocol="tcp" portid="80"><state state="open"/><service name="http"/></port></ports>
+  </host>
+  <runstats><finished time="1"/></runstats>
+</nmaprun>
+"""
+
+
+NUCLEI_JSONL = "\n".join(json.dumps(r) for r in [
+    {"template-id": "CVE-2021-44228", "info": {"name": "Log4Shell", "severity": "critical",
+     "classification": {"cve-id": ["CVE-2021-44228"]}, "tags": ["cve", "rce"]},
+     "matched-at": "http://example.com/api", "host": "http://example.com"},
+    {"template-id": "apache-detect", "info": {"name": "Apache", "severity": "info", "tags": ["tech"]},
+     "matched-at": "http://example.com", "host": "http://example.com"},
+])
+
+
+@pytest.mark.unit
+class TestStreamParsers:
+    """Streamed parsing yields the same findings as the batch parsers."""
+
+    def test_nuclei_jsonl_matches_batch(self):
+        batch = nuclei.nuclei_parser(NUCLEI_JSONL, "", 0, AGENT_ID, TARGET)
+        streamed = _stream(NucleiLineParser(AGENT_ID, TARGET), NUCLEI_JSONL)
+        assert len(streamed) == 2
+        assert _key(streamed) == _key(batch)
+
+    def test_nuclei_skips_broken_json_line(self):
+        parser = NucleiLineParser(AGENT_ID, TARGET)
+        lines = NUCLEI_JSONL.split("\n")
+        assert len(parser.feed(lines[0])) == 1
+        assert parser.feed("{not json}") == []
+        assert parser.feed("   ") == []
+        assert len(parser.feed(lines[1])) == 1
+
+    def test_nuclei_plain_text_matches_batch(self):
+        stdout = (
+            "[CVE-2021-41773] [http] [critical] http://example.com/cgi-bin/\n"
+            "[INF] status line\n"
+            "[tech-detect:nginx] [http] [info] http://example.com"
+        )
+        batch = nuclei.nuclei_parser(stdout, "", 0, AGENT_ID, TARGET)
+        streamed = _stream(NucleiLineParser(AGENT_ID, TARGET), stdout)
+        assert _key(streamed) == _key(batch)
+
+    def test_masscan_stdout_matches_batch(self):
+        stdout = (
+            "Starting masscan\n"
+            "Discovered open port 80/tcp on 10.0.0.1\n"
+            "Discovered open port 443/tcp on 10.0.0.2"
+        )
+        batch = masscan.masscan_parser(stdout, "", 0, AGENT_ID, TARGET)
+        streamed = _stream(MasscanLineParser(AGENT_ID, TARGET), stdout)
+        assert len(streamed) == 2
+        assert _key(streamed) == _key(batch)
+
+    def test_masscan_json_records_match_batch(self):
+        entries = [
+            {"ip": "10.0.0.1", "ports": [{"port": 80, "proto": "tcp", "status": "open"}]},
+            {"ip": "10.0.0.2", "ports": [{"port": 22, "proto": "tcp", "status": "open"}]},
+        ]
+        # masscan -oJ: one record per line, comma separated inside [ ]
+        stdout = "[\n" + ",\n".join(json.dumps(e) for e in entries) + "\n]"
+        batch = masscan.masscan_parser(stdout, "", 0, AGENT_ID, TARGET)
+        streamed = _stream(MasscanLineParser(AGENT_ID, TARGET), stdout)
+        assert len(streamed) == 2
+        assert _key(streamed) == _key(batch)
+
+    def test_masscan_non_record_lines_are_skipped(self):
+        parser = MasscanLineParser(AGENT_ID, TARGET)
+        assert parser.feed("{broken") == []
+        assert parser.feed('["not", "a", "record"]') == []
+
+    def test_gobuster_matches_batch(self):
+        dir_out = "/admin (Status: 200) [Size: 1234]\n/backup/ (Status: 301) [Size: 456]\nProgress: 100"
+        dns_out = "Found: mail.example.com\nFound: dev.example.com"
+        for stdout in (dir_out, dns_out):
+            batch = gobuster.gobuster_parser(stdout, "", 0, AGENT_ID, TARGET)
+            streamed = _stream(GobusterLineParser(AGENT_ID, TARGET), stdout)
+            assert len(streamed) == 2
+            assert _key(streamed) == _key(batch)
+
+    def test_ffuf_json_lines_match_batch(self):
+        results = [
+            {"url": "http://example.com/admin", "status": 200, "length": 10, "words": 1, "lines": 1},
+            {"url": "http://example.com/.git", "status": 403, "length": 5, "words": 1, "lines": 1},
+        ]
+        batch = ffuf.ffuf_parser(json.dumps({"results": results}), AGENT_ID, TARGET)
+        streamed = _stream(
+            FfufLineParser(AGENT_ID, TARGET),
+            "banner\n" + "\n".join(json.dumps(r) for r in results) + "\n{broken",
+        )
+        assert _key(streamed) == _key(batch)
+
+    def test_ffuf_whole_document_on_one_line(self):
+        doc = json.dumps({"results": [{"url": "http://example.com/a", "status": 200}], "config": {}})
+        assert len(FfufLineParser(AGENT_ID, TARGET).feed(doc)) == 1
+
+    def test_nmap_xml_hosts_match_batch(self):
+        parser = NmapLineParser(AGENT_ID, TARGET)
+        lines = NMAP_XML.split("\n")
+        # Findings of a host arrive with the line that closes it
+        first_host_end = lines.index("  </host>")
+        emitted = [parser.feed(line) for line in ["", *lines[:first_host_end + 1]]]
+        assert _key(emitted[-1]) == [("host_status", "info", "Host is up"),
+                                     ("open_port", "info", "22/tcp open ssh")]
+        assert not any(emitted[:-1])
+
+        batch = nmap.nmap_parser(NMAP_XML, "", 0, AGENT_ID, TARGET)
+        assert _key(_stream(NmapLineParser(AGENT_ID, TARGET), NMAP_XML)) == _key(batch)
+
+    def test_nmap_grepable_and_malformed_xml(self):
+        grepable = "# Nmap 7.94 scan\nHost: 10.0.0.1 ()\tPorts: 22/open/tcp//ssh//\n# Nmap done"
+        assert _key(_stream(NmapLineParser(AGENT_ID, TARGET), grepable)) == [
+            ("open_port", "info", "22/tcp open ssh")
+        ]
+
+        parser = NmapLineParser(AGENT_ID, TARGET)
+        assert parser.feed("<nmaprun><host></nmaprun>") == []
+        assert parser.feed("<host/>") == [] and parser.finish() == []
+
+        # Output cut short: the unfinished host is dropped at finish()
+        truncated = NMAP_XML[:NMAP_XML.index("<runstats>")]
+        assert len(_stream(NmapLineParser(AGENT_ID, TARGET), truncated)) == 4
+
+    def test_registry(self):
+        assert set(STREAM_PARSERS) == {"nuclei", "masscan", "gobuster", "ffuf", "nmap"}
+        assert isinstance(get_line_parser("Nuclei", AGENT_ID, TARGET), NucleiLineParser)
+        assert get_line_parser("sqlmap", AGENT_ID, TARGET) is None
+
+    def test_base_class_requires_feed(self):
+        with pytest.raises(TypeError):
+            LineParser(AGENT_ID, TARGET)
@@ -0,0 +1,199 @@
+"""Unit tests for cyberred.tools.command_parser module.
+
+The tokenizer replaces shlex.split() in the scope hard gate, so its word
+splitting is checked against shlex on a generated corpus, and its
+injection rules against the original per-context checks.
+"""
+
+import random
+import shlex
+from pathlib import Path
+
+import pytest
+
+from cyberred.core.exceptions import ScopeViolationError
+from cyberred.tools.command_parser import (
+    ArgumentSchema,
+    is_host_like,
+    load_argument_schemas,
+    parse_command,
+    parse_port_spec,
+    tokenize,
+)
+
+MANIFEST = Path(__file__).resolve().parents[3] / "tools" / "manifest.yaml"
+
+
+class TestTokenize:
+    """Tests for the single-pass tokenizer."""
+
+    @pytest.mark.parametrize("command", [
+        "nmap -sV 192.168.1.1",
+        "  nmap   -p 80  ",
+        "echo 'single quoted; | &'",
+        'echo "double quoted; | &"',
+        'echo "escaped \\" quote" and\\ space',
+        'echo "keep \\n backslash"',
+        "echo a'b'\"c\"d",
+        "echo '' \"\"",
+        "",
+    ])
+    def test_matches_shlex(self, command):
+        assert tokenize(command) == shlex.split(command)
+
+    def test_matches_shlex_on_generated_corpus(self):
+        rng = random.Random(29)
+        alphabet = ["a", "b", "1", ".", "-", " ", "\t", "'", '"', "\\", ":", "/"]
+        checked = 0
+        for _ in range(3000):
+            command = "".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 20)))
+            try:
+                expected = shlex.split(command)
+            except ValueError:
+                with pytest.raises(ScopeViolationError) as exc:
+                    tokenize(command)
+                assert exc.value.scope_rule == "parse_error"
+                continue
+            assert tokenize(command) == expected
+            checked += 1
+        assert checked > 100
+
+    @pytest.mark.parametrize("command,rule", [
+        ("nmap 1.1.1.1; id", "injection_unquoted_;"),
+        ("nmap 1.1.1.1 | nc", "injection_unquoted_|"),
+        ("nmap $(id)", "injection_unquoted_$"),
+        ("nmap `id`", "injection_unquoted_`"),
+        ('nmap "$HOME"', "injection_dollar_double_quote"),
+        ('nmap "`id`"', "injection_backtick_double_quote"),
+    ])
+    def test_injection_rules(self, command, rule):
+        with pytest.raises(ScopeViolationError) as exc:
+            tokenize(command)
+        assert exc.value.scope_rule == rule
+
+    def test_single_quotes_and_escapes_are_safe(self):
+        assert tokenize("echo '$(id); `x`' \\;") == ["echo", "$(id); `x`", ";"]
+
+    def test_parse_error_beats_injection(self):
+        with pytest.raises(ScopeViolationError) as exc:
+            tokenize("nmap ; 'unterminated")
+        assert exc.value.scope_rule == "parse_error"
+
+    def test_trailing_backslash(self):
+        for command in ("nmap \\", 'nmap "\\'):
+            with pytest.raises(ScopeViolationError) as exc:
+                tokenize(command)
+            assert exc.value.scope_rule == "parse_error"
+
+
+class TestParsePortSpec:
+    """Tests for port spec parsing."""
+
+    def test_lists_ranges_and_protocol_prefixes(self):
+        assert parse_port_spec("80,443,8000-8100,U:53,T:22,bogus") == [
+            (80, 80), (443, 443), (8000, 8100), (53, 53), (22, 22),
+        ]
+
+
+class TestParseCommand:
+    """Tests for schema-driven target extraction."""
+
+    @pytest.fixture
+    def schemas(self):
+        return {
+            "nmap": ArgumentSchema(
+                port_flags=frozenset({"-p"}),
+                value_flags=frozenset({"-oX", "--script"}),
+            ),
+            "gobuster": ArgumentSchema(
+                target_flags=frozenset({"-u", "--url"}),
+                value_flags=frozenset({"-w"}),
+            ),
+        }
+
+    def test_all_targets_and_ports(self, schemas):
+        parsed = parse_command(
+            "/usr/bin/nmap -p 22,1-1000 -oX out.xml --script vuln 10.0.0.1 10.0.0.2 host.example.com",
+            schemas,
+        )
+        assert parsed.tool == "nmap"
+        assert parsed.targets == ["10.0.0.1", "10.0.0.2", "host.example.com"]
+        assert parsed.ports == [(22, 22), (1, 1000)]
+
+    def test_without_schema_short_flag_values_are_not_hosts(self):
+        parsed = parse_command("nmap -sV -oX out.xml 10.0.0.1")
+        assert parsed.targets == ["10.0.0.1"]
+        assert parse_command("ping -c 4 10.0.0.1").targets == ["10.0.0.1"]
+        assert parse_command("hydra -P rockyou.txt ssh://10.0.0.1").targets == ["10.0.0.1"]
+
+    def test_host_like_flag_values_are_still_targets(self):
+        assert parse_command("nmap -sV evil.example.org").targets == ["evil.example.org"]
+        assert parse_command("curl -x 10.0.0.9:3128 http://10.0.0.1/").targets == ["10.0.0.9", "10.0.0.1"]
+
+    @pytest.mark.parametrize("word, host", [
+        ("10.0.0.1", True), ("10.0.0.0/8", True), ("fe80::1", True), ("[::1]", False),
+        ("app.example.com", True), ("example.com:8443", True), ("example.com/path", True),
+        ("0x7f.1", True), ("10.0.0.999", True), ("smb://fileserver", True),
+        ("4", False), ("abc", False), ("out.xml", False), ("rockyou.txt", False),
+        ("scan.gnmap", False), ("a..b", False), ("user=admin", False),
+    ])
+    def test_is_host_like(self, word, host):
+        assert is_host_like(word) is host
+
+    def test_command_wrappers_are_skipped(self, schemas):
+        parsed = parse_command("sudo -E /usr/bin/nmap -oX scan 10.0.0.1", schemas)
+        assert parsed.tool == "nmap"
+        assert parsed.targets == ["10.0.0.1"]
+        assert parse_command("proxychains4 curl http://10.0.0.1/").tool == "curl"
+        assert parse_command("sudo").tool == "sudo"
+
+    def test_schema_target_flag_with_inline_value(self, schemas):
+        parsed = parse_command(
+            "gobuster dir --url=http://app.example.com:8080/ -w words.txt -u internal", schemas
+        )
+        assert parsed.targets == ["app.example.com", "internal"]
+        assert parsed.ports == [(8080, 8080)]
+
+    def test_default_u_flag_requires_url(self):
+        assert parse_command("tool -u admin").targets == []
+        assert parse_command("tool -u tcp://10.0.0.1:25").protocol == "tcp"
+
+    def test_host_port_and_missing_flag_value(self):
+        parsed = parse_command("nc example.com:4444 -p")
+        assert parsed.targets == ["example.com"]
+        assert parsed.ports == [(4444, 4444)]
+
+    def test_unknown_long_flag_swallows_short_value(self):
+        parsed = parse_command("tool --threads 10 --mode abc.example.com")
+        assert parsed.targets == ["abc.example.com"]
+
+    def test_url_without_host(self):
+        assert parse_command("curl http://").targets == []
+
+    def test_empty_command(self):
+        assert parse_command("").targets == []
+
+
+class TestLoadArgumentSchemas:
+    """Tests for manifest schema loading."""
+
+    def test_shipped_manifest(self):
+        schemas = load_argument_schemas(MANIFEST)
+        assert "-p" in schemas["nmap"].port_flags
+        assert "-oX" in schemas["nmap"].value_flags
+        assert "-u" in schemas["sqlmap"].target_flags
+
+    def test_tools_without_arguments_are_skipped(self, tmp_path):
+        p = tmp_path / "manifest.yaml"
+        p.write_text(
+            "categories:\n"
+            "  recon:\n"
+            "    tools:\n"
+            "      - name: whois\n"
+            "      - name: ffuf\n"
+            "        arguments:\n"
+            "          target_flags: [-u]\n"
+        )
+        schemas = load_argument_schemas(p)
+        assert set(schemas) == {"ffuf"}
+        assert schemas["ffuf"] == ArgumentSchema(target_flags=frozenset({"-u"}))
@@ -0,0 +1,110 @@
+from cyberred.tools.compaction import (
+    CHARS_PER_TOKEN,
+    MAX_LINE_CHARS,
+    REPEAT_KEEP,
+    SEGMENT_LINES,
+    compact,
+    estimate_tokens,
+    line_score,
+)
+
+
+def test_estimate_tokens_rounds_up():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a") == 1
+    assert estimate_tokens("a" * (CHARS_PER_TOKEN * 3)) == 3
+
+
+def test_line_score_weights_security_signals():
+    assert line_score("Starting scan at 10:00") == 0
+    assert line_score("CVE-2021-44228 vulnerable") == 10
+    assert line_score("22/tcp open ssh") > line_score("10.0.0.5")
+
+
+def test_empty_output():
+    result = compact("", 100)
+
+    assert result.text == ""
+    assert (result.chars_in, result.lines_in, result.lines_kept) == (0, 0, 0)
+
+
+def test_small_output_is_only_cleaned():
+    """Output that fits keeps every line, minus ANSI codes."""
+    text = "\x1b[1;32m[+] host up\x1b[0m\n  22/tcp open  ssh  \n\nscan done\x07"
+    result = compact(text, 100)
+
+    assert result.text == "[+] host up\n22/tcp open  ssh\nscan done"
+    assert result.lines_in == 4
+    assert result.lines_kept == 3
+
+
+def test_carriage_return_redraws_keep_last_state():
+    text = "loading   \rloading.  \rready\r\nresult: ok\r\n"
+    assert compact(text, 100).text == "ready\nresult: ok"
+
+
+def test_drops_progress_lines():
+    text = "\n".join([
+        "Stats: 0:00:05 elapsed; 0 hosts completed",
+        "SYN Stealth Scan Timing: About 45.20% done; ETC: 10:01",
+        ":: Progress: [120/4614] :: Job [1/1] :: 40 req/sec ::",
+        "[STATUS] 64.00 tries/min, 64 tries in 00:01h",
+        "[##########..........]",
+        " 73% ",
+        "Remaining time ETA 00:12",
+        "80/tcp open http",
+        "see /etc/passwd and 100% of hosts",
+    ])
+    assert compact(text, 100).text == "80/tcp open http\nsee /etc/passwd and 100% of hosts"
+
+
+def test_collapses_runs_of_near_identical_lines():
+    lines = [f"Trying payload {i} hash {i:08x}deadbeef" for i in range(50)]
+    result = compact("\n".join(lines + ["done"]), 500)
+
+    assert result.text.split("\n") == lines[:REPEAT_KEEP] + [
+        f"[... {50 - REPEAT_KEEP} similar lines]", "done"]
+    assert result.lines_kept == 51
+
+
+def test_collapses_blank_lines():
+    assert compact("a\n\n\n\nb", 100).text == "a\nb"
+
+
+def test_shortens_long_lines():
+    result = compact("x" * (MAX_LINE_CHARS * 2), 1000)
+    assert result.text == "x" * MAX_LINE_CHARS + " [...]"
+
+
+def test_packs_highest_signal_segments_in_order():
+    """Over budget, signal-bearing segments win and keep their order."""
+    noise = [f"debug: step {i} of {chr(97 + i % 26)}{i * 7}x" for i in range(SEGMENT_LINES * 20)]
+    text = "\n".join(
+        noise[:100]
+        + ["[+] Found CVE-2021-41773 on 10.0.0.5:80"]
+        + noise[100:200]
+        + ["[+] Valid login: admin / password123"]
+        + noise[200:]
+    )
+    result = compact(text, 250)
+    lines = result.text.split("\n")
+
+    cve = next(i for i, line in enumerate(lines) if "CVE-2021-41773" in line)
+    login = next(i for i, line in enumerate(lines) if "admin / password123" in line)
+    assert cve < login
+    assert lines[0].endswith("lines omitted]")
+    assert len(result.text) <= 250 * CHARS_PER_TOKEN
+    assert result.lines_kept < result.lines_in
+
+
+def test_cuts_best_segment_when_nothing_fits():
+    text = "\n".join(
+        [f"{port}/tcp open {service}".ljust(60, ".") for port, service in [(22, "ssh"), (80, "http"), (443, "https")]]
+        + [""]
+        + [f"note: {word}".ljust(60, ".") for word in ["alpha", "beta", "gamma"]]
+    )
+    result = compact(text, 40)
+
+    assert len(result.text) <= 40 * CHARS_PER_TOKEN
+    assert result.text.startswith("22/tcp open ssh")
+    assert result.text.endswith("[... 3 lines omitted]")
@@ -0,0 +1,329 @@
+"""Tests for the elastic ContainerPool autoscaler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cyberred.core.exceptions import ContainerPoolExhausted
+from cyberred.tools.container_autoscaler import (
+    ContainerAutoscaler,
+    ContainerPoolMetrics,
+    ScalingPolicy,
+    _TokenBucket,
+)
+from cyberred.tools.container_pool import ContainerPool
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_container(*_args, **_kwargs):
+    container = MagicMock()
+    container.start = AsyncMock()
+    container.stop = AsyncMock()
+    container.container_id = None
+    return container
+
+
+@pytest.fixture
+def patched():
+    with patch("cyberred.tools.container_pool.RealContainer", side_effect=_make_container) as rc, \
+         patch("cyberred.tools.container_pool.ContainerHealthMonitor"):
+        yield rc
+
+
+async def _elastic_pool(clock: FakeClock, **policy) -> tuple[ContainerPool, ContainerAutoscaler]:
+    """Initialized elastic pool whose autoscaler loop is not running."""
+    policy.setdefault("evaluate_interval", 3600.0)
+    pool = ContainerPool(mode="real", scaling=ScalingPolicy(**policy))
+    pool._clock = clock
+    await pool.initialize()
+    await pool._autoscaler.stop()
+    return pool, ContainerAutoscaler(pool, pool._scaling, clock=clock)
+
+
+async def _settle(pool: ContainerPool) -> None:
+    while pool._background:
+        await asyncio.gather(*list(pool._background))
+
+
+def test_policy_validation():
+    with pytest.raises(ValueError, match="Invalid pool bounds"):
+        ScalingPolicy(min_size=5, max_size=2)
+    with pytest.raises(ValueError):
+        ScalingPolicy(scale_up_step=0)
+    with pytest.raises(ValueError):
+        ScalingPolicy(spawn_rate=0)
+
+
+def test_metrics_wait_p95_and_decisions():
+    metrics = ContainerPoolMetrics(wait_window=100)
+    assert metrics.wait_p95() == 0.0
+    for ms in range(1, 101):
+        metrics.record_wait(float(ms))
+    assert metrics.wait_p95() == 95.0
+
+    metrics.record_decision("up", "pressure", 2, 4)
+    metrics.record_decision("down", "idle", 4, 3)
+    data = metrics.get_metrics()
+    assert data["scale_ups"] == 1
+    assert data["scale_downs"] == 1
+    assert data["acquire_wait_samples"] == 100
+    assert [d["reason"] for d in data["decisions"]] == ["pressure", "idle"]
+
+    metrics.clear_waits()
+    assert metrics.get_metrics()["acquire_wait_samples"] == 0
+
+
+def test_metrics_boot_times():
+    metrics = ContainerPoolMetrics(wait_window=2)
+    metrics.record_boot("c1", "cold", 20000.0)
+    metrics.record_boot("c2", "warm", 40.0)
+    metrics.record_boot("c3", "warm", 60.0)
+    metrics.record_boot(None, "warm", 50.0)
+
+    data = metrics.get_metrics()
+    assert data["boots_cold"] == 1 and data["boots_warm"] == 3
+    assert data["boot_p95_ms"] == {"cold": 20000.0, "warm": 60.0}
+    # Per-container boot times are bounded like the wait window
+    assert metrics.boot_ms("c1") is None
+    assert metrics.boot_ms("c3") == 60.0
+
+
+def test_token_bucket_refills_at_rate():
+    clock = FakeClock()
+    bucket = _TokenBucket(rate=2.0, burst=2, clock=clock)
+    assert bucket.try_take() and bucket.try_take()
+    assert not bucket.try_take()
+    clock.now += 0.5
+    assert bucket.try_take()
+    assert not bucket.try_take()
+
+
+@pytest.mark.asyncio
+async def test_initialize_starts_min_size_and_standby(patched):
+    pool, _ = await _elastic_pool(FakeClock(), min_size=2, max_size=6, standby_size=1)
+    assert pool.available_count == 2
+    assert pool.standby_count == 1
+    assert pool.target_size == 2
+    assert patched.call_count == 3
+    await pool.shutdown()
+    assert pool.standby_count == 0
+
+
+@pytest.mark.asyncio
+async def test_scale_up_on_pressure_promotes_standby_first(patched):
+    clock = FakeClock()
+    pool, scaler = await _elastic_pool(
+        clock, min_size=2, max_size=6, standby_size=1, scale_up_step=2
+    )
+    a = await pool.acquire()
+    b = await pool.acquire()
+    assert pool.pressure == 1.0
+
+    assert scaler.evaluate() == "up"
+    # Standby promoted immediately, one container spawning, standby refilled
+    assert pool.metrics.get_metrics()["standby_promoted"] == 1
+    assert pool.available_count == 1
+    assert pool.target_size == 4
+    await _settle(pool)
+    assert pool.available_count == 2
+    assert pool.standby_count == 1
+    decision = pool.metrics.get_metrics()["decisions"][-1]
+    assert decision["reason"] == "pressure"
+    assert (decision["size_before"], decision["size_after"]) == (2, 4)
+
+    await pool.release(a)
+    await pool.release(b)
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_scale_up_on_wait_p95_respects_max(patched):
+    pool, scaler = await _elastic_pool(
+        FakeClock(), min_size=2, max_size=3, standby_size=0, scale_up_wait_p95_ms=100.0
+    )
+    for _ in range(10):
+        pool.metrics.record_wait(500.0)
+    assert scaler.evaluate() == "up"
+    assert pool.target_size == 3
+    assert pool.metrics.get_metrics()["acquire_wait_samples"] == 0
+    await _settle(pool)
+
+    # At max_size nothing more is added
+    for _ in range(10):
+        pool.metrics.record_wait(500.0)
+    assert scaler.evaluate() is None
+    assert pool.target_size == 3
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_no_scale_up_while_spawns_pending(patched):
+    pool, scaler = await _elastic_pool(FakeClock(), min_size=1, max_size=5, standby_size=0)
+    await pool.acquire()
+    assert scaler.evaluate() == "up"
+    assert pool.pending_spawns == 2
+    assert scaler.evaluate() is None
+    await _settle(pool)
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_spawns_are_rate_limited(patched):
+    clock = FakeClock()
+    pool, scaler = await _elastic_pool(
+        clock, min_size=1, max_size=10, standby_size=0,
+        scale_up_step=5, spawn_rate=1.0, spawn_burst=2,
+    )
+    await pool.acquire()
+    assert scaler.evaluate() == "up"
+    assert pool.target_size == 3
+    assert pool.metrics.get_metrics()["spawn_throttled"] == 1
+    await _settle(pool)
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_throttled_scale_up_is_not_a_decision(patched):
+    clock = FakeClock()
+    pool, scaler = await _elastic_pool(
+        clock, min_size=1, max_size=10, standby_size=1, spawn_burst=1, spawn_rate=0.001
+    )
+    await pool.acquire()
+    pool._standby.clear()
+    scaler._bucket.try_take()
+    assert scaler.evaluate() is None
+    assert pool.metrics.get_metrics()["scale_ups"] == 0
+    # Standby refill was throttled as well
+    assert pool.metrics.get_metrics()["spawn_throttled"] == 2
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_idle_reaping_after_cooldown(patched):
+    clock = FakeClock()
+    pool, scaler = await _elastic_pool(
+        clock, min_size=1, max_size=5, standby_size=0,
+        idle_timeout=60.0, cooldown=30.0,
+    )
+    await pool.acquire()
+    scaler.evaluate()
+    await _settle(pool)
+    assert pool.target_size == 3
+
+    # Within idle timeout: nothing reaped
+    clock.now += 40
+    assert scaler.evaluate() is None
+
+    # Past idle timeout and cooldown: idle containers go, down to min_size
+    clock.now += 30
+    assert scaler.evaluate() == "down"
+    await _settle(pool)
+    assert pool.target_size == 1
+    assert pool.available_count == 0
+    assert pool.metrics.get_metrics()["reaped"] == 2
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_no_reaping_during_cooldown(patched):
+    clock = FakeClock()
+    pool, scaler = await _elastic_pool(
+        clock, min_size=1, max_size=5, standby_size=0, idle_timeout=0.0, cooldown=100.0,
+    )
+    held = await pool.acquire()
+    scaler.evaluate()
+    await _settle(pool)
+    await pool.release(held)
+    clock.now += 10
+    assert scaler.evaluate() is None
+    assert pool.target_size == 3
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_reap_idle_skips_quarantined_and_zero_budget(patched):
+    clock = FakeClock()
+    pool, _ = await _elastic_pool(clock, min_size=2, max_size=5, standby_size=0)
+    assert pool.reap_idle(0.0, 0) == 0
+    victim = pool._available._queue[0]
+    pool._unhealthy.add(victim)
+    clock.now += 10
+    assert pool.reap_idle(0.0, 5) == 1
+    assert pool.available_count == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_grow_to_min_size(patched):
+    pool, scaler = await _elastic_pool(FakeClock(), min_size=2, max_size=5, standby_size=0)
+    pool._size = 0
+    assert scaler.evaluate() == "up"
+    assert pool.metrics.get_metrics()["decisions"][-1]["reason"] == "min_size"
+    await _settle(pool)
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_spawn_failure_is_counted(patched):
+    pool, _ = await _elastic_pool(FakeClock(), min_size=1, max_size=5, standby_size=0)
+    patched.side_effect = RuntimeError("docker down")
+    pool.spawn_container()
+    await _settle(pool)
+    assert pool.pending_spawns == 0
+    assert pool.target_size == 1
+    assert pool.metrics.get_metrics()["spawn_failures"] == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_standby_is_dropped(patched):
+    pool, _ = await _elastic_pool(FakeClock(), min_size=1, max_size=5, standby_size=1)
+    standby = pool._standby[0]
+    pool.mark_unhealthy(standby)
+    await _settle(pool)
+    assert pool.standby_count == 0
+    assert pool.quarantined_count == 0
+    standby.stop.assert_awaited_once()
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_acquire_records_waits_and_timeouts(patched):
+    pool, _ = await _elastic_pool(FakeClock(), min_size=1, max_size=5, standby_size=0)
+    await pool.acquire()
+    with pytest.raises(ContainerPoolExhausted):
+        await pool.acquire(timeout=0.01)
+    data = pool.metrics.get_metrics()
+    assert data["acquire_wait_samples"] == 2
+    assert data["acquire_timeouts"] == 1
+    await pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_autoscaler_loop_evaluates_and_survives_errors(patched):
+    pool = ContainerPool(
+        mode="real", scaling=ScalingPolicy(min_size=1, max_size=2, evaluate_interval=0.001)
+    )
+    await pool.initialize()
+    scaler = pool._autoscaler
+    calls = []
+
+    def boom():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    scaler.evaluate = boom
+    while len(calls) < 2:
+        await asyncio.sleep(0.001)
+    scaler.start()  # Already running: no second task
+    await pool.shutdown()
+    assert pool._autoscaler is None
+    await scaler.stop()  # Idempotent
@@ -0,0 +1,259 @@
+"""Unit tests for cyberred.tools.container_health module."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cyberred.tools.container_health import ContainerHealthMonitor
+from cyberred.tools.container_pool import ContainerPool, RealContainer
+
+
+def _listed(container_id, status):
+    container = MagicMock()
+    container.id = container_id
+    container.status = status
+    return container
+
+
+class FakeStream:
+    """Docker events stream that yields events and then blocks until closed."""
+
+    def __init__(self, events):
+        self._events = list(events)
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        yield from self._events
+        self._closed.wait(5)
+
+    def close(self):
+        self._closed.set()
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+@pytest.mark.unit
+class TestContainerHealthMonitor:
+    """Tests for event and poll based health tracking."""
+
+    @pytest.mark.asyncio
+    async def test_poll_reports_missing_and_stopped(self, client):
+        reported = []
+        monitor = ContainerHealthMonitor(reported.append, client_factory=lambda: client)
+        monitor.start(asyncio.get_running_loop())
+        monitor.stop()
+        for cid in ("aaa111", "bbb222", "ccc333"):
+            monitor.track(cid)
+        client.containers.list.return_value = [
+            _listed("aaa111fullid", "running"),
+            _listed("bbb222fullid", "exited"),
+        ]
+
+        assert sorted(monitor.poll_once()) == ["bbb222", "ccc333"]
+        client.containers.list.assert_called_once()
+        _, kwargs = client.containers.list.call_args
+        assert sorted(kwargs["filters"]["id"]) == ["aaa111", "bbb222", "ccc333"]
+
+        # Reported IDs are not polled or reported again
+        assert monitor.poll_once() == []
+        await asyncio.sleep(0)
+        assert sorted(reported) == ["bbb222", "ccc333"]
+
+    def test_poll_with_nothing_tracked_skips_docker(self, client):
+        monitor = ContainerHealthMonitor(MagicMock(), client_factory=lambda: client)
+        assert monitor.poll_once() == []
+        client.containers.list.assert_not_called()
+
+    def test_events_filter_actions_and_tracked_ids(self):
+        monitor = ContainerHealthMonitor(MagicMock())
+        monitor.track("abc")
+        with patch.object(monitor, "_report") as report:
+            monitor.handle_event({"Action": "start", "id": "abc"})
+            monitor.handle_event({"Action": "die", "id": "other"})
+            monitor.handle_event({"status": "oom", "id": "abc"})
+            monitor.handle_event({"Action": "health_status: unhealthy", "Actor": {"ID": "abc"}})
+        assert report.call_count == 2
+
+    def test_untracked_ids_are_not_reported(self):
+        monitor = ContainerHealthMonitor(MagicMock())
+        monitor.track("abc")
+        monitor.untrack("abc")
+        monitor._report("abc")
+        assert monitor._reported == set()
+
+    @pytest.mark.asyncio
+    async def test_threads_follow_events_and_stop(self, client):
+        reported = asyncio.Event()
+        client.events.return_value = FakeStream([{"Action": "die", "id": "dead"}])
+        monitor = ContainerHealthMonitor(
+            lambda cid: reported.set(), poll_interval=0.01, client_factory=lambda: client
+        )
+        monitor.track("dead")
+        monitor.start(asyncio.get_running_loop())
+        monitor.start(asyncio.get_running_loop())  # idempotent
+        assert monitor.running
+
+        await asyncio.wait_for(reported.wait(), timeout=2)
+        await asyncio.to_thread(monitor.stop)
+        assert not monitor.running
+
+    @pytest.mark.asyncio
+    async def test_thread_errors_are_contained(self):
+        factory = MagicMock(side_effect=Exception("docker unavailable"))
+        monitor = ContainerHealthMonitor(MagicMock(), poll_interval=0.01, client_factory=factory)
+        monitor.track("abc")
+        monitor.start(asyncio.get_running_loop())
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(monitor.stop)
+        assert factory.call_count >= 2
+
+    def test_events_loop_exits_when_stopped_mid_stream(self, client):
+        monitor = ContainerHealthMonitor(MagicMock(), client_factory=lambda: client)
+
+        def events(**kwargs):
+            monitor._stop.set()
+            yield {"Action": "die", "id": "abc"}
+
+        client.events.side_effect = events
+        with patch.object(monitor, "handle_event") as handle:
+            monitor._events_loop()
+        handle.assert_not_called()
+
+    def test_report_without_running_loop(self):
+        callback = MagicMock()
+        monitor = ContainerHealthMonitor(callback)
+        monitor.track("abc")
+        monitor._report("abc")
+        loop = asyncio.new_event_loop()
+        loop.close()
+        monitor._loop = loop
+        monitor.track("def")
+        monitor._report("def")
+        callback.assert_not_called()
+        assert monitor._reported == {"abc", "def"}
+
+    def test_stop_tolerates_stream_close_errors(self):
+        monitor = ContainerHealthMonitor(MagicMock())
+        monitor._events_stream = MagicMock(close=MagicMock(side_effect=Exception("closed")))
+        monitor.stop()
+        assert monitor._events_stream is None
+
+
+@pytest.mark.unit
+class TestPoolHealthIntegration:
+    """ContainerPool uses cached health only."""
+
+    @pytest.mark.asyncio
+    async def test_health_event_quarantines_idle_container(self):
+        with patch("cyberred.tools.container_pool.RealContainer") as mock_rc, \
+             patch("cyberred.tools.container_pool.ContainerHealthMonitor") as mock_monitor:
+            containers = []
+
+            def make():
+                container = MagicMock()
+                container.container_id = f"id{len(containers)}"
+                container.start = AsyncMock()
+                container.stop = AsyncMock()
+                containers.append(container)
+                return container
+
+            mock_rc.side_effect = make
+            pool = ContainerPool(mode="real", size=2)
+            await pool.initialize()
+            monitor = mock_monitor.return_value
+            assert monitor.track.call_count == 2
+            monitor.start.assert_called_once()
+
+            pool._on_health_event("id0")
+            pool._on_health_event("id0")  # duplicate is ignored
+            pool._on_health_event("unknown")
+            assert pool.available_count == 1
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            containers[0].stop.assert_awaited_once()
+            monitor.untrack.assert_called_once_with("id0")
+            assert pool.available_count == 2
+            assert pool.quarantined_count == 0
+            # The replacement is tracked too
+            monitor.track.assert_called_with("id2")
+            for container in containers:
+                container.is_healthy.assert_not_called()
+
+            await pool.shutdown()
+            monitor.stop.assert_called_once()
+            assert pool._monitor is None
+
+    @pytest.mark.asyncio
+    async def test_in_use_container_is_quarantined_on_release(self):
+        pool = ContainerPool(mode="real", size=1)
+        container = MagicMock(spec=RealContainer)
+        container.stop = AsyncMock()
+        await pool._available.put(container)
+
+        with patch.object(pool, "_spawn_replacement", AsyncMock()) as spawn:
+            async with pool.acquire() as acquired:
+                pool.mark_unhealthy(acquired)
+                assert pool.quarantined_count == 1
+                container.stop.assert_not_called()
+            await asyncio.sleep(0)
+        container.stop.assert_awaited_once()
+        spawn.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quarantine_without_monitor(self):
+        pool = ContainerPool(mode="real", size=1)
+        container = MagicMock(container_id="abc", stop=AsyncMock())
+        pool._track(container)
+        with patch.object(pool, "_spawn_replacement", AsyncMock()):
+            pool._quarantine(container)
+            await asyncio.sleep(0)
+        assert pool._by_id == {}
+        assert pool._all_containers == []
+
+    @pytest.mark.asyncio
+    async def test_mark_unhealthy_is_noop_in_mock_mode(self):
+        pool = ContainerPool(mode="mock", size=1)
+        pool.mark_unhealthy(MagicMock())
+        assert pool.quarantined_count == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_pending_replacements(self):
+        pool = ContainerPool(mode="real", size=1)
+        container = MagicMock(spec=RealContainer)
+        started = asyncio.Event()
+
+        async def slow_stop():
+            started.set()
+            await asyncio.sleep(10)
+
+        container.stop = slow_stop
+        pool.mark_unhealthy(container)
+        pool._quarantine(container)
+        await started.wait()
+        await pool.shutdown()
+        await asyncio.sleep(0)
+        assert not pool._background
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_real_container_records_container_id():
+    with patch("cyberred.tools.container_pool.DockerContainer") as mock_dc, \
+         patch("docker.from_env"):
+        mock_dc.return_value.get_wrapped_container.return_value.id = "abc123"
+        container = RealContainer()
+        await container.start()
+        assert container.container_id == "abc123"
+
+        mock_dc.return_value.get_wrapped_container.side_effect = Exception("gone")
+        await container.start()
+        assert container.container_id is None
+
+        await container.stop()
+        assert container.container_id is None
@@ -328,15 +328,20 @@ async def test_container_pool_real_release():
         await pool.release(acquired)
         assert pool._available.qsize() == 1
         
-        # Test 2: Release unhealthy container
+        # Test 2: Release container marked unhealthy while in use
         acquired_2 = await pool.acquire()
-        mock_container.is_healthy.return_value = False
         mock_container.stop = AsyncMock()
+        mock_rc_cls.return_value = MagicMock(start=AsyncMock(side_effect=Exception("no docker")))
+        pool.mark_unhealthy(acquired_2)
         
         await pool.release(acquired_2)
         assert pool._available.qsize() == 0 
+        await asyncio.sleep(0)
         
         mock_container.stop.assert_called()
+        # Health is cached: release never probes Docker
+        mock_container.is_healthy.assert_not_called()
+        await pool.shutdown()
 
 @pytest.mark.asyncio
 async def test_container_pool_pressure():
@@ -512,11 +517,13 @@ async def test_container_pool_release_cleanup_error():
     
     pool = ContainerPool(mode="real")
     mock_container = MagicMock()
-    mock_container.is_healthy.return_value = False
     mock_container.stop = AsyncMock(side_effect=Exception("Stop failed"))
+    pool.mark_unhealthy(mock_container)
     
     # Should not raise
-    await pool.release(mock_container)
+    with patch.object(pool, "_spawn_replacement", AsyncMock()):
+        await pool.release(mock_container)
+        await asyncio.sleep(0)
 
 @pytest.mark.unit
 def test_mock_container_tool_detection_edge_cases():
@@ -539,45 +546,48 @@ async def test_mock_container_missing_fixture():
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_container_pool_restart_unhealthy_logic():
-    """Test restart logic when acquiring unhealthy container."""
+    """Acquire skips a container cached as unhealthy and replaces it in the background."""
     from cyberred.tools.container_pool import ContainerPool, RealContainer
     
-    pool = ContainerPool(mode="real", size=1)
+    pool = ContainerPool(mode="real", size=2)
     
-    # Mock container
-    mock_container = MagicMock(spec=RealContainer)
-    mock_container.is_healthy.side_effect = [False, True] # First check false, second true
-    mock_container.stop = AsyncMock()
-    mock_container.start = AsyncMock()
+    unhealthy = MagicMock(spec=RealContainer)
+    unhealthy.stop = AsyncMock()
+    healthy = MagicMock(spec=RealContainer)
     
-    # Put in queue
-    await pool._available.put(mock_container)
+    await pool._available.put(unhealthy)
+    await pool._available.put(healthy)
+    pool._unhealthy.add(unhealthy)
     
-    # Acquire
-    async with pool.acquire() as c:
-        assert c is mock_container
-        
-    # Verify restart called
-    mock_container.stop.assert_called_once()
-    mock_container.start.assert_called_once()
+    with patch.object(pool, "_spawn_replacement", AsyncMock()) as spawn:
+        async with pool.acquire() as c:
+            assert c is healthy
+        await asyncio.sleep(0)
+    
+    unhealthy.stop.assert_called_once()
+    spawn.assert_awaited_once()
+    unhealthy.is_healthy.assert_not_called()
+    healthy.is_healthy.assert_not_called()
+    assert pool.quarantined_count == 0
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_container_pool_restart_unhealthy_failure():
-    """Test restart failure is swallowed."""
+    """Acquire times out when only quarantined containers are left."""
     from cyberred.tools.container_pool import ContainerPool, RealContainer
+    from cyberred.core.exceptions import ContainerPoolExhausted
     
     pool = ContainerPool(mode="real", size=1)
     mock_container = MagicMock(spec=RealContainer)
-    mock_container.is_healthy.return_value = False
     mock_container.stop = AsyncMock()
-    mock_container.start = AsyncMock(side_effect=Exception("Restart failed"))
     
     await pool._available.put(mock_container)
+    pool._unhealthy.add(mock_container)
     
-    async with pool.acquire() as c:
-        assert c is mock_container
-        # Exception swallowed
+    with patch.object(pool, "_spawn_replacement", AsyncMock()):
+        with pytest.raises(ContainerPoolExhausted):
+            async with pool.acquire(timeout=0.05):
+                pass
 
 @pytest.mark.unit
 def test_container_pool_zero_size_pressure():
@@ -886,8 +896,8 @@ async def test_spawn_replacement_called_on_unhealthy_release():
     
     # Create unhealthy mock container
     mock_container = MagicMock(spec=RealContainer)
-    mock_container.is_healthy.return_value = False
     mock_container.stop = AsyncMock()
+    pool.mark_unhealthy(mock_container)
     
     # Release unhealthy container - should trigger spawn
     await pool.release(mock_container)
@@ -914,7 +924,7 @@ async def test_spawn_replacement_maintains_pool_size():
         mock_container.start = AsyncMock()
         mock_container.stop = AsyncMock()
         mock_container.is_healthy.return_value = True
-        mock_rc.return_value = mock_container
+        mock_rc.side_effect = lambda: MagicMock(start=AsyncMock(), stop=AsyncMock())
         
         pool = ContainerPool(mode="real", size=3)
         await pool.initialize()
@@ -927,7 +937,7 @@ async def test_spawn_replacement_maintains_pool_size():
         assert pool._available.qsize() == 2
         
         # Make container unhealthy before release
-        acquired.is_healthy.return_value = False
+        pool.mark_unhealthy(acquired)
         
         # Release unhealthy container
         await pool.release(acquired)
@@ -962,7 +972,7 @@ async def test_spawn_replacement_failure_is_logged_not_raised():
         
         # Acquire container
         acquired = await pool.acquire()
-        acquired.is_healthy.return_value = False
+        pool.mark_unhealthy(acquired)
         
         # Make replacement fail
         failing_container = MagicMock()
@@ -978,3 +988,459 @@ async def test_spawn_replacement_failure_is_logged_not_raised():
         
         # System should still be operational (no exception propagated)
         assert True, "Replacement failure should be handled gracefully"
+
+
+@pytest.mark.asyncio
+async def test_real_container_start_opens_exec_channel():
+    """RealContainer starts a persistent exec channel once it has an ID."""
+    from cyberred.tools.container_pool import RealContainer
+
+    with patch("cyberred.tools.container_pool.DockerContainer") as mock_dc, \
+         patch("cyberred.tools.container_pool.ExecChannel") as mock_channel_cls:
+        mock_dc.return_value.get_wrapped_container.return_value.id = "abc123"
+        channel = mock_channel_cls.return_value
+        channel.start = AsyncMock()
+        channel.close = AsyncMock()
+        container = RealContainer()
+        await container.start()
+
+        mock_channel_cls.assert_called_once_with("abc123")
+        assert container._channel is channel
+
+        await container.stop()
+        channel.close.assert_awaited_once()
+        assert container._channel is None
+
+
+@pytest.mark.asyncio
+async def test_real_container_falls_back_when_agent_unavailable():
+    """Without an agent, execute() keeps using exec_run."""
+    from cyberred.core.exceptions import ExecChannelError
+    from cyberred.tools.container_pool import RealContainer
+
+    with patch("cyberred.tools.container_pool.ExecChannel") as mock_channel_cls:
+        mock_channel_cls.return_value.start = AsyncMock(
+            side_effect=ExecChannelError("abc123", "no python3")
+        )
+        container = RealContainer()
+        assert await container._open_channel("abc123") is None
+
+
+@pytest.mark.asyncio
+async def test_real_container_execute_via_channel():
+    """execute() runs commands through the exec channel when it is alive."""
+    from cyberred.core.exec_channel import ExecResult
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    container._container = MagicMock()
+    container._channel = MagicMock(alive=True)
+    container._channel.run = AsyncMock(return_value=ExecResult(0, b"open 80", b""))
+
+    result = await container.execute("nmap -p 80 10.0.0.1", timeout=10)
+
+    container._channel.run.assert_awaited_once_with(
+        ["nmap", "-p", "80", "10.0.0.1"], timeout=10, on_output=None, capture_stdout=True
+    )
+    container._container.get_wrapped_container.return_value.exec_run.assert_not_called()
+    assert result.success is True
+    assert result.stdout == "open 80"
+
+
+@pytest.mark.asyncio
+async def test_real_container_execute_via_channel_timeout():
+    """A job killed by the agent at its timeout maps to TIMEOUT."""
+    from cyberred.core.exec_channel import ExecResult
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    container._container = MagicMock()
+    container._channel = MagicMock(alive=True)
+    container._channel.run = AsyncMock(return_value=ExecResult(-9, b"", b"", timed_out=True))
+
+    result = await container.execute("nmap 10.0.0.1", timeout=1)
+
+    assert result.error_type == "TIMEOUT"
+
+
+@pytest.mark.asyncio
+async def test_real_container_execute_channel_lost_is_crash():
+    """Losing the exec channel mid-job reports CONTAINER_CRASHED."""
+    from cyberred.core.exceptions import ExecChannelError
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    container._container = MagicMock()
+    container._channel = MagicMock(alive=True)
+    container._channel.run = AsyncMock(side_effect=ExecChannelError("abc", "agent exited"))
+
+    result = await container.execute("nmap 10.0.0.1")
+
+    assert result.error_type == "CONTAINER_CRASHED"
+
+
+@pytest.mark.asyncio
+async def test_real_container_execute_streams_via_channel():
+    """With on_output, stdout is streamed and not kept in the result."""
+    from cyberred.core.exec_channel import ExecResult
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    container._container = MagicMock()
+    container._channel = MagicMock(alive=True)
+    container._channel.run = AsyncMock(return_value=ExecResult(0, b"", b""))
+    on_output = MagicMock()
+
+    result = await container.execute("nuclei -u http://x", timeout=10, on_output=on_output)
+
+    container._channel.run.assert_awaited_once_with(
+        ["nuclei", "-u", "http://x"], timeout=10, on_output=on_output, capture_stdout=False
+    )
+    assert result.success is True
+    assert result.stdout == ""
+
+
+@pytest.mark.asyncio
+async def test_real_container_exec_run_fallback_delivers_output_once():
+    """Without a channel, exec_run output goes to on_output at the end."""
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    container._container = MagicMock()
+    container._channel = None
+    container._container.get_wrapped_container.return_value.exec_run.return_value = (
+        0, (b"80/tcp open\n", b"")
+    )
+    on_output = MagicMock()
+
+    result = await container.execute("nmap 10.0.0.1", on_output=on_output)
+
+    on_output.assert_called_once_with("stdout", b"80/tcp open\n")
+    assert result.stdout == ""
+
+
+@pytest.mark.asyncio
+async def test_mock_container_execute_streams_output():
+    """MockContainer delivers its canned stdout through on_output."""
+    container = MockContainer()
+    await container.start()
+    chunks = []
+
+    result = await container.execute("nmap 10.0.0.1", on_output=lambda s, d: chunks.append((s, d)))
+
+    assert result.stdout == ""
+    assert chunks and chunks[0][0] == "stdout"
+
+
+@pytest.mark.asyncio
+async def test_container_pool_is_execution_backend():
+    """ContainerPool runs scheduler jobs through run()."""
+    from cyberred.protocols import ExecutionBackendProtocol
+    from cyberred.tools.container_autoscaler import ScalingPolicy
+
+    pool = ContainerPool(mode="mock", size=3)
+    assert isinstance(pool, ExecutionBackendProtocol)
+    assert pool.capacity == 3
+    assert ContainerPool(mode="mock", scaling=ScalingPolicy(min_size=1, max_size=8)).capacity == 8
+
+    result = await pool.run("nmap -sV 192.168.1.1", timeout=5)
+    assert isinstance(result, ToolResult)
+
+
+@pytest.mark.asyncio
+async def test_container_pool_run_error_paths():
+    """run() turns exhaustion, crashes and exceptions into ToolResults."""
+    from cyberred.core.exceptions import ContainerPoolExhausted
+
+    pool = ContainerPool(mode="real", size=1)
+    container = MagicMock()
+    pool._available.put_nowait(container)
+
+    container.execute = AsyncMock(return_value=ToolResult(False, "", "gone", -1, 1, "CONTAINER_CRASHED"))
+    with patch.object(pool, "mark_unhealthy") as mark, patch.object(pool, "release", AsyncMock()):
+        result = await pool.run("id", timeout=1)
+    assert result.error_type == "CONTAINER_CRASHED"
+    mark.assert_called_once_with(container)
+
+    container.execute = AsyncMock(side_effect=RuntimeError("boom"))
+    pool._available.put_nowait(container)
+    with patch.object(pool, "release", AsyncMock()):
+        result = await pool.run("id", timeout=1)
+    assert result.error_type == "EXECUTION_EXCEPTION"
+
+    with patch.object(pool, "_acquire_impl", AsyncMock(side_effect=ContainerPoolExhausted("empty"))):
+        result = await pool.run("id", timeout=1)
+    assert result.error_type == "POOL_EXHAUSTED"
+
+
+@pytest.mark.asyncio
+async def test_real_container_records_cold_boot_and_pauses():
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    with pytest.raises(RuntimeError, match="not started"):
+        await container.pause()
+    with pytest.raises(RuntimeError, match="not started"):
+        await container.resume()
+
+    with patch("cyberred.tools.container_pool.DockerContainer"):
+        await container.start()
+    assert container.boot_mode == "cold" and container.boot_ms >= 0
+
+    wrapped = container._container.get_wrapped_container.return_value
+    await container.pause()
+    wrapped.pause.assert_called_once()
+    await container.resume()
+    wrapped.unpause.assert_called_once()
+    assert container.boot_mode == "warm"
+
+
+@pytest.mark.asyncio
+async def test_real_container_checkpoint():
+    from cyberred.tools.container_pool import RealContainer
+
+    container = RealContainer()
+    with pytest.raises(RuntimeError, match="not started"):
+        await container.checkpoint("k", "/ckpt")
+
+    channel = MagicMock(close=AsyncMock())
+    container._container_id = "abc"
+    container._channel = channel
+    with patch("cyberred.tools.container_pool._docker", AsyncMock()) as docker_cli:
+        await container.checkpoint("k", "/ckpt")
+    channel.close.assert_awaited_once()
+    assert container._channel is None
+    docker_cli.assert_awaited_once_with("checkpoint", "create", "--checkpoint-dir", "/ckpt", "abc", "k")
+
+
+@pytest.mark.asyncio
+async def test_real_container_restore():
+    import sys
+    from cyberred.tools.container_pool import RealContainer
+
+    mock_docker = MagicMock()
+    wrapped = mock_docker.from_env.return_value.containers.get.return_value
+    calls = []
+
+    async def docker_cli(*args, check=True):
+        calls.append(args)
+        return "abc\n" if args[0] == "create" else ""
+
+    with patch.dict(sys.modules, {"docker": mock_docker}), \
+            patch("cyberred.tools.container_pool._docker", docker_cli), \
+            patch.object(RealContainer, "_open_channel", AsyncMock(return_value=None)):
+        container = await RealContainer.restore("k", "/ckpt")
+
+    assert calls[0][:3] == ("create", "--network", "none")
+    assert calls[1] == ("start", "--checkpoint-dir", "/ckpt", "--checkpoint", "k", "abc")
+    assert container.container_id == "abc" and container.boot_mode == "restored"
+    assert container._container.get_wrapped_container() is wrapped
+    await container.stop()
+    wrapped.remove.assert_called_once_with(force=True, v=True)
+
+
+@pytest.mark.asyncio
+async def test_real_container_restore_failure_removes_container():
+    from cyberred.tools.container_pool import RealContainer
+
+    calls = []
+
+    async def docker_cli(*args, check=True):
+        calls.append(args)
+        if args[0] == "start":
+            raise RuntimeError("docker start failed: checkpoint not found")
+        return "abc"
+
+    with patch("cyberred.tools.container_pool._docker", docker_cli):
+        with pytest.raises(RuntimeError, match="checkpoint not found"):
+            await RealContainer.restore("k", "/ckpt")
+    assert calls[-1] == ("rm", "-f", "abc")
+
+
+@pytest.mark.asyncio
+async def test_docker_cli_helper():
+    from cyberred.tools.container_pool import _docker
+
+    proc = MagicMock(returncode=0)
+    proc.communicate = AsyncMock(return_value=(b"true\n", b""))
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as create:
+        assert await _docker("info") == "true\n"
+    assert create.await_args.args[1:] == ("info",)
+
+    proc.returncode = 1
+    proc.communicate = AsyncMock(return_value=(b"", b"no such container\n"))
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+        with pytest.raises(RuntimeError, match="docker rm failed: no such container"):
+            await _docker("rm", "x")
+        assert await _docker("rm", "x", check=False) == ""
+
+
+@pytest.mark.asyncio
+async def test_container_pool_takes_warm_containers():
+    from cyberred.tools.container_pool import ContainerPool
+
+    warm = MagicMock()
+    warm_container = MagicMock(container_id="warm-1", boot_mode="warm", boot_ms=40.0)
+    warm.take = AsyncMock(side_effect=[warm_container, None])
+    with patch("cyberred.tools.container_pool.RealContainer") as mock_rc_cls, \
+            patch("cyberred.tools.container_pool.ContainerHealthMonitor"):
+        cold = mock_rc_cls.return_value
+        cold.start = AsyncMock()
+        cold.container_id, cold.boot_mode, cold.boot_ms = "cold-1", "cold", 20000.0
+        pool = ContainerPool(mode="real", size=2, warm_pool=warm)
+        await pool.initialize()
+
+    assert warm.take.await_count == 2
+    cold.start.assert_awaited_once()
+    data = pool.metrics.get_metrics()
+    assert data["boots_warm"] == 1 and data["boots_cold"] == 1
+    assert pool.metrics.boot_ms("warm-1") == 40.0
+
+
+@pytest.mark.asyncio
+async def test_container_pool_passes_blob_store_to_containers(tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.tools.container_pool import ContainerPool
+
+    store = BlobStore(tmp_path)
+    warm = MagicMock()
+    warm_container = MagicMock(container_id="warm-1", boot_mode="warm", boot_ms=40.0)
+    warm.take = AsyncMock(side_effect=[warm_container, None])
+    with patch("cyberred.tools.container_pool.RealContainer") as mock_rc_cls, \
+            patch("cyberred.tools.container_pool.ContainerHealthMonitor"):
+        mock_rc_cls.return_value.start = AsyncMock()
+        pool = ContainerPool(mode="real", size=2, warm_pool=warm, blob_store=store)
+        await pool.initialize()
+
+    assert pool.blob_store is store
+    assert mock_rc_cls.return_value.blob_store is store
+    assert warm_container.blob_store is store
+
+
+@pytest.mark.asyncio
+async def test_real_container_stores_raw_stdout(tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.tools.container_pool import RealContainer
+
+    store = BlobStore(tmp_path)
+    container = RealContainer(blob_store=store)
+    container._container = MagicMock()
+    wrapped = container._container.get_wrapped_container.return_value
+    wrapped.exec_run.return_value = (0, (b"80/tcp open \xff", b""))
+
+    result = await container.execute("nmap x")
+
+    assert result.stdout == "80/tcp open �"
+    assert store.get(result.output_ref) == b"80/tcp open \xff"
+
+    # Empty output is not stored; a failing store only loses the reference
+    wrapped.exec_run.return_value = (0, (b"", b""))
+    assert (await container.execute("true")).output_ref is None
+    wrapped.exec_run.return_value = (0, (b"out", b""))
+    with patch.object(store, "put", side_effect=OSError("disk full")):
+        result = await container.execute("nmap x")
+    assert result.success and result.output_ref is None
+
+
+@pytest.mark.asyncio
+async def test_real_container_keeps_preview_of_stored_stdout(tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.tools.container_pool import RealContainer
+
+    store = BlobStore(tmp_path)
+    container = RealContainer(blob_store=store)
+    container.OUTPUT_PREVIEW = 8
+    container._container = MagicMock()
+    wrapped = container._container.get_wrapped_container.return_value
+    wrapped.exec_run.return_value = (0, (b"80/tcp open http\n", b""))
+
+    result = await container.execute("nmap x")
+
+    assert result.stdout == "80/tcp o"
+    assert result.output(store).text() == "80/tcp open http\n"
+
+
+@pytest.mark.asyncio
+async def test_real_container_stores_streamed_stdout(tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.core.exec_channel import ExecResult
+    from cyberred.tools.container_pool import RealContainer
+
+    store = BlobStore(tmp_path)
+    container = RealContainer(blob_store=store)
+    container._container = MagicMock()
+    container._channel = MagicMock(alive=True)
+
+    async def run(cmd, timeout, on_output, capture_stdout):
+        on_output("stdout", b"[high] ")
+        on_output("stderr", b"progress")
+        on_output("stdout", b"http://x\n")
+        return ExecResult(0, b"", b"")
+
+    container._channel.run = AsyncMock(side_effect=run)
+    chunks = []
+
+    result = await container.execute("nuclei -u http://x", on_output=lambda *c: chunks.append(c))
+
+    assert chunks == [("stdout", b"[high] "), ("stderr", b"progress"), ("stdout", b"http://x\n")]
+    assert result.stdout == ""
+    assert store.get(result.output_ref) == b"[high] http://x\n"
+
+    # exec_run fallback delivers (and stores) everything at the end
+    container._channel = None
+    wrapped = container._container.get_wrapped_container.return_value
+    wrapped.exec_run.return_value = (0, (b"80/tcp open\n", b""))
+    result = await container.execute("nmap x", on_output=MagicMock())
+    assert result.stdout == "" and store.get(result.output_ref) == b"80/tcp open\n"
+
+    # No output, nothing stored
+    wrapped.exec_run.return_value = (0, (b"", b""))
+    assert (await container.execute("true", on_output=MagicMock())).output_ref is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_real_container_streamed_store_failures(tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.core.exceptions import ExecChannelError
+    from cyberred.tools.container_pool import RealContainer
+
+    store = BlobStore(tmp_path)
+    container = RealContainer(blob_store=store)
+    container._container = MagicMock()
+    wrapped = container._container.get_wrapped_container.return_value
+    wrapped.exec_run.return_value = (0, (b"out", b""))
+    on_output = MagicMock()
+
+    # Unusable store: the run still streams, without a reference
+    with patch.object(store, "writer", side_effect=OSError("read-only")):
+        result = await container.execute("nmap x", on_output=on_output)
+    assert result.success and result.output_ref is None
+    on_output.assert_called_once_with("stdout", b"out")
+
+    with patch("cyberred.core.blob_store.BlobWriter.write", side_effect=OSError("disk full")):
+        assert (await container.execute("nmap x", on_output=on_output)).output_ref is None
+
+        async def crash_after_output(cmd, timeout, on_output, capture_stdout):
+            on_output("stdout", b"partial")
+            raise ExecChannelError("abc", "agent exited")
+
+        container._channel = MagicMock(alive=True)
+        container._channel.run = AsyncMock(side_effect=crash_after_output)
+        result = await container.execute("nmap x", on_output=on_output)
+        assert result.error_type == "CONTAINER_CRASHED"
+        container._channel = None
+    with patch("cyberred.core.blob_store.os.replace", side_effect=OSError("disk full")):
+        assert (await container.execute("nmap x", on_output=on_output)).output_ref is None
+
+    # Failed and cancelled runs leave no partial blob
+    wrapped.exec_run.side_effect = RuntimeError("boom")
+    assert (await container.execute("nmap x", on_output=on_output)).error_type == "EXECUTION_EXCEPTION"
+    wrapped.exec_run.side_effect = asyncio.CancelledError
+    with pytest.raises(asyncio.CancelledError):
+        await container.execute("nmap x", on_output=on_output)
+    with pytest.raises(asyncio.CancelledError):
+        await container.execute("nmap x")
+    wrapped.exec_run.side_effect = asyncio.TimeoutError
+    assert (await container.execute("nmap x", on_output=on_output)).error_type == "TIMEOUT"
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,193 @@
+"""Tests for the paused-container warm pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cyberred.tools import container_warm_pool as warm_module
+from cyberred.tools.container_warm_pool import WarmPool, WarmStartPolicy, checkpoint_supported
+
+
+def _container(name="c"):
+    container = MagicMock(name=name)
+    for method in ("start", "stop", "pause", "resume", "execute", "checkpoint"):
+        setattr(container, method, AsyncMock())
+    return container
+
+
+class Factory:
+    """Container factory recording what it made."""
+
+    def __init__(self):
+        self.made = []
+
+    def __call__(self):
+        container = _container(f"c{len(self.made)}")
+        self.made.append(container)
+        return container
+
+
+async def _no_checkpoint():
+    return False
+
+
+async def _checkpoint_ok():
+    return True
+
+
+def test_policy_validation():
+    with pytest.raises(ValueError, match="Invalid warm start policy"):
+        WarmStartPolicy(size=-1)
+
+
+@pytest.mark.asyncio
+async def test_fill_warms_and_pauses_containers():
+    factory = Factory()
+    pool = WarmPool(WarmStartPolicy(size=2, warmup_commands=("nmap --version",)), factory,
+                    checkpoint_probe=_no_checkpoint)
+
+    await pool.fill()
+    await pool.fill()  # Already full
+
+    assert pool.available == 2 and len(factory.made) == 2
+    for container in factory.made:
+        container.start.assert_awaited_once()
+        container.execute.assert_awaited_once_with("nmap --version", timeout=30)
+        container.pause.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_take_resumes_and_refills():
+    factory = Factory()
+    pool = WarmPool(WarmStartPolicy(size=1, warmup_commands=()), factory,
+                    checkpoint_probe=_no_checkpoint)
+    await pool.fill()
+
+    container = await pool.take()
+
+    container.resume.assert_awaited_once()
+    await asyncio.gather(*pool._background)
+    assert pool.available == 1 and len(factory.made) == 2
+    assert pool.get_metrics()["taken"] == 1
+
+
+@pytest.mark.asyncio
+async def test_take_skips_containers_that_fail_to_resume():
+    factory = Factory()
+    pool = WarmPool(WarmStartPolicy(size=2, warmup_commands=(), refill=False), factory,
+                    checkpoint_probe=_no_checkpoint)
+    await pool.fill()
+    factory.made[1].resume.side_effect = RuntimeError("gone")
+    factory.made[1].stop.side_effect = RuntimeError("already gone")
+
+    assert await pool.take() is factory.made[0]
+    assert await pool.take() is None
+    assert pool.get_metrics()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prepare_failures_are_counted():
+    factory = Factory()
+    pool = WarmPool(WarmStartPolicy(size=2, warmup_commands=()), factory,
+                    checkpoint_probe=_no_checkpoint)
+    original = factory.__call__
+
+    def flaky():
+        container = original()
+        if len(factory.made) == 1:
+            container.start.side_effect = RuntimeError("no docker")
+        else:
+            container.pause.side_effect = RuntimeError("cannot pause")
+        return container
+
+    pool._factory = flaky
+    await pool.fill()
+
+    assert pool.available == 0
+    assert pool.get_metrics()["prepare_failures"] == 2
+    # The container that started but could not pause is stopped
+    factory.made[1].stop.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_restore():
+    factory = Factory()
+    restored = []
+
+    async def restorer(name, checkpoint_dir):
+        restored.append((name, checkpoint_dir))
+        return _container("restored")
+
+    policy = WarmStartPolicy(size=2, checkpoint=True, checkpoint_dir="/ckpt", checkpoint_name="k")
+    pool = WarmPool(policy, factory, restorer, checkpoint_probe=_checkpoint_ok)
+    await pool.fill()
+
+    # One template was booted, warmed, checkpointed and removed
+    template = factory.made[0]
+    template.checkpoint.assert_awaited_once_with("k", "/ckpt")
+    template.stop.assert_awaited_once()
+    assert len(factory.made) == 1
+    assert restored == [("k", "/ckpt")] * 2
+    assert pool.restoring and pool.available == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_checkpoint_or_restore_falls_back_to_cold_starts():
+    factory = Factory()
+    original = factory.__call__
+
+    def failing_template():
+        container = original()
+        container.checkpoint.side_effect = RuntimeError("experimental mode required")
+        return container
+
+    pool = WarmPool(WarmStartPolicy(size=1, warmup_commands=(), checkpoint=True), failing_template,
+                    checkpoint_probe=_checkpoint_ok)
+    await pool.fill()
+    assert not pool.restoring and pool.available == 1
+
+    async def broken_restorer(name, checkpoint_dir):
+        raise RuntimeError("restore failed")
+
+    pool = WarmPool(WarmStartPolicy(size=1, warmup_commands=(), checkpoint=True), Factory(),
+                    broken_restorer, checkpoint_probe=_checkpoint_ok)
+    await pool.fill()
+    assert not pool.restoring and pool.available == 1
+    assert pool.get_metrics()["restore_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_paused_containers():
+    factory = Factory()
+    pool = WarmPool(WarmStartPolicy(size=1, warmup_commands=()), factory,
+                    checkpoint_probe=_no_checkpoint)
+    await pool.fill()
+    await pool.take()  # Starts a background refill
+
+    await pool.shutdown()
+
+    assert pool.available == 0
+    assert all(c.stop.await_count <= 1 for c in factory.made)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_supported():
+    with patch.object(warm_module.shutil, "which", return_value=None):
+        assert not await checkpoint_supported()
+    with patch.object(warm_module.shutil, "which", return_value="/usr/sbin/criu"), \
+            patch("cyberred.tools.container_pool._docker", AsyncMock(return_value="true\n")):
+        assert await checkpoint_supported()
+    with patch.object(warm_module.shutil, "which", return_value="/usr/sbin/criu"), \
+            patch("cyberred.tools.container_pool._docker", AsyncMock(side_effect=OSError)):
+        assert not await checkpoint_supported()
+
+
+@pytest.mark.asyncio
+async def test_default_factories_build_real_containers():
+    from cyberred.tools.container_pool import RealContainer
+
+    assert isinstance(warm_module._default_factory(), RealContainer)
+    with patch.object(RealContainer, "restore", AsyncMock(return_value="restored")) as restore:
+        assert await warm_module._default_restorer("k", "/ckpt") == "restored"
+    restore.assert_awaited_once_with("k", "/ckpt")
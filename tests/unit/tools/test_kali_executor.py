@@ -27,7 +27,9 @@ def mock_pool(mock_container):
 
 @pytest.fixture
 def mock_scope_validator():
-    return MagicMock(spec=ScopeValidator)
+    validator = MagicMock(spec=ScopeValidator)
+    validator.argument_schemas = {}
+    return validator
 
 @pytest.mark.unit
 def test_kali_executor_init(mock_pool, mock_scope_validator):
@@ -49,7 +51,7 @@ async def test_execute_success(mock_pool, mock_scope_validator, mock_container):
     assert result.stdout == "hello"
     mock_scope_validator.validate.assert_called_with(command="echo hello") # Task 4
     mock_pool.acquire.assert_called_once()
-    mock_container.execute.assert_called_with("echo hello", timeout=300)
+    mock_container.execute.assert_called_with("echo hello", timeout=300, on_output=None)
 
 @pytest.mark.asyncio
 async def test_execute_timeout(mock_pool, mock_scope_validator, mock_container):
@@ -223,3 +225,153 @@ async def test_execute_general_exception_returns_tool_result(mock_pool, mock_sco
     assert result.success is False
     assert result.error_type == "EXECUTION_EXCEPTION"
     assert "Unexpected error" in result.stderr
+
+@pytest.mark.asyncio
+async def test_execute_container_crash_marks_container_unhealthy(mock_pool, mock_scope_validator, mock_container):
+    """A crashed container is reported to the pool so it is quarantined on release."""
+    mock_container.execute.return_value = ToolResult(
+        success=False, stdout="", stderr="gone", exit_code=-1, duration_ms=1,
+        error_type="CONTAINER_CRASHED",
+    )
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator)
+
+    result = await executor.execute("nmap 10.0.0.1")
+
+    assert result.error_type == "CONTAINER_CRASHED"
+    mock_pool.mark_unhealthy.assert_called_once_with(mock_container)
+
+
+@pytest.mark.asyncio
+async def test_execute_passes_output_callback(mock_pool, mock_scope_validator, mock_container):
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator)
+    on_output = MagicMock()
+
+    await executor.execute("nuclei -u http://x", timeout=60, on_output=on_output)
+
+    mock_container.execute.assert_called_with("nuclei -u http://x", timeout=60, on_output=on_output)
+
+
+@pytest.mark.asyncio
+async def test_execute_via_scheduler(mock_pool, mock_scope_validator):
+    scheduler = MagicMock()
+    scheduler.submit = AsyncMock(return_value=ToolResult(
+        success=True, stdout="scheduled", stderr="", exit_code=0, duration_ms=1
+    ))
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, scheduler=scheduler)
+
+    result = await executor.execute("nmap 10.0.0.1", timeout=60, agent_id="ghost-1", engagement_id="eng-1")
+
+    assert result.stdout == "scheduled"
+    mock_scope_validator.validate.assert_called_with(command="nmap 10.0.0.1")
+    mock_pool.acquire.assert_not_called()
+    scheduler.submit.assert_awaited_once_with(
+        "nmap 10.0.0.1", tool="nmap", engagement_id="eng-1", agent_id="ghost-1",
+        timeout=60, on_output=None
+    )
+
+    await executor.execute("   ")
+    assert scheduler.submit.await_args.kwargs["tool"] == ""
+    # Profiles, quotas and breakers are keyed by the tool, not the first word
+    for command in ("/usr/bin/nmap -sV 10.0.0.1", "sudo nmap -sS 10.0.0.1"):
+        await executor.execute(command)
+        assert scheduler.submit.await_args.kwargs["tool"] == "nmap"
+
+
+@pytest.mark.asyncio
+async def test_execute_serves_cacheable_tools_from_cache(mock_pool, mock_scope_validator, mock_container):
+    from cyberred.core.result_cache import ResultCache
+
+    mock_scope_validator.snapshot.return_value.version = 1
+    cache = ResultCache({"nmap": 900})
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, cache=cache)
+
+    first = await executor.execute("nmap -sV 10.0.0.1", engagement_id="eng-1")
+    second = await executor.execute("nmap  -sV '10.0.0.1'", engagement_id="eng-1")
+
+    assert second is first
+    assert mock_pool.acquire.call_count == 1
+    # Scope is still validated on a hit
+    mock_scope_validator.validate.assert_called_with(command="nmap  -sV '10.0.0.1'")
+
+    # Another engagement or a new scope version runs the tool again
+    await executor.execute("nmap -sV 10.0.0.1", engagement_id="eng-2")
+    mock_scope_validator.snapshot.return_value.version = 2
+    await executor.execute("nmap -sV 10.0.0.1", engagement_id="eng-1")
+    assert mock_pool.acquire.call_count == 3
+
+    # Uncached tools always run
+    await executor.execute("hydra 10.0.0.1", engagement_id="eng-1")
+    await executor.execute("hydra 10.0.0.1", engagement_id="eng-1")
+    assert mock_pool.acquire.call_count == 5
+
+
+def test_cache_key_uses_scope_argument_schemas(mock_pool, mock_scope_validator):
+    from cyberred.core.result_cache import ResultCache
+    from cyberred.tools.command_parser import ArgumentSchema
+
+    mock_scope_validator.snapshot.return_value.version = 1
+    mock_scope_validator.argument_schemas = {"nmap": ArgumentSchema.from_dict({"value_flags": ["--excludefile"]})}
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, cache=ResultCache({"nmap": 900}))
+
+    # Without the schema, hosts.skip would be taken for a target
+    assert executor._cache_key("nmap --excludefile hosts.skip 10.0.0.1")[2] == ("10.0.0.1",)
+
+
+@pytest.mark.asyncio
+async def test_execute_cache_skips_failures_and_replays_to_streams(mock_pool, mock_scope_validator, mock_container):
+    from cyberred.core.result_cache import ResultCache
+
+    cache = ResultCache({"nmap": 900})
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, cache=cache)
+    on_output = MagicMock()
+
+    # Streamed runs are not stored (stdout is not retained)
+    await executor.execute("nmap 10.0.0.1", on_output=on_output)
+    mock_container.execute.return_value = ToolResult(False, "", "err", 1, 10, "NON_ZERO_EXIT")
+    await executor.execute("nmap 10.0.0.1")
+    assert cache.get_metrics()["stores"] == 0
+
+    mock_container.execute.return_value = ToolResult(True, "cached out", "", 0, 10)
+    await executor.execute("nmap 10.0.0.1")
+    result = await executor.execute("nmap 10.0.0.1", on_output=on_output)
+
+    on_output.assert_called_with("stdout", b"cached out")
+    assert result.success and result.stdout == ""
+    assert mock_pool.acquire.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_replays_stored_output_in_full(mock_pool, mock_scope_validator, mock_container, tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.core.result_cache import ResultCache
+
+    store = BlobStore(tmp_path)
+    mock_pool.blob_store = store
+    mock_container.execute.return_value = ToolResult(True, "80/", "", 0, 10, output_ref=store.put(b"80/tcp open"))
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, cache=ResultCache({"nmap": 900}))
+    on_output = MagicMock()
+
+    await executor.execute("nmap 10.0.0.1")
+    await executor.execute("nmap 10.0.0.1", on_output=on_output)
+
+    on_output.assert_called_once_with("stdout", b"80/tcp open")
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_with_evicted_output_runs_again(mock_pool, mock_scope_validator, mock_container, tmp_path):
+    from cyberred.core.blob_store import BlobStore
+    from cyberred.core.result_cache import ResultCache
+
+    store = BlobStore(tmp_path)
+    mock_pool.blob_store = store
+    digest = store.put(b"80/tcp open")
+    mock_container.execute.return_value = ToolResult(True, "80/", "", 0, 10, output_ref=digest)
+    executor = KaliExecutor(pool=mock_pool, scope_validator=mock_scope_validator, cache=ResultCache({"nmap": 900}))
+
+    await executor.execute("nmap 10.0.0.1")
+    await executor.execute("nmap 10.0.0.1")
+    assert mock_pool.acquire.call_count == 1
+    store.delete(digest)
+    await executor.execute("nmap 10.0.0.1")
+
+    assert mock_pool.acquire.call_count == 2
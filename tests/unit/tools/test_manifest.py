@@ -111,3 +111,97 @@ categories:
 
 
 
+
+def test_manifest_argument_schema(tmp_path):
+    """Tools may declare an arguments block for scope target extraction."""
+    from cyberred.tools.manifest import ManifestLoader
+
+    manifest_content = """
+version: "1.0"
+categories:
+  reconnaissance:
+    tools:
+      - name: nmap
+        arguments:
+          port_flags: ["-p"]
+          value_flags: ["-oX"]
+      - name: whois
+"""
+    p = tmp_path / "manifest.yaml"
+    p.write_text(manifest_content)
+
+    tools = {t.name: t for t in ManifestLoader.from_file(str(p)).load()}
+    assert tools["nmap"].arguments == {"port_flags": ["-p"], "value_flags": ["-oX"]}
+    assert tools["whois"].arguments == {}
+
+def test_manifest_resource_profiles(tmp_path):
+    """Tools may declare a resources block for scheduler admission."""
+    from cyberred.core.scheduler import ToolProfile
+    from cyberred.tools.manifest import ManifestLoader, load_tool_profiles
+
+    manifest_content = """
+version: "1.0"
+categories:
+  reconnaissance:
+    tools:
+      - name: nmap
+        resources:
+          expected_duration: 600
+          cpu: 1.0
+          max_concurrent: 4
+      - name: whois
+"""
+    p = tmp_path / "manifest.yaml"
+    p.write_text(manifest_content)
+
+    tools = {t.name: t for t in ManifestLoader.from_file(str(p)).load()}
+    assert tools["whois"].resources == {}
+    assert load_tool_profiles(p) == {
+        "nmap": ToolProfile(expected_duration=600.0, cpu=1.0, max_concurrent=4)
+    }
+
+
+def test_shipped_manifest_resource_profiles():
+    """The shipped manifest profiles the heavy tools."""
+    from pathlib import Path
+    from cyberred.tools.manifest import load_tool_profiles
+
+    manifest = Path(__file__).resolve().parents[3] / "tools" / "manifest.yaml"
+    profiles = load_tool_profiles(manifest)
+    assert profiles["hydra"].max_concurrent == 2
+    assert profiles["whatweb"].expected_duration < profiles["sqlmap"].expected_duration
+
+
+def test_manifest_cache_ttls(tmp_path):
+    """Tools opt in to result caching with a cache block."""
+    from cyberred.tools.manifest import ManifestLoader, load_cache_ttls
+
+    manifest_content = """
+version: "1.0"
+categories:
+  reconnaissance:
+    tools:
+      - name: whatweb
+        cache:
+          ttl: 1800
+      - name: hydra
+        cache: {}
+      - name: whois
+"""
+    p = tmp_path / "manifest.yaml"
+    p.write_text(manifest_content)
+
+    tools = {t.name: t for t in ManifestLoader.from_file(str(p)).load()}
+    assert tools["whois"].cache == {}
+    assert load_cache_ttls(p) == {"whatweb": 1800.0}
+
+
+def test_shipped_manifest_caches_only_recon_tools():
+    """Only idempotent recon tools are cached."""
+    from pathlib import Path
+    from cyberred.tools.manifest import load_cache_ttls
+
+    manifest = Path(__file__).resolve().parents[3] / "tools" / "manifest.yaml"
+    ttls = load_cache_ttls(manifest)
+    assert {"nmap", "whatweb", "wafw00f", "subfinder", "nuclei"} <= set(ttls)
+    assert not {"hydra", "sqlmap", "ffuf"} & set(ttls)
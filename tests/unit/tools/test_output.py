@@ -1,3 +1,4 @@
+import inspect
 import pytest
 import structlog
 import json
@@ -452,9 +453,9 @@ def test_locking_mechanism(MockRLock):
     
     mock_lock.reset_mock()
     
-    # Process should acquire lock
+    # Process reads the current parser map without the lock
     processor.process("out", "err", "tool", 0, "id", "target")
-    mock_lock.__enter__.assert_called()
+    mock_lock.__enter__.assert_not_called()
 
 def test_watcher_lifecycle_edge_cases():
     """Verify start/stop idempotency and robustness."""
@@ -669,3 +670,189 @@ def test_tier1_parser_receives_error_type():
     assert len(received_error_type) == 1
     assert received_error_type[0] == "NON_ZERO_EXIT"
 
+
+
+class TestOutputStream:
+    """Incremental Tier 1 parsing of streamed output."""
+
+    AGENT = "00000000-0000-4000-8000-000000000001"
+
+    def test_open_stream_returns_none_without_line_parser(self):
+        assert OutputProcessor().open_stream("sqlmap", self.AGENT, "http://10.0.0.1") is None
+
+    def test_findings_are_emitted_as_lines_arrive(self):
+        seen = []
+        stream = OutputProcessor(max_raw_length=20).open_stream(
+            "Gobuster", self.AGENT, "example.com", on_finding=seen.append
+        )
+        stream.feed("stdout", b"/admin (Status: 200) [Size: 1]\n/back")
+        assert len(seen) == 1
+        stream.feed("stderr", b"/ignored (Status: 200) [Size: 1]\n")
+        stream.feed("stdout", b"up/ (Status: 301) [Size: 2]")
+        assert len(seen) == 1
+
+        result = stream.finish()
+        assert len(seen) == 2
+        assert result.findings == seen
+        assert result.tier == 1
+        assert "(streamed)" in result.summary
+        # Only the tail of stdout is kept
+        assert len(result.raw_truncated) == 20
+        assert result.raw_truncated.endswith("[Size: 2]")
+
+    def test_parser_and_callback_errors_are_logged(self):
+        def boom(finding):
+            raise RuntimeError("subscriber down")
+
+        stream = OutputProcessor().open_stream("gobuster", self.AGENT, "example.com", on_finding=boom)
+        stream.feed("stdout", b"/admin (Status: 200) [Size: 1]\n")
+        assert len(stream.findings) == 1
+
+        with patch.object(stream._parser, "feed", side_effect=ValueError("bad line")):
+            stream.feed("stdout", b"/x (Status: 200) [Size: 1]\n")
+        assert len(stream.finish().findings) == 1
+
+    def test_stream_without_callback_collects_findings(self):
+        stream = OutputProcessor().open_stream("ffuf", self.AGENT, "example.com")
+        stream.feed("stdout", b'{"url": "http://example.com/a", "status": 200}\n')
+        assert len(stream.finish().findings) == 1
+
+
+def test_builtin_parsers_resolved_lazily():
+    """builtin_parsers=True routes known tools to tools/parsers on first use."""
+    from cyberred.tools.output import OutputProcessor
+    
+    processor = OutputProcessor(builtin_parsers=True)
+    assert processor.get_registered_parsers() == []
+    
+    result = processor.process(
+        "Discovered open port 80/tcp on 10.0.0.5", "", "Masscan", 0,
+        "00000000-0000-0000-0000-000000000000", "10.0.0.5"
+    )
+    
+    assert result.tier == 1
+    assert result.findings[0].tool == "masscan"
+    assert processor.get_registered_parsers() == ["masscan"]
+
+def test_parser_calling_convention_cached_at_registration():
+    """The parser signature is inspected once, when it is registered."""
+    from cyberred.tools.output import OutputProcessor
+    
+    processor = OutputProcessor()
+    seen = []
+    
+    def parser(stdout, stderr, exit_code, agent_id, target, error_type=None):
+        seen.append(error_type)
+        return []
+    
+    with patch("cyberred.tools.parsers.registry.inspect.signature", wraps=inspect.signature) as sig:
+        processor.register_parser("tool", parser)
+        processor.process("out", "", "tool", 1, "id", "target", error_type="NON_ZERO_EXIT")
+        processor.process("out", "", "tool", 0, "id", "target")
+    
+    assert sig.call_count == 1
+    assert seen == ["NON_ZERO_EXIT", None]
+
+MASSCAN_AGENT = "00000000-0000-0000-0000-000000000000"
+MASSCAN_OUT = "Discovered open port 80/tcp on 10.0.0.5"
+
+async def test_process_async_small_output_inline():
+    """Outputs below the pool threshold are parsed on the calling loop."""
+    from cyberred.tools.parse_pool import ParsePool
+    
+    pool = ParsePool(threshold=1 << 20)
+    processor = OutputProcessor(builtin_parsers=True, parse_pool=pool)
+    with patch.object(pool, "parse") as parse:
+        result = await processor.process_async(MASSCAN_OUT, "", "masscan", 0, MASSCAN_AGENT, "10.0.0.5")
+    
+    parse.assert_not_called()
+    assert result.tier == 1
+    assert result.findings[0].target == "10.0.0.5"
+    metrics = processor.get_parse_metrics()["masscan"]
+    assert metrics["calls"] == 1
+    assert metrics["offloaded"] == 0
+    assert metrics["chars"] == len(MASSCAN_OUT)
+    assert metrics["seconds"] >= 0
+
+async def test_process_async_large_output_offloaded():
+    """Outputs at the threshold go to the parse pool."""
+    from cyberred.tools.parse_pool import ParsePool
+    
+    pool = ParsePool(threshold=10)
+    processor = OutputProcessor(builtin_parsers=True, parse_pool=pool)
+    finding = Finding(
+        id="11111111-1111-1111-1111-111111111111", type="open_port", severity="info",
+        target="10.0.0.5", evidence="e", agent_id=MASSCAN_AGENT,
+        timestamp="2023-01-01T00:00:00+00:00", tool="masscan", topic="t", signature=""
+    )
+    with patch.object(pool, "parse", AsyncMock(return_value=[finding])) as parse:
+        result = await processor.process_async(MASSCAN_OUT, "", "masscan", 1, MASSCAN_AGENT, "10.0.0.5", error_type="TIMEOUT")
+    
+    parse.assert_awaited_once()
+    assert parse.await_args.args[1:] == (MASSCAN_OUT, "", 1, MASSCAN_AGENT, "10.0.0.5", "TIMEOUT")
+    assert result.tier == 1
+    assert result.findings == [finding]
+    assert processor.get_parse_metrics()["masscan"]["offloaded"] == 1
+
+async def test_process_async_offload_failure_falls_back():
+    """A failed offloaded parse falls back to Tier 2/3 off the loop."""
+    from cyberred.tools.parse_pool import ParsePool
+    
+    pool = ParsePool(threshold=0)
+    processor = OutputProcessor(builtin_parsers=True, parse_pool=pool)
+    with patch.object(pool, "parse", AsyncMock(side_effect=RuntimeError("worker died"))), \
+         patch("cyberred.tools.output.get_gateway", side_effect=RuntimeError("no llm")):
+        result = await processor.process_async(MASSCAN_OUT, "", "masscan", 0, MASSCAN_AGENT, "10.0.0.5")
+    
+    assert result.tier == 3
+    assert processor.get_parse_metrics() == {}
+
+@patch("cyberred.tools.output.get_gateway")
+async def test_process_async_without_parser_runs_tier2_in_thread(mock_get_gateway):
+    """Tier 2 (which runs its own event loop) works from async callers."""
+    mock_gateway = AsyncMock()
+    mock_gateway.complete.return_value = MagicMock(content='{"findings": [], "summary": "llm"}')
+    mock_get_gateway.return_value = mock_gateway
+    
+    processor = OutputProcessor()
+    result = await processor.process_async("out", "", "unknowntool", 0, MASSCAN_AGENT, "10.0.0.5")
+    
+    assert result.tier == 2
+    assert result.summary == "llm"
+
+@patch("cyberred.tools.output.get_gateway")
+def test_tier2_prompt_carries_findings_past_noise(mock_get_gateway):
+    """Tier 2 prompts keep findings a fixed-length cut would lose."""
+    mock_gateway = AsyncMock()
+    mock_gateway.complete.return_value = MagicMock(content='{"findings": [], "summary": "llm"}')
+    mock_get_gateway.return_value = mock_gateway
+    noise = "\n".join(f"\x1b[2m[INFO] Trying payload {i}\x1b[0m" for i in range(500))
+    stdout = noise + "\n\n[+] Valid credentials admin:hunter2\n\n" + noise
+
+    processor = OutputProcessor(tier2_token_budget=200)
+    processor.process(stdout, "", "unknowntool", 0, MASSCAN_AGENT, "10.0.0.5")
+
+    prompt = mock_gateway.complete.call_args[0][0].prompt
+    assert len(stdout) > 4000
+    assert "[+] Valid credentials admin:hunter2" in prompt
+    assert "similar lines]" in prompt
+    assert "\x1b" not in prompt
+
+@patch("cyberred.tools.output.get_gateway")
+def test_tier2_results_recorded_in_sample_store(mock_get_gateway):
+    """Tier 2 findings are recorded with the LLM's evidence snippet."""
+    from cyberred.tools.parser_learning import SampleStore
+
+    mock_gateway = AsyncMock()
+    mock_gateway.complete.return_value = MagicMock(content=json.dumps({
+        "findings": [{"type": "credential", "severity": "high", "description": "login", "evidence": "[+] admin:admin"}],
+        "summary": "llm",
+    }))
+    mock_get_gateway.return_value = mock_gateway
+    store = SampleStore()
+
+    processor = OutputProcessor(sample_store=store)
+    processor.process("[+] admin:admin", "", "CredCheck", 0, MASSCAN_AGENT, "10.0.0.5")
+
+    assert [tuple(sample) for sample in store.samples("credcheck")] == [
+        ("[+] admin:admin", (("credential", "high", "[+] admin:admin"),))]
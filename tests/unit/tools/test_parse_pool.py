@@ -0,0 +1,139 @@
+import os
+import signal
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pytest
+
+from cyberred.core.models import Finding
+from cyberred.tools.parse_pool import (
+    FINDING_FIELDS,
+    ParsePool,
+    _parse,
+    _preload,
+    _worker_parsers,
+    decode_findings,
+    encode_findings,
+)
+from cyberred.tools.parsers.common import create_finding
+from cyberred.tools.parsers.registry import ParserRegistry, RegisteredParser
+
+AGENT_ID = str(uuid.uuid4())
+MASSCAN_OUT = "Discovered open port 80/tcp on 10.0.0.5\nDiscovered open port 22/tcp on 10.0.0.6\n"
+
+
+def masscan():
+    return ParserRegistry(builtins=True).get("masscan")
+
+
+def test_encode_decode_round_trip():
+    """Findings survive encoding as field tuples."""
+    findings = [
+        create_finding("open_port", "info", "10.0.0.1", "22/tcp", AGENT_ID, "nmap"),
+        create_finding("vuln", "high", "example.com", "CVE", AGENT_ID, "nuclei", topic="t"),
+    ]
+    rows = encode_findings(findings)
+
+    assert rows[0] == tuple(getattr(findings[0], name) for name in FINDING_FIELDS)
+    assert decode_findings(rows) == findings
+
+
+def test_offloads_only_large_builtin_parses():
+    """Offload needs a built-in parser and an output at the threshold."""
+    pool = ParsePool(threshold=100)
+    registered = RegisteredParser.wrap(lambda *args: [])
+
+    assert pool.offloads(masscan(), 100) is True
+    assert pool.offloads(masscan(), 99) is False
+    assert pool.offloads(registered, 10_000) is False
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError, match="threshold"):
+        ParsePool(threshold=-1)
+
+
+async def test_parse_rejects_registered_parser():
+    """Parsers without a module cannot be imported by workers."""
+    pool = ParsePool()
+    with pytest.raises(ValueError, match="built-in"):
+        await pool.parse(RegisteredParser.wrap(lambda *args: []), "", "", 0, AGENT_ID, "t")
+
+
+def test_worker_entry_point_caches_parser():
+    """_parse loads a built-in once per worker and encodes its findings."""
+    _worker_parsers.pop("masscan", None)
+    _preload(("masscan",))
+
+    rows = _parse("masscan", MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5", None)
+    parser = _worker_parsers["masscan"]
+    _parse("masscan", MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5", None)
+
+    assert _worker_parsers["masscan"] is parser
+    assert [row[FINDING_FIELDS.index("target")] for row in rows] == ["10.0.0.5", "10.0.0.6"]
+
+
+async def test_parse_in_worker_process():
+    """A real worker parses and findings come back as Finding objects."""
+    pool = ParsePool(threshold=0, max_workers=1, preload=["masscan"])
+    try:
+        findings = await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+        again = await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+    finally:
+        pool.shutdown()
+        pool.shutdown()  # idempotent
+
+    assert all(isinstance(f, Finding) for f in findings)
+    assert [f.target for f in findings] == ["10.0.0.5", "10.0.0.6"]
+    assert findings[0].agent_id == AGENT_ID
+    assert len(again) == 2
+
+
+async def test_parse_restarts_pool_after_worker_death():
+    """A killed worker breaks the pool; the next parse spawns a new one."""
+    pool = ParsePool(threshold=0, max_workers=1, preload=["masscan"])
+    try:
+        await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+        broken = pool._executor
+        for pid in list(broken._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        with pytest.raises(BrokenProcessPool):
+            await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+        assert pool._executor is None
+
+        findings = await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+        assert pool._executor is not broken
+    finally:
+        pool.shutdown()
+
+    assert len(findings) == 2
+
+
+async def test_broken_pool_is_discarded_once():
+    """A parse failing on a pool that was already replaced leaves it alone."""
+    pool = ParsePool(threshold=0)
+    with patch("cyberred.tools.parse_pool.ProcessPoolExecutor") as Executor:
+        replacement = object()
+
+        def broken(*args):
+            pool._executor = replacement
+            raise BrokenProcessPool("worker died")
+
+        Executor.return_value.submit.side_effect = broken
+        with pytest.raises(BrokenProcessPool):
+            await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+    assert pool._executor is replacement
+    Executor.return_value.shutdown.assert_not_called()
+
+
+async def test_parse_propagates_worker_errors():
+    """Exceptions raised by the parser in the worker reach the caller."""
+    pool = ParsePool(threshold=0)
+    with patch("cyberred.tools.parse_pool.ProcessPoolExecutor") as Executor:
+        Executor.return_value.submit.side_effect = RuntimeError("boom")
+        with pytest.raises(RuntimeError, match="boom"):
+            await pool.parse(masscan(), MASSCAN_OUT, "", 0, AGENT_ID, "10.0.0.5")
+        pool.shutdown(wait=False)
+    Executor.return_value.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
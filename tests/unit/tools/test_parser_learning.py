@@ -0,0 +1,152 @@
+import uuid
+
+import pytest
+
+from cyberred.tools.output import OutputProcessor
+from cyberred.tools.parser_learning import (
+    CONTEXT_LINES,
+    MAX_SAMPLE_CHARS,
+    MIN_SAMPLES,
+    ParserProposal,
+    SampleStore,
+    TemplateParser,
+    TemplateRule,
+    Tier2Sample,
+    excerpt_sample,
+    propose_parser,
+)
+from cyberred.tools.parser_watcher import ParserWatcher
+
+AGENT_ID = str(uuid.uuid4())
+CREDENTIAL = TemplateRule(r'\[\+\]\s+Valid\s+credentials:\s+\S+', "credential", "high")
+
+
+def credcheck_sample(n, users):
+    """Output of a credential checker and the findings Tier 2 returned."""
+    lines = ["credcheck v2.1", f"Target: 10.0.0.{n}"]
+    findings = []
+    for user in users:
+        lines.append(f"[*] Checking {user}")
+        lines.append(f"\x1b[32m[+] Valid credentials: {user}:Summer{n}!\x1b[0m")
+        findings.append(("credential", "high", f"[+] Valid credentials: {user}:Summer{n}!"))
+    lines.append(f"Finished in {n}.5s")
+    return Tier2Sample("\n".join(lines), tuple(findings))
+
+
+SAMPLES = [credcheck_sample(n, users) for n, users in enumerate(
+    [["alice"], ["bob", "carol"], [], ["dave"], ["eve", "mallory"]])]
+
+
+def test_proposes_generalized_rule():
+    proposal = propose_parser("credcheck", SAMPLES)
+
+    assert proposal == ParserProposal("credcheck", (CREDENTIAL,), len(SAMPLES), 1.0, 1.0)
+    assert proposal.build().rules == [CREDENTIAL]
+
+
+def test_generalizes_numbers_and_addresses():
+    samples = [
+        Tier2Sample(f"Host 10.0.{n}.1 port {n * 11} open\nbanner", (("open_port", "info", f"port {n * 11} open"),))
+        for n in range(1, 4)
+    ]
+    proposal = propose_parser("portcheck", samples)
+
+    assert proposal.rules == (TemplateRule(
+        r'Host\s+(?:\d{1,3}\.){3}\d{1,3}\s+port\s+\d+\s+open', "open_port", "info"),)
+
+
+def test_template_parser_extracts_findings():
+    parser = TemplateParser("credcheck", [CREDENTIAL])
+    findings = parser("[*] Checking zed\n  [+] Valid credentials: zed:pw  \n", "", 0, AGENT_ID, "10.0.0.9")
+
+    assert [(f.type, f.severity, f.evidence, f.tool, f.target) for f in findings] == [
+        ("credential", "high", "[+] Valid credentials: zed:pw", "credcheck", "10.0.0.9")]
+
+
+def test_needs_support_in_several_samples():
+    assert propose_parser("credcheck", SAMPLES[:1]) is None
+
+
+def test_drops_imprecise_rules():
+    """A line shape that is evidence only sometimes yields no rule."""
+    samples = [
+        Tier2Sample("user admin found\nuser guest found", (("account", "medium", "user admin found"),)),
+        Tier2Sample("user root found\nuser nobody found", (("account", "medium", "user root found"),)),
+    ]
+    assert propose_parser("users", samples) is None
+
+
+def test_rejects_low_recall():
+    """Findings whose evidence is not in the output cannot be learned."""
+    samples = [
+        Tier2Sample(sample.stdout, sample.findings + (("vuln", "high", "paraphrased by the model\nv2.1"),))
+        for sample in SAMPLES
+    ]
+    assert propose_parser("credcheck", samples) is None
+
+
+def test_rejects_invalid_tool_name():
+    with pytest.raises(ValueError):
+        propose_parser("../evil", SAMPLES)
+
+
+def test_sample_store_candidates_and_proposal():
+    store = SampleStore(max_samples=MIN_SAMPLES)
+    for sample in SAMPLES + SAMPLES[:2]:
+        store.record("CredCheck", sample.stdout, sample.findings)
+    store.record("rare", "output", [])
+
+    assert len(store.samples("credcheck")) == MIN_SAMPLES
+    assert store.candidates() == ["credcheck"]
+    assert store.propose("credcheck").rules == (CREDENTIAL,)
+    assert store.propose("rare") is None
+
+
+def test_sample_store_keeps_excerpts_of_large_outputs():
+    noise = [f"[*] Checking user{n}" for n in range(100_000)]
+    store = SampleStore()
+    for n, sample in enumerate(SAMPLES):
+        lines = sample.stdout.split("\n")
+        store.record("credcheck", "\n".join(noise[:n * 1000] + lines + noise), sample.findings)
+
+    samples = store.samples("credcheck")
+    assert all(len(sample.stdout) <= MAX_SAMPLE_CHARS for sample in samples)
+    assert [sample.findings for sample in samples] == [sample.findings for sample in SAMPLES]
+    assert store.propose("credcheck").rules == (CREDENTIAL,)
+
+
+def test_excerpt_keeps_context_and_size_cap():
+    lines = [f"line {n:05d}" for n in range(50_000)]
+    lines[100] = lines[40_000] = "[+] Valid credentials: alice:pw"
+    findings = (("credential", "high", "[+] Valid credentials: alice:pw"),
+                ("vuln", "high", "paraphrased by the model"))
+
+    sample = excerpt_sample("\n".join(lines), findings)
+    kept = sample.stdout.split("\n")
+    assert kept == lines[100 - CONTEXT_LINES:100 + CONTEXT_LINES + 1] + lines[40_000 - CONTEXT_LINES:40_000 + CONTEXT_LINES + 1]
+    assert sample.findings == findings
+
+    # No evidence located: the head of the output, up to the cap
+    sample = excerpt_sample("\n".join(lines), (("vuln", "high", "paraphrased by the model"),))
+    assert len(sample.stdout) <= MAX_SAMPLE_CHARS and sample.stdout.startswith("line 00000\nline 00001")
+
+    # Evidence cut off by the cap: its finding is dropped
+    evidence = "[+] Valid credentials: bob:pw"
+    dense = [evidence] + [f"{evidence} {n:05d}" for n in range(10_000)] + ["[+] Valid credentials: zed"]
+    sample = excerpt_sample("\n".join(dense), (("credential", "high", evidence),
+                                               ("credential", "high", "[+] Valid credentials: zed")))
+    assert sample.findings == (("credential", "high", evidence),)
+
+
+def test_written_proposal_loads_in_parser_watcher(tmp_path):
+    processor = OutputProcessor()
+    path = propose_parser("credcheck", SAMPLES).write(tmp_path)
+
+    assert path == tmp_path / "credcheck.py"
+    assert ParserWatcher(tmp_path, processor)._reload_parser(path)
+    result = processor.process(SAMPLES[1].stdout, "", "credcheck", 0, AGENT_ID, "10.0.0.1")
+    assert result.tier == 1
+    assert [f.evidence for f in result.findings] == [evidence for _, _, evidence in SAMPLES[1].findings]
+
+    with pytest.raises(FileExistsError):
+        propose_parser("credcheck", SAMPLES).write(tmp_path)
@@ -975,3 +975,582 @@ class TestCoverageEdgeCases:
 
 
 
+
+
+class TestDecisionCache:
+    """Test memoized validation decisions and aggregated audit (user-027)."""
+
+    @pytest.fixture
+    def validator(self):
+        return ScopeValidator.from_config({
+            "allowed_targets": ["192.168.1.0/24", "example.com"],
+            "allowed_ports": [80, 443],
+            "allow_private": True,
+        })
+
+    def test_repeat_allow_skips_pipeline(self, validator):
+        with patch.object(
+            validator, "_validate_uncached", wraps=validator._validate_uncached
+        ) as uncached:
+            for _ in range(5):
+                assert validator.validate(target="192.168.1.10", port=80) is True
+        assert uncached.call_count == 1
+
+    def test_repeat_deny_reraises_same_violation(self, validator):
+        with pytest.raises(ScopeViolationError) as first:
+            validator.validate(target="10.0.0.1")
+        with patch.object(validator, "_validate_uncached") as uncached:
+            with pytest.raises(ScopeViolationError) as second:
+                validator.validate(target="10.0.0.1")
+        uncached.assert_not_called()
+        assert second.value.scope_rule == first.value.scope_rule == "ip_out_of_scope"
+        assert str(second.value) == str(first.value)
+        assert second.value is not first.value
+
+    def test_validation_errors_are_not_cached(self, validator):
+        with patch.object(
+            validator, "_is_ip_in_scope", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(ScopeViolationError, match="fail-closed"):
+                validator.validate(target="192.168.1.10")
+        assert validator.validate(target="192.168.1.10") is True
+
+    def test_cache_is_bounded_lru(self):
+        validator = ScopeValidator(
+            ScopeValidator.from_config({
+                "allowed_targets": ["192.168.1.0/24"], "allow_private": True,
+            }).config,
+            cache_size=2,
+        )
+        validator.validate(target="192.168.1.1")
+        validator.validate(target="192.168.1.2")
+        validator.validate(target="192.168.1.1")  # refresh .1
+        validator.validate(target="192.168.1.3")  # evicts .2
+        keys = [k[1] for k in validator._decisions]
+        assert keys == ["192.168.1.1", "192.168.1.3"]
+
+    def test_cache_disabled_with_zero_size(self):
+        config = ScopeValidator.from_config({"allowed_targets": ["example.com"]}).config
+        validator = ScopeValidator(config, cache_size=0)
+        validator.validate(target="example.com")
+        assert len(validator._decisions) == 0
+
+    def test_reload_invalidates_decisions(self, validator):
+        assert validator.validate(target="192.168.1.10") is True
+        narrowed = ScopeValidator.from_config({
+            "allowed_targets": ["192.168.2.0/24"], "allow_private": True,
+        }).config
+        validator.reload(narrowed)
+        assert len(validator._decisions) == 0
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="192.168.1.10")
+
+    def test_reload_rejects_non_config(self, validator):
+        with pytest.raises(ValueError):
+            validator.reload({"allowed_targets": []})  # type: ignore[arg-type]
+
+    def test_in_place_config_change_invalidates(self, validator):
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="example.org")
+        validator.config.allowed_hostnames.append("example.org")
+        assert validator.validate(target="example.org") is True
+
+    def test_decision_from_old_scope_is_not_stored(self, validator):
+        version = validator.snapshot().version
+        validator.reload(validator.config)
+        validator._store_decision((version, "x", None, None, None), MagicMock(), version)
+        assert len(validator._decisions) == 0
+
+    def test_unhashable_target_fails_closed(self, validator):
+        with pytest.raises(ScopeViolationError, match="fail-closed"):
+            validator.validate(target=["192.168.1.1"])  # type: ignore[arg-type]
+
+    def test_cached_hits_are_aggregated_not_logged(self, validator):
+        validator.validate(target="192.168.1.10")
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="10.0.0.1")
+        with patch("cyberred.tools.scope.log") as mock_log:
+            for _ in range(3):
+                validator.validate(target="192.168.1.10")
+            with pytest.raises(ScopeViolationError):
+                validator.validate(target="10.0.0.1")
+            mock_log.info.assert_not_called()
+            validator.flush_audit()
+        mock_log.info.assert_called_once()
+        args, kwargs = mock_log.info.call_args
+        assert args[0] == "scope_validation_summary"
+        assert kwargs["targets"] == {
+            "192.168.1.10": {"allow": 3, "deny": 0},
+            "10.0.0.1": {"allow": 0, "deny": 1},
+        }
+        assert kwargs["allow"] == 3
+        assert kwargs["deny"] == 1
+
+    def test_flush_audit_without_counts_is_silent(self, validator):
+        with patch("cyberred.tools.scope.log") as mock_log:
+            validator.flush_audit()
+        mock_log.info.assert_not_called()
+
+    def test_audit_flushes_after_interval(self, validator):
+        validator.validate(target="192.168.1.10")
+        with patch("cyberred.tools.scope.AUDIT_FLUSH_INTERVAL", 0.0):
+            with patch("cyberred.tools.scope.log") as mock_log:
+                validator.validate(target="192.168.1.10")
+        assert mock_log.info.call_args[0][0] == "scope_validation_summary"
+
+
+class TestScopeFileWatching:
+    """Test scope hot reload via ConfigWatcher (user-027)."""
+
+    @pytest.fixture
+    def scope_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "scope.yaml"
+        path.write_text('allowed_targets:\n  - "example.com"\n')
+        return path
+
+    def test_start_watching_requires_path(self):
+        validator = ScopeValidator.from_config({"allowed_targets": ["example.com"]})
+        with pytest.raises(ValueError, match="No scope file"):
+            validator.start_watching()
+
+    def test_start_and_stop_watching(self, scope_file: Path):
+        validator = ScopeValidator.from_file(scope_file)
+        with patch("cyberred.core.config_watcher.ConfigWatcher") as watcher_cls:
+            validator.start_watching()
+            watcher_cls.assert_called_once_with(
+                config_path=scope_file,
+                callback=validator._handle_scope_file_change,
+            )
+            watcher_cls.return_value.start.assert_called_once()
+            validator.stop_watching()
+            watcher_cls.return_value.stop.assert_called_once()
+        validator.stop_watching()  # idempotent
+
+    def test_start_watching_explicit_path(self, scope_file: Path):
+        validator = ScopeValidator.from_config({"allowed_targets": ["example.com"]})
+        with patch("cyberred.core.config_watcher.ConfigWatcher"):
+            validator.start_watching(str(scope_file))
+        assert validator._source_path == scope_file
+
+    def test_file_change_reloads_scope(self, scope_file: Path):
+        validator = ScopeValidator.from_file(scope_file)
+        assert validator.validate(target="example.com") is True
+        scope_file.write_text('allowed_targets:\n  - "example.org"\n')
+        validator._handle_scope_file_change(scope_file)
+        assert validator.validate(target="example.org") is True
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="example.com")
+
+    def test_invalid_file_fails_closed(self, scope_file: Path):
+        validator = ScopeValidator.from_file(scope_file)
+        assert validator.validate(target="example.com") is True
+        scope_file.write_text("not_a_scope: true\n")
+        validator._handle_scope_file_change(scope_file)
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="example.com")
+
+
+class TestCIDRContainment:
+    """CIDR targets must lie entirely inside the scope (user-028)."""
+
+    @pytest.fixture
+    def validator(self):
+        return ScopeValidator.from_config({
+            "allowed_targets": ["192.168.1.0/24", "203.0.113.0/24"],
+            "allow_private": True,
+        })
+
+    def test_contained_cidr_passes(self, validator):
+        assert validator.validate(target="192.168.1.128/25") is True
+
+    def test_wider_cidr_with_in_scope_base_is_denied(self, validator):
+        """Base address 192.168.1.0 is in scope but /16 is not."""
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(target="192.168.1.0/16")
+        assert exc.value.scope_rule == "ip_out_of_scope"
+
+    def test_wider_cidr_in_command_is_denied(self, validator):
+        with pytest.raises(ScopeViolationError):
+            validator.validate(command="nmap -sn 192.168.1.0/16")
+
+    def test_cidr_spanning_reserved_space_is_denied(self):
+        validator = ScopeValidator.from_config({"allowed_targets": ["0.0.0.0/0"]})
+        # Ends are public, but the range spans 127.0.0.0/8
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(target="124.0.0.0/5")
+        assert exc.value.scope_rule == "reserved_ip"
+
+    def test_cidr_spanning_private_space_is_denied(self):
+        validator = ScopeValidator.from_config({"allowed_targets": ["0.0.0.0/0"]})
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(target="8.0.0.0/5")
+        assert exc.value.scope_rule == "reserved_ip"
+
+    def test_cidr_with_reserved_edge_is_denied(self):
+        validator = ScopeValidator.from_config({"allowed_targets": ["0.0.0.0/0"]})
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="127.0.0.0/30")
+
+    def test_loopback_and_private_cidr_allowed_when_configured(self):
+        validator = ScopeValidator.from_config({
+            "allowed_targets": ["0.0.0.0/0"],
+            "allow_private": True,
+            "allow_loopback": True,
+        })
+        assert validator.validate(target="120.0.0.0/5") is True
+
+    @pytest.mark.parametrize(
+        "target",
+        ["169.254.0.0/16", "100.64.0.0/10", "100.64.0.1", "198.0.0.0/8", "240.0.0.0/4"],
+    )
+    def test_special_purpose_space_matches_single_ip_policy(self, target):
+        """Ranges blocked for a single IP are blocked for a CIDR too."""
+        validator = ScopeValidator.from_config({"allowed_targets": ["0.0.0.0/0"]})
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(target=target)
+        assert exc.value.scope_rule == "reserved_ip"
+
+    def test_shared_address_space_allowed_when_private_allowed(self):
+        validator = ScopeValidator.from_config({
+            "allowed_targets": ["0.0.0.0/0"],
+            "allow_private": True,
+        })
+        assert validator.validate(target="100.64.0.0/10") is True
+        assert validator.validate(target="100.64.0.1") is True
+
+    def test_corrupted_config_denies_cidr(self, validator):
+        from ipaddress import ip_network
+        validator._matcher = MagicMock(side_effect=TypeError("corrupt"))  # type: ignore[method-assign]
+        assert validator._is_network_in_scope(ip_network("192.168.1.0/25")) is False
+
+
+class TestValidateMany:
+    """Test bulk scope validation (user-028)."""
+
+    @pytest.fixture
+    def validator(self):
+        return ScopeValidator.from_config({
+            "allowed_targets": ["192.168.1.0/24", "2001:db8::/32", "*.example.com"],
+            "allowed_ports": [80, 443],
+            "allowed_protocols": ["tcp"],
+            "allow_private": True,
+        })
+
+    def test_partitions_in_input_order(self, validator):
+        result = validator.validate_many([
+            "192.168.1.20", "10.0.0.1", "www.example.com", "evil.com",
+            "2001:db8::5", "192.168.1.0/28", "192.168.0.0/16", "192.168.1.5",
+        ])
+        assert result.allowed == [
+            "192.168.1.20", "www.example.com", "2001:db8::5",
+            "192.168.1.0/28", "192.168.1.5",
+        ]
+        assert [(d.target, d.scope_rule) for d in result.denied] == [
+            ("10.0.0.1", "ip_out_of_scope"),
+            ("evil.com", "hostname_out_of_scope"),
+            ("192.168.0.0/16", "ip_out_of_scope"),
+        ]
+        assert not result.all_allowed
+
+    def test_matches_single_validate(self, validator):
+        targets = [
+            "192.168.1.1", "192.168.2.1", "127.0.0.1", "169.254.1.1",
+            "http://www.example.com:8080/x", "https://example.com/", "example.com:443",
+            "a.example.com:22", "2001:db9::1", "", "host\x00.example.com",
+            "192.168.1.0/25", "fe80::/64",
+        ]
+        result = validator.validate_many(targets)
+        denied = {d.target: d.scope_rule for d in result.denied}
+        for target in targets:
+            try:
+                validator.validate(target=target)
+                expected = None
+            except ScopeViolationError as e:
+                expected = e.scope_rule
+            assert denied.get(target) == expected, target
+
+    def test_port_and_protocol_applied_to_batch(self, validator):
+        result = validator.validate_many(["192.168.1.1", "192.168.1.2:443"], port=8080)
+        assert result.allowed == ["192.168.1.2:443"]
+        assert result.denied[0].scope_rule == "port_blocked"
+
+        result = validator.validate_many(["192.168.1.1"], protocol="udp")
+        assert result.denied[0].scope_rule == "protocol_blocked"
+
+    def test_never_raises_on_bad_input(self, validator):
+        result = validator.validate_many([None, 42, "http://"])  # type: ignore[list-item]
+        assert result.allowed == []
+        rules = [d.scope_rule for d in result.denied]
+        assert rules == ["null_input", "validation_error", "missing_target"]
+
+    def test_corrupt_scope_denies_everything(self, validator):
+        validator.config.allowed_hostnames = None  # type: ignore[assignment]
+        result = validator.validate_many(["192.168.1.1", "www.example.com"])
+        assert result.allowed == []
+        assert {d.scope_rule for d in result.denied} == {"validation_error"}
+
+    def test_logs_single_batch_event(self, validator):
+        with patch("cyberred.tools.scope.log") as mock_log:
+            validator.validate_many(["192.168.1.1", "10.0.0.1", "10.0.0.2"])
+        mock_log.info.assert_called_once()
+        args, kwargs = mock_log.info.call_args
+        assert args[0] == "scope_validation_batch"
+        assert kwargs["total"] == 3
+        assert kwargs["allowed"] == 1
+        assert kwargs["denied_rules"] == {"ip_out_of_scope": 2}
+        assert kwargs["denied_targets"] == ["10.0.0.1", "10.0.0.2"]
+
+    def test_large_batch(self, validator):
+        hosts = [f"192.168.{i % 4}.{i % 250 + 1}" for i in range(10000)]
+        result = validator.validate_many(hosts)
+        assert len(result.allowed) == 2500
+        assert len(result.denied) == 7500
+
+
+class TestCommandTargetExtraction:
+    """Every target and port in a command is checked (user-029)."""
+
+    @pytest.fixture
+    def validator(self):
+        from cyberred.tools.command_parser import load_argument_schemas
+
+        schemas = load_argument_schemas(
+            Path(__file__).resolve().parents[3] / "tools" / "manifest.yaml"
+        )
+        return ScopeValidator.from_config(
+            {
+                "allowed_targets": ["192.168.1.0/24", "example.com"],
+                "allowed_ports": [22, 80, 443, [8000, 8100]],
+                "allow_private": True,
+            },
+            argument_schemas=schemas,
+        )
+
+    def test_all_positional_targets_must_be_in_scope(self, validator):
+        assert validator.validate(command="nmap 192.168.1.1 192.168.1.2") is True
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(command="nmap 192.168.1.1 10.0.0.1")
+        assert exc.value.target == "10.0.0.1"
+
+    def test_port_range_must_be_fully_allowed(self, validator):
+        assert validator.validate(command="nmap -p 8000-8100,22 192.168.1.1") is True
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(command="nmap -p 1-1000 192.168.1.1")
+        assert exc.value.scope_rule == "port_blocked"
+
+    def test_schema_value_flags_are_not_targets(self, validator):
+        # Without the nmap schema "out.xml" would be checked as a hostname
+        assert validator.validate(
+            command="nmap -p 80 -oX out.xml --script http-title 192.168.1.1"
+        ) is True
+
+    def test_schema_target_flags(self, validator):
+        assert validator.validate(
+            command="gobuster dir -u http://example.com -w /usr/share/wordlists/common.txt"
+        ) is True
+        with pytest.raises(ScopeViolationError):
+            validator.validate(command="subfinder -d evil.org -o out.txt")
+
+    def test_explicit_port_overrides_command_ports(self, validator):
+        assert validator.validate(port=80, command="nmap -p 1-65535 192.168.1.1") is True
+
+    @pytest.mark.parametrize("command", [
+        "ping -c 4 10.0.0.1",
+        "nmap -sV -oX out.xml 10.0.0.1",
+        "curl -o out.html http://10.0.0.1/",
+        "hydra -P rockyou.txt ssh://10.0.0.1",
+        "sudo nmap -sV 10.0.0.1",
+    ])
+    def test_common_commands_without_schemas(self, command):
+        validator = ScopeValidator.from_config(
+            {"allowed_targets": ["10.0.0.0/8", "example.com"], "allow_private": True}
+        )
+        assert validator.validate(command=command) is True
+
+    @pytest.mark.parametrize("command, target", [
+        ("nmap -sV evil.org", "evil.org"),
+        ("hydra -P rockyou.txt ssh://192.168.9.9", "192.168.9.9"),
+        ("ping 0x7f.1", "0x7f.1"),
+    ])
+    def test_flag_values_and_urls_naming_hosts_are_checked(self, command, target):
+        validator = ScopeValidator.from_config(
+            {"allowed_targets": ["10.0.0.0/8", "example.com"], "allow_private": True}
+        )
+        with pytest.raises(ScopeViolationError) as exc:
+            validator.validate(command=command)
+        assert exc.value.target == target
+
+    def test_check_injection_uses_tokenizer(self, validator):
+        validator._check_injection("nmap '192.168.1.1'")
+        with pytest.raises(ScopeViolationError):
+            validator._check_injection("nmap 192.168.1.1 && id")
+
+
+class TestScopeSnapshots:
+    """Versioned, immutable scope snapshots (user-030)."""
+
+    @pytest.fixture
+    def scope_file(self, tmp_path):
+        path = tmp_path / "scope.yaml"
+        path.write_text("allowed_targets:\n  - 192.168.1.0/24\nallow_private: true\n")
+        return path
+
+    def test_file_snapshot_hash_matches_checkpoint_hash(self, scope_file):
+        from cyberred.core.hashing import calculate_file_hash
+
+        validator = ScopeValidator.from_file(scope_file)
+        snapshot = validator.snapshot()
+        assert snapshot.version == 1
+        assert snapshot.scope_hash == calculate_file_hash(scope_file)
+        assert validator.scope_hash == snapshot.scope_hash
+
+    def test_reload_publishes_next_version(self, scope_file):
+        from cyberred.tools.scope import scope_config_hash
+
+        validator = ScopeValidator.from_file(scope_file)
+        first = validator.snapshot()
+        new_config = ScopeValidator.parse_config({"allowed_targets": ["example.com"]})
+        second = validator.reload(new_config)
+        assert second.version == 2
+        assert second.scope_hash == scope_config_hash(new_config)
+        assert validator.snapshot() is second
+        # The old snapshot is untouched
+        assert first.compiled.contains_ip(__import__("ipaddress").ip_address("192.168.1.1"))
+
+    def test_config_hash_is_order_independent(self):
+        from cyberred.tools.scope import scope_config_hash
+
+        a = ScopeValidator.parse_config({"allowed_targets": ["a.com", "10.0.0.0/8"]})
+        b = ScopeValidator.parse_config({"allowed_targets": ["10.0.0.0/8", "a.com"]})
+        c = ScopeValidator.parse_config({"allowed_targets": ["a.com"], "allowed_ports": [80]})
+        assert scope_config_hash(a) == scope_config_hash(b)
+        assert scope_config_hash(a) != scope_config_hash(c)
+
+    def test_cached_decision_does_not_survive_reload(self, scope_file):
+        validator = ScopeValidator.from_file(scope_file)
+        assert validator.validate(target="192.168.1.5") is True
+        validator.reload(ScopeValidator.parse_config({"allowed_targets": ["example.com"]}))
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="192.168.1.5")
+
+    def test_validation_is_pinned_to_one_snapshot(self, scope_file):
+        """A reload mid-validation does not change the running decision."""
+        validator = ScopeValidator.from_file(scope_file)
+        original = validator._is_ip_in_scope
+
+        def reload_midway(ip):
+            validator.reload(ScopeValidator.parse_config({"allowed_targets": ["example.com"]}))
+            return original(ip)
+
+        with patch.object(validator, "_is_ip_in_scope", side_effect=reload_midway):
+            assert validator.validate(target="192.168.1.5") is True
+        # The decision was computed against version 1 and is not cached for 2
+        assert validator.snapshot().version == 2
+        assert len(validator._decisions) == 0
+
+    def test_concurrent_readers_see_consistent_snapshots(self, scope_file):
+        import threading
+
+        validator = ScopeValidator.from_file(scope_file)
+        scopes = [
+            ScopeValidator.parse_config({"allowed_targets": ["192.168.1.0/24"], "allow_private": True}),
+            ScopeValidator.parse_config({"allowed_targets": ["10.0.0.0/8"], "allow_private": True}),
+        ]
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                outcomes = validator.validate_many(["192.168.1.1", "10.0.0.1"])
+                # Exactly one of the two is in scope in either version
+                if len(outcomes.allowed) != 1:
+                    errors.append(outcomes)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        with patch("cyberred.tools.scope.log"):
+            for t in threads:
+                t.start()
+            for i in range(200):
+                validator.reload(scopes[i % 2])
+            stop.set()
+            for t in threads:
+                t.join()
+        assert errors == []
+        assert validator.snapshot().version == 201
+
+    def test_add_targets_copies_config(self, scope_file):
+        validator = ScopeValidator.from_file(scope_file)
+        before = validator.snapshot()
+        after = validator.add_targets(["10.9.9.9", "New.Example.com", "192.168.1.0/24"])
+        assert after.version == before.version + 1
+        assert len(before.config.allowed_networks) == 1
+        assert validator.validate(target="10.9.9.9") is True
+        assert validator.validate(target="new.example.com") is True
+        assert len(after.config.allowed_networks) == 2
+        validator.add_targets(["new.example.com"])
+        assert validator.config.allowed_hostnames == ["new.example.com"]
+
+    def test_add_targets_keeps_interleaved_narrowing_reload(self):
+        from cyberred.tools.scope import CompiledScope
+
+        validator = ScopeValidator.from_config(
+            {"allowed_targets": ["10.0.0.0/24", "old.example.com"], "allow_private": True})
+        narrow = ScopeValidator.parse_config({"allowed_targets": ["10.0.0.0/24"], "allow_private": True})
+        compile_scope = CompiledScope.compile
+        raced = []
+
+        def compile_with_race(config):
+            # A scope file reload lands while add_targets is merging
+            if not raced:
+                raced.append(True)
+                validator.reload(narrow)
+            return compile_scope(config)
+
+        with patch.object(CompiledScope, "compile", side_effect=compile_with_race):
+            snapshot = validator.add_targets(["10.9.9.9"])
+
+        assert snapshot.version == 3
+        assert snapshot.config.allowed_hostnames == []
+        assert validator.validate(target="10.9.9.9") is True
+        with pytest.raises(ScopeViolationError):
+            validator.validate(target="old.example.com")
+
+    def test_roe_loader_persisted_target_is_published(self, scope_file, tmp_path):
+        from cyberred.core.roe_loader import RoELoader
+
+        validator = ScopeValidator.from_file(scope_file)
+        loader = RoELoader(str(tmp_path / "roe.yaml"))
+        loader.load()
+        loader.add_listener(lambda target: validator.add_targets([target]))
+        loader.authorize_target("http://10.20.30.40:8080/", persist=True)
+        assert validator.validate(target="10.20.30.40") is True
+
+    def test_settings_reload_follows_scope_path(self, scope_file, tmp_path):
+        from cyberred.core.hashing import calculate_file_hash
+
+        validator = ScopeValidator.from_config({"allowed_targets": ["example.com"]})
+        settings = MagicMock()
+        settings.engagement.scope_path = str(scope_file)
+
+        validator.handle_settings_reload(settings, ["llm.timeout"])
+        assert validator.snapshot().version == 1
+
+        with patch.object(validator, "start_watching") as mock_watch:
+            validator._watcher = MagicMock()
+            validator.handle_settings_reload(settings, ["engagement.scope_path"])
+            mock_watch.assert_called_once_with()
+        assert validator.snapshot().scope_hash == calculate_file_hash(scope_file)
+        assert validator.validate(target="192.168.1.9") is True
+
+        settings.engagement.scope_path = ""
+        validator.handle_settings_reload(settings, ["engagement.scope_path"])
+        assert validator.snapshot().version == 2
+
+        validator._watcher = None
+        settings.engagement.scope_path = str(scope_file)
+        validator.handle_settings_reload(settings, ["engagement.scope_path"])
+        assert validator.snapshot().version == 3
+
+    def test_corrupt_config_rejected_at_construction(self):
+        with pytest.raises(ValueError, match="Invalid scope configuration"):
+            ScopeValidator(ScopeConfig(allowed_networks=None))  # type: ignore[arg-type]
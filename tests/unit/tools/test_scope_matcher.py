@@ -0,0 +1,192 @@
+"""Unit tests for cyberred.tools.scope_matcher module.
+
+Verifies that the compiled lookup structures (bisect interval sets and the
+reversed-label hostname trie) give exactly the same answers as the linear
+checks they replace.
+"""
+
+import random
+from ipaddress import ip_address, ip_network
+
+import pytest
+
+from cyberred.tools.scope import ScopeConfig, ScopeValidator
+from cyberred.tools.scope_matcher import CompiledScope, _IntervalSet
+
+
+class TestIntervalSet:
+    """Tests for the merged interval set."""
+
+    def test_merges_overlapping_and_adjacent(self):
+        intervals = _IntervalSet([(10, 20), (15, 30), (31, 40), (50, 60)])
+        assert intervals.starts == [10, 50]
+        assert intervals.ends == [40, 60]
+        assert len(intervals) == 2
+
+    def test_nested_interval_does_not_shrink(self):
+        intervals = _IntervalSet([(10, 100), (20, 30)])
+        assert intervals.ends == [100]
+
+    def test_inverted_interval_is_ignored(self):
+        intervals = _IntervalSet([(9000, 8000), (80, 80)])
+        assert len(intervals) == 1
+        assert not intervals.contains(8500)
+
+    def test_contains_boundaries(self):
+        intervals = _IntervalSet([(10, 20)])
+        assert intervals.contains(10)
+        assert intervals.contains(20)
+        assert not intervals.contains(9)
+        assert not intervals.contains(21)
+
+    def test_empty_set_contains_nothing(self):
+        assert not _IntervalSet([]).contains(1)
+
+
+class TestCompiledScopeIP:
+    """Tests for IP membership."""
+
+    def test_ipv4_and_ipv6_are_separate(self):
+        compiled = CompiledScope.compile(ScopeConfig(
+            allowed_networks=[ip_network("10.0.0.0/8"), ip_network("2001:db8::/32")],
+        ))
+        assert compiled.contains_ip(ip_address("10.1.2.3"))
+        assert compiled.contains_ip(ip_address("2001:db8::1"))
+        assert not compiled.contains_ip(ip_address("11.0.0.1"))
+        # ::a00:1 has the same integer value as 10.0.0.1
+        assert not compiled.contains_ip(ip_address("::a00:1"))
+
+    def test_matches_linear_scan_on_large_scope(self):
+        rng = random.Random(1337)
+        networks = [
+            ip_network(f"{rng.randrange(1, 223)}.{rng.randrange(256)}.{rng.randrange(256)}.0/{rng.choice([24, 28, 30, 32])}", strict=False)
+            for _ in range(2000)
+        ]
+        compiled = CompiledScope.compile(ScopeConfig(allowed_networks=networks))
+        probes = [ip_address(int(n.network_address) + 1) for n in networks[:200]]
+        probes += [ip_address(rng.randrange(1 << 32)) for _ in range(500)]
+        for ip in probes:
+            assert compiled.contains_ip(ip) == any(ip in n for n in networks)
+
+
+class TestCompiledScopeHostname:
+    """Tests for the reversed-label hostname trie."""
+
+    @pytest.fixture
+    def compiled(self):
+        return CompiledScope.compile(ScopeConfig(
+            allowed_hostnames=["example.com", "*.corp.example.org", "*.a.b.test"],
+        ))
+
+    def test_exact_match(self, compiled):
+        assert compiled.contains_hostname("example.com")
+        assert not compiled.contains_hostname("www.example.com")
+        assert not compiled.contains_hostname("com")
+
+    def test_wildcard_matches_subdomains_and_root(self, compiled):
+        assert compiled.contains_hostname("corp.example.org")
+        assert compiled.contains_hostname("www.corp.example.org")
+        assert compiled.contains_hostname("x.y.corp.example.org")
+        assert not compiled.contains_hostname("example.org")
+        assert not compiled.contains_hostname("evilcorp.example.org")
+
+    def test_deep_wildcard(self, compiled):
+        assert compiled.contains_hostname("host.a.b.test")
+        assert not compiled.contains_hostname("host.b.test")
+
+    def test_matches_suffix_scan(self):
+        patterns = [f"*.dept{i}.example.com" for i in range(500)]
+        patterns += [f"host{i}.example.net" for i in range(500)]
+        compiled = CompiledScope.compile(ScopeConfig(allowed_hostnames=patterns))
+
+        def linear(hostname: str) -> bool:
+            for allowed in patterns:
+                if allowed.startswith("*."):
+                    if hostname.endswith(allowed[1:]) or hostname == allowed[2:]:
+                        return True
+                elif hostname == allowed:
+                    return True
+            return False
+
+        for hostname in [
+            "www.dept7.example.com", "dept499.example.com", "dept500.example.com",
+            "host3.example.net", "x.host3.example.net", "example.com", "",
+        ]:
+            assert compiled.contains_hostname(hostname) == linear(hostname)
+
+
+class TestCompiledScopePortsProtocols:
+    """Tests for port intervals and protocol set."""
+
+    def test_ports_none_allows_all(self):
+        assert CompiledScope.compile(ScopeConfig()).port_allowed(65535)
+
+    def test_port_ranges(self):
+        assert CompiledScope.compile(ScopeConfig()).port_range_allowed(1, 65535)
+        compiled = CompiledScope.compile(ScopeConfig(allowed_ports=[(1, 1024), 8080]))
+        assert compiled.port_range_allowed(1, 1024)
+        assert not compiled.port_range_allowed(1000, 8080)
+
+    def test_ports_empty_blocks_all(self):
+        assert not CompiledScope.compile(ScopeConfig(allowed_ports=[])).port_allowed(80)
+
+    def test_ports_mixed_single_and_ranges(self):
+        compiled = CompiledScope.compile(ScopeConfig(
+            allowed_ports=[443, (8000, 8100), 80, (8050, 8200), "bogus"],  # type: ignore[list-item]
+        ))
+        assert compiled.port_allowed(80)
+        assert compiled.port_allowed(443)
+        assert compiled.port_allowed(8200)
+        assert not compiled.port_allowed(81)
+        assert not compiled.port_allowed(8201)
+
+    def test_protocols(self):
+        assert CompiledScope.compile(ScopeConfig()).protocol_allowed("icmp")
+        compiled = CompiledScope.compile(ScopeConfig(allowed_protocols=["tcp"]))
+        assert compiled.protocol_allowed("TCP")
+        assert not compiled.protocol_allowed("udp")
+
+
+class TestValidatorRecompilation:
+    """ScopeValidator recompiles when its config is edited in place."""
+
+    def test_appended_network_is_picked_up(self):
+        validator = ScopeValidator.from_config({
+            "allowed_targets": ["192.168.1.0/24"],
+            "allow_private": True,
+        })
+        assert not validator._is_ip_in_scope(ip_address("10.0.0.1"))
+        validator.config.allowed_networks.append(ip_network("10.0.0.0/8"))
+        assert validator._is_ip_in_scope(ip_address("10.0.0.1"))
+
+    def test_compiled_scope_is_reused(self):
+        validator = ScopeValidator.from_config({"allowed_targets": ["example.com"]})
+        assert validator._matcher() is validator._matcher()
+
+
+class TestBatchAndNetworkLookup:
+    """Tests for CIDR containment and batched IP sweeps (user-028)."""
+
+    @pytest.fixture
+    def compiled(self):
+        return CompiledScope.compile(ScopeConfig(
+            allowed_networks=[ip_network("10.0.0.0/24"), ip_network("10.0.1.0/24"),
+                              ip_network("10.0.5.0/24")],
+        ))
+
+    def test_network_spanning_merged_intervals(self, compiled):
+        assert compiled.contains_network(ip_network("10.0.0.0/23"))
+        assert not compiled.contains_network(ip_network("10.0.0.0/22"))
+        assert not compiled.contains_network(ip_network("9.0.0.0/8"))
+
+    def test_contains_ips_matches_single_lookups(self, compiled):
+        rng = random.Random(7)
+        values = [int(ip_address("10.0.0.0")) + rng.randrange(2048) for _ in range(1000)]
+        values += [0, (1 << 32) - 1]
+        expected = [compiled.contains_ip(ip_address(v)) for v in values]
+        assert compiled.contains_ips(values, 4) == expected
+
+    def test_contains_ips_empty_scope(self):
+        compiled = CompiledScope.compile(ScopeConfig())
+        assert compiled.contains_ips([1, 2, 3], 6) == [False, False, False]
+        assert compiled.contains_ips([], 4) == []